@@ -0,0 +1,122 @@
+"""Benchmark guardrail pattern scanning cost per KB of input.
+
+Compare running every regex in sequence against the PatternScanner
+literal prefilter for the prompt proxy syntactic filter, the MCP
+syntactic gatekeeper, and the policy enforcer data boundary patterns.
+
+Usage:
+    python scripts/benchmark_pattern_scanner.py
+    python scripts/benchmark_pattern_scanner.py --sizes 1 64 200 --repeat 20
+"""
+
+import argparse
+import json
+import re
+import time
+from collections.abc import Callable
+from functools import partial
+
+from streetrace.guardrails.mcp_guard import policy_enforcer, syntactic_gatekeeper
+from streetrace.guardrails.pattern_scanner import PatternScanner
+from streetrace.guardrails.prompt_proxy.patterns import PATTERN_REGISTRY
+
+_SAMPLE_LINES = [
+    "def load_config(path: str) -> dict:",
+    '    """Read the configuration file and return its values."""',
+    "    with open(path) as handle:",
+    "        return json.load(handle)",
+    "INFO 2025-01-01 12:00:00 request completed in 35ms status=200",
+    "The quick brown fox jumps over the lazy dog near the riverbank.",
+    '{"id": 42, "name": "widget", "tags": ["blue", "small"], "price": 9.99}',
+    "| column_a | column_b | column_c |",
+]
+
+
+def _make_text(size_kb: int) -> str:
+    """Build benign tool output of roughly the given size."""
+    lines: list[str] = []
+    total = 0
+    i = 0
+    while total < size_kb * 1024:
+        line = _SAMPLE_LINES[i % len(_SAMPLE_LINES)]
+        lines.append(line)
+        total += len(line) + 1
+        i += 1
+    return "\n".join(lines)
+
+
+def _pattern_sets() -> dict[str, list[tuple[re.Pattern[str], tuple[str, ...]]]]:
+    """Collect the (regex, literals) pairs of each guardrail."""
+    gatekeeper = syntactic_gatekeeper._DETECTOR_REGISTRY  # noqa: SLF001
+    boundaries = policy_enforcer._DATA_BOUNDARY_PATTERNS  # noqa: SLF001
+    return {
+        "syntactic_filter": [
+            (entry.pattern, entry.literals)
+            for patterns in PATTERN_REGISTRY.values()
+            for entry in patterns
+        ],
+        "syntactic_gatekeeper": [
+            (pattern, literals)
+            for patterns in gatekeeper.values()
+            for _, pattern, literals in patterns
+        ],
+        "data_boundaries": [
+            (pattern, literals) for _, pattern, literals in boundaries
+        ],
+    }
+
+
+def _search_all(regexes: list[re.Pattern[str]], text: str) -> None:
+    """Run every regex over the text in sequence."""
+    for pattern in regexes:
+        pattern.search(text)
+
+
+def _time_per_kb(func: Callable[[str], object], text: str, repeat: int) -> float:
+    """Return the best time per KB in microseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(text)
+        best = min(best, time.perf_counter() - start)
+    return best * 1e6 / (len(text) / 1024)
+
+
+def main():
+    """Run the benchmark and print a table or JSON."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 16, 200])
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--json", action="store_true", help="Output as JSON")
+    args = parser.parse_args()
+
+    results = []
+    for name, patterns in _pattern_sets().items():
+        scanner = PatternScanner(patterns)
+        sequential = partial(_search_all, [pattern for pattern, _ in patterns])
+
+        for size_kb in args.sizes:
+            text = _make_text(size_kb)
+            results.append({
+                "patterns": name,
+                "size_kb": size_kb,
+                "sequential_us_per_kb": _time_per_kb(sequential, text, args.repeat),
+                "scanner_us_per_kb": _time_per_kb(scanner.scan, text, args.repeat),
+            })
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'patterns':<22} {'KB':>5} {'sequential':>12} {'scanner':>12} {'x':>6}")
+    for row in results:
+        speedup = row["sequential_us_per_kb"] / row["scanner_us_per_kb"]
+        print(
+            f"{row['patterns']:<22} {row['size_kb']:>5} "
+            f"{row['sequential_us_per_kb']:>9.1f} us "
+            f"{row['scanner_us_per_kb']:>9.1f} us {speedup:>5.1f}x",
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""Benchmark the PII regex pre-pass on code and log outputs.
+
+Report the pre-pass cost per KB, how many texts of a code/log corpus
+still need NER, and, if Presidio is installed, the NER cost the
+pre-pass saves.
+
+Usage:
+    python scripts/benchmark_pii_prefilter.py
+    python scripts/benchmark_pii_prefilter.py --ner --repeat 3
+"""
+
+import argparse
+import json
+import time
+from collections.abc import Callable
+
+from streetrace.dsl.runtime.pii_prefilter import has_pii_candidates, mask_pii_regex
+
+_CODE_OUTPUT = '''\
+from pathlib import Path
+
+
+def load_config(path: Path) -> dict[str, object]:
+    """Read the configuration file and return its values."""
+    if not path.exists():
+        return {}
+    with path.open() as handle:
+        return json.load(handle)
+
+
+class Cache:
+    def __init__(self, size: int = 128) -> None:
+        self._entries: dict[str, bytes] = {}
+        self._size = size
+'''
+
+_LOG_OUTPUT = """\
+INFO 2025-01-01 12:00:00 request completed in 35ms status=200 path=/api/items
+DEBUG 2025-01-01 12:00:01 cache miss key=items:42 ttl=300
+WARNING 2025-01-01 12:00:02 retrying upstream call attempt=2 delay=0.5s
+ERROR 2025-01-01 12:00:03 upstream returned 503, giving up after 3 attempts
+"""
+
+_TEST_OUTPUT = """\
+============================= test session starts ==============================
+collected 42 items
+
+tests/test_cache.py ........                                             [ 19%]
+tests/test_config.py ...........                                         [ 45%]
+tests/test_server.py .......................                             [100%]
+
+============================== 42 passed in 1.37s ==============================
+"""
+
+_JSON_OUTPUT = json.dumps(
+    [{"id": i, "name": f"widget-{i}", "price": i * 1.5} for i in range(40)],
+    indent=2,
+)
+
+_PII_OUTPUT = """\
+Ticket #4512 opened by Jane Doe (jane.doe@example.com, 555-201-7788).
+Customer asked to update card 4111-1111-1111-1111 on file.
+"""
+
+CORPUS: dict[str, str] = {
+    "code": _CODE_OUTPUT,
+    "log": _LOG_OUTPUT,
+    "pytest": _TEST_OUTPUT,
+    "json": _JSON_OUTPUT,
+    "pii": _PII_OUTPUT,
+}
+"""Representative tool outputs; only the last one contains PII."""
+
+
+def _time_us(func: Callable[[str], object], text: str, repeat: int) -> float:
+    """Return the best time of one call in microseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(text)
+        best = min(best, time.perf_counter() - start)
+    return best * 1e6
+
+
+def _load_ner() -> Callable[[str], str] | None:
+    """Load the Presidio backend, or None if it isn't installed."""
+    try:
+        from streetrace.dsl.runtime.pii_guardrail import _PresidioBackend
+
+        return _PresidioBackend().mask_pii
+    except ImportError:
+        return None
+
+
+def main():
+    """Run the benchmark and print a table or JSON."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument(
+        "--ner", action="store_true", help="Also time Presidio NER",
+    )
+    parser.add_argument("--json", action="store_true", help="Output as JSON")
+    args = parser.parse_args()
+
+    ner = _load_ner() if args.ner else None
+
+    results = []
+    for name, text in CORPUS.items():
+        row: dict[str, object] = {
+            "output": name,
+            "size_kb": round(len(text) / 1024, 2),
+            "needs_ner": has_pii_candidates(text),
+            "prefilter_us": _time_us(has_pii_candidates, text, args.repeat),
+            "regex_mask_us": _time_us(mask_pii_regex, text, args.repeat),
+        }
+        if ner is not None:
+            row["ner_us"] = _time_us(ner, text, args.repeat)
+        results.append(row)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(
+        f"{'output':<8} {'KB':>6} {'NER?':>5} {'prefilter':>12} "
+        f"{'regex mask':>12} {'NER':>12}",
+    )
+    for row in results:
+        ner_us = row.get("ner_us")
+        ner_col = f"{ner_us:>9.0f} us" if isinstance(ner_us, float) else "-"
+        print(
+            f"{row['output']:<8} {row['size_kb']:>6} "
+            f"{'yes' if row['needs_ner'] else 'no':>5} "
+            f"{row['prefilter_us']:>9.1f} us {row['regex_mask_us']:>9.1f} us "
+            f"{ner_col:>12}",
+        )
+    skipped = sum(1 for row in results if not row["needs_ner"])
+    print(f"\n{skipped}/{len(results)} outputs skip NER in prefilter+ner mode")
+
+
+if __name__ == "__main__":
+    main()
@@ -95,10 +95,14 @@ class Application:
             await self.session_manager.display_sessions()
             raise SystemExit
 
-        if self.args.prompt or self.args.arbitrary_prompt:
-            await self._run_non_interactive()
-        else:
-            await self._run_interactive()
+        try:
+            if self.args.prompt or self.args.arbitrary_prompt:
+                await self._run_non_interactive()
+            else:
+                await self._run_interactive()
+        finally:
+            # write-behind session storage may hold unwritten events
+            self.session_manager.close()
 
     async def _process_input(self, user_input: str) -> None:
         lazy_setup_litellm_logging()
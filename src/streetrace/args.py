@@ -4,6 +4,7 @@ import os
 from collections.abc import Callable
 from datetime import datetime
 from pathlib import Path
+from typing import Literal
 
 import typed_argparse as tap
 from tzlocal import get_localzone
@@ -49,6 +50,28 @@ class Args(tap.TypedArgs):
     user_id: str | None = tap.arg(help="User ID for the session", default=None)
     session_id: str | None = tap.arg(help="Session ID to use (or create)", default=None)
     list_sessions: bool = tap.arg(help="List available sessions", default=False)
+    session_format: Literal["json", "json.gz", "jsonl", "sqlite"] = tap.arg(
+        help=(
+            "Session storage format: 'json' rewrites a JSON document on every "
+            "event, 'json.gz' does the same with a gzip-compressed document, "
+            "'jsonl' appends events to a JSON Lines log, 'sqlite' keeps "
+            "all sessions in one SQLite database (import existing sessions with "
+            "'streetrace migrate-sessions')"
+        ),
+        default="json",
+    )
+    session_flush_interval: float | None = tap.arg(
+        help=(
+            "Write session events in the background every N seconds instead of on "
+            "every event; sessions are also written at the end of each turn and on "
+            "exit (not used with 'sqlite')"
+        ),
+        default=None,
+    )
+    session_fsync: bool = tap.arg(
+        help="Flush session files to disk after every write",
+        default=False,
+    )
     list_agents: bool = tap.arg(help="List available agents", default=False)
     version: bool = tap.arg(help="Show version and exit", default=False)
     cache: bool = tap.arg(help="Enable Redis caching for LLM responses", default=False)
@@ -12,6 +12,7 @@ from streetrace.commands.base_command import Command
 from streetrace.llm.model_factory import ModelFactory
 from streetrace.log import get_logger
 from streetrace.messages import COMPACT
+from streetrace.session.compaction import mark_compaction_summary
 
 if TYPE_CHECKING:
     from google.genai import types as genai_types
@@ -136,11 +137,13 @@ class CompactCommand(Command):
             self.ui_bus.dispatch_ui_update(ui_events.Markdown(summary_message))
 
             compacted_session_events.append(
-                Event(
-                    author=assistant_author_name or "assistant",
-                    content=genai_types.Content(
-                        role=role,
-                        parts=[genai_types.Part.from_text(text=summary_message)],
+                mark_compaction_summary(
+                    Event(
+                        author=assistant_author_name or "assistant",
+                        content=genai_types.Content(
+                            role=role,
+                            parts=[genai_types.Part.from_text(text=summary_message)],
+                        ),
                     ),
                 ),
             )
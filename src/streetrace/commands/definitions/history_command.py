@@ -215,10 +215,12 @@ class HistoryCommand(Command):
         system = self.system_context.get_system_message()
         session = await self.session_manager.get_current_session()
         if session:
+            # the session holds events after the last compaction only
+            history = await self.session_manager.get_current_session_history()
             self.ui_bus.dispatch_ui_update(
                 _DisplayHistory(
                     system_message=system,
-                    session=session,
+                    session=session.model_copy(update={"events": history}),
                 ),
             )
         else:
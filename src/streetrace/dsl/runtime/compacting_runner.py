@@ -311,6 +311,8 @@ class SummarizeCompactionStrategy(CompactionStrategy):
         from google.adk.events import Event
         from google.genai import types as genai_types
 
+        from streetrace.session.compaction import mark_compaction_summary
+
         events = session.events
         if len(events) <= 1:
             return session
@@ -332,15 +334,17 @@ class SummarizeCompactionStrategy(CompactionStrategy):
             summary = await self._llm.summarize(text_to_summarize)
 
             # Create summary event
-            summary_event = Event(
-                author="system",
-                content=genai_types.Content(
-                    role="user",
-                    parts=[
-                        genai_types.Part(
-                            text=f"[Previous conversation summary: {summary}]",
-                        ),
-                    ],
+            summary_event = mark_compaction_summary(
+                Event(
+                    author="system",
+                    content=genai_types.Content(
+                        role="user",
+                        parts=[
+                            genai_types.Part(
+                                text=f"[Previous conversation summary: {summary}]",
+                            ),
+                        ],
+                    ),
                 ),
             )
             new_events.append(summary_event)
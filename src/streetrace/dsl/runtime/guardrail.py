@@ -1,8 +1,12 @@
 """Guardrail protocol and custom guardrail adapter.
 
-Define the ``Guardrail`` protocol that all guardrails implement and
-the ``CustomGuardrailAdapter`` that wraps user-provided functions
-into the protocol interface.
+Define the ``Guardrail`` protocol that all guardrails implement, the
+optional ``AsyncCheckGuardrail`` and ``AsyncMaskGuardrail`` protocols
+for guardrails with async check and batched mask paths, the optional
+``MemoizableGuardrail`` protocol for guardrails with deterministic
+results, the optional ``ToolCallGuardrail`` protocol for guardrails
+that inspect parsed tool calls, and the ``CustomGuardrailAdapter``
+that wraps user-provided functions into the protocol interface.
 """
 
 from __future__ import annotations
@@ -10,7 +14,10 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Protocol, runtime_checkable
 
 if TYPE_CHECKING:
-    from streetrace.dsl.runtime.guardrail_types import GuardrailFunc
+    from streetrace.dsl.runtime.guardrail_types import (
+        GuardrailFunc,
+        ToolCallContent,
+    )
 
 
 @runtime_checkable
@@ -52,6 +59,95 @@ class Guardrail(Protocol):
         ...
 
 
+@runtime_checkable
+class AsyncCheckGuardrail(Protocol):
+    """Protocol for guardrails that can check text asynchronously.
+
+    The provider awaits ``check_async`` instead of calling
+    ``check_str`` when a guardrail implements it, so checks that run
+    model inference don't block the event loop.
+    """
+
+    async def check_async(self, text: str) -> tuple[bool, str]:
+        """Check if *text* triggers the guardrail.
+
+        Args:
+            text: Input text to check.
+
+        Returns:
+            Tuple of (triggered, detail message).
+
+        """
+        ...
+
+
+@runtime_checkable
+class AsyncMaskGuardrail(Protocol):
+    """Protocol for guardrails that can mask batches of text asynchronously.
+
+    The provider awaits ``mask_batch_async`` instead of calling
+    ``mask_str`` when a guardrail implements it, passing all fields of
+    a tool result in one call, so expensive masking runs off the event
+    loop and can process texts together.
+    """
+
+    async def mask_batch_async(self, texts: list[str]) -> list[str]:
+        """Mask sensitive content in each of *texts*.
+
+        Args:
+            texts: Input texts to mask.
+
+        Returns:
+            Masked texts, in the same order as *texts*.
+
+        """
+        ...
+
+
+@runtime_checkable
+class ToolCallGuardrail(Protocol):
+    """Protocol for guardrails that check structured tool calls.
+
+    The provider awaits ``check_tool_call`` with the ``ToolCallContent``
+    itself instead of passing its JSON text to ``check_str``, so the
+    guardrail reads the parsed arguments without decoding them again.
+    """
+
+    async def check_tool_call(
+        self, content: ToolCallContent,
+    ) -> tuple[bool, str]:
+        """Check if a tool call triggers the guardrail.
+
+        Args:
+            content: Tool call to check.
+
+        Returns:
+            Tuple of (triggered, detail message).
+
+        """
+        ...
+
+
+@runtime_checkable
+class MemoizableGuardrail(Protocol):
+    """Protocol for guardrails whose results can be memoized.
+
+    A guardrail implements this when its results only depend on the
+    input content and its configuration. The provider then reuses
+    results for content it has already seen.
+    """
+
+    @property
+    def memo_key(self) -> str | None:
+        """Return a key identifying the guardrail configuration.
+
+        Results are memoized per key, so it must change whenever the
+        configuration changes results. Return None while results
+        aren't deterministic.
+        """
+        ...
+
+
 class CustomGuardrailAdapter:
     """Adapt a ``GuardrailFunc`` to the ``Guardrail`` protocol.
 
@@ -59,16 +155,25 @@ class CustomGuardrailAdapter:
     function if it returns a coroutine.
     """
 
-    def __init__(self, guardrail_name: str, func: GuardrailFunc) -> None:
+    def __init__(
+        self,
+        guardrail_name: str,
+        func: GuardrailFunc,
+        *,
+        memoize: bool = False,
+    ) -> None:
         """Initialize the adapter.
 
         Args:
             guardrail_name: Guardrail name used in DSL.
             func: User-provided guardrail function.
+            memoize: Whether the function is deterministic, so its
+                results can be memoized.
 
         """
         self._name = guardrail_name
         self._func = func
+        self._memoize = memoize
 
     @property
     def name(self) -> str:
@@ -80,6 +185,13 @@ class CustomGuardrailAdapter:
         """Return the wrapped function for async dispatch."""
         return self._func
 
+    @property
+    def memo_key(self) -> str | None:
+        """Return the memo key if the function opted in to memoization."""
+        if not self._memoize:
+            return None
+        return f"custom:{id(self._func)}"
+
     def mask_str(self, text: str) -> str:
         """Invoke the underlying function synchronously for masking.
 
@@ -0,0 +1,126 @@
+"""LRU memo for deterministic guardrail results.
+
+The same text is often checked several times, for example the last
+user message on every model call of a tool loop, or identical tool
+outputs. Guardrails whose result only depends on the input and their
+configuration expose a ``memo_key`` and have their results memoized
+here, keyed by guardrail name, memo key, and a digest of the content.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections import OrderedDict
+
+from opentelemetry import metrics
+
+DEFAULT_MEMO_ENTRIES = 1024
+"""Default maximum number of memoized results per operation."""
+
+_DIGEST_SIZE = 16
+"""Size of content digests in bytes."""
+
+_meter = metrics.get_meter(__name__)
+
+_MEMO_HITS = _meter.create_counter(
+    "streetrace.guardrail.memo.hits",
+    description="Guardrail results served from the memo",
+)
+"""Counter of memo hits by guardrail and operation."""
+
+_MEMO_MISSES = _meter.create_counter(
+    "streetrace.guardrail.memo.misses",
+    description="Guardrail results not found in the memo",
+)
+"""Counter of memo misses by guardrail and operation."""
+
+MemoKey = tuple[str, str, bytes]
+"""Memo key of (guardrail name, guardrail memo key, content digest)."""
+
+
+def content_digest(kind: str, text: str) -> bytes:
+    """Hash content for use in a memo key.
+
+    Args:
+        kind: Content type, so equal text of different types differs.
+        text: Content text.
+
+    Returns:
+        Content digest.
+
+    """
+    digest = hashlib.blake2b(kind.encode(), digest_size=_DIGEST_SIZE)
+    digest.update(b"\0")
+    digest.update(text.encode("utf-8", "surrogatepass"))
+    return digest.digest()
+
+
+class GuardrailMemo[V]:
+    """Bounded LRU map from memo keys to guardrail results.
+
+    Record hits and misses in OTEL counters tagged with the guardrail
+    name and operation.
+    """
+
+    def __init__(
+        self,
+        operation: str,
+        *,
+        max_entries: int = DEFAULT_MEMO_ENTRIES,
+    ) -> None:
+        """Initialize an empty memo.
+
+        Args:
+            operation: Guardrail operation, 'check' or 'mask'.
+            max_entries: Maximum number of results to keep. Zero
+                disables the memo.
+
+        """
+        self._operation = operation
+        self._max_entries = max_entries
+        self._entries: OrderedDict[MemoKey, V] = OrderedDict()
+
+    def get(self, key: MemoKey) -> V | None:
+        """Look up a result and mark it as recently used.
+
+        Args:
+            key: Memo key.
+
+        Returns:
+            Memoized result, or None if not memoized.
+
+        """
+        attributes = {
+            "streetrace.guardrail.name": key[0],
+            "streetrace.guardrail.operation": self._operation,
+        }
+        value = self._entries.get(key)
+        if value is None:
+            _MEMO_MISSES.add(1, attributes)
+            return None
+        self._entries.move_to_end(key)
+        _MEMO_HITS.add(1, attributes)
+        return value
+
+    def put(self, key: MemoKey, value: V) -> None:
+        """Store a result, evicting the least recently used if full.
+
+        Args:
+            key: Memo key.
+            value: Guardrail result.
+
+        """
+        if self._max_entries <= 0:
+            return
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all memoized results."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        """Return the number of memoized results."""
+        return len(self._entries)
@@ -10,7 +10,7 @@ from __future__ import annotations
 
 import json
 import os
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, cast
 
 from openinference.semconv.trace import (
     OpenInferenceSpanKindValues,
@@ -18,7 +18,19 @@ from openinference.semconv.trace import (
 )
 from opentelemetry import trace
 
-from streetrace.dsl.runtime.guardrail import CustomGuardrailAdapter
+from streetrace.dsl.runtime.guardrail import (
+    AsyncCheckGuardrail,
+    AsyncMaskGuardrail,
+    CustomGuardrailAdapter,
+    MemoizableGuardrail,
+    ToolCallGuardrail,
+)
+from streetrace.dsl.runtime.guardrail_memo import (
+    DEFAULT_MEMO_ENTRIES,
+    GuardrailMemo,
+    MemoKey,
+    content_digest,
+)
 from streetrace.dsl.runtime.guardrail_types import (
     INSPECTABLE_FIELDS_CHECK,
     INSPECTABLE_FIELDS_MASK,
@@ -26,8 +38,9 @@ from streetrace.dsl.runtime.guardrail_types import (
     GuardrailFunc,
     ToolCallContent,
     ToolResultContent,
-    check_fields,
+    check_fields_async,
     mask_fields,
+    mask_fields_batched,
 )
 from streetrace.dsl.runtime.pii_guardrail import PiiGuardrail
 from streetrace.guardrails.audit.violation_events import (
@@ -42,6 +55,8 @@ from streetrace.log import get_logger
 if TYPE_CHECKING:
     from streetrace.dsl.runtime.context import WorkflowContext
     from streetrace.dsl.runtime.guardrail import Guardrail
+    from streetrace.guardrails.config import McpGuardConfig, PiiConfig
+    from streetrace.guardrails.inference.pipeline import InferencePipeline
 
 logger = get_logger(__name__)
 
@@ -84,17 +99,50 @@ class GuardrailProvider:
     orchestration concerns that live here, not in individual guardrails.
     """
 
-    def __init__(self) -> None:
-        """Initialize with built-in guardrails."""
+    def __init__(
+        self,
+        *,
+        memo_max_entries: int = DEFAULT_MEMO_ENTRIES,
+        pii_workers: int = 0,
+        pii_config: PiiConfig | None = None,
+        inference_pipeline: InferencePipeline | None = None,
+        mcp_guard_config: McpGuardConfig | None = None,
+    ) -> None:
+        """Initialize with built-in guardrails.
+
+        Args:
+            memo_max_entries: Maximum number of memoized results per
+                operation for guardrails implementing
+                ``MemoizableGuardrail``. Zero disables memoization.
+            pii_workers: Number of worker processes for PII masking.
+                Zero masks in-process on a worker thread.
+            pii_config: PII masking configuration. Uses defaults if
+                None.
+            inference_pipeline: ONNX inference facade shared by the
+                model-based stages of the built-in guardrails, or None
+                to run them without models.
+            mcp_guard_config: MCP-Guard configuration. Uses defaults
+                if None.
+
+        """
         self._registry: dict[str, Guardrail] = {}
+        self._check_memo: GuardrailMemo[tuple[bool, str]] = GuardrailMemo(
+            "check", max_entries=memo_max_entries,
+        )
+        self._mask_memo: GuardrailMemo[str] = GuardrailMemo(
+            "mask", max_entries=memo_max_entries,
+        )
         self._parent_ctx: WorkflowContext | None = None
         self._session_id: str | None = None
         self._session_state: dict[str, object] | None = None
 
         # Register built-in guardrails
-        jailbreak = PromptProxyPipeline(inference_pipeline=None)
-        pii = PiiGuardrail()
-        mcp_guard = McpGuardOrchestrator()
+        jailbreak = PromptProxyPipeline(inference_pipeline=inference_pipeline)
+        pii = PiiGuardrail(max_workers=pii_workers, config=pii_config)
+        mcp_guard = McpGuardOrchestrator(
+            inference_pipeline=inference_pipeline,
+            config=mcp_guard_config,
+        )
         self._registry[jailbreak.name] = jailbreak
         self._registry[pii.name] = pii
         self._registry[mcp_guard.name] = mcp_guard
@@ -105,7 +153,9 @@ class GuardrailProvider:
             CognitiveMonitor,
         )
 
-        cognitive = CognitiveMonitor(provider=self)
+        cognitive = CognitiveMonitor(
+            provider=self, inference_pipeline=inference_pipeline,
+        )
         self._registry[cognitive.name] = cognitive
 
     # -- invocation context ---------------------------------------------------
@@ -146,7 +196,9 @@ class GuardrailProvider:
 
     # -- custom guardrail registration ------------------------------------
 
-    def register_custom(self, name: str, func: GuardrailFunc) -> None:
+    def register_custom(
+        self, name: str, func: GuardrailFunc, *, memoize: bool = False,
+    ) -> None:
         """Register a custom guardrail function.
 
         Custom guardrails override built-in guardrails with the same name.
@@ -154,9 +206,16 @@ class GuardrailProvider:
         Args:
             name: Guardrail name used in DSL (e.g. ``mask my_guard``).
             func: Callable accepting a message string.
+            memoize: Reuse results for content already seen. Only set
+                this for functions whose result depends on nothing but
+                the content.
 
         """
-        self._registry[name] = CustomGuardrailAdapter(name, func)
+        self._registry[name] = CustomGuardrailAdapter(
+            name, func, memoize=memoize,
+        )
+        self._check_memo.clear()
+        self._mask_memo.clear()
         logger.debug("Registered custom guardrail: %s", name)
 
     # -- public API -------------------------------------------------------
@@ -200,8 +259,15 @@ class GuardrailProvider:
 
             # Custom guardrail adapter — receives full content, may be async
             if isinstance(impl, CustomGuardrailAdapter):
-                result = await self._call_custom_mask(impl, content)
-                masked: GuardrailContent = str(result)
+                key = _memo_entry_key(impl, content)
+                masked_custom = (
+                    self._mask_memo.get(key) if key is not None else None
+                )
+                if masked_custom is None:
+                    masked_custom = await self._call_custom_mask(impl, content)
+                    if key is not None:
+                        self._mask_memo.put(key, masked_custom)
+                masked: GuardrailContent = masked_custom
                 triggered = masked != _serialize_content(content)
                 _set_triggered_output(
                     span, triggered=triggered, output_value=str(masked),
@@ -213,7 +279,7 @@ class GuardrailProvider:
                 return content
 
             if isinstance(content, ToolResultContent):
-                masked_result = self._mask_tool_result(
+                masked_result = await self._mask_tool_result(
                     impl, content,
                 )
                 triggered = masked_result.data != content.data
@@ -226,7 +292,7 @@ class GuardrailProvider:
                 return masked_result
 
             # str path
-            masked_str = self._mask_str(impl, guardrail, content)
+            masked_str = await self._mask_str(impl, guardrail, content)
             triggered = masked_str != content
             _set_triggered_output(
                 span,
@@ -235,11 +301,13 @@ class GuardrailProvider:
             )
             return masked_str
 
-    def _mask_str(
+    async def _mask_str(
         self, impl: Guardrail | None, guardrail: str, message: str,
     ) -> str:
         """Apply masking to a plain string.
 
+        Await ``mask_batch_async`` for guardrails that implement it.
+
         Args:
             impl: Guardrail implementation or None.
             guardrail: Name of the guardrail.
@@ -254,15 +322,78 @@ class GuardrailProvider:
                 "Unknown guardrail type for masking: %s", guardrail,
             )
             return message
-        return impl.mask_str(message)
+        if isinstance(impl, AsyncMaskGuardrail):
+            [masked] = await self._mask_texts_async(impl, [message])
+            return masked
+        return self._mask_text(impl, message)
+
+    def _mask_text(self, impl: Guardrail, text: str) -> str:
+        """Mask text, reusing the memoized result if there is one.
+
+        Args:
+            impl: Guardrail implementation.
+            text: Text to mask.
+
+        Returns:
+            Masked text.
+
+        """
+        key = _memo_entry_key(impl, text)
+        if key is not None:
+            cached = self._mask_memo.get(key)
+            if cached is not None:
+                return cached
+        masked = impl.mask_str(text)
+        if key is not None:
+            self._mask_memo.put(key, masked)
+        return masked
+
+    async def _mask_texts_async(
+        self, impl: Guardrail, texts: list[str],
+    ) -> list[str]:
+        """Mask texts in one batch, reusing memoized results.
+
+        Only texts without a memoized result are passed to
+        ``mask_batch_async``.
+
+        Args:
+            impl: Guardrail implementation with a batched mask path.
+            texts: Texts to mask.
+
+        Returns:
+            Masked texts, in the same order as *texts*.
 
-    def _mask_tool_result(
+        """
+        masked: list[str | None] = []
+        keys: list[MemoKey | None] = []
+        for text in texts:
+            key = _memo_entry_key(impl, text)
+            keys.append(key)
+            masked.append(
+                self._mask_memo.get(key) if key is not None else None,
+            )
+        pending = [i for i, value in enumerate(masked) if value is None]
+        if pending:
+            results = await cast("AsyncMaskGuardrail", impl).mask_batch_async(
+                [texts[i] for i in pending],
+            )
+            for i, value in zip(pending, results, strict=True):
+                masked[i] = value
+                key = keys[i]
+                if key is not None:
+                    self._mask_memo.put(key, value)
+        return [str(value) for value in masked]
+
+    async def _mask_tool_result(
         self,
         impl: Guardrail | None,
         content: ToolResultContent,
     ) -> ToolResultContent:
         """Apply masking to inspectable fields in a tool result.
 
+        Guardrails implementing ``AsyncMaskGuardrail`` receive all
+        fields in one batch.
+
         Args:
             impl: Guardrail implementation or None.
             content: Tool result content to mask.
@@ -273,8 +404,14 @@ class GuardrailProvider:
         """
         if impl is None:
             return content
+        if isinstance(impl, AsyncMaskGuardrail):
+            masked_data = await mask_fields_batched(
+                content.data,
+                lambda texts: self._mask_texts_async(impl, texts),
+            )
+            return ToolResultContent(data=masked_data)
         masked_data = mask_fields(
-            content.data, impl.mask_str,
+            content.data, lambda text: self._mask_text(impl, text),
         )
         return ToolResultContent(data=masked_data)
 
@@ -283,9 +420,10 @@ class GuardrailProvider:
     ) -> bool:
         """Check if content triggers a guardrail.
 
-        Custom guardrails are tried first. The built-in ``jailbreak``
-        guardrail uses regex patterns by design (Presidio has no
-        jailbreak detection).
+        Custom guardrails are tried first. Guardrails implementing
+        ``AsyncCheckGuardrail`` are awaited, so the ``jailbreak``
+        guardrail can run its model-based stages without blocking the
+        event loop.
 
         Args:
             guardrail: Name of the guardrail (e.g., 'jailbreak').
@@ -317,19 +455,26 @@ class GuardrailProvider:
 
             # Custom guardrail adapter — receives full content, may be async
             if isinstance(impl, CustomGuardrailAdapter):
-                result = await self._call_custom_check(impl, content)
-                triggered = bool(result)
-                if triggered:
-                    detail = f"custom guardrail '{guardrail}' triggered"
+                key = _memo_entry_key(impl, content)
+                cached = self._check_memo.get(key) if key is not None else None
+                if cached is not None:
+                    triggered, detail = cached
+                else:
+                    triggered = await self._call_custom_check(impl, content)
+                    if triggered:
+                        detail = f"custom guardrail '{guardrail}' triggered"
+                    if key is not None:
+                        self._check_memo.put(key, (triggered, detail))
             elif isinstance(content, ToolResultContent):
-                triggered, detail = self._check_tool_result(
+                triggered, detail = await self._check_tool_result(
                     impl, content,
                 )
             elif isinstance(content, ToolCallContent):
-                text = json.dumps(content.data, default=str)
-                triggered, detail = self._check_str(impl, guardrail, text)
+                triggered, detail = await self._check_tool_call(
+                    impl, guardrail, content,
+                )
             else:
-                triggered, detail = self._check_str(
+                triggered, detail = await self._check_str(
                     impl, guardrail, content,
                 )
 
@@ -362,11 +507,14 @@ class GuardrailProvider:
 
             return triggered
 
-    def _check_str(
+    async def _check_str(
         self, impl: Guardrail | None, guardrail: str, text: str,
     ) -> tuple[bool, str]:
         """Check a plain string against a guardrail.
 
+        Await ``check_async`` for guardrails that implement it. Results
+        of memoizable guardrails are memoized.
+
         Args:
             impl: Guardrail implementation or None.
             guardrail: Name of the guardrail.
@@ -381,9 +529,52 @@ class GuardrailProvider:
                 "Unknown guardrail type for checking: %s", guardrail,
             )
             return False, ""
-        return impl.check_str(text)
+        key = _memo_entry_key(impl, text)
+        if key is not None:
+            cached = self._check_memo.get(key)
+            if cached is not None:
+                return cached
+        if isinstance(impl, AsyncCheckGuardrail):
+            result = await impl.check_async(text)
+        else:
+            result = impl.check_str(text)
+        if key is not None:
+            self._check_memo.put(key, result)
+        return result
+
+    async def _check_tool_call(
+        self,
+        impl: Guardrail | None,
+        guardrail: str,
+        content: ToolCallContent,
+    ) -> tuple[bool, str]:
+        """Check a tool call against a guardrail.
+
+        Guardrails implementing ``ToolCallGuardrail`` receive the
+        content itself; others check its canonical JSON text.
 
-    def _check_tool_result(
+        Args:
+            impl: Guardrail implementation or None.
+            guardrail: Name of the guardrail.
+            content: Tool call content to check.
+
+        Returns:
+            Tuple of (triggered, detail).
+
+        """
+        if not isinstance(impl, ToolCallGuardrail):
+            return await self._check_str(impl, guardrail, content.text)
+        key = _memo_entry_key(impl, content)
+        if key is not None:
+            cached = self._check_memo.get(key)
+            if cached is not None:
+                return cached
+        result = await impl.check_tool_call(content)
+        if key is not None:
+            self._check_memo.put(key, result)
+        return result
+
+    async def _check_tool_result(
         self,
         impl: Guardrail | None,
         content: ToolResultContent,
@@ -404,9 +595,9 @@ class GuardrailProvider:
         """
         if impl is None:
             return False, ""
-        return check_fields(
+        return await check_fields_async(
             content.data,
-            lambda text: impl.check_str(text),
+            lambda text: self._check_str(impl, "", text),
         )
 
     # -- OTEL helpers -----------------------------------------------------
@@ -482,6 +673,34 @@ class GuardrailProvider:
 # ---------------------------------------------------------------------------
 
 
+def _memo_entry_key(
+    impl: Guardrail, content: GuardrailContent,
+) -> MemoKey | None:
+    """Build the memo key for a guardrail result.
+
+    Args:
+        impl: Guardrail implementation.
+        content: Content being checked or masked.
+
+    Returns:
+        Memo key, or None if the guardrail's results can't be memoized.
+
+    """
+    memo_key = impl.memo_key if isinstance(impl, MemoizableGuardrail) else None
+    if not isinstance(memo_key, str):
+        return None
+    if isinstance(content, str):
+        digest = content_digest("str", content)
+    elif isinstance(content, ToolCallContent):
+        digest = content_digest(type(content).__name__, content.text)
+    else:
+        digest = content_digest(
+            type(content).__name__,
+            json.dumps(content.data, sort_keys=True, default=str),
+        )
+    return impl.name, memo_key, digest
+
+
 def _serialize_content(content: GuardrailContent) -> str:
     """Serialize guardrail content to a string for OTEL attributes.
 
@@ -492,7 +711,9 @@ def _serialize_content(content: GuardrailContent) -> str:
         String representation.
 
     """
-    if isinstance(content, (ToolResultContent, ToolCallContent)):
+    if isinstance(content, ToolCallContent):
+        return content.text
+    if isinstance(content, ToolResultContent):
         return json.dumps(content.data, default=str)
     return content
 
@@ -6,7 +6,9 @@ inspectable field constants, and the custom guardrail function protocol.
 
 from __future__ import annotations
 
+import json
 from dataclasses import dataclass
+from functools import cached_property
 from typing import TYPE_CHECKING, Protocol, runtime_checkable
 
 if TYPE_CHECKING:
@@ -26,10 +28,20 @@ class ToolResultContent:
 
 @dataclass(frozen=True)
 class ToolCallContent:
-    """Tool call arguments for guardrail inspection."""
+    """Tool call arguments for guardrail inspection.
+
+    Guardrails that understand tool calls read the parsed ``data``
+    directly. Text-based guardrails, memo keys, and span capture share
+    ``text``, which is serialized at most once per content object.
+    """
 
     data: dict[str, object]
 
+    @cached_property
+    def text(self) -> str:
+        """Return the canonical JSON form of the data, with sorted keys."""
+        return json.dumps(self.data, sort_keys=True, default=str)
+
 
 GuardrailContent = str | ToolResultContent | ToolCallContent
 """Union type for content passed to guardrail operations."""
@@ -81,6 +93,37 @@ def mask_fields(
     return result
 
 
+async def mask_fields_batched(
+    data: dict[str, object],
+    mask_batch_fn: Callable[[list[str]], Awaitable[list[str]]],
+) -> dict[str, object]:
+    """Mask inspectable content fields with one batched mask call.
+
+    Collect the string-valued ``INSPECTABLE_FIELDS_MASK`` fields and
+    pass them to *mask_batch_fn* together. Return a shallow copy with
+    replaced fields.
+
+    Args:
+        data: Original tool result dict.
+        mask_batch_fn: Coroutine function masking a list of strings.
+
+    Returns:
+        New dict with masked field values.
+
+    """
+    fields = [
+        field for field in INSPECTABLE_FIELDS_MASK
+        if isinstance(data.get(field), str) and data.get(field)
+    ]
+    result = dict(data)
+    if not fields:
+        return result
+    masked = await mask_batch_fn([str(data[field]) for field in fields])
+    for field, value in zip(fields, masked, strict=True):
+        result[field] = value
+    return result
+
+
 def check_fields(
     data: dict[str, object],
     check_fn: Callable[[str], tuple[bool, str]],
@@ -104,3 +147,29 @@ def check_fields(
             if triggered:
                 return True, f"{detail} in field '{field}'"
     return False, ""
+
+
+async def check_fields_async(
+    data: dict[str, object],
+    check_fn: Callable[[str], Awaitable[tuple[bool, str]]],
+) -> tuple[bool, str]:
+    """Check inspectable content fields with an async check function.
+
+    Iterate ``INSPECTABLE_FIELDS_CHECK`` and return on first trigger.
+
+    Args:
+        data: Tool result dict.
+        check_fn: Coroutine function returning (triggered, detail) for a
+            string.
+
+    Returns:
+        Tuple of (triggered, detail).
+
+    """
+    for field in INSPECTABLE_FIELDS_CHECK:
+        value = data.get(field)
+        if isinstance(value, str) and value:
+            triggered, detail = await check_fn(value)
+            if triggered:
+                return True, f"{detail} in field '{field}'"
+    return False, ""
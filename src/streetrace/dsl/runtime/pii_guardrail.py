@@ -2,11 +2,26 @@
 
 Detect and anonymize personally identifiable information.
 This is a mask-only guardrail — checking always returns not triggered.
+Batched masking runs on a worker thread, or on a process pool of warm
+Presidio engines when worker processes are configured. A regex pre-pass
+skips Presidio for texts without PII candidates.
 """
 
 from __future__ import annotations
 
+import asyncio
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any
+
 from streetrace.dsl.runtime.errors import MissingDependencyError
+from streetrace.dsl.runtime.pii_prefilter import (
+    has_pii_candidates,
+    mask_pii_regex,
+)
+from streetrace.guardrails.config import PiiConfig, PiiMode
 from streetrace.log import get_logger
 
 logger = get_logger(__name__)
@@ -26,6 +41,12 @@ DATE_TIME recognizer matches time references (``5 minutes``) in
 documentation content.
 """
 
+_NLP_BATCH_SIZE = 32
+"""Number of texts processed per spaCy ``nlp.pipe`` batch."""
+
+_worker_backend: dict[str, _PresidioBackend] = {}
+"""Presidio backend of the current worker process, keyed by 'backend'."""
+
 
 class _PresidioBackend:
     """Wrap Presidio analyzer and anonymizer engines.
@@ -56,6 +77,45 @@ class _PresidioBackend:
 
         """
         all_results = self._analyzer.analyze(text=text, language="en")
+        return self._anonymize(text, all_results)
+
+    def mask_batch(self, texts: list[str]) -> list[str]:
+        """Detect and anonymize PII in each of *texts*.
+
+        Run NLP analysis over all texts with ``BatchAnalyzerEngine``,
+        which feeds them through spaCy's ``nlp.pipe``.
+
+        Args:
+            texts: Input texts to scan.
+
+        Returns:
+            Masked texts, in the same order as *texts*.
+
+        """
+        import presidio_analyzer
+
+        batch_analyzer = presidio_analyzer.BatchAnalyzerEngine(
+            analyzer_engine=self._analyzer,
+        )
+        all_results = batch_analyzer.analyze_iterator(
+            texts, language="en", batch_size=_NLP_BATCH_SIZE,
+        )
+        return [
+            self._anonymize(text, results)
+            for text, results in zip(texts, all_results, strict=True)
+        ]
+
+    def _anonymize(self, text: str, all_results: list[Any]) -> str:
+        """Replace analyzed PII entities in *text* with placeholders.
+
+        Args:
+            text: Analyzed text.
+            all_results: Presidio recognizer results for *text*.
+
+        Returns:
+            Text with non-excluded entities replaced.
+
+        """
         results = [
             r for r in all_results
             if r.entity_type not in _EXCLUDED_ENTITY_TYPES
@@ -75,6 +135,25 @@ class _PresidioBackend:
         return str(anonymized.text)
 
 
+def _init_presidio_worker() -> None:
+    """Load warm Presidio engines in a worker process."""
+    PiiGuardrail._ensure_spacy_model()  # noqa: SLF001
+    _worker_backend["backend"] = _PresidioBackend()
+
+
+def _mask_batch_in_worker(texts: list[str]) -> list[str]:
+    """Mask a batch of texts with the worker's Presidio backend.
+
+    Args:
+        texts: Input texts to mask.
+
+    Returns:
+        Masked texts, in the same order as *texts*.
+
+    """
+    return _worker_backend["backend"].mask_batch(texts)
+
+
 class PiiGuardrail:
     """Mask PII using Microsoft Presidio.
 
@@ -82,17 +161,48 @@ class PiiGuardrail:
     ``(False, "")``. PII masking requires Presidio — if not installed,
     a runtime install is attempted; if that also fails, a clear error
     is raised.
+
+    ``mask_batch_async`` keeps masking, and the lazy Presidio load, off
+    the event loop, and analyzes a batch in one ``nlp.pipe`` pass. With
+    worker processes configured, each worker holds its own warm
+    Presidio engines; a broken pool is replaced on the next batch.
+
+    The configured ``PiiMode`` decides which texts reach Presidio: all
+    of them, only those with regex or name candidates, or none, with
+    the regex recognizers masking on their own.
     """
 
-    def __init__(self) -> None:
-        """Initialize with lazy Presidio detection."""
+    def __init__(
+        self,
+        *,
+        max_workers: int = 0,
+        config: PiiConfig | None = None,
+    ) -> None:
+        """Initialize with lazy Presidio detection.
+
+        Args:
+            max_workers: Number of worker processes for batched
+                masking. Each worker loads its own spaCy model. Zero
+                masks in-process on a worker thread.
+            config: PII masking configuration. Uses defaults if None.
+
+        """
+        self._mode = (config or PiiConfig()).mode
         self._presidio: _PresidioBackend | None = None
+        self._presidio_lock = threading.Lock()
+        self._max_workers = max_workers
+        self._executor: ProcessPoolExecutor | None = None
 
     @property
     def name(self) -> str:
         """Return the guardrail name."""
         return "pii"
 
+    @property
+    def memo_key(self) -> str:
+        """Return the memo key -- masking depends on the text and mode."""
+        return f"presidio:{self._mode}"
+
     def mask_str(self, text: str) -> str:
         """Mask PII in *text* using Presidio.
 
@@ -106,9 +216,98 @@ class PiiGuardrail:
             MissingDependencyError: If Presidio is unavailable.
 
         """
+        if self._mode is PiiMode.REGEX_ONLY:
+            return mask_pii_regex(text)
+        if not self._needs_ner(text):
+            return text
         backend = self._require_presidio()
         return backend.mask_pii(text)
 
+    async def mask_batch_async(self, texts: list[str]) -> list[str]:
+        """Mask PII in each of *texts* without blocking the event loop.
+
+        Args:
+            texts: Input texts to mask.
+
+        Returns:
+            Masked texts, in the same order as *texts*.
+
+        Raises:
+            MissingDependencyError: If Presidio is unavailable.
+
+        """
+        if self._mode is PiiMode.REGEX_ONLY:
+            return [mask_pii_regex(text) for text in texts]
+        masked = list(texts)
+        pending = [i for i, text in enumerate(texts) if self._needs_ner(text)]
+        if not pending:
+            return masked
+        results = await self._mask_with_ner([texts[i] for i in pending])
+        for i, value in zip(pending, results, strict=True):
+            masked[i] = value
+        return masked
+
+    async def _mask_with_ner(self, texts: list[str]) -> list[str]:
+        """Mask texts with Presidio on the worker pool or a thread.
+
+        Args:
+            texts: Input texts to mask.
+
+        Returns:
+            Masked texts, in the same order as *texts*.
+
+        """
+        if self._max_workers <= 0:
+            return await asyncio.to_thread(self._mask_batch_in_thread, texts)
+        executor = self._require_executor()
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(
+                executor, _mask_batch_in_worker, texts,
+            )
+        except BrokenProcessPool:
+            logger.warning("Presidio worker pool broke, restarting it")
+            if self._executor is executor:
+                executor.shutdown(wait=False)
+                self._executor = None
+            return await loop.run_in_executor(
+                self._require_executor(), _mask_batch_in_worker, texts,
+            )
+
+    def _mask_batch_in_thread(self, texts: list[str]) -> list[str]:
+        """Load Presidio if needed and mask a batch, blocking the caller.
+
+        Args:
+            texts: Input texts to mask.
+
+        Returns:
+            Masked texts, in the same order as *texts*.
+
+        """
+        return self._require_presidio().mask_batch(texts)
+
+    def _needs_ner(self, text: str) -> bool:
+        """Return whether Presidio has to analyze *text*.
+
+        Args:
+            text: Input text.
+
+        Returns:
+            True in ``ner`` mode, or if the pre-pass finds a candidate.
+
+        """
+        return self._mode is PiiMode.NER or has_pii_candidates(text)
+
+    def close(self) -> None:
+        """Shut down the worker processes.
+
+        Wait for running batches to finish. The pool is recreated if
+        the guardrail is used again.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
     def check_str(self, text: str) -> tuple[bool, str]:  # noqa: ARG002
         """Return not triggered — PII is mask-only.
 
@@ -141,22 +340,80 @@ class PiiGuardrail:
         if self._presidio is not None:
             return self._presidio
 
-        if self._try_load_presidio():
-            return self._presidio  # type: ignore[return-value]
+        # Batches masked on worker threads may race to load the engines
+        with self._presidio_lock:
+            if self._presidio is not None or self._try_load_presidio():
+                return self._presidio  # type: ignore[return-value]
 
-        logger.warning(
-            "Presidio not found. Attempting runtime install: %s",
-            INSTALL_COMMAND,
-        )
-        if self._attempt_runtime_install() and self._try_load_presidio():
-            logger.info("Presidio installed successfully at runtime")
-            return self._presidio  # type: ignore[return-value]
+            logger.warning(
+                "Presidio not found. Attempting runtime install: %s",
+                INSTALL_COMMAND,
+            )
+            if self._attempt_runtime_install() and self._try_load_presidio():
+                logger.info("Presidio installed successfully at runtime")
+                return self._presidio  # type: ignore[return-value]
 
         raise MissingDependencyError(
             package="presidio-analyzer",
             install_command=INSTALL_COMMAND,
         )
 
+    def _require_executor(self) -> ProcessPoolExecutor:
+        """Return the worker pool, installing deps if necessary.
+
+        Presidio is only imported here to verify it is installed; the
+        engines are loaded in the workers.
+
+        Returns:
+            Process pool whose workers hold Presidio engines.
+
+        Raises:
+            MissingDependencyError: If Presidio cannot be installed.
+
+        """
+        if self._executor is not None:
+            return self._executor
+
+        if not self._presidio_installed():
+            logger.warning(
+                "Presidio not found. Attempting runtime install: %s",
+                INSTALL_COMMAND,
+            )
+            if not (
+                self._attempt_runtime_install() and self._presidio_installed()
+            ):
+                raise MissingDependencyError(
+                    package="presidio-analyzer",
+                    install_command=INSTALL_COMMAND,
+                )
+
+        # Spawn so workers don't inherit the event loop's threads and locks
+        self._executor = ProcessPoolExecutor(
+            max_workers=self._max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_presidio_worker,
+        )
+        logger.info(
+            "Started %d Presidio worker processes for PII detection",
+            self._max_workers,
+        )
+        return self._executor
+
+    @staticmethod
+    def _presidio_installed() -> bool:
+        """Check whether Presidio can be imported.
+
+        Returns:
+            True if both Presidio packages are installed.
+
+        """
+        import importlib.util
+
+        return all(
+            importlib.util.find_spec(name) is not None
+            for name in ("presidio_analyzer", "presidio_anonymizer")
+        )
+
     def _try_load_presidio(self) -> bool:
         """Try to import Presidio and create the backend.
 
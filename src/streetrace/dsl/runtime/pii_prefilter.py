@@ -0,0 +1,309 @@
+"""Regex pre-pass for PII masking.
+
+Most tool outputs (code, logs, JSON) contain no PII, yet Presidio runs
+full spaCy NER over every text. Compiled recognizers for structured
+identifiers (emails, phone numbers, card numbers, IBANs, SSNs, IP
+addresses) plus a capitalized-name heuristic cheaply decide whether a
+text has PII candidates at all, so NER only runs where it can find
+something. The recognizers can also mask on their own, without NER.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+_MIN_CARD_DIGITS = 13
+"""Minimum number of digits in a payment card number."""
+
+_IBAN_MOD = 97
+"""Modulus of the IBAN check digit computation."""
+
+_LETTER_BASE = ord("A") - 10
+"""Offset mapping IBAN letters to their numeric values (A=10)."""
+
+_NAME_STOPWORDS = frozenset({
+    "Any", "Callable", "Dict", "Enum", "Error", "Exception", "False",
+    "Iterable", "Iterator", "List", "Literal", "None", "Optional", "Path",
+    "Protocol", "Self", "Set", "True", "Tuple", "Type", "Union", "Warning",
+})
+"""Capitalized words common in code that are never names."""
+
+_CODE_KEYWORDS = frozenset({
+    "as", "class", "def", "enum", "except", "extends", "from", "implements",
+    "import", "in", "interface", "is", "new", "not", "raise", "return",
+    "struct", "throw", "type",
+})
+"""Keywords that precede a capitalized identifier in code."""
+
+_KEYWORD_WINDOW = 12
+"""Characters before a capitalized word searched for a code keyword."""
+
+
+@dataclass(frozen=True)
+class PiiCandidate:
+    """A span of text that may contain PII.
+
+    Args:
+        entity_type: Presidio entity type, e.g. ``EMAIL_ADDRESS``.
+        start: Start offset in the text.
+        end: End offset in the text.
+
+    """
+
+    entity_type: str
+    start: int
+    end: int
+
+
+def _luhn_valid(match: str) -> bool:
+    """Check a card number candidate against the Luhn checksum.
+
+    Args:
+        match: Matched card number, possibly with separators.
+
+    Returns:
+        True if the digits form a valid card number.
+
+    """
+    digits = [int(char) for char in match if char.isdigit()]
+    if len(digits) < _MIN_CARD_DIGITS:
+        return False
+    total = 0
+    for position, digit in enumerate(reversed(digits)):
+        total += sum(divmod(digit * 2, 10)) if position % 2 else digit
+    return total % 10 == 0
+
+
+def _iban_valid(match: str) -> bool:
+    """Check an IBAN candidate against its mod-97 check digits.
+
+    Args:
+        match: Matched IBAN, possibly with spaces.
+
+    Returns:
+        True if the check digits are valid.
+
+    """
+    compact = match.replace(" ", "")
+    rearranged = compact[4:] + compact[:4]
+    numeric = "".join(
+        str(ord(char) - _LETTER_BASE) if char.isalpha() else char
+        for char in rearranged
+    )
+    return int(numeric) % _IBAN_MOD == 1
+
+
+_EMAIL_LOCAL = re.compile(r"[\w.+-]+\Z")
+"""Local part of an email address, matched backwards from the ``@``."""
+
+_EMAIL_DOMAIN = re.compile(r"@[\w-]+(?:\.[\w-]+)*\.[A-Za-z]{2,}\b")
+"""Domain of an email address, matched from the ``@``."""
+
+_EMAIL_LOCAL_MAX = 64
+"""Maximum length of the local part of an email address."""
+
+_IBAN = re.compile(r"[A-Z][A-Z]\d\d(?: ?[A-Z0-9]{4}){2,7}(?: ?[A-Z0-9]{1,3})?\b")
+"""IBAN; matches preceded by a letter or digit are discarded."""
+
+_NUMERIC_RUN = re.compile(r"\d[\d ().+-]{5,}\d")
+"""Run of digits and separators long enough to hold a numeric entity.
+
+Patterns starting with a single character class keep the regex
+engine's fast scan for the first character, so the text is searched
+once for all numeric recognizers, which then only run inside the short
+runs. A leading ``+`` or ``(`` is added to the run afterwards.
+"""
+
+_NUMERIC_RECOGNIZERS: list[
+    tuple[str, re.Pattern[str], Callable[[str], bool] | None]
+] = [
+    (
+        "CREDIT_CARD",
+        re.compile(r"(?<![\d-])\d(?:[ -]?\d){12,18}(?![\d-])"),
+        _luhn_valid,
+    ),
+    (
+        "US_SSN",
+        re.compile(r"(?<![\d-])(?!000|666)\d{3}-(?!00)\d{2}-(?!0000)\d{4}(?![\d-])"),
+        None,
+    ),
+    (
+        "PHONE_NUMBER",
+        re.compile(
+            r"(?<![\w+-])(?:\+\d{1,3}[ .-]?)?"
+            r"(?:\(\d{3}\) ?|\d{3}[ .-])\d{3}[ .-]\d{4}(?![\w-])",
+        ),
+        None,
+    ),
+    (
+        "IP_ADDRESS",
+        re.compile(
+            r"(?<![\d.])(?:(?:25[0-5]|2[0-4]\d|1?\d?\d)\.){3}"
+            r"(?:25[0-5]|2[0-4]\d|1?\d?\d)(?![\d.])",
+        ),
+        None,
+    ),
+]
+"""Numeric recognizers as (entity type, pattern, optional validator)."""
+
+_FULL_NAME = re.compile(
+    r"[A-Z](?<![\w.][A-Z])(?:[a-z]+|rs?\.|s\.|rof\.) +[A-Z][a-z]+\b",
+)
+"""Two consecutive capitalized words, or an honorific and a name."""
+
+_SPACED_CAPITALIZED = re.compile(r" ([A-Z][a-z]+)\b")
+"""Capitalized word after a space; the preceding word is checked."""
+
+
+def _word_start(text: str, start: int) -> bool:
+    """Return whether *start* is not preceded by a letter or digit."""
+    return start == 0 or not text[start - 1].isalnum()
+
+
+def _iter_candidates(text: str) -> Iterator[PiiCandidate]:
+    """Yield validated candidates, grouped by entity type.
+
+    Args:
+        text: Text to scan.
+
+    Yields:
+        Candidates in the order emails, IBANs, then numeric entities.
+
+    """
+    yield from _iter_emails(text)
+    for match in _IBAN.finditer(text):
+        if _word_start(text, match.start()) and _iban_valid(match.group()):
+            yield PiiCandidate("IBAN_CODE", match.start(), match.end())
+    runs: list[tuple[int, str]] = []
+    for run in _NUMERIC_RUN.finditer(text):
+        start = run.start()
+        while start > 0 and text[start - 1] in "+(":
+            start -= 1
+        runs.append((start, text[start:run.end()]))
+    for entity_type, pattern, validator in _NUMERIC_RECOGNIZERS:
+        for offset, run_text in runs:
+            for match in pattern.finditer(run_text):
+                if validator is None or validator(match.group()):
+                    yield PiiCandidate(
+                        entity_type,
+                        offset + match.start(),
+                        offset + match.end(),
+                    )
+
+
+def _iter_emails(text: str) -> Iterator[PiiCandidate]:
+    """Yield email addresses around each ``@`` in the text.
+
+    Args:
+        text: Text to scan.
+
+    Yields:
+        Email address candidates.
+
+    """
+    at = text.find("@")
+    while at != -1:
+        domain = _EMAIL_DOMAIN.match(text, at)
+        local = _EMAIL_LOCAL.search(text, max(0, at - _EMAIL_LOCAL_MAX), at)
+        if domain and local:
+            yield PiiCandidate("EMAIL_ADDRESS", local.start(), domain.end())
+        at = text.find("@", at + 1)
+
+
+def find_pii_candidates(text: str) -> list[PiiCandidate]:
+    """Find structured PII matched by the regex recognizers.
+
+    Args:
+        text: Text to scan.
+
+    Returns:
+        Validated candidates in recognizer order.
+
+    """
+    return list(_iter_candidates(text))
+
+
+def may_contain_name(text: str) -> bool:
+    """Check whether text contains something that looks like a name.
+
+    A name candidate is an honorific followed by a capitalized word,
+    two consecutive capitalized words, or a capitalized word in the
+    middle of a sentence that isn't a common code identifier or
+    follows a code keyword such as ``class``.
+
+    Args:
+        text: Text to scan.
+
+    Returns:
+        True if NER may find a person, location, or organization.
+
+    """
+    if _FULL_NAME.search(text):
+        return True
+    for match in _SPACED_CAPITALIZED.finditer(text):
+        if match.group(1) in _NAME_STOPWORDS:
+            continue
+        start = match.start()
+        window = text[max(0, start - _KEYWORD_WINDOW):start].rstrip(" ")
+        if not window or window[-1] in "\n\r\t":
+            continue
+        if window[-1] == ",":
+            return True
+        if (window[-1].isalnum() or window[-1] == "_") and (
+            window.split()[-1] not in _CODE_KEYWORDS
+        ):
+            return True
+    return False
+
+
+def has_pii_candidates(text: str) -> bool:
+    """Check whether NER is needed to mask the text.
+
+    Args:
+        text: Text to scan.
+
+    Returns:
+        True if the recognizers or the name heuristic find a candidate.
+
+    """
+    return next(_iter_candidates(text), None) is not None or may_contain_name(
+        text,
+    )
+
+
+def mask_pii_regex(text: str) -> str:
+    """Mask structured PII found by the regex recognizers.
+
+    Overlapping candidates keep the one found first, in recognizer
+    order. Names are not masked; they need NER.
+
+    Args:
+        text: Text to mask.
+
+    Returns:
+        Text with candidates replaced by placeholders such as
+        ``[MASKED_EMAIL_ADDRESS]``.
+
+    """
+    spans: list[PiiCandidate] = []
+    for candidate in find_pii_candidates(text):
+        if all(
+            candidate.end <= kept.start or candidate.start >= kept.end
+            for kept in spans
+        ):
+            spans.append(candidate)
+    if not spans:
+        return text
+    parts: list[str] = []
+    position = 0
+    for span in sorted(spans, key=lambda candidate: candidate.start):
+        parts.append(text[position:span.start])
+        parts.append(f"[MASKED_{span.entity_type}]")
+        position = span.end
+    parts.append(text[position:])
+    return "".join(parts)
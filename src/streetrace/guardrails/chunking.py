@@ -0,0 +1,56 @@
+"""Split long texts into overlapping chunks for scanning.
+
+Model-based guardrail stages only see as many tokens as the model
+accepts, so long texts are checked as a series of bounded windows. The
+windows overlap, so a detection that straddles a chunk boundary is
+still seen whole by one of the chunks.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+def iter_chunks(
+    text: str,
+    *,
+    chunk_size: int,
+    overlap: int = 0,
+) -> Iterator[str]:
+    """Yield overlapping windows of the text.
+
+    Each chunk after the first starts with the last ``overlap``
+    characters of the previous one, so any span of up to
+    ``overlap + 1`` characters lies entirely within some chunk. Texts
+    no longer than ``chunk_size`` are yielded as is.
+
+    Args:
+        text: Text to split.
+        chunk_size: Maximum chunk length in characters.
+        overlap: Characters shared by consecutive chunks.
+
+    Yields:
+        Chunks in text order.
+
+    Raises:
+        ValueError: If overlap is negative or not less than chunk_size.
+
+    """
+    if not 0 <= overlap < chunk_size:
+        msg = "overlap must be non-negative and less than chunk_size"
+        raise ValueError(msg)
+
+    if len(text) <= chunk_size:
+        yield text
+        return
+
+    step = chunk_size - overlap
+    start = 0
+    while True:
+        yield text[start : start + chunk_size]
+        if start + chunk_size >= len(text):
+            return
+        start += step
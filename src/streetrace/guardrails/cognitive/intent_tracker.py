@@ -3,16 +3,31 @@
 Baseline: cosine similarity delta between consecutive turn embeddings.
 Optional: GRU forward pass on embedding sequence when weights available.
 Risk score is the maximum of both tiers.
+
+The math runs on float32 NumPy arrays when NumPy is installed, with
+the weights converted once at construction. A pure Python path is kept
+as a fallback when NumPy is missing. Vectors carried across turns are
+stored in session state as base64-encoded float32 bytes.
 """
 
 from __future__ import annotations
 
+import base64
+import binascii
 import math
-from typing import TYPE_CHECKING
+import sys
+from array import array
+from typing import TYPE_CHECKING, Any
 
+from streetrace.dsl.runtime.errors import MissingDependencyError
+from streetrace.guardrails.inference.postprocess import load_numpy
 from streetrace.log import get_logger
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from pathlib import Path
+    from types import ModuleType
+
     from streetrace.dsl.runtime.guardrail_provider import GuardrailProvider
 
 logger = get_logger(__name__)
@@ -23,6 +38,46 @@ HIDDEN_STATE_KEY = "streetrace.cognitive_monitor.hidden_state"
 PREV_EMBEDDING_KEY = "streetrace.cognitive_monitor.prev_embedding"
 """Session state key for previous turn embedding."""
 
+GRU_WEIGHT_KEYS = (
+    "W_z", "U_z", "b_z", "W_r", "U_r", "b_r", "W_h", "U_h", "b_h",
+)
+"""Arrays required in GRU weights; biases may be 1-D or shaped [1, hidden]."""
+
+NUMPY_PACKAGE = "numpy"
+"""Package name for NumPy."""
+
+NUMPY_INSTALL_COMMAND = "pip install numpy"
+"""Install command for NumPy."""
+
+
+def load_gru_weights(path: Path) -> dict[str, Any]:
+    """Load GRU weights from a NumPy ``.npz`` archive.
+
+    Args:
+        path: Archive holding one array per key in ``GRU_WEIGHT_KEYS``.
+
+    Returns:
+        Weight arrays as float32, keyed by name.
+
+    Raises:
+        MissingDependencyError: If NumPy is not installed.
+        ValueError: If the archive lacks a required array.
+
+    """
+    np = load_numpy()
+    if np is None:
+        raise MissingDependencyError(NUMPY_PACKAGE, NUMPY_INSTALL_COMMAND)
+    with np.load(path) as archive:
+        missing = [key for key in GRU_WEIGHT_KEYS if key not in archive.files]
+        if missing:
+            msg = f"GRU weights in {path} lack arrays: {', '.join(missing)}"
+            raise ValueError(msg)
+        return {
+            key: np.asarray(archive[key], dtype=np.float32)
+            for key in GRU_WEIGHT_KEYS
+        }
+
+
 class IntentTracker:
     """Track intent drift with two-tier scoring.
 
@@ -38,17 +93,28 @@ class IntentTracker:
         self,
         *,
         provider: GuardrailProvider,
-        gru_weights: dict[str, list[list[float]]] | None = None,
+        gru_weights: Mapping[str, Any] | None = None,
     ) -> None:
         """Initialize the tracker.
 
         Args:
             provider: GuardrailProvider for session context access.
-            gru_weights: Optional GRU weight matrices.
+            gru_weights: Optional GRU weight matrices, as nested lists
+                or arrays. Matrices are shaped [hidden, input] and
+                [hidden, hidden].
 
         """
         self._provider = provider
-        self._gru_weights = gru_weights
+        self._np = load_numpy()
+        self._gru: dict[str, Any] | None = None
+        self._hidden_size = 0
+        if gru_weights is not None:
+            self._gru = (
+                _gru_arrays(self._np, gru_weights)
+                if self._np is not None
+                else _gru_lists(gru_weights)
+            )
+            self._hidden_size = len(_bias_row(gru_weights["b_z"]))
         self._turn_count = 0
 
     @property
@@ -73,25 +139,28 @@ class IntentTracker:
         self._turn_count += 1
         state = self._get_session_state()
 
-        prev_embedding = self._read_prev_embedding(state)
-        self._write_prev_embedding(state, embedding)
+        current = self._as_vector(embedding)
+        prev_embedding = self._read_vector(state, PREV_EMBEDDING_KEY)
+        state[PREV_EMBEDDING_KEY] = _pack_vector(self._np, current)
 
         if prev_embedding is None:
             logger.debug("First turn, establishing baseline")
-            if self._gru_weights is not None:
-                hidden_size = len(self._gru_weights["b_z"][0])
-                self._write_hidden_state(
-                    state, [0.0] * hidden_size,
+            if self._gru is not None:
+                state[HIDDEN_STATE_KEY] = _pack_vector(
+                    self._np, self._as_vector([0.0] * self._hidden_size),
                 )
             return 0.0
 
         # Tier 1: Baseline cosine delta
-        baseline_risk = _cosine_delta(prev_embedding, embedding)
+        if self._np is not None:
+            baseline_risk = _cosine_delta_np(self._np, prev_embedding, current)
+        else:
+            baseline_risk = _cosine_delta(prev_embedding, current)
 
         # Tier 2: Optional GRU forward pass
         gru_risk = 0.0
-        if self._gru_weights is not None:
-            gru_risk = self._gru_forward(state, embedding)
+        if self._gru is not None:
+            gru_risk = self._gru_forward(state, current)
 
         risk = max(baseline_risk, gru_risk)
         risk = max(0.0, min(1.0, risk))
@@ -105,74 +174,35 @@ class IntentTracker:
     def _gru_forward(
         self,
         state: dict[str, object],
-        embedding: list[float],
+        embedding: Any,
     ) -> float:
         """Run GRU forward pass and compute risk from hidden state.
 
         Args:
             state: Session state dict.
-            embedding: Current turn embedding.
+            embedding: Current turn embedding, as returned by
+                ``_as_vector``.
 
         Returns:
             GRU-based risk score.
 
         """
-        assert self._gru_weights is not None  # noqa: S101  # nosec B101
-        weights = self._gru_weights
-
-        h_prev = self._read_hidden_state(state)
-        hidden_size = len(weights["b_z"][0])
-
+        assert self._gru is not None  # noqa: S101  # nosec B101
+        h_prev = self._read_vector(state, HIDDEN_STATE_KEY)
         if h_prev is None:
-            h_prev = [0.0] * hidden_size
-
-        x = embedding
-
-        # Update gate: z = sigmoid(W_z @ x + U_z @ h_prev + b_z)
-        z = _sigmoid_vec(
-            _add_vec(
-                _add_vec(
-                    _mat_vec(weights["W_z"], x),
-                    _mat_vec(weights["U_z"], h_prev),
-                ),
-                weights["b_z"][0],
-            ),
-        )
+            h_prev = self._as_vector([0.0] * self._hidden_size)
 
-        # Reset gate: r = sigmoid(W_r @ x + U_r @ h_prev + b_r)
-        r = _sigmoid_vec(
-            _add_vec(
-                _add_vec(
-                    _mat_vec(weights["W_r"], x),
-                    _mat_vec(weights["U_r"], h_prev),
-                ),
-                weights["b_r"][0],
-            ),
-        )
-
-        # Candidate hidden state
-        r_h = _elem_mul(r, h_prev)
-        h_tilde = _tanh_vec(
-            _add_vec(
-                _add_vec(
-                    _mat_vec(weights["W_h"], x),
-                    _mat_vec(weights["U_h"], r_h),
-                ),
-                weights["b_h"][0],
-            ),
-        )
+        if self._np is not None:
+            h_new = _gru_step_np(self._np, self._gru, embedding, h_prev)
+            delta = float(self._np.linalg.norm(h_new - h_prev))
+        else:
+            h_new = _gru_step(self._gru, embedding, h_prev)
+            delta = _l2_norm(_sub_vec(h_new, h_prev))
 
-        # New hidden state: h = (1 - z) * h_prev + z * h_tilde
-        h_new = _add_vec(
-            _elem_mul(_sub_from_one(z), h_prev),
-            _elem_mul(z, h_tilde),
-        )
-
-        self._write_hidden_state(state, h_new)
+        state[HIDDEN_STATE_KEY] = _pack_vector(self._np, h_new)
 
         # Risk from hidden state magnitude change
-        delta = _l2_norm(_sub_vec(h_new, h_prev))
-        max_delta = math.sqrt(float(hidden_size)) * 2.0
+        max_delta = math.sqrt(float(self._hidden_size)) * 2.0
         return min(1.0, delta / max_delta) if max_delta > 0 else 0.0
 
     def _get_session_state(self) -> dict[str, object]:
@@ -187,67 +217,183 @@ class IntentTracker:
             return {}
         return state
 
-    def _read_prev_embedding(
-        self, state: dict[str, object],
-    ) -> list[float] | None:
-        """Read previous embedding from session state.
+    def _as_vector(self, values: list[float]) -> Any:
+        """Convert values to the vector type of the active math path.
 
         Args:
-            state: Session state dict.
+            values: Vector elements.
 
         Returns:
-            Previous embedding or None.
+            A float32 array with NumPy, else a list of floats.
 
         """
-        raw = state.get(PREV_EMBEDDING_KEY)
-        if isinstance(raw, list):
-            return [float(v) for v in raw]
-        return None
-
-    @staticmethod
-    def _write_prev_embedding(
-        state: dict[str, object],
-        embedding: list[float],
-    ) -> None:
-        """Write embedding to session state.
-
-        Args:
-            state: Session state dict.
-            embedding: Embedding vector to store.
+        if self._np is not None:
+            return self._np.asarray(values, dtype=self._np.float32)
+        return [float(v) for v in values]
 
-        """
-        state[PREV_EMBEDDING_KEY] = embedding
+    def _read_vector(self, state: dict[str, object], key: str) -> Any:
+        """Read a vector stored under *key* in session state.
 
-    def _read_hidden_state(
-        self, state: dict[str, object],
-    ) -> list[float] | None:
-        """Read GRU hidden state from session state.
+        Lists written by earlier versions are still accepted.
 
         Args:
             state: Session state dict.
+            key: Session state key.
 
         Returns:
-            Hidden state vector or None.
+            The vector as returned by ``_as_vector``, or None.
 
         """
-        raw = state.get(HIDDEN_STATE_KEY)
+        raw = state.get(key)
         if isinstance(raw, list):
-            return [float(v) for v in raw]
-        return None
+            return self._as_vector(raw)
+        if not isinstance(raw, str):
+            return None
+        try:
+            packed = base64.b64decode(raw, validate=True)
+        except (binascii.Error, ValueError):
+            logger.warning("Ignoring malformed vector in session state: %s", key)
+            return None
+        if self._np is not None:
+            return self._np.frombuffer(packed, dtype="<f4")
+        values = array("f")
+        values.frombytes(packed)
+        if sys.byteorder == "big":
+            values.byteswap()
+        return values.tolist()
+
+
+def _pack_vector(np: ModuleType | None, vector: Any) -> str:
+    """Encode a vector as base64 little-endian float32 bytes.
 
-    @staticmethod
-    def _write_hidden_state(
-        state: dict[str, object],
-        hidden: list[float],
-    ) -> None:
-        """Write GRU hidden state to session state.
+    Args:
+        np: NumPy module, or None on the pure Python path.
+        vector: Vector as returned by ``IntentTracker._as_vector``.
 
-        Args:
-            state: Session state dict.
-            hidden: Hidden state vector to store.
+    Returns:
+        JSON-safe string for session state.
 
-        """
-        state[HIDDEN_STATE_KEY] = hidden
+    """
+    if np is not None:
+        packed = np.asarray(vector, dtype="<f4").tobytes()
+    else:
+        values = array("f", vector)
+        if sys.byteorder == "big":
+            values.byteswap()
+        packed = values.tobytes()
+    return base64.b64encode(packed).decode("ascii")
+
+
+def _bias_row(bias: Any) -> Any:
+    """Return a bias vector given as [hidden] or [1, hidden].
+
+    Args:
+        bias: Bias vector or single-row matrix.
+
+    Returns:
+        The bias as a flat sequence.
+
+    """
+    first = bias[0]
+    return first if hasattr(first, "__len__") else bias
+
+
+def _gru_lists(weights: Mapping[str, Any]) -> dict[str, Any]:
+    """Copy GRU weights into float lists for the pure Python path.
+
+    Args:
+        weights: Weight matrices as nested lists or arrays.
+
+    Returns:
+        Matrices as lists of rows and biases as flat lists.
+
+    """
+    gru: dict[str, Any] = {}
+    for key in GRU_WEIGHT_KEYS:
+        if key.startswith("b_"):
+            gru[key] = [float(v) for v in _bias_row(weights[key])]
+        else:
+            gru[key] = [[float(v) for v in row] for row in weights[key]]
+    return gru
+
+
+def _gru_arrays(np: ModuleType, weights: Mapping[str, Any]) -> dict[str, Any]:
+    """Convert GRU weights to float32 arrays with stacked gates.
+
+    The update and reset gates share their inputs, so their matrices
+    are stacked and both gates are computed with one product each.
+
+    Args:
+        np: NumPy module.
+        weights: Weight matrices as nested lists or arrays.
+
+    Returns:
+        Arrays keyed ``W_zr``, ``U_zr``, ``b_zr``, ``W_h``, ``U_h``,
+        and ``b_h``.
+
+    """
+
+    def matrix(key: str) -> Any:
+        return np.asarray(weights[key], dtype=np.float32)
+
+    def bias(key: str) -> Any:
+        return np.asarray(weights[key], dtype=np.float32).reshape(-1)
+
+    return {
+        "W_zr": np.vstack([matrix("W_z"), matrix("W_r")]),
+        "U_zr": np.vstack([matrix("U_z"), matrix("U_r")]),
+        "b_zr": np.concatenate([bias("b_z"), bias("b_r")]),
+        "W_h": matrix("W_h"),
+        "U_h": matrix("U_h"),
+        "b_h": bias("b_h"),
+    }
+
+
+def _gru_step_np(
+    np: ModuleType, gru: dict[str, Any], x: Any, h_prev: Any,
+) -> Any:
+    """Compute the next GRU hidden state with NumPy.
+
+    Args:
+        np: NumPy module.
+        gru: Arrays from ``_gru_arrays``.
+        x: Current input as a float32 array.
+        h_prev: Previous hidden state as a float32 array.
+
+    Returns:
+        New hidden state as a float32 array.
+
+    """
+    hidden_size = h_prev.shape[0]
+    # sigmoid(v) == (1 + tanh(v / 2)) / 2, without overflow in exp
+    gates = 0.5 + 0.5 * np.tanh(
+        0.5 * (gru["W_zr"] @ x + gru["U_zr"] @ h_prev + gru["b_zr"]),
+    )
+    z = gates[:hidden_size]
+    r = gates[hidden_size:]
+    h_tilde = np.tanh(gru["W_h"] @ x + gru["U_h"] @ (r * h_prev) + gru["b_h"])
+    return (1.0 - z) * h_prev + z * h_tilde
+
+
+def _cosine_delta_np(np: ModuleType, a: Any, b: Any) -> float:
+    """Compute cosine delta of two float32 arrays.
+
+    Args:
+        np: NumPy module.
+        a: First vector.
+        b: Second vector.
+
+    Returns:
+        Cosine delta score, see ``_cosine_delta``.
+
+    """
+    if a.shape != b.shape:
+        msg = f"Embedding size changed from {a.shape[0]} to {b.shape[0]}"
+        raise ValueError(msg)
+    norms = float(np.linalg.norm(a)) * float(np.linalg.norm(b))
+    if norms == 0.0:
+        return 0.0
+    return (1.0 - float(a @ b) / norms) / 2.0
 
 
 # ---------------------------------------------------------------------------
@@ -255,6 +401,52 @@ class IntentTracker:
 # ---------------------------------------------------------------------------
 
 
+def _gru_step(
+    gru: dict[str, Any], x: list[float], h_prev: list[float],
+) -> list[float]:
+    """Compute the next GRU hidden state in pure Python.
+
+    Args:
+        gru: Lists from ``_gru_lists``.
+        x: Current input.
+        h_prev: Previous hidden state.
+
+    Returns:
+        New hidden state.
+
+    """
+    # Update gate: z = sigmoid(W_z @ x + U_z @ h_prev + b_z)
+    z = _sigmoid_vec(
+        _add_vec(
+            _add_vec(_mat_vec(gru["W_z"], x), _mat_vec(gru["U_z"], h_prev)),
+            gru["b_z"],
+        ),
+    )
+
+    # Reset gate: r = sigmoid(W_r @ x + U_r @ h_prev + b_r)
+    r = _sigmoid_vec(
+        _add_vec(
+            _add_vec(_mat_vec(gru["W_r"], x), _mat_vec(gru["U_r"], h_prev)),
+            gru["b_r"],
+        ),
+    )
+
+    # Candidate hidden state
+    r_h = _elem_mul(r, h_prev)
+    h_tilde = _tanh_vec(
+        _add_vec(
+            _add_vec(_mat_vec(gru["W_h"], x), _mat_vec(gru["U_h"], r_h)),
+            gru["b_h"],
+        ),
+    )
+
+    # New hidden state: h = (1 - z) * h_prev + z * h_tilde
+    return _add_vec(
+        _elem_mul(_sub_from_one(z), h_prev),
+        _elem_mul(z, h_tilde),
+    )
+
+
 def _cosine_delta(a: list[float], b: list[float]) -> float:
     """Compute cosine delta: (1 - cosine_similarity) / 2.
 
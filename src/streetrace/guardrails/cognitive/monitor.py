@@ -8,7 +8,8 @@ intent drift detection.
 from __future__ import annotations
 
 import hashlib
-from typing import TYPE_CHECKING
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 from opentelemetry import trace
 
@@ -16,7 +17,10 @@ from streetrace.guardrails.cognitive.drift_detector import (
     DriftDetector,
     DriftResult,
 )
-from streetrace.guardrails.cognitive.intent_tracker import IntentTracker
+from streetrace.guardrails.cognitive.intent_tracker import (
+    IntentTracker,
+    load_gru_weights,
+)
 from streetrace.guardrails.cognitive.mttr_calculator import MttrCalculator
 from streetrace.guardrails.cognitive.sequence_anomaly import (
     SequenceAnomalyDetector,
@@ -28,6 +32,8 @@ from streetrace.guardrails.types import GuardrailAction
 from streetrace.log import get_logger
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from streetrace.dsl.runtime.guardrail_provider import GuardrailProvider
     from streetrace.guardrails.inference.pipeline import InferencePipeline
 
@@ -66,7 +72,7 @@ class CognitiveMonitor:
         provider: GuardrailProvider,
         inference_pipeline: InferencePipeline | None = None,
         config: CognitiveMonitorConfig | None = None,
-        gru_weights: dict[str, list[list[float]]] | None = None,
+        gru_weights: Mapping[str, Any] | None = None,
         sequence_patterns: list[SequencePattern] | None = None,
     ) -> None:
         """Initialize the cognitive monitor.
@@ -76,12 +82,15 @@ class CognitiveMonitor:
             inference_pipeline: ONNX inference facade, or None for
                 fallback text-hash embeddings.
             config: Monitor configuration. Uses defaults if None.
-            gru_weights: Optional GRU weight matrices.
+            gru_weights: Optional GRU weight matrices. Loaded from
+                ``config.gru_weights_path`` when None and set.
             sequence_patterns: Suspicious sequence patterns.
 
         """
         self._provider = provider
         self._config = config or CognitiveMonitorConfig()
+        if gru_weights is None and self._config.gru_weights_path:
+            gru_weights = load_gru_weights(Path(self._config.gru_weights_path))
         self._embedder = TurnEmbedder(
             inference_pipeline=inference_pipeline,
         )
@@ -3,17 +3,28 @@
 Detect suspicious sequences of tool calls that individually appear
 benign but collectively suggest adversarial intent (e.g., data
 exfiltration: read_file -> encode -> send_email).
+
+All patterns are compiled into one automaton over tool names. Each
+tool name is resolved once to the pattern steps it can satisfy (exact
+names through a hash map, globs through precompiled regexes), and each
+call only advances the partial matches waiting on those steps, so the
+per-call cost doesn't grow with the number of loaded patterns.
 """
 
 from __future__ import annotations
 
 import fnmatch
+import re
+from collections import deque
 from dataclasses import dataclass, field
 
 from streetrace.log import get_logger
 
 logger = get_logger(__name__)
 
+_MAX_CACHED_TOOLS = 4096
+"""Distinct tool names whose matching steps are cached."""
+
 
 @dataclass(frozen=True)
 class SequencePattern:
@@ -23,11 +34,46 @@ class SequencePattern:
         name: Pattern identifier (e.g., 'data_exfiltration').
         sequence: Ordered list of tool names. Supports '*' wildcard
             and glob patterns like 'encode_*'.
+        within: Maximum number of calls a match may span, counting
+            the matched calls, so other calls can occur between the
+            steps. None requires the steps to be consecutive.
 
     """
 
     name: str
     sequence: list[str]
+    within: int | None = None
+
+    def __post_init__(self) -> None:
+        """Validate the sequence and window."""
+        if not self.sequence:
+            msg = f"Sequence pattern '{self.name}' has no steps"
+            raise ValueError(msg)
+        if self.within is not None and self.within < len(self.sequence):
+            msg = (
+                f"Sequence pattern '{self.name}' must span at least "
+                f"{len(self.sequence)} calls, got within={self.within}"
+            )
+            raise ValueError(msg)
+
+    @property
+    def window(self) -> int:
+        """Return the maximum number of calls a match may span."""
+        return self.within if self.within is not None else len(self.sequence)
+
+
+@dataclass(frozen=True)
+class SequenceMatch:
+    """A pattern matched by the latest tool call.
+
+    Attributes:
+        pattern_name: Name of the matched pattern.
+        sequence: The tool calls that matched the pattern steps.
+
+    """
+
+    pattern_name: str
+    sequence: list[str]
 
 
 @dataclass(frozen=True)
@@ -36,24 +82,56 @@ class SequenceResult:
 
     Attributes:
         detected: Whether a suspicious sequence was found.
-        pattern_name: Name of the matched pattern, empty if none.
-        sequence: The tool call sequence that matched.
+        pattern_name: Name of the first matched pattern, empty if none.
+        sequence: The tool call sequence that matched it.
+        matches: Every pattern matched by the call, in pattern order.
 
     """
 
     detected: bool
     pattern_name: str = ""
     sequence: list[str] = field(default_factory=list)
+    matches: list[SequenceMatch] = field(default_factory=list)
 
 
 _NO_MATCH = SequenceResult(detected=False)
 
 
+@dataclass(frozen=True)
+class _Step:
+    """Position of one element in a compiled pattern.
+
+    Attributes:
+        pattern: Index of the pattern.
+        index: Index of the element in the pattern's sequence.
+
+    """
+
+    pattern: int
+    index: int
+
+
+@dataclass(frozen=True)
+class _Partial:
+    """A matched prefix of a pattern.
+
+    Attributes:
+        start: Position of the call matching the first step.
+        positions: Positions of the calls matching each step so far.
+
+    """
+
+    start: int
+    positions: tuple[int, ...]
+
+
 class SequenceAnomalyDetector:
     """Detect suspicious tool-use sequences.
 
-    Maintain a sliding window of recent tool calls and check
-    against configured suspicious patterns.
+    For each pattern and prefix length, keep the matched prefix with
+    the latest start. Any continuation of an older prefix also
+    continues the later one within the pattern's window, so one
+    partial match per prefix is enough to find every match.
     """
 
     def __init__(
@@ -66,11 +144,30 @@ class SequenceAnomalyDetector:
 
         """
         self._patterns = patterns
-        self._history: list[str] = []
-        # Maximum sequence length to track
-        self._max_window = max(
-            (len(p.sequence) for p in patterns), default=0,
+        self._windows = [pattern.window for pattern in patterns]
+        self._exact: dict[str, list[_Step]] = {}
+        self._any: list[_Step] = []
+        globs: dict[str, list[_Step]] = {}
+        for pattern_index, pattern in enumerate(patterns):
+            for step_index, element in enumerate(pattern.sequence):
+                step = _Step(pattern_index, step_index)
+                if element == "*":
+                    self._any.append(step)
+                elif "*" in element or "?" in element:
+                    globs.setdefault(element, []).append(step)
+                else:
+                    self._exact.setdefault(element, []).append(step)
+        self._globs: list[tuple[re.Pattern[str], list[_Step]]] = [
+            (re.compile(fnmatch.translate(glob)), steps)
+            for glob, steps in globs.items()
+        ]
+        self._steps_by_tool: dict[str, tuple[_Step, ...]] = {}
+        self._partials: dict[tuple[int, int], _Partial] = {}
+        # Calls kept to report matched sequences
+        self._history: deque[str] = deque(
+            maxlen=max(self._windows, default=0),
         )
+        self._position = -1
 
     def record_tool_call(self, tool_name: str) -> SequenceResult:
         """Record a tool call and check for suspicious sequences.
@@ -79,71 +176,107 @@ class SequenceAnomalyDetector:
             tool_name: Name of the tool that was called.
 
         Returns:
-            SequenceResult indicating whether a pattern was matched.
+            SequenceResult with every pattern completed by this call.
 
         """
+        self._position += 1
+        now = self._position
         self._history.append(tool_name)
 
-        # Trim history to max window size
-        if self._max_window > 0 and len(self._history) > self._max_window:
-            self._history = self._history[-self._max_window:]
-
-        for pattern in self._patterns:
-            if self._matches_pattern(pattern):
-                logger.warning(
-                    "Suspicious sequence detected: %s", pattern.name,
-                )
-                seq_len = len(pattern.sequence)
-                matched_seq = self._history[-seq_len:]
-                return SequenceResult(
-                    detected=True,
-                    pattern_name=pattern.name,
-                    sequence=list(matched_seq),
-                )
-
-        return _NO_MATCH
+        completed: list[tuple[int, _Partial]] = []
+        for step in self._steps_for(tool_name):
+            partial = self._advance(step, now)
+            if partial is None:
+                continue
+            if step.index == len(self._patterns[step.pattern].sequence) - 1:
+                completed.append((step.pattern, partial))
+                continue
+            key = (step.pattern, step.index + 1)
+            current = self._partials.get(key)
+            if current is None or current.start <= partial.start:
+                self._partials[key] = partial
+
+        if not completed:
+            return _NO_MATCH
+
+        matches: list[SequenceMatch] = []
+        for pattern_index, partial in sorted(completed, key=lambda c: c[0]):
+            name = self._patterns[pattern_index].name
+            logger.warning("Suspicious sequence detected: %s", name)
+            matches.append(SequenceMatch(
+                pattern_name=name,
+                sequence=self._calls_at(partial.positions),
+            ))
+        return SequenceResult(
+            detected=True,
+            pattern_name=matches[0].pattern_name,
+            sequence=list(matches[0].sequence),
+            matches=matches,
+        )
 
     def reset(self) -> None:
         """Clear tool call history."""
+        self._partials.clear()
         self._history.clear()
+        self._position = -1
 
-    def _matches_pattern(self, pattern: SequencePattern) -> bool:
-        """Check if recent history matches a pattern.
+    def _advance(self, step: _Step, now: int) -> _Partial | None:
+        """Extend the prefix ending before *step* with the current call.
 
         Args:
-            pattern: Pattern to check against.
+            step: Pattern step satisfied by the current call.
+            now: Position of the current call.
 
         Returns:
-            True if the pattern matches the tail of history.
+            The prefix including *step*, or None if no prefix within
+            the pattern's window is waiting for it.
 
         """
-        seq = pattern.sequence
-        if len(self._history) < len(seq):
-            return False
-
-        tail = self._history[-len(seq):]
-        return all(
-            _tool_matches(actual, expected)
-            for actual, expected in zip(tail, seq, strict=True)
+        if step.index == 0:
+            return _Partial(start=now, positions=(now,))
+        prefix = self._partials.get((step.pattern, step.index))
+        if prefix is None or now - prefix.start >= self._windows[step.pattern]:
+            return None
+        return _Partial(
+            start=prefix.start, positions=(*prefix.positions, now),
         )
 
+    def _steps_for(self, tool_name: str) -> tuple[_Step, ...]:
+        """Return the pattern steps a tool name satisfies.
 
-def _tool_matches(actual: str, pattern: str) -> bool:
-    """Check if a tool name matches a pattern element.
+        Steps are ordered by descending step index, so a single call
+        never satisfies two steps of the same match. Results are
+        cached per tool name.
 
-    Supports exact match, '*' wildcard (any tool), and glob
-    patterns like 'encode_*'.
+        Args:
+            tool_name: Name of the tool that was called.
 
-    Args:
-        actual: Actual tool name.
-        pattern: Pattern element from sequence definition.
+        Returns:
+            Steps matched by the tool name.
 
-    Returns:
-        True if actual matches pattern.
+        """
+        steps = self._steps_by_tool.get(tool_name)
+        if steps is not None:
+            return steps
+        matched = [*self._exact.get(tool_name, ()), *self._any]
+        for regex, glob_steps in self._globs:
+            if regex.match(tool_name):
+                matched.extend(glob_steps)
+        steps = tuple(sorted(matched, key=lambda step: -step.index))
+        if len(self._steps_by_tool) >= _MAX_CACHED_TOOLS:
+            del self._steps_by_tool[next(iter(self._steps_by_tool))]
+        self._steps_by_tool[tool_name] = steps
+        return steps
+
+    def _calls_at(self, positions: tuple[int, ...]) -> list[str]:
+        """Return the recorded calls at the given positions.
 
-    """
-    if pattern == "*":
-        return True
-    if "*" in pattern or "?" in pattern:
-        return fnmatch.fnmatch(actual, pattern)
-    return actual == pattern
+        Args:
+            positions: Call positions within the history window.
+
+        Returns:
+            Tool names of those calls.
+
+        """
+        offset = self._position + 1 - len(self._history)
+        return [self._history[position - offset] for position in positions]
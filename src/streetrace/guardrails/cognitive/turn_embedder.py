@@ -1,12 +1,12 @@
 """Turn embedder for generating per-turn MiniLM embeddings.
 
 Generate fixed-size embedding vectors per conversation turn via
-the shared InferencePipeline, with content-hash-based caching.
+the shared InferencePipeline. Caching is left to the pipeline's
+bounded EmbeddingCache, so turn embeddings are stored only once.
 """
 
 from __future__ import annotations
 
-import hashlib
 from typing import TYPE_CHECKING
 
 from streetrace.dsl.runtime.errors import MissingDependencyError
@@ -28,10 +28,11 @@ ONNX_INSTALL_COMMAND = "pip install onnxruntime"
 
 
 class TurnEmbedder:
-    """Generate per-turn embeddings with content-hash caching.
+    """Generate per-turn embeddings via the shared InferencePipeline.
 
-    Use the shared InferencePipeline for MiniLM inference. Cache
-    results keyed by SHA-256 text hash to avoid re-computation.
+    Use the shared InferencePipeline for MiniLM inference. Results
+    are cached by the pipeline's LRU EmbeddingCache, which bounds
+    memory and reports hit rate and size through its metrics.
     """
 
     def __init__(
@@ -46,13 +47,12 @@ class TurnEmbedder:
 
         """
         self._pipeline = inference_pipeline
-        self._cache: dict[str, list[float]] = {}
 
     async def embed(self, text: str) -> list[float]:
         """Generate an embedding for the given text.
 
-        Check the local cache first. On miss, delegate to the
-        InferencePipeline.
+        Delegate to the InferencePipeline, which serves repeated
+        texts from its cache.
 
         Args:
             text: Turn text to embed.
@@ -69,23 +69,12 @@ class TurnEmbedder:
                 ONNX_PACKAGE, ONNX_INSTALL_COMMAND,
             )
 
-        cache_key = self._hash_text(text)
-        cached = self._cache.get(cache_key)
-        if cached is not None:
-            logger.debug("Cache hit for turn embedding")
-            return cached
-
-        embedding = await self._pipeline.get_embedding(
-            EMBEDDING_MODEL_ID, text,
-        )
-        self._cache[cache_key] = embedding
-        logger.debug("Generated and cached turn embedding")
-        return embedding
+        return await self._pipeline.get_embedding(EMBEDDING_MODEL_ID, text)
 
     def embed_sync(self, text: str) -> list[float] | None:
         """Return a cached embedding synchronously, or None.
 
-        Check the local cache only. If no cached embedding exists,
+        Check the pipeline's cache only. If no cached embedding exists,
         return None so the caller can fall back to a hash-based
         pseudo-embedding. The async ``embed`` method populates
         the cache.
@@ -100,18 +89,4 @@ class TurnEmbedder:
         if self._pipeline is None:
             return None
 
-        cache_key = self._hash_text(text)
-        return self._cache.get(cache_key)
-
-    @staticmethod
-    def _hash_text(text: str) -> str:
-        """Compute SHA-256 hash of text for cache keying.
-
-        Args:
-            text: Text to hash.
-
-        Returns:
-            Hex digest string.
-
-        """
-        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return self._pipeline.get_cached_embedding(EMBEDDING_MODEL_ID, text)
@@ -1,11 +1,13 @@
 """Configuration models for enterprise guardrails.
 
-Pydantic models for Prompt Proxy, MCP-Guard, and Cognitive Monitor
-configuration with threshold validation.
+Pydantic models for Prompt Proxy, MCP-Guard, Cognitive Monitor, and
+PII masking configuration with threshold validation.
 """
 
 from __future__ import annotations
 
+from enum import StrEnum
+
 from pydantic import BaseModel, model_validator
 
 
@@ -16,12 +18,32 @@ class PromptProxyConfig(BaseModel):
         enabled: Whether the prompt proxy is active.
         warn_threshold: Semantic similarity score that triggers a warning.
         block_threshold: Semantic similarity score that triggers a block.
+        reference_patterns_path: File with reference injection phrases
+            for the semantic stage, one per line. Uses the bundled
+            patterns if None.
+        latency_budget_ms: Time allowed for the model-based stages of
+            one async check. Stages still running when it runs out are
+            cancelled and the check falls back to the Stage 1 result.
+        chunk_size: Characters per chunk given to the model-based
+            stages. Longer texts are split into overlapping chunks.
+        chunk_overlap: Characters shared by consecutive chunks.
+        max_scan_chars: Maximum characters the model-based stages scan
+            per check, counting overlaps. Text past the budget is only
+            checked by Stage 1. None scans the whole text.
+        syntactic_max_scan_chars: Maximum characters Stage 1 scans per
+            check, counting overlaps. None scans the whole text.
 
     """
 
     enabled: bool = True
     warn_threshold: float = 0.60
     block_threshold: float = 0.85
+    reference_patterns_path: str | None = None
+    latency_budget_ms: float = 200.0
+    chunk_size: int = 2048
+    chunk_overlap: int = 256
+    max_scan_chars: int | None = 65536
+    syntactic_max_scan_chars: int | None = None
 
     @model_validator(mode="after")
     def _validate_thresholds(self) -> PromptProxyConfig:
@@ -35,6 +57,46 @@ class PromptProxyConfig(BaseModel):
         if self.warn_threshold >= self.block_threshold:
             msg = "warn_threshold must be less than block_threshold"
             raise ValueError(msg)
+        if self.latency_budget_ms <= 0.0:
+            msg = "latency_budget_ms must be positive"
+            raise ValueError(msg)
+        if not 0 <= self.chunk_overlap < self.chunk_size:
+            msg = "chunk_overlap must be non-negative and less than chunk_size"
+            raise ValueError(msg)
+        if self.max_scan_chars is not None and self.max_scan_chars <= 0:
+            msg = "max_scan_chars must be positive"
+            raise ValueError(msg)
+        if (
+            self.syntactic_max_scan_chars is not None
+            and self.syntactic_max_scan_chars <= 0
+        ):
+            msg = "syntactic_max_scan_chars must be positive"
+            raise ValueError(msg)
+        return self
+
+
+class RateLimitConfig(BaseModel):
+    """Configure a token bucket rate limit.
+
+    Attributes:
+        calls_per_minute: Sustained call rate the bucket refills at.
+        burst: Calls allowed back to back before the sustained rate
+            applies, i.e. the bucket capacity.
+
+    """
+
+    calls_per_minute: float = 60.0
+    burst: int = 100
+
+    @model_validator(mode="after")
+    def _validate_limits(self) -> RateLimitConfig:
+        """Ensure the rate and burst are positive."""
+        if self.calls_per_minute <= 0.0:
+            msg = "calls_per_minute must be positive"
+            raise ValueError(msg)
+        if self.burst < 1:
+            msg = "burst must be at least 1"
+            raise ValueError(msg)
         return self
 
 
@@ -46,6 +108,22 @@ class McpGuardConfig(BaseModel):
         trust_threshold: Minimum trust score for tool servers.
         server_allowlist: Servers always allowed (bypass checks).
         server_denylist: Servers always denied.
+        tool_rate_limit: Rate limit per tool of each server, or None
+            to disable it.
+        server_rate_limit: Aggregate rate limit over all tools of a
+            server, or None to disable it.
+        neural_block_threshold: Neural inspector anomaly score that
+            triggers a block.
+        neural_deadline_ms: Time an async check waits for the neural
+            inspector. Past it the check falls back to the syntactic
+            result, and the verdict is cached for later calls once
+            inference finishes.
+        neural_max_inflight: Maximum neural inspections left running
+            past their deadline. Calls beyond it skip the neural stage
+            until earlier inspections finish.
+        max_scan_chars: Maximum characters of a tool call the syntactic
+            gatekeeper and the data boundary check scan, counting
+            overlaps. None scans the whole call.
 
     """
 
@@ -53,6 +131,29 @@ class McpGuardConfig(BaseModel):
     trust_threshold: float = 0.5
     server_allowlist: list[str] = []
     server_denylist: list[str] = []
+    tool_rate_limit: RateLimitConfig | None = RateLimitConfig()
+    server_rate_limit: RateLimitConfig | None = None
+    neural_block_threshold: float = 0.80
+    neural_deadline_ms: float = 50.0
+    neural_max_inflight: int = 32
+    max_scan_chars: int | None = None
+
+    @model_validator(mode="after")
+    def _validate_neural(self) -> McpGuardConfig:
+        """Ensure the neural settings and the scan budget are in range."""
+        if not 0.0 < self.neural_block_threshold <= 1.0:
+            msg = "neural_block_threshold must be in (0.0, 1.0]"
+            raise ValueError(msg)
+        if self.neural_deadline_ms <= 0.0:
+            msg = "neural_deadline_ms must be positive"
+            raise ValueError(msg)
+        if self.neural_max_inflight <= 0:
+            msg = "neural_max_inflight must be positive"
+            raise ValueError(msg)
+        if self.max_scan_chars is not None and self.max_scan_chars <= 0:
+            msg = "max_scan_chars must be positive"
+            raise ValueError(msg)
+        return self
 
 
 class CognitiveMonitorConfig(BaseModel):
@@ -63,6 +164,8 @@ class CognitiveMonitorConfig(BaseModel):
         warn_threshold: Risk score that triggers a warning.
         block_threshold: Risk score that triggers a block.
         min_turns_before_alert: Minimum conversation turns before alerting.
+        gru_weights_path: NumPy ``.npz`` archive with GRU weights for
+            the intent tracker, or None for cosine delta scoring only.
 
     """
 
@@ -70,6 +173,7 @@ class CognitiveMonitorConfig(BaseModel):
     warn_threshold: float = 0.60
     block_threshold: float = 0.85
     min_turns_before_alert: int = 3
+    gru_weights_path: str | None = None
 
     @model_validator(mode="after")
     def _validate_thresholds(self) -> CognitiveMonitorConfig:
@@ -89,12 +193,75 @@ class CognitiveMonitorConfig(BaseModel):
         return self
 
 
+class PiiMode(StrEnum):
+    """How PII masking decides which texts Presidio analyzes."""
+
+    REGEX_ONLY = "regex-only"
+    PREFILTER_NER = "prefilter+ner"
+    NER = "ner"
+
+
+class PiiConfig(BaseModel):
+    """Configure PII masking.
+
+    Attributes:
+        mode: ``ner`` runs Presidio on every text. ``prefilter+ner``
+            runs Presidio only on texts where the regex recognizers or
+            the name heuristic find a PII candidate; it is faster but
+            can miss names and entity types the pre-pass doesn't
+            recognize. ``regex-only`` masks only what the regex
+            recognizers find and never loads Presidio.
+
+    """
+
+    mode: PiiMode = PiiMode.NER
+
+
+class InferenceConfig(BaseModel):
+    """Configure the shared ONNX inference pipeline.
+
+    Attributes:
+        embedding_cache_entries: Maximum embeddings kept in memory.
+        embedding_cache_ttl_seconds: Time-to-live of in-memory
+            embeddings.
+        embedding_store_path: SQLite file that persists embeddings
+            across runs and shares them between processes. None keeps
+            embeddings in memory only.
+        embedding_store_max_bytes: Maximum total size of the vectors
+            in the store. Least recently used entries are evicted past
+            it.
+
+    """
+
+    embedding_cache_entries: int = 10_000
+    embedding_cache_ttl_seconds: float = 3600.0
+    embedding_store_path: str | None = None
+    embedding_store_max_bytes: int = 256 * 1024 * 1024
+
+    @model_validator(mode="after")
+    def _validate_sizes(self) -> InferenceConfig:
+        """Ensure the cache and store limits are positive."""
+        if self.embedding_cache_entries <= 0:
+            msg = "embedding_cache_entries must be positive"
+            raise ValueError(msg)
+        if self.embedding_cache_ttl_seconds <= 0.0:
+            msg = "embedding_cache_ttl_seconds must be positive"
+            raise ValueError(msg)
+        if self.embedding_store_max_bytes <= 0:
+            msg = "embedding_store_max_bytes must be positive"
+            raise ValueError(msg)
+        return self
+
+
 class GuardrailsConfig(BaseModel):
     """Top-level guardrails configuration.
 
-    Compose sub-configs for all three proxy layers.
+    Compose sub-configs for all three proxy layers, PII masking and
+    the inference pipeline they share.
     """
 
     prompt_proxy: PromptProxyConfig = PromptProxyConfig()
     mcp_guard: McpGuardConfig = McpGuardConfig()
     cognitive_monitor: CognitiveMonitorConfig = CognitiveMonitorConfig()
+    pii: PiiConfig = PiiConfig()
+    inference: InferenceConfig = InferenceConfig()
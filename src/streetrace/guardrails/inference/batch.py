@@ -17,6 +17,10 @@ from streetrace.log import get_logger
 if TYPE_CHECKING:
     from collections.abc import Awaitable, Callable
 
+    from streetrace.guardrails.inference.tokenizer_manager import (
+        TokenizerOutput,
+    )
+
 logger = get_logger(__name__)
 
 DEFAULT_MAX_BATCH_SIZE = 8
@@ -31,7 +35,7 @@ class _PendingRequest:
     """A pending inference request awaiting batching."""
 
     model_id: str
-    input_ids: list[int]
+    tokens: TokenizerOutput
     future: asyncio.Future[list[float]] = field(
         default_factory=lambda: asyncio.get_event_loop().create_future(),
     )
@@ -49,7 +53,7 @@ class BatchInferenceQueue:
         self,
         *,
         inference_fn: Callable[
-            [str, list[list[int]]],
+            [str, list[TokenizerOutput]],
             Awaitable[list[list[float]]],
         ],
         max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
@@ -59,7 +63,7 @@ class BatchInferenceQueue:
 
         Args:
             inference_fn: Async function that runs batched inference.
-                Takes (model_id, list_of_input_ids) and returns
+                Takes (model_id, list_of_tokenizer_outputs) and returns
                 list_of_embeddings.
             max_batch_size: Maximum requests per batch.
             deadline_ms: Maximum wait time before flushing in ms.
@@ -76,13 +80,13 @@ class BatchInferenceQueue:
     async def submit(
         self,
         model_id: str,
-        input_ids: list[int],
+        tokens: TokenizerOutput,
     ) -> list[float]:
         """Submit a single inference request to be batched.
 
         Args:
             model_id: Model identifier.
-            input_ids: Tokenized input IDs.
+            tokens: Token IDs and attention mask of the input.
 
         Returns:
             The embedding vector for this request.
@@ -91,7 +95,7 @@ class BatchInferenceQueue:
         loop = asyncio.get_running_loop()
         request = _PendingRequest(
             model_id=model_id,
-            input_ids=input_ids,
+            tokens=tokens,
             future=loop.create_future(),
         )
 
@@ -142,7 +146,7 @@ class BatchInferenceQueue:
             batch: List of pending requests to process.
 
         """
-        inputs = [req.input_ids for req in batch]
+        inputs = [req.tokens for req in batch]
         logger.debug(
             "Flushing batch of %d for %s",
             len(batch),
@@ -154,7 +158,8 @@ class BatchInferenceQueue:
             for request, result in zip(batch, results, strict=True):
                 if not request.future.done():
                     request.future.set_result(result)
-        except (ValueError, RuntimeError, ImportError) as exc:
+        except Exception as exc:  # noqa: BLE001
+            # Fail every waiter, an unhandled error would leave them hanging
             for request in batch:
                 if not request.future.done():
                     request.future.set_exception(exc)
@@ -1,21 +1,57 @@
 """LRU embedding cache with TTL and OTEL metrics.
 
 Cache embedding vectors keyed by SHA-256 content hash with
-configurable max entries, TTL, and optional metrics recording.
+configurable max entries, TTL, and optional metrics recording
+(OtelCacheMetrics reports hits, misses, and size as OTEL metrics).
+Vectors are kept as packed float32 arrays, and an optional
+EmbeddingStore adds a disk tier shared between processes.
 """
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import time
 from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Protocol
+from pathlib import Path
+from typing import TYPE_CHECKING, Protocol
 
+from opentelemetry import metrics as otel_metrics
+
+from streetrace.guardrails.inference.embedding_store import (
+    EmbeddingStore,
+    pack_embedding,
+)
 from streetrace.log import get_logger
 
+if TYPE_CHECKING:
+    from array import array
+
+    from streetrace.guardrails.config import InferenceConfig
+
 logger = get_logger(__name__)
 
+_meter = otel_metrics.get_meter(__name__)
+
+_CACHE_HITS = _meter.create_counter(
+    "streetrace.inference.cache.hits",
+    description="Embeddings served from the cache",
+)
+"""Counter of cache hits by cache name."""
+
+_CACHE_MISSES = _meter.create_counter(
+    "streetrace.inference.cache.misses",
+    description="Embedding lookups not found in the cache",
+)
+"""Counter of cache misses by cache name."""
+
+_CACHE_ENTRIES = _meter.create_up_down_counter(
+    "streetrace.inference.cache.entries",
+    description="Embeddings held in the in-memory cache tier",
+)
+"""Number of in-memory cache entries by cache name."""
+
 
 class CacheMetrics(Protocol):
     """Protocol for cache metrics recording."""
@@ -28,12 +64,57 @@ class CacheMetrics(Protocol):
         """Record a cache miss."""
         ...
 
+    def record_size(self, size: int) -> None:
+        """Record the current number of in-memory entries.
+
+        Optional: the cache skips size reports for recorders that
+        don't implement it.
+        """
+        ...
+
+
+class OtelCacheMetrics:
+    """Record cache hits, misses, and size as OTEL metrics.
+
+    Hit rate is hits / (hits + misses); the entry count is reported
+    as an up-down counter tracking the latest size.
+    """
+
+    def __init__(self, *, cache_name: str = "embedding") -> None:
+        """Initialize the recorder.
+
+        Args:
+            cache_name: Value of the ``cache`` metric attribute.
+
+        """
+        self._attributes = {"cache": cache_name}
+        self._size = 0
+
+    def record_hit(self) -> None:
+        """Record a cache hit."""
+        _CACHE_HITS.add(1, self._attributes)
+
+    def record_miss(self) -> None:
+        """Record a cache miss."""
+        _CACHE_MISSES.add(1, self._attributes)
+
+    def record_size(self, size: int) -> None:
+        """Record the current number of in-memory entries.
+
+        Args:
+            size: Number of entries.
+
+        """
+        if size != self._size:
+            _CACHE_ENTRIES.add(size - self._size, self._attributes)
+            self._size = size
+
 
 @dataclass
 class _CacheEntry:
     """Internal cache entry with embedding and timestamp."""
 
-    embedding: list[float]
+    embedding: array[float]
     created_at: float = field(default_factory=time.monotonic)
 
 
@@ -43,6 +124,12 @@ class EmbeddingCache:
     Store embeddings with TTL-based expiry and LRU eviction when
     the maximum number of entries is reached. Optionally record
     hit/miss metrics via an injected metrics recorder.
+
+    When an EmbeddingStore is given, in-memory misses are looked up
+    in the store and every put is written through to it, so warm
+    embeddings survive restarts. TTL only applies to the in-memory
+    tier; the store is bounded by size. The async methods access the
+    store on a worker thread, so they don't block the event loop.
     """
 
     def __init__(
@@ -51,6 +138,7 @@ class EmbeddingCache:
         max_entries: int = 10_000,
         ttl_seconds: float = 3600.0,
         metrics: CacheMetrics | None = None,
+        store: EmbeddingStore | None = None,
     ) -> None:
         """Initialize the embedding cache.
 
@@ -58,11 +146,13 @@ class EmbeddingCache:
             max_entries: Maximum number of cached embeddings.
             ttl_seconds: Time-to-live for cache entries in seconds.
             metrics: Optional metrics recorder for hit/miss tracking.
+            store: Optional disk-backed store for persistent entries.
 
         """
         self._max_entries = max_entries
         self._ttl_seconds = ttl_seconds
         self._metrics = metrics
+        self._store = store
         self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
 
     @property
@@ -74,39 +164,53 @@ class EmbeddingCache:
         self,
         model_id: str,
         text: str,
+        *,
+        include_store: bool = True,
     ) -> list[float] | None:
         """Look up a cached embedding by model and text.
 
+        The store lookup blocks on SQLite, async callers use
+        ``get_async`` instead.
+
         Args:
             model_id: Model identifier used for embedding.
             text: Input text that was embedded.
+            include_store: Look up in-memory misses in the store.
 
         Returns:
             Cached embedding vector, or None on miss/expiry.
 
         """
         key = self._make_key(model_id, text)
-        entry = self._entries.get(key)
-
-        if entry is None:
-            if self._metrics is not None:
-                self._metrics.record_miss()
-            return None
-
-        elapsed = time.monotonic() - entry.created_at
-        if elapsed > self._ttl_seconds:
-            del self._entries[key]
-            if self._metrics is not None:
-                self._metrics.record_miss()
-            return None
+        entry = self._lookup(key)
+        if entry is None and include_store and self._store is not None:
+            stored = self._store.get(key)
+            if stored is not None:
+                entry = self._insert(key, stored)
+        return self._result(entry)
+
+    async def get_async(
+        self,
+        model_id: str,
+        text: str,
+    ) -> list[float] | None:
+        """Look up a cached embedding, reading the store on a worker thread.
 
-        # Move to end for LRU ordering
-        self._entries.move_to_end(key)
+        Args:
+            model_id: Model identifier used for embedding.
+            text: Input text that was embedded.
 
-        if self._metrics is not None:
-            self._metrics.record_hit()
+        Returns:
+            Cached embedding vector, or None on miss/expiry.
 
-        return entry.embedding
+        """
+        key = self._make_key(model_id, text)
+        entry = self._lookup(key)
+        if entry is None and self._store is not None:
+            stored = await asyncio.to_thread(self._store.get, key)
+            if stored is not None:
+                entry = self._insert(key, stored)
+        return self._result(entry)
 
     def put(
         self,
@@ -123,18 +227,103 @@ class EmbeddingCache:
 
         """
         key = self._make_key(model_id, text)
+        packed = pack_embedding(embedding)
+        self._insert(key, packed)
+        if self._store is not None:
+            self._store.put(key, packed)
+
+    async def put_async(
+        self,
+        model_id: str,
+        text: str,
+        embedding: list[float],
+    ) -> None:
+        """Store an embedding, writing the store on a worker thread.
+
+        Args:
+            model_id: Model identifier used for embedding.
+            text: Input text that was embedded.
+            embedding: The embedding vector to cache.
+
+        """
+        key = self._make_key(model_id, text)
+        packed = pack_embedding(embedding)
+        self._insert(key, packed)
+        if self._store is not None:
+            await asyncio.to_thread(self._store.put, key, packed)
+
+    def _lookup(self, key: str) -> _CacheEntry | None:
+        """Find a live entry in the in-memory tier.
+
+        Expired entries are dropped, hits move to the LRU end.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            The entry, or None if missing or expired.
+
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry.created_at > self._ttl_seconds:
+            del self._entries[key]
+            self._record_size()
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def _result(self, entry: _CacheEntry | None) -> list[float] | None:
+        """Record a hit or miss and return the entry's embedding.
+
+        Args:
+            entry: Entry found in either tier, or None.
+
+        Returns:
+            The embedding vector, or None on a miss.
+
+        """
+        if entry is None:
+            if self._metrics is not None:
+                self._metrics.record_miss()
+            return None
+        if self._metrics is not None:
+            self._metrics.record_hit()
+        return entry.embedding.tolist()
+
+    def _insert(self, key: str, embedding: array[float]) -> _CacheEntry:
+        """Insert an entry into the in-memory tier.
+
+        Args:
+            key: Cache key.
+            embedding: Packed embedding vector.
+
+        Returns:
+            The inserted entry.
+
+        """
+        entry = _CacheEntry(embedding=embedding)
 
         if key in self._entries:
             self._entries.move_to_end(key)
-            self._entries[key] = _CacheEntry(embedding=embedding)
-            return
+            self._entries[key] = entry
+            return entry
 
         # Evict oldest if at capacity
         while len(self._entries) >= self._max_entries:
             evicted_key, _ = self._entries.popitem(last=False)
             logger.debug("Evicted cache entry %s", evicted_key[:16])
 
-        self._entries[key] = _CacheEntry(embedding=embedding)
+        self._entries[key] = entry
+        self._record_size()
+        return entry
+
+    def _record_size(self) -> None:
+        """Report the in-memory entry count to the metrics recorder."""
+        record_size = getattr(self._metrics, "record_size", None)
+        if record_size is not None:
+            record_size(len(self._entries))
 
     @staticmethod
     def _make_key(model_id: str, text: str) -> str:
@@ -150,3 +339,34 @@ class EmbeddingCache:
         """
         content_hash = hashlib.sha256(text.encode("utf-8")).hexdigest()
         return f"{model_id}:{content_hash}"
+
+
+def create_embedding_cache(
+    config: InferenceConfig,
+    *,
+    metrics: CacheMetrics | None = None,
+) -> EmbeddingCache:
+    """Build the embedding cache described by the inference config.
+
+    Args:
+        config: Inference configuration.
+        metrics: Metrics recorder for hit/miss tracking. Reports OTEL
+            metrics through OtelCacheMetrics if None.
+
+    Returns:
+        Embedding cache, backed by an EmbeddingStore when the config
+        sets ``embedding_store_path``.
+
+    """
+    store = None
+    if config.embedding_store_path is not None:
+        store = EmbeddingStore(
+            Path(config.embedding_store_path).expanduser(),
+            max_bytes=config.embedding_store_max_bytes,
+        )
+    return EmbeddingCache(
+        max_entries=config.embedding_cache_entries,
+        ttl_seconds=config.embedding_cache_ttl_seconds,
+        metrics=metrics or OtelCacheMetrics(),
+        store=store,
+    )
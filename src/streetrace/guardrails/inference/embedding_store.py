@@ -0,0 +1,202 @@
+"""Disk-backed embedding store shared between processes.
+
+Persist embedding vectors as packed float32 blobs in a SQLite database so
+warm embeddings survive restarts and are shared by concurrent runs on the
+same host. The store is bounded by total vector size and evicts the least
+recently used entries first.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from array import array
+from typing import TYPE_CHECKING, Final
+
+from streetrace.log import get_logger
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+logger = get_logger(__name__)
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+"""Default maximum total size of stored vectors in bytes."""
+
+EMBEDDING_TYPECODE: Final = "f"
+"""Array typecode of packed embedding vectors (float32)."""
+
+_EVICTION_CHECK_INTERVAL = 128
+"""Number of writes between checks of the store size."""
+
+_EVICTION_LOW_WATERMARK = 0.9
+"""Fraction of max_bytes the store is trimmed down to when over the limit."""
+
+_ACCESS_FLUSH_INTERVAL = 64
+"""Number of hits whose access times are buffered before they are written."""
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS embeddings (
+    key TEXT PRIMARY KEY,
+    vector BLOB NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS embeddings_by_access
+    ON embeddings (accessed_at);
+"""
+"""Database schema."""
+
+
+def pack_embedding(embedding: list[float] | array[float]) -> array[float]:
+    """Pack an embedding vector into a float32 array.
+
+    Args:
+        embedding: Embedding vector.
+
+    Returns:
+        Packed float32 array.
+
+    """
+    if isinstance(embedding, array) and embedding.typecode == EMBEDDING_TYPECODE:
+        return embedding
+    return array(EMBEDDING_TYPECODE, embedding)
+
+
+class EmbeddingStore:
+    """SQLite-backed embedding store with size-based LRU eviction.
+
+    The database runs in WAL mode, so several processes can read and
+    write it at the same time. Each entry records its last access time,
+    and when the total vector size exceeds max_bytes the least recently
+    used entries are deleted until the store is back under the limit.
+
+    Lookups don't write: access times of hits are buffered and written
+    in one transaction every few hits, before eviction and on close.
+
+    All methods block on SQLite; async callers run them on a worker
+    thread.
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        *,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ) -> None:
+        """Open or create the store.
+
+        Args:
+            db_path: Path to the SQLite database file.
+            max_bytes: Maximum total size of stored vectors in bytes.
+
+        """
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._writes_since_check = 0
+        self._accessed: dict[str, float] = {}
+        self._connection = sqlite3.connect(
+            db_path,
+            timeout=30,
+            check_same_thread=False,
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(_SCHEMA)
+        self._evict()
+
+    def get(self, key: str) -> array[float] | None:
+        """Look up a stored embedding and mark it as recently used.
+
+        Args:
+            key: Cache key of the embedding.
+
+        Returns:
+            Packed float32 embedding, or None if not stored.
+
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT vector FROM embeddings WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            self._accessed[key] = time.time()
+            if len(self._accessed) >= _ACCESS_FLUSH_INTERVAL:
+                self._write_access_times()
+        embedding = array(EMBEDDING_TYPECODE)
+        embedding.frombytes(row[0])
+        return embedding
+
+    def put(self, key: str, embedding: array[float]) -> None:
+        """Store an embedding.
+
+        Args:
+            key: Cache key of the embedding.
+            embedding: Packed float32 embedding.
+
+        """
+        with self._lock, self._connection:
+            self._accessed.pop(key, None)
+            self._connection.execute(
+                "INSERT OR REPLACE INTO embeddings (key, vector, accessed_at) "
+                "VALUES (?, ?, ?)",
+                (key, embedding.tobytes(), time.time()),
+            )
+            self._writes_since_check += 1
+            check_size = self._writes_since_check >= _EVICTION_CHECK_INTERVAL
+        if check_size:
+            self._evict()
+
+    @property
+    def size(self) -> int:
+        """Return the number of stored embeddings."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT COUNT(*) FROM embeddings",
+            ).fetchone()
+        return int(row[0])
+
+    def close(self) -> None:
+        """Write buffered access times and close the database connection."""
+        with self._lock:
+            self._write_access_times()
+            self._connection.close()
+
+    def _write_access_times(self) -> None:
+        """Write buffered access times in one transaction.
+
+        The caller holds the lock.
+        """
+        if not self._accessed:
+            return
+        with self._connection:
+            self._connection.executemany(
+                "UPDATE embeddings SET accessed_at = ? WHERE key = ?",
+                [(accessed_at, key) for key, accessed_at in self._accessed.items()],
+            )
+        self._accessed.clear()
+
+    def _evict(self) -> None:
+        """Delete least recently used entries while over max_bytes."""
+        with self._lock:
+            self._write_access_times()
+            self._writes_since_check = 0
+            total_bytes, count = self._connection.execute(
+                "SELECT COALESCE(SUM(LENGTH(vector)), 0), COUNT(*) FROM embeddings",
+            ).fetchone()
+            if total_bytes <= self._max_bytes:
+                return
+
+            target_bytes = self._max_bytes * _EVICTION_LOW_WATERMARK
+            average_bytes = total_bytes / count
+            evict_count = int((total_bytes - target_bytes) / average_bytes) + 1
+            with self._connection:
+                self._connection.execute(
+                    "DELETE FROM embeddings WHERE key IN ("
+                    "SELECT key FROM embeddings ORDER BY accessed_at LIMIT ?)",
+                    (evict_count,),
+                )
+        logger.debug("Evicted %d embeddings from the store", evict_count)
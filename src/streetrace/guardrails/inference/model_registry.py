@@ -28,6 +28,9 @@ ONNX_PACKAGE = "onnxruntime"
 ONNX_INSTALL_COMMAND = "pip install onnxruntime"
 """Install command for ONNX Runtime."""
 
+DEFAULT_INTRA_OP_THREADS = 2
+"""Default number of threads ONNX Runtime uses within a single operator."""
+
 
 class ModelState(StrEnum):
     """Loading state for a registered model."""
@@ -50,6 +53,7 @@ class _ModelEntry:
     load_future: asyncio.Future[object] | None = None
     load_callback: Callable[..., Awaitable[object]] | None = None
     failure_reason: str = ""
+    outputs_logits: bool = False
 
 
 class ModelRegistry:
@@ -60,10 +64,23 @@ class ModelRegistry:
     prevent duplicate loading.
     """
 
-    def __init__(self) -> None:
-        """Initialize an empty model registry."""
+    def __init__(
+        self,
+        *,
+        intra_op_num_threads: int = DEFAULT_INTRA_OP_THREADS,
+    ) -> None:
+        """Initialize an empty model registry.
+
+        Args:
+            intra_op_num_threads: Threads each ONNX session uses within
+                an operator. Sessions run in parallel on the inference
+                thread pool, so keep pool size times this value at or
+                below the number of CPU cores.
+
+        """
         self._models: dict[str, _ModelEntry] = {}
         self._lock = asyncio.Lock()
+        self._intra_op_num_threads = intra_op_num_threads
 
     def register_model(
         self,
@@ -72,6 +89,7 @@ class ModelRegistry:
         path: Path,
         checksum: str,
         load_callback: Callable[..., Awaitable[object]] | None = None,
+        outputs_logits: bool = False,
     ) -> None:
         """Register a model for later loading.
 
@@ -80,6 +98,8 @@ class ModelRegistry:
             path: Filesystem path to the ONNX model file.
             checksum: Expected SHA-256 hex digest of the model file.
             load_callback: Optional async callback to create session.
+            outputs_logits: Whether a classifier model outputs logits
+                that need a softmax, rather than final scores.
 
         Raises:
             ValueError: If model_id is already registered.
@@ -94,9 +114,24 @@ class ModelRegistry:
             path=path,
             checksum=checksum,
             load_callback=load_callback,
+            outputs_logits=outputs_logits,
         )
         logger.info("Registered model %s at %s", model_id, path)
 
+    def outputs_logits(self, model_id: str) -> bool:
+        """Return whether a classifier model outputs logits.
+
+        Args:
+            model_id: Model identifier.
+
+        Returns:
+            True if the model was registered as outputting logits,
+            False if its scores are used as is or it isn't registered.
+
+        """
+        entry = self._models.get(model_id)
+        return entry is not None and entry.outputs_logits
+
     def get_state(self, model_id: str) -> ModelState:
         """Return the current loading state of a model.
 
@@ -233,7 +268,10 @@ class ModelRegistry:
             return await entry.load_callback(entry.path, model_bytes)
 
         try:
-            return _create_onnx_session(model_bytes)
+            return _create_onnx_session(
+                model_bytes,
+                intra_op_num_threads=self._intra_op_num_threads,
+            )
         except ImportError:
             entry.failure_reason = "onnxruntime is not installed"
             raise MissingDependencyError(
@@ -242,11 +280,19 @@ class ModelRegistry:
             ) from None
 
 
-def _create_onnx_session(model_bytes: bytes) -> object:
+def _create_onnx_session(
+    model_bytes: bytes,
+    *,
+    intra_op_num_threads: int = DEFAULT_INTRA_OP_THREADS,
+) -> object:
     """Create an ONNX Runtime InferenceSession from model bytes.
 
+    Operators in a single run execute sequentially, parallelism comes from
+    running pooled sessions concurrently on the inference thread pool.
+
     Args:
         model_bytes: Raw ONNX model file content.
+        intra_op_num_threads: Threads used within a single operator.
 
     Returns:
         An onnxruntime.InferenceSession instance.
@@ -258,8 +304,9 @@ def _create_onnx_session(model_bytes: bytes) -> object:
     import onnxruntime as ort
 
     opts = ort.SessionOptions()
-    opts.inter_op_num_threads = 2
-    opts.intra_op_num_threads = 2
+    opts.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+    opts.inter_op_num_threads = 1
+    opts.intra_op_num_threads = intra_op_num_threads
     opts.graph_optimization_level = (
         ort.GraphOptimizationLevel.ORT_ENABLE_ALL
     )
@@ -1,19 +1,35 @@
 """Inference pipeline facade combining registry, pool, cache, and tokenizer.
 
 Provide a unified API for embedding generation, classification, and
-batch operations with caching and fail-fast error handling.
+batch operations with caching and fail-fast error handling. Concurrent
+requests are grouped by BatchInferenceQueue into padded batches, and
+each batch runs as a single ONNX call on a dedicated thread pool so it
+doesn't block the event loop.
 """
 
 from __future__ import annotations
 
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
+from streetrace.guardrails.inference.batch import (
+    DEFAULT_DEADLINE_MS,
+    DEFAULT_MAX_BATCH_SIZE,
+    BatchInferenceQueue,
+)
+from streetrace.guardrails.inference.embedding_cache import create_embedding_cache
 from streetrace.guardrails.inference.model_registry import ModelState
+from streetrace.guardrails.inference.postprocess import (
+    split_embeddings,
+    split_probabilities,
+)
 from streetrace.log import get_logger
 
 if TYPE_CHECKING:
+    from streetrace.guardrails.config import GuardrailsConfig
     from streetrace.guardrails.inference.embedding_cache import (
+        CacheMetrics,
         EmbeddingCache,
     )
     from streetrace.guardrails.inference.model_registry import (
@@ -22,25 +38,41 @@ if TYPE_CHECKING:
     from streetrace.guardrails.inference.session_pool import SessionPool
     from streetrace.guardrails.inference.tokenizer_manager import (
         TokenizerManager,
+        TokenizerOutput,
     )
 
 logger = get_logger(__name__)
 
+_THREAD_NAME_PREFIX = "guardrails-inference"
+"""Name prefix for inference worker threads."""
+
 
 class InferencePipeline:
     """Facade combining model registry, session pool, cache, and tokenizer.
 
     Provide high-level inference operations that handle caching,
     tokenization, session management, and error propagation.
+
+    Embedding and classification requests are submitted to batch
+    queues. Requests for the same model that arrive within the batch
+    deadline are padded to a common length and run as one
+    [batch, sequence] inference, then the output is split per request.
+
+    ONNX Runtime releases the GIL while running a session, so inference
+    dispatched to the worker threads overlaps with other work on the
+    event loop. The thread pool has one worker per pooled session.
     """
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         *,
         registry: ModelRegistry,
         pool: SessionPool,
         cache: EmbeddingCache,
         tokenizer_manager: TokenizerManager,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        batch_deadline_ms: float = DEFAULT_DEADLINE_MS,
+        normalize_embeddings: bool = False,
     ) -> None:
         """Initialize the inference pipeline.
 
@@ -49,12 +81,27 @@ class InferencePipeline:
             pool: Session pool for ONNX sessions.
             cache: Embedding cache for deduplication.
             tokenizer_manager: Tokenizer manager for text encoding.
+            max_batch_size: Maximum requests per inference batch.
+            batch_deadline_ms: Maximum wait for a batch to fill in ms.
+            normalize_embeddings: L2-normalize embedding vectors.
 
         """
         self._registry = registry
         self._pool = pool
         self._cache = cache
         self._tokenizer_manager = tokenizer_manager
+        self._normalize_embeddings = normalize_embeddings
+        self._executor: ThreadPoolExecutor | None = None
+        self._embedding_queue = BatchInferenceQueue(
+            inference_fn=self._embed_batch,
+            max_batch_size=max_batch_size,
+            deadline_ms=batch_deadline_ms,
+        )
+        self._classification_queue = BatchInferenceQueue(
+            inference_fn=self._classify_batch,
+            max_batch_size=max_batch_size,
+            deadline_ms=batch_deadline_ms,
+        )
 
     async def get_embedding(
         self,
@@ -77,28 +124,37 @@ class InferencePipeline:
             MissingDependencyError: If the model is unavailable.
 
         """
-        cached = self._cache.get(model_id, text)
+        cached = await self._cache.get_async(model_id, text)
         if cached is not None:
             return cached
 
         # Ensure model is loaded (may trigger load or raise)
         await self._registry.get_session(model_id)
 
-        session = await self._pool.acquire(model_id)
-        try:
-            tokens = self._tokenizer_manager.tokenize(model_id, text)
-            result = session.run(  # type: ignore[attr-defined]
-                None,
-                {
-                    "input_ids": [tokens.input_ids],
-                    "attention_mask": [tokens.attention_mask],
-                },
-            )
-            embedding = _extract_embedding(result)
-            self._cache.put(model_id, text, embedding)
-            return embedding
-        finally:
-            self._pool.release(model_id, session)
+        tokens = await self._tokenize(model_id, text)
+        embedding = await self._embedding_queue.submit(model_id, tokens)
+        await self._cache.put_async(model_id, text, embedding)
+        return embedding
+
+    def get_cached_embedding(
+        self,
+        model_id: str,
+        text: str,
+    ) -> list[float] | None:
+        """Return an embedding from the cache without running inference.
+
+        Only the in-memory tier is read, so the call never blocks on
+        the disk store.
+
+        Args:
+            model_id: Model identifier.
+            text: Input text that was embedded.
+
+        Returns:
+            Cached embedding vector, or None if not cached.
+
+        """
+        return self._cache.get(model_id, text, include_store=False)
 
     async def classify(
         self,
@@ -123,25 +179,17 @@ class InferencePipeline:
         """
         await self._registry.get_session(model_id)
 
-        session = await self._pool.acquire(model_id)
-        try:
-            tokens = self._tokenizer_manager.tokenize(model_id, text)
-            result = session.run(  # type: ignore[attr-defined]
-                None,
-                {
-                    "input_ids": [tokens.input_ids],
-                    "attention_mask": [tokens.attention_mask],
-                },
-            )
-            probabilities = _extract_probabilities(result)
+        tokens = await self._tokenize(model_id, text)
+        probabilities = await self._classification_queue.submit(
+            model_id,
+            tokens,
+        )
 
-            if labels is not None:
-                return dict(zip(labels, probabilities, strict=False))
-            return {
-                str(i): prob for i, prob in enumerate(probabilities)
-            }
-        finally:
-            self._pool.release(model_id, session)
+        if labels is not None:
+            return dict(zip(labels, probabilities, strict=False))
+        return {
+            str(i): prob for i, prob in enumerate(probabilities)
+        }
 
     async def batch_embed(
         self,
@@ -150,8 +198,8 @@ class InferencePipeline:
     ) -> list[list[float]]:
         """Generate embeddings for multiple texts.
 
-        Check cache for each text individually. Run inference
-        only for cache misses.
+        Check cache for each text individually. Cache misses are
+        submitted together and run in as few batches as possible.
 
         Args:
             model_id: Model identifier.
@@ -172,6 +220,126 @@ class InferencePipeline:
         results: list[list[float]] = await asyncio.gather(*tasks)
         return list(results)
 
+    async def _tokenize(self, model_id: str, text: str) -> TokenizerOutput:
+        """Tokenize text on a worker thread.
+
+        Tokenization uses the default executor so it doesn't queue
+        behind running inference.
+
+        Args:
+            model_id: Model identifier.
+            text: Input text.
+
+        Returns:
+            Token IDs and attention mask for the text.
+
+        """
+        return await asyncio.to_thread(
+            self._tokenizer_manager.tokenize,
+            model_id,
+            text,
+        )
+
+    async def _embed_batch(
+        self,
+        model_id: str,
+        batch: list[TokenizerOutput],
+    ) -> list[list[float]]:
+        """Run an embedding model on a batch of token sequences.
+
+        Args:
+            model_id: Model identifier.
+            batch: Token IDs and attention mask for each request.
+
+        Returns:
+            One embedding vector per request.
+
+        """
+        result = await self._run_batch(model_id, batch)
+        lengths = [sum(tokens.attention_mask) for tokens in batch]
+        return split_embeddings(
+            result,
+            lengths,
+            normalize=self._normalize_embeddings,
+        )
+
+    async def _classify_batch(
+        self,
+        model_id: str,
+        batch: list[TokenizerOutput],
+    ) -> list[list[float]]:
+        """Run a classification model on a batch of token sequences.
+
+        Args:
+            model_id: Model identifier.
+            batch: Token IDs and attention mask for each request.
+
+        Returns:
+            Class probabilities for each request.
+
+        """
+        result = await self._run_batch(model_id, batch)
+        return split_probabilities(
+            result,
+            len(batch),
+            outputs_logits=self._registry.outputs_logits(model_id),
+        )
+
+    async def _run_batch(
+        self,
+        model_id: str,
+        batch: list[TokenizerOutput],
+    ) -> list[object]:
+        """Pad a batch and run it on an inference thread.
+
+        Args:
+            model_id: Model identifier.
+            batch: Token IDs and attention mask for each request.
+
+        Returns:
+            Raw ONNX inference output.
+
+        """
+        input_ids, attention_mask = _pad_batch(
+            batch, self._tokenizer_manager.pad_token_id(model_id),
+        )
+        session = await self._pool.acquire(model_id)
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._get_executor(),
+                _run_session,
+                session,
+                input_ids,
+                attention_mask,
+            )
+        finally:
+            self._pool.release(model_id, session)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Return the inference thread pool, creating it on first use.
+
+        Returns:
+            Thread pool with one worker per pooled session.
+
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._pool.pool_size,
+                thread_name_prefix=_THREAD_NAME_PREFIX,
+            )
+        return self._executor
+
+    def close(self) -> None:
+        """Shut down the inference thread pool.
+
+        Wait for running inference to finish. The pool is recreated if
+        the pipeline is used again.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
     def is_model_ready(self, model_id: str) -> bool:
         """Check if a model is loaded and ready for inference.
 
@@ -216,87 +384,88 @@ class InferencePipeline:
                 logger.info("Warmed up model %s", model_id)
 
 
-def _to_nested_list(raw: object) -> list[list[list[float]]]:
-    """Convert raw ONNX output to a nested list structure.
+def create_inference_pipeline(
+    config: GuardrailsConfig,
+    *,
+    registry: ModelRegistry,
+    pool: SessionPool,
+    tokenizer_manager: TokenizerManager,
+    metrics: CacheMetrics | None = None,
+) -> InferencePipeline:
+    """Build an inference pipeline with the cache the guardrails config sets.
 
     Args:
-        raw: Raw output from ONNX inference (ndarray or list).
+        config: Guardrails configuration, its ``inference`` section
+            sizes the embedding cache and enables the embedding store.
+        registry: Model registry for state tracking.
+        pool: Session pool for ONNX sessions.
+        tokenizer_manager: Tokenizer manager for text encoding.
+        metrics: Metrics recorder for the embedding cache. Reports OTEL
+            metrics if None.
 
     Returns:
-        Nested list in [batch, sequence, features] shape.
+        The inference pipeline.
 
     """
-    converted = raw.tolist() if hasattr(raw, "tolist") else raw
-
-    if not isinstance(converted, list):
-        return [[[float(converted)]]]  # type: ignore[arg-type]
-
-    if len(converted) == 0:
-        return [[[]]]
-
-    first = converted[0]
-    if not isinstance(first, list):
-        return [[_as_floats(converted)]]
-
-    second = first[0] if len(first) > 0 else None
-    if not isinstance(second, list):
-        return [[_as_floats(item) for item in converted]]
+    return InferencePipeline(
+        registry=registry,
+        pool=pool,
+        cache=create_embedding_cache(config.inference, metrics=metrics),
+        tokenizer_manager=tokenizer_manager,
+    )
 
-    return [
-        [_as_floats(token) for token in batch]
-        for batch in converted
-    ]
 
+def _pad_batch(
+    batch: list[TokenizerOutput],
+    pad_token_id: int,
+) -> tuple[list[list[int]], list[list[int]]]:
+    """Pad token sequences to the length of the longest one.
 
-def _as_floats(values: list[object]) -> list[float]:
-    """Convert a list of numeric values to floats.
+    Each request keeps the attention mask its tokenizer produced,
+    extended with zeros over the added padding.
 
     Args:
-        values: List of numeric values.
+        batch: Token IDs and attention mask for each request.
+        pad_token_id: Token ID the model's tokenizer pads with.
 
     Returns:
-        List of float values.
+        Padded input IDs and the matching attention mask.
 
     """
-    return [float(v) for v in values]  # type: ignore[arg-type]
-
+    max_length = max(len(tokens.input_ids) for tokens in batch)
+    input_ids = [
+        tokens.input_ids + [pad_token_id] * (max_length - len(tokens.input_ids))
+        for tokens in batch
+    ]
+    attention_mask = [
+        tokens.attention_mask + [0] * (max_length - len(tokens.attention_mask))
+        for tokens in batch
+    ]
+    return input_ids, attention_mask
 
-def _extract_embedding(result: list[object]) -> list[float]:
-    """Extract embedding vector from ONNX inference output.
 
-    Apply mean pooling over token dimension for transformer outputs
-    shaped [batch, tokens, hidden_dim].
+def _run_session(
+    session: object,
+    input_ids: list[list[int]],
+    attention_mask: list[list[int]],
+) -> list[object]:
+    """Run an ONNX session on a padded batch, blocking the caller.
 
     Args:
-        result: Raw ONNX inference output.
+        session: ONNX InferenceSession borrowed from the pool.
+        input_ids: Padded token IDs shaped [batch, sequence].
+        attention_mask: Attention mask shaped [batch, sequence].
 
     Returns:
-        Embedding vector as a list of floats.
+        Raw ONNX inference output.
 
     """
-    nested = _to_nested_list(result[0])
-    batch = nested[0]
-
-    if len(batch) == 1:
-        return batch[0]
-
-    dim = len(batch[0])
-    pooled = [0.0] * dim
-    for token in batch:
-        for i, val in enumerate(token):
-            pooled[i] += val
-    return [v / len(batch) for v in pooled]
-
-
-def _extract_probabilities(result: list[object]) -> list[float]:
-    """Extract classification probabilities from ONNX output.
-
-    Args:
-        result: Raw ONNX inference output.
-
-    Returns:
-        List of class probabilities.
+    result: list[object] = session.run(  # type: ignore[attr-defined]
+        None,
+        {
+            "input_ids": input_ids,
+            "attention_mask": attention_mask,
+        },
+    )
+    return result
 
-    """
-    nested = _to_nested_list(result[0])
-    return nested[0][0]
@@ -0,0 +1,242 @@
+"""Post-processing of batched ONNX outputs.
+
+Turn raw model outputs into per-request embedding vectors and class
+probabilities. Pooling, normalization, and softmax run on NumPy arrays
+when NumPy is installed (onnxruntime depends on it), so only the final
+per-request vectors are converted to Python floats. A pure Python path
+is kept as a fallback when NumPy is missing.
+"""
+
+from __future__ import annotations
+
+import importlib
+import math
+from functools import cache
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from types import ModuleType
+
+_TOKEN_OUTPUT_NDIM = 3
+"""Rank of per-token outputs shaped [batch, tokens, features]."""
+
+_NORM_EPSILON = 1e-12
+"""Smallest norm used when L2-normalizing, avoids division by zero."""
+
+
+@cache
+def load_numpy() -> ModuleType | None:
+    """Import NumPy if it is installed.
+
+    Returns:
+        The numpy module, or None if it is not installed.
+
+    """
+    try:
+        return importlib.import_module("numpy")
+    except ImportError:
+        return None
+
+
+def split_embeddings(
+    result: list[object],
+    lengths: list[int],
+    *,
+    normalize: bool = False,
+) -> list[list[float]]:
+    """Split batched ONNX output into per-request embedding vectors.
+
+    Transformer outputs shaped [batch, tokens, hidden_dim] are mean
+    pooled over each request's real tokens, ignoring padding. Outputs
+    shaped [batch, hidden_dim] are already pooled.
+
+    Args:
+        result: Raw ONNX inference output.
+        lengths: Unpadded token count of each request.
+        normalize: L2-normalize each embedding vector.
+
+    Returns:
+        One embedding vector per request.
+
+    Raises:
+        ValueError: If the output doesn't have one row per request.
+
+    """
+    np = load_numpy()
+    if np is None:
+        return _split_embeddings_py(result, lengths, normalize=normalize)
+
+    hidden = np.asarray(result[0], dtype=np.float32)
+    _check_batch_size(hidden.shape[0] if hidden.ndim else 0, len(lengths))
+
+    if hidden.ndim == _TOKEN_OUTPUT_NDIM:
+        seq_len = hidden.shape[1]
+        counts = np.clip(np.asarray(lengths), 1, max(seq_len, 1))
+        mask = np.arange(seq_len)[None, :] < counts[:, None]
+        pooled = np.einsum("bsh,bs->bh", hidden, mask.astype(np.float32))
+        pooled /= counts[:, None]
+    else:
+        pooled = hidden.reshape(hidden.shape[0], -1)
+
+    if normalize:
+        norms = np.linalg.norm(pooled, axis=1, keepdims=True)
+        pooled = pooled / np.maximum(norms, _NORM_EPSILON)
+
+    embeddings: list[list[float]] = pooled.tolist()
+    return embeddings
+
+
+def split_probabilities(
+    result: list[object],
+    batch_size: int,
+    *,
+    outputs_logits: bool = False,
+) -> list[list[float]]:
+    """Split batched ONNX output into per-request class probabilities.
+
+    Args:
+        result: Raw ONNX inference output.
+        batch_size: Number of requests in the batch.
+        outputs_logits: The model outputs logits, so rows pass through
+            softmax. Otherwise rows are returned as is.
+
+    Returns:
+        Class probabilities for each request.
+
+    Raises:
+        ValueError: If the output doesn't have one row per request.
+
+    """
+    np = load_numpy()
+    if np is None:
+        return _split_probabilities_py(
+            result, batch_size, outputs_logits=outputs_logits,
+        )
+
+    scores = np.asarray(result[0], dtype=np.float32)
+    _check_batch_size(scores.shape[0] if scores.ndim else 0, batch_size)
+    if scores.ndim == _TOKEN_OUTPUT_NDIM:
+        scores = scores[:, 0, :]
+    scores = scores.reshape(batch_size, -1)
+
+    if outputs_logits:
+        exp = np.exp(scores - scores.max(axis=1, keepdims=True))
+        scores = exp / exp.sum(axis=1, keepdims=True)
+    probabilities: list[list[float]] = scores.tolist()
+    return probabilities
+
+
+def _check_batch_size(actual: int, expected: int) -> None:
+    """Raise if the model output batch dimension doesn't match.
+
+    Args:
+        actual: Batch dimension of the model output.
+        expected: Number of requests in the batch.
+
+    Raises:
+        ValueError: If the sizes differ.
+
+    """
+    if actual != expected:
+        msg = f"Expected model output for {expected} inputs, got {actual}"
+        raise ValueError(msg)
+
+
+def _output_rows(result: list[object], batch_size: int) -> list[Any]:
+    """Return per-request rows of the first ONNX output as lists.
+
+    Args:
+        result: Raw ONNX inference output.
+        batch_size: Number of requests in the batch.
+
+    Returns:
+        One row per request.
+
+    """
+    raw = result[0]
+    rows = raw.tolist() if hasattr(raw, "tolist") else raw
+    if not isinstance(rows, list):
+        rows = []
+    _check_batch_size(len(rows), batch_size)
+    return rows
+
+
+def _split_embeddings_py(
+    result: list[object],
+    lengths: list[int],
+    *,
+    normalize: bool,
+) -> list[list[float]]:
+    """Split embeddings without NumPy, see split_embeddings."""
+    embeddings: list[list[float]] = []
+    for row, length in zip(
+        _output_rows(result, len(lengths)),
+        lengths,
+        strict=True,
+    ):
+        if not isinstance(row, list) or not row:
+            embedding: list[float] = []
+        elif isinstance(row[0], list):
+            embedding = _mean_pool(row[: max(length, 1)])
+        else:
+            embedding = [float(v) for v in row]
+
+        if normalize:
+            norm = math.sqrt(sum(v * v for v in embedding))
+            embedding = [v / max(norm, _NORM_EPSILON) for v in embedding]
+        embeddings.append(embedding)
+    return embeddings
+
+
+def _split_probabilities_py(
+    result: list[object],
+    batch_size: int,
+    *,
+    outputs_logits: bool,
+) -> list[list[float]]:
+    """Split probabilities without NumPy, see split_probabilities."""
+    probabilities: list[list[float]] = []
+    for row in _output_rows(result, batch_size):
+        values = row
+        if isinstance(values, list) and values and isinstance(values[0], list):
+            values = values[0]
+        scores = [float(v) for v in values] if isinstance(values, list) else []
+        probabilities.append(
+            _softmax(scores) if outputs_logits else scores,
+        )
+    return probabilities
+
+
+def _mean_pool(tokens: list[list[float]]) -> list[float]:
+    """Average token vectors into a single vector.
+
+    Args:
+        tokens: Token vectors shaped [tokens, hidden_dim].
+
+    Returns:
+        Mean vector.
+
+    """
+    pooled = [0.0] * len(tokens[0])
+    for token in tokens:
+        for i, val in enumerate(token):
+            pooled[i] += float(val)
+    return [v / len(tokens) for v in pooled]
+
+
+def _softmax(scores: list[float]) -> list[float]:
+    """Convert logits to probabilities.
+
+    Args:
+        scores: Classifier logits.
+
+    Returns:
+        Probabilities summing to one.
+
+    """
+    if not scores:
+        return []
+    top = max(scores)
+    exp = [math.exp(s - top) for s in scores]
+    total = sum(exp)
+    return [e / total for e in exp]
@@ -31,6 +31,11 @@ class SessionPool:
         self._pool_size = pool_size
         self._queues: dict[str, asyncio.Queue[object]] = {}
 
+    @property
+    def pool_size(self) -> int:
+        """Maximum number of sessions per model."""
+        return self._pool_size
+
     def add_session(self, model_id: str, session: object) -> None:
         """Add a session to the pool for a model.
 
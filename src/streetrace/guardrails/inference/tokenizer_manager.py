@@ -22,6 +22,12 @@ TOKENIZERS_INSTALL_COMMAND = "pip install tokenizers"
 DEFAULT_MAX_LENGTH = 512
 """Default maximum token length for tokenization."""
 
+DEFAULT_PAD_TOKEN_ID = 0
+"""Padding token ID used when a tokenizer doesn't define one."""
+
+_PAD_TOKENS = ("[PAD]", "<pad>")
+"""Padding tokens looked up in vocabularies without a padding config."""
+
 
 @dataclass(frozen=True)
 class TokenizerOutput:
@@ -47,6 +53,7 @@ class TokenizerManager:
     def __init__(self) -> None:
         """Initialize with an empty tokenizer registry."""
         self._tokenizers: dict[str, object] = {}
+        self._pad_token_ids: dict[str, int] = {}
 
     def register(self, model_id: str, tokenizer: object) -> None:
         """Register a tokenizer for a model.
@@ -57,6 +64,7 @@ class TokenizerManager:
 
         """
         self._tokenizers[model_id] = tokenizer
+        self._pad_token_ids.pop(model_id, None)
         logger.info("Registered tokenizer for %s", model_id)
 
     def has_tokenizer(self, model_id: str) -> bool:
@@ -108,6 +116,36 @@ class TokenizerManager:
             attention_mask=attention_mask,
         )
 
+    def pad_token_id(self, model_id: str) -> int:
+        """Return the token ID the model's tokenizer pads with.
+
+        Read the tokenizer's padding configuration, then look up
+        common padding tokens in its vocabulary, and fall back to
+        DEFAULT_PAD_TOKEN_ID.
+
+        Args:
+            model_id: Model identifier.
+
+        Returns:
+            Padding token ID for the model.
+
+        Raises:
+            MissingDependencyError: If no tokenizer is registered.
+
+        """
+        pad_token_id = self._pad_token_ids.get(model_id)
+        if pad_token_id is not None:
+            return pad_token_id
+        tokenizer = self._tokenizers.get(model_id)
+        if tokenizer is None:
+            raise MissingDependencyError(
+                package=f"Tokenizer for '{model_id}'",
+                install_command=TOKENIZERS_INSTALL_COMMAND,
+            )
+        pad_token_id = _read_pad_token_id(tokenizer)
+        self._pad_token_ids[model_id] = pad_token_id
+        return pad_token_id
+
     def load_from_path(self, model_id: str, path: str) -> None:
         """Load a tokenizer from a filesystem path.
 
@@ -131,6 +169,29 @@ class TokenizerManager:
         logger.info("Loaded tokenizer for %s from %s", model_id, path)
 
 
+def _read_pad_token_id(tokenizer: object) -> int:
+    """Read the padding token ID of a HuggingFace tokenizer.
+
+    Args:
+        tokenizer: A tokenizer instance.
+
+    Returns:
+        The configured or vocabulary padding token ID, or
+        DEFAULT_PAD_TOKEN_ID if the tokenizer defines none.
+
+    """
+    padding = getattr(tokenizer, "padding", None)
+    if isinstance(padding, dict) and isinstance(padding.get("pad_id"), int):
+        return int(padding["pad_id"])
+    token_to_id = getattr(tokenizer, "token_to_id", None)
+    if callable(token_to_id):
+        for token in _PAD_TOKENS:
+            token_id = token_to_id(token)
+            if isinstance(token_id, int):
+                return token_id
+    return DEFAULT_PAD_TOKEN_ID
+
+
 def _load_tokenizer_from_path(path: str) -> object:
     """Load a HuggingFace tokenizer from a filesystem path.
 
@@ -3,17 +3,28 @@
 Embed tool descriptions via E5-small ONNX, compute cosine
 similarity against known-good patterns, and detect JSON-RPC
 structural anomalies.
+
+Tool descriptions only change with the server manifest, so their
+anomaly scores are cached per server and manifest hash, and the
+known-good reference embeddings are computed once. Per call, only the
+structural argument analysis runs. Both the servers and the scores per
+server are kept in bounded LRU maps; calls without a manifest hash are
+scored but not cached.
 """
 
 from __future__ import annotations
 
+import asyncio
 import math
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 from streetrace.log import get_logger
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from streetrace.guardrails.inference.pipeline import InferencePipeline
 
 logger = get_logger(__name__)
@@ -51,6 +62,12 @@ _KNOWN_GOOD_DESCRIPTIONS: list[str] = [
 ]
 """Reference descriptions for known-good tool patterns."""
 
+MAX_CACHED_SERVERS = 256
+"""Servers whose description scores are cached."""
+
+MAX_CACHED_SCORES = 1024
+"""Description scores cached per server manifest."""
+
 
 @dataclass(frozen=True)
 class InspectorResult:
@@ -66,6 +83,51 @@ class InspectorResult:
     anomalies: list[str] = field(default_factory=list)
 
 
+@dataclass
+class _ManifestScores:
+    """Description anomaly scores of one server manifest.
+
+    Attributes:
+        manifest_hash: Hash of the manifest the scores belong to.
+        scores: Anomaly score by (tool name, tool description), least
+            recently used first.
+
+    """
+
+    manifest_hash: str
+    scores: OrderedDict[tuple[str, str], float] = field(
+        default_factory=OrderedDict,
+    )
+
+    def get(self, key: tuple[str, str]) -> float | None:
+        """Return a cached score and mark it recently used.
+
+        Args:
+            key: Tool name and description.
+
+        Returns:
+            The cached score, or None on a miss.
+
+        """
+        score = self.scores.get(key)
+        if score is not None:
+            self.scores.move_to_end(key)
+        return score
+
+    def put(self, key: tuple[str, str], score: float) -> None:
+        """Cache a score, evicting the least recently used one if full.
+
+        Args:
+            key: Tool name and description.
+            score: Anomaly score of the description.
+
+        """
+        self.scores[key] = score
+        self.scores.move_to_end(key)
+        if len(self.scores) > MAX_CACHED_SCORES:
+            self.scores.popitem(last=False)
+
+
 class NeuralInspector:
     """Analyze tool descriptions and args for anomalies.
 
@@ -85,6 +147,42 @@ class NeuralInspector:
 
         """
         self._pipeline = inference_pipeline
+        self._manifests: OrderedDict[str, _ManifestScores] = OrderedDict()
+        self._references: list[list[float]] | None = None
+
+    async def register_manifest(
+        self,
+        server_id: str,
+        manifest_hash: str,
+        tool_descriptions: Mapping[str, str],
+    ) -> None:
+        """Precompute description anomaly scores for a server manifest.
+
+        Scores cached for an earlier manifest of the server are
+        dropped. ``McpGuardOrchestrator.register_manifest`` calls this
+        with the hash it registers with the trust evaluator; use the
+        same hash in ``inspect``.
+
+        Args:
+            server_id: MCP server identifier.
+            manifest_hash: Hash of the server manifest.
+            tool_descriptions: Advertised description by tool name.
+
+        Raises:
+            ValueError: If manifest_hash is empty, as scores are only
+                cached for a known manifest.
+
+        """
+        if not manifest_hash:
+            msg = f"Manifest hash of server '{server_id}' is empty"
+            raise ValueError(msg)
+        entry = self._manifest_scores(server_id, manifest_hash)
+        # Embed the references before fanning out, so it happens once
+        await self._reference_embeddings()
+        await asyncio.gather(*(
+            self._description_anomaly(entry, tool_name, description)
+            for tool_name, description in tool_descriptions.items()
+        ))
 
     async def inspect(
         self,
@@ -92,16 +190,22 @@ class NeuralInspector:
         tool_name: str,
         tool_description: str,
         args: dict[str, object],
+        server_id: str = "",
+        manifest_hash: str = "",
     ) -> InspectorResult:
         """Inspect a tool call for anomalies.
 
         Run structural analysis and embedding-based similarity
-        checking against known-good tool patterns.
+        checking against known-good tool patterns. The similarity
+        score is cached until the server's manifest hash changes, and
+        not at all without a manifest hash.
 
         Args:
             tool_name: Name of the tool being called.
             tool_description: Tool's advertised description.
             args: Tool call arguments.
+            server_id: MCP server identifier.
+            manifest_hash: Hash of the server's current manifest.
 
         Returns:
             InspectorResult with anomaly score and descriptions.
@@ -113,9 +217,11 @@ class NeuralInspector:
         structural_anomalies = _detect_structural_anomalies(args)
         anomalies.extend(structural_anomalies)
 
-        # Stage 2: Embedding similarity (if pipeline available)
-        embedding_score = await self._compute_embedding_anomaly(
-            tool_name, tool_description,
+        # Stage 2: Embedding similarity, cached per manifest
+        embedding_score = await self._description_anomaly(
+            self._manifest_scores(server_id, manifest_hash),
+            tool_name,
+            tool_description,
         )
 
         # Combine scores: structural issues raise the floor
@@ -131,11 +237,72 @@ class NeuralInspector:
             anomalies=anomalies,
         )
 
-    async def _compute_embedding_anomaly(
+    def _manifest_scores(
         self,
+        server_id: str,
+        manifest_hash: str,
+    ) -> _ManifestScores | None:
+        """Return the score cache of a manifest, replacing stale ones.
+
+        Args:
+            server_id: MCP server identifier.
+            manifest_hash: Hash of the server's current manifest.
+
+        Returns:
+            Score cache for the server and manifest hash, or None if
+            the hash is empty and scores can't be tied to a manifest.
+
+        """
+        if not manifest_hash:
+            return None
+        entry = self._manifests.get(server_id)
+        if entry is None or entry.manifest_hash != manifest_hash:
+            if entry is not None:
+                logger.info(
+                    "Manifest of %s changed, dropping %d cached scores",
+                    server_id,
+                    len(entry.scores),
+                )
+            entry = _ManifestScores(manifest_hash=manifest_hash)
+            self._manifests[server_id] = entry
+        self._manifests.move_to_end(server_id)
+        if len(self._manifests) > MAX_CACHED_SERVERS:
+            self._manifests.popitem(last=False)
+        return entry
+
+    async def _description_anomaly(
+        self,
+        entry: _ManifestScores | None,
         tool_name: str,
         tool_description: str,
     ) -> float:
+        """Return the cached anomaly score of a tool description.
+
+        Args:
+            entry: Score cache of the server's manifest, or None to
+                compute the score without caching it.
+            tool_name: Tool name for context.
+            tool_description: Tool description to score.
+
+        Returns:
+            Anomaly score from 0.0 to 1.0.
+
+        """
+        key = (tool_name, tool_description)
+        score = entry.get(key) if entry is not None else None
+        if score is None:
+            score, complete = await self._compute_embedding_anomaly(
+                tool_name, tool_description,
+            )
+            if complete and entry is not None:
+                entry.put(key, score)
+        return score
+
+    async def _compute_embedding_anomaly(
+        self,
+        tool_name: str,
+        tool_description: str,
+    ) -> tuple[float, bool]:
         """Compute anomaly score based on embedding similarity.
 
         Embed the tool description and compare against known-good
@@ -146,7 +313,8 @@ class NeuralInspector:
             tool_description: Tool description to embed.
 
         Returns:
-            Anomaly score from 0.0 to 1.0.
+            Anomaly score from 0.0 to 1.0, and whether every
+            embedding succeeded so the score can be cached.
 
         """
         text = f"{tool_name}: {tool_description}"
@@ -159,25 +327,55 @@ class NeuralInspector:
                 "Embedding failed for tool %s, using structural only",
                 tool_name,
             )
-            return ANOMALY_SCORE_FLOOR
+            return ANOMALY_SCORE_FLOOR, False
+
+        references, complete = await self._reference_embeddings()
 
         # Compare against known-good patterns
         max_similarity = ANOMALY_SCORE_FLOOR
-        for ref_desc in _KNOWN_GOOD_DESCRIPTIONS:
-            try:
-                ref_embedding = await self._pipeline.get_embedding(
-                    E5_MODEL_ID, ref_desc,
-                )
-                sim = _cosine_similarity(embedding, ref_embedding)
-                max_similarity = max(max_similarity, sim)
-            except (ValueError, RuntimeError):
-                continue
+        for ref_embedding in references:
+            sim = _cosine_similarity(embedding, ref_embedding)
+            max_similarity = max(max_similarity, sim)
 
         # Convert similarity to anomaly: high similarity = low anomaly
-        return max(
+        score = max(
             ANOMALY_SCORE_FLOOR,
             ANOMALY_SCORE_CEILING - max_similarity,
         )
+        return score, complete
+
+    async def _reference_embeddings(self) -> tuple[list[list[float]], bool]:
+        """Embed the known-good descriptions, once if all succeed.
+
+        Returns:
+            Embeddings of the references that could be embedded, and
+            whether that is all of them. Failed references are
+            retried on the next call.
+
+        """
+        if self._references is not None:
+            return self._references, True
+        results = await asyncio.gather(
+            *(
+                self._pipeline.get_embedding(E5_MODEL_ID, ref_desc)
+                for ref_desc in _KNOWN_GOOD_DESCRIPTIONS
+            ),
+            return_exceptions=True,
+        )
+        references: list[list[float]] = []
+        for ref_desc, result in zip(
+            _KNOWN_GOOD_DESCRIPTIONS, results, strict=True,
+        ):
+            if isinstance(result, BaseException):
+                if not isinstance(result, (ValueError, RuntimeError)):
+                    raise result
+                logger.warning("Embedding failed for reference %r", ref_desc)
+                continue
+            references.append(result)
+        complete = len(references) == len(_KNOWN_GOOD_DESCRIPTIONS)
+        if complete:
+            self._references = references
+        return references, complete
 
 
 def _detect_structural_anomalies(
@@ -1,27 +1,49 @@
 """MCP-Guard orchestrator implementing the Guardrail protocol.
 
 Manage the 2-stage pipeline (syntactic + neural) with policy
-enforcement and trust evaluation. Receive JSON-serialized tool
-call data via check_str and return (triggered, detail) tuples.
+enforcement and trust evaluation. Receive tool call data, either
+parsed via check_tool_call or JSON-serialized via check_str, and
+return (triggered, detail) tuples.
+
+The sync check_str runs policy and syntactic stages only. The
+provider awaits check_tool_call (or check_async for text) instead,
+which also evaluates server trust and runs the neural inspector
+within a deadline.
 """
 
 from __future__ import annotations
 
+import asyncio
 import json
+from dataclasses import dataclass
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from opentelemetry import trace
 
+from streetrace.dsl.runtime.guardrail_memo import GuardrailMemo, content_digest
 from streetrace.guardrails.config import McpGuardConfig
+from streetrace.guardrails.mcp_guard.neural_inspector import (
+    InspectorResult,
+    NeuralInspector,
+)
 from streetrace.guardrails.mcp_guard.policy_enforcer import PolicyEnforcer
 from streetrace.guardrails.mcp_guard.syntactic_gatekeeper import (
+    GatekeeperResult,
     SyntacticGatekeeper,
 )
-from streetrace.guardrails.mcp_guard.trust_evaluator import TrustEvaluator
+from streetrace.guardrails.mcp_guard.trust_evaluator import (
+    TrustEvaluator,
+    TrustResult,
+)
 from streetrace.guardrails.types import GuardrailAction, GuardrailResult
 from streetrace.log import get_logger
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from streetrace.dsl.runtime.guardrail_memo import MemoKey
+    from streetrace.dsl.runtime.guardrail_types import ToolCallContent
     from streetrace.guardrails.inference.pipeline import InferencePipeline
 
 logger = get_logger(__name__)
@@ -31,12 +53,42 @@ _PROXY_NAME = "mcp_guard"
 
 _STAGE_POLICY = "policy"
 _STAGE_SYNTACTIC = "syntactic"
+_STAGE_TRUST = "trust"
 _STAGE_NEURAL = "neural"
 
 STAGE1_CONFIDENCE = 1.0
 """Confidence score for deterministic pattern matches."""
 
 
+@dataclass(frozen=True)
+class _ToolCall:
+    """Fields of a tool call read from its data.
+
+    Attributes:
+        server_id: MCP server identifier.
+        tool_name: Name of the tool being called.
+        tool_description: Tool's advertised description.
+        manifest_hash: Hash of the server manifest, empty if unknown.
+        args: Tool call arguments.
+
+    """
+
+    server_id: str
+    tool_name: str
+    tool_description: str
+    manifest_hash: str
+    args: dict[str, object]
+
+    @cached_property
+    def args_text(self) -> str:
+        """Return the canonical JSON form of the arguments.
+
+        Shared by the policy stage and the memo keys, so the arguments
+        are serialized once per call.
+        """
+        return json.dumps(self.args, sort_keys=True, default=str)
+
+
 class McpGuardOrchestrator:
     """Orchestrate MCP tool call validation pipeline.
 
@@ -60,17 +112,60 @@ class McpGuardOrchestrator:
         """
         self._inference_pipeline = inference_pipeline
         self._config = config or McpGuardConfig()
-        self._gatekeeper = SyntacticGatekeeper()
+        self._gatekeeper = SyntacticGatekeeper(
+            max_scan_chars=self._config.max_scan_chars,
+        )
+        self._syntactic_memo: GuardrailMemo[GatekeeperResult] = (
+            GuardrailMemo("check")
+        )
         self._policy = PolicyEnforcer(config=self._config)
         self._trust = TrustEvaluator(
             trust_threshold=self._config.trust_threshold,
         )
+        self._inspector = (
+            NeuralInspector(inference_pipeline=inference_pipeline)
+            if inference_pipeline is not None
+            else None
+        )
+        self._neural_memo: GuardrailMemo[InspectorResult] = GuardrailMemo(
+            "check",
+        )
+        self._inflight: dict[MemoKey, asyncio.Task[InspectorResult]] = {}
 
     @property
     def name(self) -> str:
         """Return the guardrail name."""
         return "mcp_guard"
 
+    async def register_manifest(
+        self,
+        server_id: str,
+        manifest_hash: str,
+        tool_descriptions: Mapping[str, str],
+    ) -> TrustResult:
+        """Register a server manifest with the trust and neural stages.
+
+        Record the hash with the trust evaluator, which registers it
+        for a new server and lowers trust if it changed, then
+        precompute the neural inspector's description scores so calls
+        to the server's tools run no description inference.
+
+        Args:
+            server_id: MCP server identifier.
+            manifest_hash: Hash of the server manifest.
+            tool_descriptions: Advertised description by tool name.
+
+        Returns:
+            TrustResult of the manifest check.
+
+        """
+        trust = self._trust.check_manifest(server_id, manifest_hash)
+        if self._inspector is not None:
+            await self._inspector.register_manifest(
+                server_id, manifest_hash, tool_descriptions,
+            )
+        return trust
+
     def mask_str(self, text: str) -> str:
         """Return text unchanged -- mcp_guard is check-only.
 
@@ -97,14 +192,51 @@ class McpGuardOrchestrator:
             Tuple of (triggered, detail).
 
         """
-        result = self._run_pipeline(text)
+        result = self._run_pipeline(_parse_tool_call(text))
+        return result.is_triggered, result.detail
+
+    async def check_tool_call(
+        self, content: ToolCallContent,
+    ) -> tuple[bool, str]:
+        """Check a structured tool call with all stages.
+
+        Read the parsed tool call data directly, without a JSON round
+        trip.
+
+        Args:
+            content: Tool call containing server_id, tool_name, and
+                args, and optionally tool_description and
+                manifest_hash.
+
+        Returns:
+            Tuple of (triggered, detail).
+
+        """
+        result = await self._run_pipeline_async(content.data)
         return result.is_triggered, result.detail
 
-    def _run_pipeline(self, text: str) -> GuardrailResult:
-        """Execute the MCP-Guard pipeline.
+    async def check_async(self, text: str) -> tuple[bool, str]:
+        """Check a tool call with all stages.
 
         Args:
-            text: JSON-serialized tool call data.
+            text: JSON-serialized tool call data containing
+                server_id, tool_name, and args, and optionally
+                tool_description and manifest_hash.
+
+        Returns:
+            Tuple of (triggered, detail).
+
+        """
+        result = await self._run_pipeline_async(_parse_tool_call(text))
+        return result.is_triggered, result.detail
+
+    def _run_pipeline(
+        self, tool_info: dict[str, object] | None,
+    ) -> GuardrailResult:
+        """Execute the policy and syntactic stages.
+
+        Args:
+            tool_info: Tool call data, or None if it couldn't be parsed.
 
         Returns:
             GuardrailResult from the highest-triggered stage.
@@ -117,77 +249,293 @@ class McpGuardOrchestrator:
             span.set_attribute(
                 "streetrace.guardrail.proxy", _PROXY_NAME,
             )
+            _, result = self._run_sync_stages(tool_info)
+            if result is None:
+                # Neural inspection requires async context, see
+                # check_async. Allow after syntactic passes.
+                result = _allow(_STAGE_SYNTACTIC)
+            _set_span_attributes(span, result)
+            return result
 
-            # Parse tool call JSON
-            tool_info = _parse_tool_call(text)
-            if tool_info is None:
-                result = GuardrailResult(
-                    action=GuardrailAction.BLOCK,
-                    confidence=STAGE1_CONFIDENCE,
-                    detail="Invalid tool call data: could not parse JSON",
-                    stage=_STAGE_POLICY,
-                    proxy=_PROXY_NAME,
-                )
-                _set_span_attributes(span, result)
-                return result
-
-            raw_server = tool_info.get("server_id", "")
-            server_id = str(raw_server) if raw_server else ""
-            raw_tool = tool_info.get("tool_name", "")
-            tool_name = str(raw_tool) if raw_tool else ""
-            raw_args = tool_info.get("args", {})
-            args: dict[str, object] = (
-                raw_args if isinstance(raw_args, dict) else {}
+    async def _run_pipeline_async(
+        self, tool_info: dict[str, object] | None,
+    ) -> GuardrailResult:
+        """Execute all stages, neural inspection within its deadline.
+
+        Run the policy and syntactic stages, then inspect the call
+        with the neural inspector while evaluating server trust. If
+        inference misses the deadline, return the syntactic result;
+        inference keeps running and its verdict is cached for the
+        next identical call. While neural_max_inflight inspections are
+        running, new calls skip the neural stage.
+
+        Args:
+            tool_info: Tool call data, or None if it couldn't be parsed.
+
+        Returns:
+            GuardrailResult from the highest-triggered stage.
+
+        """
+        tracer = trace.get_tracer(__name__)
+        with tracer.start_as_current_span(
+            "guardrail.mcp_guard.pipeline",
+        ) as span:
+            span.set_attribute(
+                "streetrace.guardrail.proxy", _PROXY_NAME,
             )
+            call, result = self._run_sync_stages(tool_info)
+            if result is None:
+                assert call is not None  # noqa: S101  # nosec B101
+                result = await self._run_trust_and_neural(call)
+            _set_span_attributes(span, result)
+            return result
+
+    def _run_sync_stages(
+        self, tool_info: dict[str, object] | None,
+    ) -> tuple[_ToolCall | None, GuardrailResult | None]:
+        """Read the tool call and run the policy and syntactic stages.
+
+        Args:
+            tool_info: Tool call data, or None if it couldn't be parsed.
 
-            # Stage 0: Policy enforcement
-            policy_result = self._policy.check(
-                server_id=server_id,
-                tool_name=tool_name,
-                args=args,
+        Returns:
+            The tool call, or None if parsing failed, and the block
+            result, or None if both stages passed.
+
+        """
+        if tool_info is None:
+            return None, GuardrailResult(
+                action=GuardrailAction.BLOCK,
+                confidence=STAGE1_CONFIDENCE,
+                detail="Invalid tool call data: could not parse JSON",
+                stage=_STAGE_POLICY,
+                proxy=_PROXY_NAME,
             )
-            if not policy_result.allowed:
-                result = GuardrailResult(
-                    action=GuardrailAction.BLOCK,
-                    confidence=STAGE1_CONFIDENCE,
-                    detail=policy_result.reason,
-                    stage=_STAGE_POLICY,
-                    proxy=_PROXY_NAME,
-                )
-                _set_span_attributes(span, result)
-                return result
-
-            # Stage 1: Syntactic gatekeeper
-            gk_result = self._gatekeeper.check(tool_name, args)
-            if gk_result.triggered:
-                detection_names = ", ".join(
-                    d.detector_name for d in gk_result.detections
-                )
-                result = GuardrailResult(
-                    action=GuardrailAction.BLOCK,
-                    confidence=STAGE1_CONFIDENCE,
-                    detail=(
-                        f"Syntactic gatekeeper triggered: "
-                        f"{detection_names}"
-                    ),
-                    stage=_STAGE_SYNTACTIC,
-                    proxy=_PROXY_NAME,
-                )
-                _set_span_attributes(span, result)
-                return result
-
-            # Stage 2: Neural inspector (async-only, skipped in sync)
-            # Neural inspection requires async context.
-            # In sync check_str, we return allow after syntactic passes.
-            result = GuardrailResult(
-                action=GuardrailAction.ALLOW,
+        call = _tool_call_fields(tool_info)
+
+        # Stage 0: Policy enforcement
+        policy_result = self._policy.check(
+            server_id=call.server_id,
+            tool_name=call.tool_name,
+            args=call.args,
+            args_text=call.args_text,
+        )
+        if not policy_result.allowed:
+            return call, GuardrailResult(
+                action=GuardrailAction.BLOCK,
+                confidence=STAGE1_CONFIDENCE,
+                detail=policy_result.reason,
+                stage=_STAGE_POLICY,
+                proxy=_PROXY_NAME,
+            )
+
+        # Stage 1: Syntactic gatekeeper
+        gk_result = self._check_syntactic(call)
+        if gk_result.triggered:
+            detection_names = ", ".join(
+                d.detector_name for d in gk_result.detections
+            )
+            return call, GuardrailResult(
+                action=GuardrailAction.BLOCK,
                 confidence=STAGE1_CONFIDENCE,
-                detail="",
+                detail=f"Syntactic gatekeeper triggered: {detection_names}",
                 stage=_STAGE_SYNTACTIC,
                 proxy=_PROXY_NAME,
             )
-            _set_span_attributes(span, result)
-            return result
+        return call, None
+
+    async def _run_trust_and_neural(self, call: _ToolCall) -> GuardrailResult:
+        """Evaluate server trust while the neural inspector runs.
+
+        Args:
+            call: Tool call that passed the policy and syntactic stages.
+
+        Returns:
+            Block result from the trust or neural stage, or allow.
+
+        """
+        manifest_hash = call.manifest_hash or (
+            self._trust.manifest_hash(call.server_id) or ""
+        )
+        key = (
+            self.name,
+            f"{_STAGE_NEURAL}:{call.server_id}:{manifest_hash}",
+            content_digest(
+                call.tool_name,
+                f"{json.dumps(call.tool_description)}\n{call.args_text}",
+            ),
+        )
+        verdict = self._neural_memo.get(key)
+        task = None
+        if verdict is None and self._inspector is not None:
+            task = self._inflight.get(key)
+            if task is None:
+                if len(self._inflight) < self._config.neural_max_inflight:
+                    task = self._start_inspection(key, call, manifest_hash)
+                else:
+                    logger.warning(
+                        "%d neural inspections still running, skipping %s",
+                        len(self._inflight),
+                        call.tool_name,
+                    )
+
+        trust = (
+            self._trust.check_manifest(call.server_id, call.manifest_hash)
+            if call.manifest_hash
+            else self._trust.evaluate(call.server_id)
+        )
+        if not trust.is_trusted:
+            return GuardrailResult(
+                action=GuardrailAction.BLOCK,
+                confidence=STAGE1_CONFIDENCE,
+                detail=trust.reason,
+                stage=_STAGE_TRUST,
+                proxy=_PROXY_NAME,
+            )
+
+        if task is not None:
+            done, _ = await asyncio.wait(
+                {task}, timeout=self._config.neural_deadline_ms / 1000.0,
+            )
+            if not done:
+                logger.warning(
+                    "Neural inspector exceeded %.0f ms deadline for %s, "
+                    "using syntactic result",
+                    self._config.neural_deadline_ms,
+                    call.tool_name,
+                )
+                return _allow(_STAGE_SYNTACTIC)
+            if not task.cancelled() and task.exception() is None:
+                verdict = task.result()
+
+        if verdict is None:
+            return _allow(_STAGE_SYNTACTIC)
+        if verdict.anomaly_score >= self._config.neural_block_threshold:
+            detail = "; ".join(verdict.anomalies) or (
+                "tool description deviates from known-good tools"
+            )
+            return GuardrailResult(
+                action=GuardrailAction.BLOCK,
+                confidence=verdict.anomaly_score,
+                detail=f"Neural inspector anomaly: {detail}",
+                stage=_STAGE_NEURAL,
+                proxy=_PROXY_NAME,
+            )
+        return _allow(_STAGE_NEURAL)
+
+    def _start_inspection(
+        self,
+        key: MemoKey,
+        call: _ToolCall,
+        manifest_hash: str,
+    ) -> asyncio.Task[InspectorResult]:
+        """Start neural inspection and cache its verdict when done.
+
+        The task outlives a check that stops waiting for it, so its
+        verdict still lands in the cache.
+
+        Args:
+            key: Memo key of the verdict.
+            call: Tool call to inspect.
+            manifest_hash: Hash of the server's current manifest.
+
+        Returns:
+            The running inspection task.
+
+        """
+        assert self._inspector is not None  # noqa: S101  # nosec B101
+        task = asyncio.ensure_future(
+            self._inspector.inspect(
+                tool_name=call.tool_name,
+                tool_description=call.tool_description,
+                args=call.args,
+                server_id=call.server_id,
+                manifest_hash=manifest_hash,
+            ),
+        )
+        self._inflight[key] = task
+
+        def _store(done: asyncio.Task[InspectorResult]) -> None:
+            self._inflight.pop(key, None)
+            if done.cancelled():
+                return
+            exc = done.exception()
+            if exc is not None:
+                logger.warning("Neural inspector failed: %s", exc)
+                return
+            self._neural_memo.put(key, done.result())
+
+        task.add_done_callback(_store)
+        return task
+
+    def _check_syntactic(self, call: _ToolCall) -> GatekeeperResult:
+        """Run the syntactic gatekeeper, reusing memoized results.
+
+        Unlike policy enforcement, which counts calls, the gatekeeper
+        result only depends on the tool name and arguments.
+
+        Args:
+            call: Tool call to check.
+
+        Returns:
+            GatekeeperResult for the tool call.
+
+        """
+        key = (
+            self.name,
+            _STAGE_SYNTACTIC,
+            content_digest(call.tool_name, call.args_text),
+        )
+        cached = self._syntactic_memo.get(key)
+        if cached is not None:
+            return cached
+        gk_result = self._gatekeeper.check(call.tool_name, call.args)
+        self._syntactic_memo.put(key, gk_result)
+        return gk_result
+
+
+def _allow(stage: str) -> GuardrailResult:
+    """Build the allow result of the last stage that ran.
+
+    Args:
+        stage: Stage name.
+
+    Returns:
+        Allow result.
+
+    """
+    return GuardrailResult(
+        action=GuardrailAction.ALLOW,
+        confidence=STAGE1_CONFIDENCE,
+        detail="",
+        stage=stage,
+        proxy=_PROXY_NAME,
+    )
+
+
+def _tool_call_fields(tool_info: dict[str, object]) -> _ToolCall:
+    """Read tool call fields from tool call data.
+
+    Args:
+        tool_info: Tool call data.
+
+    Returns:
+        Tool call fields; missing or empty values become empty.
+
+    """
+
+    def text_field(name: str) -> str:
+        value = tool_info.get(name, "")
+        return str(value) if value else ""
+
+    raw_args = tool_info.get("args", {})
+    return _ToolCall(
+        server_id=text_field("server_id"),
+        tool_name=text_field("tool_name"),
+        tool_description=text_field("tool_description"),
+        manifest_hash=text_field("manifest_hash"),
+        args=raw_args if isinstance(raw_args, dict) else {},
+    )
 
 
 def _parse_tool_call(text: str) -> dict[str, object] | None:
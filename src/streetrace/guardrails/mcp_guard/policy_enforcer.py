@@ -8,37 +8,51 @@ from __future__ import annotations
 
 import json
 import re
+import time
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
+from streetrace.guardrails.config import RateLimitConfig
+from streetrace.guardrails.mcp_guard.rate_limiter import TokenBucketLimiter
+from streetrace.guardrails.pattern_scanner import PatternScanner
 from streetrace.log import get_logger
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from streetrace.guardrails.config import McpGuardConfig
 
 logger = get_logger(__name__)
 
-DEFAULT_MAX_CALLS_PER_TOOL = 100
-"""Default maximum calls per tool per session."""
+DEFAULT_MAX_CALLS_PER_TOOL = RateLimitConfig().burst
+"""Default number of back-to-back calls allowed per tool."""
 
-_DATA_BOUNDARY_PATTERNS: list[tuple[str, re.Pattern[str]]] = [
+_DATA_BOUNDARY_PATTERNS: list[tuple[str, re.Pattern[str], tuple[str, ...]]] = [
     ("aws_secret", re.compile(
         r"(?:AWS_SECRET_ACCESS_KEY|AWS_SESSION_TOKEN)\s*=",
         re.IGNORECASE,
-    )),
+    ), ("aws_secret_access_key", "aws_session_token")),
     ("api_key", re.compile(
         r"(?:OPENAI_API_KEY|ANTHROPIC_API_KEY|API_KEY)\s*=",
         re.IGNORECASE,
-    )),
+    ), ("api_key",)),
     ("private_key", re.compile(
         r"-----BEGIN\s+(?:RSA\s+)?PRIVATE\s+KEY-----",
-    )),
+    ), ("-----begin",)),
     ("password_field", re.compile(
         r"(?:password|passwd|secret)\s*[:=]\s*\S+",
         re.IGNORECASE,
-    )),
+    ), ("password", "passwd", "secret")),
 ]
-"""Patterns for detecting credential exfiltration in arguments."""
+"""Patterns for detecting credential exfiltration in arguments.
+
+Each entry is (pattern name, regex, literals), see PatternScanner.
+"""
+
+_DATA_BOUNDARY_SCANNER = PatternScanner([
+    (pattern, literals) for _, pattern, literals in _DATA_BOUNDARY_PATTERNS
+])
+"""Scanner over the data boundary patterns."""
 
 
 @dataclass(frozen=True)
@@ -66,18 +80,35 @@ class PolicyEnforcer:
         self,
         *,
         config: McpGuardConfig,
-        max_calls_per_tool: int = DEFAULT_MAX_CALLS_PER_TOOL,
+        max_calls_per_tool: int | None = None,
+        clock: Callable[[], float] = time.monotonic,
     ) -> None:
         """Initialize the policy enforcer.
 
         Args:
-            config: MCP-Guard configuration with lists and thresholds.
-            max_calls_per_tool: Maximum calls per tool before rate limiting.
+            config: MCP-Guard configuration with lists, thresholds,
+                and rate limits.
+            max_calls_per_tool: Burst size overriding the configured
+                per-tool limit, at its configured sustained rate.
+            clock: Monotonic clock for rate limiting, in seconds.
 
         """
         self._config = config
-        self._max_calls = max_calls_per_tool
-        self._call_counts: dict[str, int] = {}
+        tool_limit = config.tool_rate_limit
+        if max_calls_per_tool is not None:
+            tool_limit = (tool_limit or RateLimitConfig()).model_copy(
+                update={"burst": max_calls_per_tool},
+            )
+        self._tool_limiter = (
+            TokenBucketLimiter(config=tool_limit, clock=clock)
+            if tool_limit is not None
+            else None
+        )
+        self._server_limiter = (
+            TokenBucketLimiter(config=config.server_rate_limit, clock=clock)
+            if config.server_rate_limit is not None
+            else None
+        )
 
     def check(
         self,
@@ -85,6 +116,7 @@ class PolicyEnforcer:
         server_id: str,
         tool_name: str,
         args: dict[str, object] | None = None,
+        args_text: str | None = None,
     ) -> PolicyResult:
         """Check a tool call against all policies.
 
@@ -95,6 +127,8 @@ class PolicyEnforcer:
             server_id: MCP server identifier.
             tool_name: Name of the tool being called.
             args: Tool call arguments (optional).
+            args_text: JSON form of *args* if the caller already has
+                it, so the arguments aren't serialized again.
 
         Returns:
             PolicyResult with allowed status and reason.
@@ -128,8 +162,10 @@ class PolicyEnforcer:
             return rate_result
 
         # Data boundary enforcement
-        if args is not None:
-            boundary_result = self._check_data_boundaries(args)
+        if args_text is None and args is not None:
+            args_text = json.dumps(args, default=str)
+        if args_text is not None:
+            boundary_result = self._check_data_boundaries(args_text)
             if not boundary_result.allowed:
                 return boundary_result
 
@@ -143,7 +179,10 @@ class PolicyEnforcer:
         server_id: str,
         tool_name: str,
     ) -> PolicyResult:
-        """Check and update rate limit for a tool.
+        """Check and update the tool and server rate limits.
+
+        A call spends a token from both buckets, and only if both
+        have one, so calls blocked by one limit don't drain the other.
 
         Args:
             server_id: Server identifier.
@@ -153,64 +192,88 @@ class PolicyEnforcer:
             PolicyResult indicating if rate limit is exceeded.
 
         """
-        key = f"{server_id}:{tool_name}"
-        current = self._call_counts.get(key, 0)
+        tool_key = f"{server_id}:{tool_name}"
+        tool_limiter = self._tool_limiter
+        server_limiter = self._server_limiter
 
-        if current >= self._max_calls:
-            logger.warning(
-                "Rate limit exceeded for %s on %s: %d/%d",
-                tool_name,
-                server_id,
-                current,
-                self._max_calls,
-            )
-            return PolicyResult(
-                allowed=False,
-                reason=(
-                    f"Rate limit exceeded for '{tool_name}' "
-                    f"on server '{server_id}': "
-                    f"{current}/{self._max_calls} calls"
-                ),
+        if tool_limiter is not None and tool_limiter.available(tool_key) < 1.0:
+            return self._rate_limited(
+                f"'{tool_name}' on server '{server_id}'", tool_limiter,
             )
+        if (
+            server_limiter is not None
+            and server_limiter.available(server_id) < 1.0
+        ):
+            return self._rate_limited(f"server '{server_id}'", server_limiter)
 
-        self._call_counts[key] = current + 1
+        if tool_limiter is not None:
+            tool_limiter.consume(tool_key)
+        if server_limiter is not None:
+            server_limiter.consume(server_id)
         return PolicyResult(
             allowed=True,
             reason="Within rate limit",
         )
 
-    def _check_data_boundaries(
-        self,
-        args: dict[str, object],
+    @staticmethod
+    def _rate_limited(
+        subject: str,
+        limiter: TokenBucketLimiter,
     ) -> PolicyResult:
+        """Build the result for a call over a rate limit.
+
+        Args:
+            subject: Description of the rate-limited tool or server.
+            limiter: Limiter whose bucket is empty.
+
+        Returns:
+            PolicyResult blocking the call.
+
+        """
+        logger.warning(
+            "Rate limit exceeded for %s: %.0f calls/min, burst %d",
+            subject,
+            limiter.rate_per_minute,
+            limiter.burst,
+        )
+        return PolicyResult(
+            allowed=False,
+            reason=(
+                f"Rate limit exceeded for {subject}: "
+                f"{limiter.rate_per_minute:g} calls/min, "
+                f"burst {limiter.burst}"
+            ),
+        )
+
+    def _check_data_boundaries(self, text: str) -> PolicyResult:
         """Check tool arguments for data boundary violations.
 
         Scan serialized arguments for credential patterns and
         other sensitive data that should not leave the system.
 
         Args:
-            args: Tool call arguments.
+            text: JSON-serialized tool call arguments.
 
         Returns:
             PolicyResult indicating if boundaries are violated.
 
         """
-        text = json.dumps(args, default=str)
-
-        for pattern_name, pattern in _DATA_BOUNDARY_PATTERNS:
-            match = pattern.search(text)
-            if match:
-                logger.warning(
-                    "Data boundary violation: %s matched in tool args",
-                    pattern_name,
-                )
-                return PolicyResult(
-                    allowed=False,
-                    reason=(
-                        f"Data boundary violation: "
-                        f"{pattern_name} pattern detected in arguments"
-                    ),
-                )
+        found = _DATA_BOUNDARY_SCANNER.first(
+            text, max_scan_chars=self._config.max_scan_chars,
+        )
+        if found is not None:
+            pattern_name = _DATA_BOUNDARY_PATTERNS[found[0]][0]
+            logger.warning(
+                "Data boundary violation: %s matched in tool args",
+                pattern_name,
+            )
+            return PolicyResult(
+                allowed=False,
+                reason=(
+                    f"Data boundary violation: "
+                    f"{pattern_name} pattern detected in arguments"
+                ),
+            )
 
         return PolicyResult(
             allowed=True,
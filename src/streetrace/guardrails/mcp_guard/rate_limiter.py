@@ -0,0 +1,137 @@
+"""Token bucket rate limiter for MCP tool calls.
+
+Each key (a tool or a server) owns a bucket holding up to ``burst``
+tokens that refills at a sustained rate; a call spends one token.
+Checks are O(1). A bucket left idle long enough to refill completely
+behaves exactly like a new one, so such buckets are evicted as keys
+are touched, keeping memory proportional to the recently active keys.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from streetrace.guardrails.config import RateLimitConfig
+
+_SECONDS_PER_MINUTE = 60.0
+"""Conversion from calls per minute to calls per second."""
+
+_EVICTIONS_PER_TOUCH = 2
+"""Idle buckets evicted at most per touched key, bounding check cost."""
+
+
+@dataclass(slots=True)
+class _Bucket:
+    """Tokens left in a bucket and when they were last refilled."""
+
+    tokens: float
+    updated_at: float
+
+
+class TokenBucketLimiter:
+    """Per-key token buckets sharing one rate and burst size."""
+
+    def __init__(
+        self,
+        *,
+        config: RateLimitConfig,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the limiter.
+
+        Args:
+            config: Sustained rate and burst size of every bucket.
+            clock: Monotonic clock in seconds, injectable for tests.
+
+        """
+        self._rate = config.calls_per_minute / _SECONDS_PER_MINUTE
+        self._burst = float(config.burst)
+        self._refill_seconds = self._burst / self._rate
+        self._clock = clock
+        self._buckets: OrderedDict[str, _Bucket] = OrderedDict()
+
+    @property
+    def rate_per_minute(self) -> float:
+        """Return the sustained rate in calls per minute."""
+        return self._rate * _SECONDS_PER_MINUTE
+
+    @property
+    def burst(self) -> int:
+        """Return the bucket capacity."""
+        return int(self._burst)
+
+    @property
+    def size(self) -> int:
+        """Return the number of tracked keys."""
+        return len(self._buckets)
+
+    def available(self, key: str) -> float:
+        """Refill the bucket for *key* and return its tokens.
+
+        Args:
+            key: Rate-limited key.
+
+        Returns:
+            Tokens available; a call is allowed if at least 1.
+
+        """
+        now = self._clock()
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = _Bucket(tokens=self._burst, updated_at=now)
+            self._buckets[key] = bucket
+        else:
+            elapsed = now - bucket.updated_at
+            if elapsed > 0:
+                bucket.tokens = min(
+                    self._burst, bucket.tokens + elapsed * self._rate,
+                )
+                bucket.updated_at = now
+            self._buckets.move_to_end(key)
+        self._evict_idle(now)
+        return bucket.tokens
+
+    def consume(self, key: str) -> None:
+        """Spend one token of *key*, refilled by a prior ``available``.
+
+        Args:
+            key: Rate-limited key.
+
+        """
+        bucket = self._buckets.get(key)
+        if bucket is not None:
+            bucket.tokens -= 1.0
+
+    def try_acquire(self, key: str) -> bool:
+        """Spend one token of *key* if one is available.
+
+        Args:
+            key: Rate-limited key.
+
+        Returns:
+            True if the call is within the limit.
+
+        """
+        if self.available(key) < 1.0:
+            return False
+        self.consume(key)
+        return True
+
+    def _evict_idle(self, now: float) -> None:
+        """Drop least recently used buckets that have fully refilled.
+
+        Args:
+            now: Current clock value.
+
+        """
+        for _ in range(_EVICTIONS_PER_TOUCH):
+            key, bucket = next(iter(self._buckets.items()))
+            if now - bucket.updated_at < self._refill_seconds:
+                return
+            del self._buckets[key]
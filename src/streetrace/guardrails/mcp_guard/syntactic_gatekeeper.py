@@ -11,6 +11,7 @@ import json
 import re
 from dataclasses import dataclass, field
 
+from streetrace.guardrails.pattern_scanner import PatternScanner
 from streetrace.log import get_logger
 
 logger = get_logger(__name__)
@@ -50,102 +51,109 @@ class GatekeeperResult:
 
 # ---------------------------------------------------------------------------
 # Pattern definitions for each detector
+#
+# Each entry is (pattern name, regex, literals). Every match contains at
+# least one of the lowercase literals, see PatternScanner.
 # ---------------------------------------------------------------------------
 
-_SHELL_INJECTION_PATTERNS: list[tuple[str, re.Pattern[str]]] = [
-    ("rm_rf", re.compile(r"\brm\s+-[a-z]*r[a-z]*f[a-z]*\s", re.IGNORECASE)),
+_DetectorPattern = tuple[str, re.Pattern[str], tuple[str, ...]]
+
+_SHELL_INJECTION_PATTERNS: list[_DetectorPattern] = [
+    ("rm_rf", re.compile(
+        r"\brm\s+-[a-z]*r[a-z]*f[a-z]*\s", re.IGNORECASE,
+    ), ("rm",)),
     ("curl_pipe_shell", re.compile(
         r"\bcurl\b.*\|\s*(?:ba)?sh\b", re.IGNORECASE,
-    )),
+    ), ("curl",)),
     ("eval_command", re.compile(
         r"\beval\s+\$?\(", re.IGNORECASE,
-    )),
+    ), ("eval",)),
     ("backtick_exec", re.compile(
         r"`[^`]*(?:curl|wget|rm|chmod|chown|cat)\b[^`]*`", re.IGNORECASE,
-    )),
+    ), ("`",)),
     ("wget_exec", re.compile(
         r"\bwget\b.*\|\s*(?:ba)?sh\b", re.IGNORECASE,
-    )),
+    ), ("wget",)),
     ("chmod_exec", re.compile(
         r"\bchmod\s+[+0-7]*[xst]\S*\s", re.IGNORECASE,
-    )),
+    ), ("chmod",)),
 ]
 
-_SQL_INJECTION_PATTERNS: list[tuple[str, re.Pattern[str]]] = [
+_SQL_INJECTION_PATTERNS: list[_DetectorPattern] = [
     ("union_select", re.compile(
         r"(?:\d+|['\"])\s*\bUNION\s+(?:ALL\s+)?SELECT\b", re.IGNORECASE,
-    )),
+    ), ("union",)),
     ("or_tautology", re.compile(
         r"['\"]\s*OR\s+\d+\s*=\s*\d+", re.IGNORECASE,
-    )),
+    ), ("=",)),
     ("drop_table", re.compile(
         r"\bDROP\s+TABLE\b", re.IGNORECASE,
-    )),
+    ), ("drop",)),
     ("sql_comment", re.compile(
         r";\s*--\s*$", re.MULTILINE,
-    )),
+    ), ("--",)),
 ]
 
-_SENSITIVE_FILE_PATTERNS: list[tuple[str, re.Pattern[str]]] = [
-    ("etc_passwd", re.compile(r"/etc/(?:passwd|shadow|hosts)\b")),
-    ("dot_env", re.compile(r"(?:^|/|\\)\.env(?:\s|$|/)", re.MULTILINE)),
-    ("ssh_dir", re.compile(r"\.ssh/")),
-    ("git_dir", re.compile(r"\.git/")),
+_SENSITIVE_FILE_PATTERNS: list[_DetectorPattern] = [
+    ("etc_passwd", re.compile(r"/etc/(?:passwd|shadow|hosts)\b"), ("/etc/",)),
+    ("dot_env", re.compile(r"(?:^|/|\\)\.env(?:\s|$|/)", re.MULTILINE), (".env",)),
+    ("ssh_dir", re.compile(r"\.ssh/"), (".ssh/",)),
+    ("git_dir", re.compile(r"\.git/"), (".git/",)),
     ("aws_credentials", re.compile(
         r"\.aws/(?:credentials|config)\b",
-    )),
-    ("docker_env", re.compile(r"\.docker/config\.json\b")),
-    ("kube_config", re.compile(r"\.kube/config\b")),
+    ), (".aws/",)),
+    ("docker_env", re.compile(r"\.docker/config\.json\b"), (".docker/config",)),
+    ("kube_config", re.compile(r"\.kube/config\b"), (".kube/config",)),
 ]
 
-_SHADOW_HIJACK_PATTERNS: list[tuple[str, re.Pattern[str]]] = [
+_SHADOW_HIJACK_PATTERNS: list[_DetectorPattern] = [
     ("spoofed_call", re.compile(
         r"\bspoofed?_?call\b", re.IGNORECASE,
-    )),
+    ), ("spoof",)),
     ("fake_server", re.compile(
         r"\bfake_?server\b", re.IGNORECASE,
-    )),
+    ), ("fake",)),
     ("instruction_override", re.compile(
         r"\boverride\s+(?:the\s+)?(?:previous\s+)?(?:tool\s+)?instructions?\b",
         re.IGNORECASE,
-    )),
+    ), ("override",)),
     ("instruction_tampering", re.compile(
         r"\btamper(?:ing|ed)?\s+(?:with\s+)?instructions?\b",
         re.IGNORECASE,
-    )),
+    ), ("tamper",)),
 ]
 
-_IMPORTANT_TAG_PATTERNS: list[tuple[str, re.Pattern[str]]] = [
+_IMPORTANT_TAG_PATTERNS: list[_DetectorPattern] = [
     ("important_tag", re.compile(
         r"<important\b[^>]*>", re.IGNORECASE,
-    )),
+    ), ("<important",)),
     ("system_tag", re.compile(
         r"<system\b[^>]*>", re.IGNORECASE,
-    )),
+    ), ("<system",)),
     ("priority_tag", re.compile(
         r"<(?:priority|urgent|critical)\b[^>]*>", re.IGNORECASE,
-    )),
+    ), ("<priority", "<urgent", "<critical")),
 ]
 
-_CROSS_ORIGIN_PATTERNS: list[tuple[str, re.Pattern[str]]] = [
+_CROSS_ORIGIN_PATTERNS: list[_DetectorPattern] = [
     ("metadata_endpoint", re.compile(
         r"169\.254\.169\.254",
-    )),
+    ), ("169.254.169.254",)),
     ("localhost_access", re.compile(
         r"(?:localhost|127\.0\.0\.1)(?::\d+)?",
-    )),
+    ), ("localhost", "127.0.0.1")),
     ("internal_ip_10", re.compile(
         r"\b10\.\d{1,3}\.\d{1,3}\.\d{1,3}\b",
-    )),
+    ), ("10.",)),
     ("internal_ip_172", re.compile(
         r"\b172\.(?:1[6-9]|2\d|3[01])\.\d{1,3}\.\d{1,3}\b",
-    )),
+    ), ("172.",)),
     ("internal_ip_192", re.compile(
         r"\b192\.168\.\d{1,3}\.\d{1,3}\b",
-    )),
+    ), ("192.168.",)),
 ]
 
-_DETECTOR_REGISTRY: dict[str, list[tuple[str, re.Pattern[str]]]] = {
+_DETECTOR_REGISTRY: dict[str, list[_DetectorPattern]] = {
     "shell_injection": _SHELL_INJECTION_PATTERNS,
     "sql_injection": _SQL_INJECTION_PATTERNS,
     "sensitive_file": _SENSITIVE_FILE_PATTERNS,
@@ -171,6 +179,20 @@ _SEVERITY_ORDER: dict[str, int] = {
 }
 """Numeric ordering for severity comparison."""
 
+_SCAN_ENTRIES: list[tuple[str, str]] = [
+    (detector_name, pattern_name)
+    for detector_name, patterns in _DETECTOR_REGISTRY.items()
+    for pattern_name, _, _ in patterns
+]
+"""(detector name, pattern name) of each pattern in scanner order."""
+
+_SCANNER = PatternScanner([
+    (pattern, literals)
+    for patterns in _DETECTOR_REGISTRY.values()
+    for _, pattern, literals in patterns
+])
+"""Scanner over all detector patterns."""
+
 
 class SyntacticGatekeeper:
     """Run 6 pattern detectors against tool call data.
@@ -179,6 +201,16 @@ class SyntacticGatekeeper:
     attack patterns across all detector categories.
     """
 
+    def __init__(self, *, max_scan_chars: int | None = None) -> None:
+        """Initialize the gatekeeper.
+
+        Args:
+            max_scan_chars: Maximum characters of a tool call scanned
+                per check, or None to scan the whole call.
+
+        """
+        self._max_scan_chars = max_scan_chars
+
     def check(
         self,
         tool_name: str,
@@ -197,22 +229,21 @@ class SyntacticGatekeeper:
         text = _serialize_for_scanning(tool_name, args)
         detections: list[Detection] = []
 
-        for detector_name, patterns in _DETECTOR_REGISTRY.items():
-            severity = SEVERITY_MAP.get(detector_name, "medium")
-            for pattern_name, pattern in patterns:
-                match = pattern.search(text)
-                if match:
-                    detections.append(Detection(
-                        detector_name=detector_name,
-                        matched_text=match.group(),
-                        severity=severity,
-                    ))
-                    logger.warning(
-                        "MCP gatekeeper %s/%s matched: %s",
-                        detector_name,
-                        pattern_name,
-                        match.group(),
-                    )
+        for index, match in _SCANNER.scan(
+            text, max_scan_chars=self._max_scan_chars,
+        ):
+            detector_name, pattern_name = _SCAN_ENTRIES[index]
+            detections.append(Detection(
+                detector_name=detector_name,
+                matched_text=match.group(),
+                severity=SEVERITY_MAP.get(detector_name, "medium"),
+            ))
+            logger.warning(
+                "MCP gatekeeper %s/%s matched: %s",
+                detector_name,
+                pattern_name,
+                match.group(),
+            )
 
         if not detections:
             return GatekeeperResult(triggered=False)
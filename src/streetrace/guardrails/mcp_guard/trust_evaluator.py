@@ -120,6 +120,18 @@ class TrustEvaluator:
             manifest_hash[:16],
         )
 
+    def manifest_hash(self, server_id: str) -> str | None:
+        """Return the registered manifest hash of a server.
+
+        Args:
+            server_id: Server identifier.
+
+        Returns:
+            The current manifest hash, or None if none is registered.
+
+        """
+        return self._manifest_hashes.get(server_id)
+
     def check_manifest(
         self,
         server_id: str,
@@ -0,0 +1,205 @@
+"""Multi-pattern scanner with a literal prefilter.
+
+Scanning large texts with dozens of regexes one after another costs a
+full regex pass per pattern. Most patterns can only match text that
+contains one of a few literal substrings (``curl``, ``/etc/``,
+``union``), so the scanner first checks which required literals occur
+in the text and only runs the regexes that can possibly match.
+
+Long texts are scanned in overlapping chunks, so the lowercased copy
+and each regex pass stay bounded, a search can stop at the first hit,
+and a per-check budget can cap how much of the text is scanned.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from streetrace.guardrails.chunking import iter_chunks
+from streetrace.log import get_logger
+
+if TYPE_CHECKING:
+    import re
+    from collections.abc import Iterator, Sequence
+
+logger = get_logger(__name__)
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+"""Characters scanned at a time in long texts."""
+
+DEFAULT_MAX_MATCH_SPAN = 1024
+"""Longest match guaranteed to be found whole across chunk boundaries."""
+
+_ASCII_CASE_EQUIVALENTS = str.maketrans({
+    "\u0130": "i",  # LATIN CAPITAL LETTER I WITH DOT ABOVE
+    "\u0131": "i",  # LATIN SMALL LETTER DOTLESS I
+    "\u017f": "s",  # LATIN SMALL LETTER LONG S
+    "\u212a": "k",  # KELVIN SIGN
+})
+"""Non-ASCII characters that match an ASCII letter under re.IGNORECASE.
+
+str.lower() maps some of them to several characters or leaves them as
+is, which would hide a literal the regex engine still matches.
+"""
+
+
+class PatternScanner:
+    """Scan text against a fixed set of regexes in one call.
+
+    Each pattern comes with the literals its matches must contain. A
+    match has to contain at least one of them, compared
+    case-insensitively. Patterns without literals always run.
+
+    Literal lookup is a substring search per distinct literal over a
+    lowercased copy of the text, which runs in C and is much cheaper
+    than a regex pass. Patterns sharing a literal share the lookup.
+
+    Texts longer than ``chunk_size`` are scanned chunk by chunk.
+    Consecutive chunks share ``max_match_span - 1`` characters, so a
+    match of up to ``max_match_span`` characters, and with it the
+    literal it contains, lies whole within one chunk. Longer matches
+    are still found if they start and end in the same chunk.
+    """
+
+    def __init__(
+        self,
+        patterns: Sequence[tuple[re.Pattern[str], tuple[str, ...]]],
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_match_span: int = DEFAULT_MAX_MATCH_SPAN,
+    ) -> None:
+        """Compile the literal index.
+
+        Args:
+            patterns: Pairs of compiled regex and required literals.
+            chunk_size: Characters scanned at a time in long texts.
+            max_match_span: Longest match guaranteed to be found across
+                chunk boundaries.
+
+        Raises:
+            ValueError: If max_match_span is not in [1, chunk_size].
+
+        """
+        if not 0 < max_match_span <= chunk_size:
+            msg = "max_match_span must be positive and at most chunk_size"
+            raise ValueError(msg)
+        self._chunk_size = chunk_size
+        self._overlap = max_match_span - 1
+        self._patterns = [pattern for pattern, _ in patterns]
+        self._always: set[int] = set()
+        self._by_literal: dict[str, list[int]] = {}
+        for index, (_, literals) in enumerate(patterns):
+            if not literals:
+                self._always.add(index)
+            for literal in literals:
+                self._by_literal.setdefault(literal.lower(), []).append(index)
+
+    def scan(
+        self,
+        text: str,
+        *,
+        max_scan_chars: int | None = None,
+    ) -> list[tuple[int, re.Match[str]]]:
+        """Find the first match of every pattern in the text.
+
+        Positions of matches in long texts are relative to the chunk
+        they were found in.
+
+        Args:
+            text: Text to scan.
+            max_scan_chars: Maximum characters to scan, counting chunk
+                overlaps. None scans the whole text.
+
+        Returns:
+            Pairs of pattern index and match, in pattern order.
+
+        """
+        found: dict[int, re.Match[str]] = {}
+        for chunk in self._chunks(text, max_scan_chars):
+            for index in self._candidates(chunk, skip=found):
+                match = self._patterns[index].search(chunk)
+                if match:
+                    found[index] = match
+            if len(found) == len(self._patterns):
+                break
+        return sorted(found.items())
+
+    def first(
+        self,
+        text: str,
+        *,
+        max_scan_chars: int | None = None,
+    ) -> tuple[int, re.Match[str]] | None:
+        """Find the first pattern that matches the text.
+
+        Chunks are scanned in text order and the scan stops at the
+        first chunk with a match. Within a chunk, patterns are tried in
+        pattern order.
+
+        Args:
+            text: Text to scan.
+            max_scan_chars: Maximum characters to scan, counting chunk
+                overlaps. None scans the whole text.
+
+        Returns:
+            Pair of pattern index and match, or None if nothing matches.
+
+        """
+        for chunk in self._chunks(text, max_scan_chars):
+            for index in self._candidates(chunk):
+                match = self._patterns[index].search(chunk)
+                if match:
+                    return index, match
+        return None
+
+    def _chunks(self, text: str, max_scan_chars: int | None) -> Iterator[str]:
+        """Yield the chunks of the text within the scan budget.
+
+        Args:
+            text: Text to scan.
+            max_scan_chars: Maximum characters to yield, or None.
+
+        Yields:
+            Overlapping chunks in text order.
+
+        """
+        scanned = 0
+        for chunk in iter_chunks(
+            text, chunk_size=self._chunk_size, overlap=self._overlap,
+        ):
+            if max_scan_chars is not None and scanned >= max_scan_chars:
+                logger.warning(
+                    "Pattern scan stopped after %d of %d characters",
+                    scanned,
+                    len(text),
+                )
+                return
+            if max_scan_chars is not None:
+                chunk = chunk[: max_scan_chars - scanned]
+            yield chunk
+            scanned += len(chunk)
+
+    def _candidates(
+        self,
+        text: str,
+        *,
+        skip: dict[int, re.Match[str]] | None = None,
+    ) -> list[int]:
+        """Return indices of patterns that may match the text.
+
+        Args:
+            text: Text to scan.
+            skip: Patterns to leave out, e.g. ones already matched.
+
+        Returns:
+            Sorted pattern indices whose literals occur in the text.
+
+        """
+        lowered = text.translate(_ASCII_CASE_EQUIVALENTS).lower()
+        candidates = set(self._always)
+        for literal, indices in self._by_literal.items():
+            if literal in lowered:
+                candidates.update(indices)
+        if skip:
+            candidates.difference_update(skip)
+        return sorted(candidates)
@@ -37,12 +37,16 @@ class PatternEntry:
         name: Human-readable pattern identifier.
         pattern: Compiled regex pattern.
         severity: Severity level ('high', 'medium', 'low').
+        literals: Lowercase substrings of which every match contains
+            at least one. Used to skip the regex on texts that can't
+            match; empty to always run it.
 
     """
 
     name: str
     pattern: re.Pattern[str]
     severity: str
+    literals: tuple[str, ...] = ()
 
 
 # ---------------------------------------------------------------------------
@@ -76,6 +80,7 @@ _INSTRUCTION_OVERRIDE_PATTERNS: list[PatternEntry] = [
             re.IGNORECASE,
         ),
         severity="high",
+        literals=("ignore",),
     ),
     PatternEntry(
         name="dan_jailbreak",
@@ -85,6 +90,7 @@ _INSTRUCTION_OVERRIDE_PATTERNS: list[PatternEntry] = [
             re.IGNORECASE,
         ),
         severity="high",
+        literals=("dan", "anything"),
     ),
     PatternEntry(
         name="pretend_no_restrictions",
@@ -94,6 +100,7 @@ _INSTRUCTION_OVERRIDE_PATTERNS: list[PatternEntry] = [
             re.IGNORECASE,
         ),
         severity="high",
+        literals=("pretend",),
     ),
     PatternEntry(
         name="reveal_system_prompt",
@@ -105,6 +112,7 @@ _INSTRUCTION_OVERRIDE_PATTERNS: list[PatternEntry] = [
             re.IGNORECASE,
         ),
         severity="high",
+        literals=("prompt", "instruction", "message"),
     ),
     PatternEntry(
         name="bypass_safety",
@@ -114,6 +122,7 @@ _INSTRUCTION_OVERRIDE_PATTERNS: list[PatternEntry] = [
             re.IGNORECASE,
         ),
         severity="high",
+        literals=("bypass",),
     ),
     PatternEntry(
         name="ignore_ethics",
@@ -123,6 +132,7 @@ _INSTRUCTION_OVERRIDE_PATTERNS: list[PatternEntry] = [
             re.IGNORECASE,
         ),
         severity="high",
+        literals=("ignore",),
     ),
     PatternEntry(
         name="new_instructions",
@@ -132,6 +142,7 @@ _INSTRUCTION_OVERRIDE_PATTERNS: list[PatternEntry] = [
             re.IGNORECASE,
         ),
         severity="high",
+        literals=("instruction",),
     ),
 ]
 
@@ -147,6 +158,7 @@ _SHELL_INJECTION_PATTERNS: list[PatternEntry] = [
             re.IGNORECASE,
         ),
         severity="high",
+        literals=("rm",),
     ),
     PatternEntry(
         name="curl_pipe_shell",
@@ -155,6 +167,7 @@ _SHELL_INJECTION_PATTERNS: list[PatternEntry] = [
             re.IGNORECASE,
         ),
         severity="high",
+        literals=("curl",),
     ),
     PatternEntry(
         name="backtick_execution",
@@ -163,6 +176,7 @@ _SHELL_INJECTION_PATTERNS: list[PatternEntry] = [
             re.IGNORECASE,
         ),
         severity="medium",
+        literals=("`",),
     ),
     PatternEntry(
         name="dollar_command_sub",
@@ -171,6 +185,7 @@ _SHELL_INJECTION_PATTERNS: list[PatternEntry] = [
             re.IGNORECASE,
         ),
         severity="medium",
+        literals=("$(",),
     ),
 ]
 
@@ -186,6 +201,7 @@ _SQL_INJECTION_PATTERNS: list[PatternEntry] = [
             re.IGNORECASE,
         ),
         severity="high",
+        literals=("union",),
     ),
     PatternEntry(
         name="or_tautology",
@@ -194,6 +210,7 @@ _SQL_INJECTION_PATTERNS: list[PatternEntry] = [
             re.IGNORECASE,
         ),
         severity="high",
+        literals=("=",),
     ),
     PatternEntry(
         name="drop_table",
@@ -202,6 +219,7 @@ _SQL_INJECTION_PATTERNS: list[PatternEntry] = [
             re.IGNORECASE,
         ),
         severity="high",
+        literals=("drop",),
     ),
     PatternEntry(
         name="sql_comment_terminator",
@@ -210,6 +228,7 @@ _SQL_INJECTION_PATTERNS: list[PatternEntry] = [
             re.MULTILINE,
         ),
         severity="medium",
+        literals=("--",),
     ),
 ]
 
@@ -224,6 +243,7 @@ _PATH_TRAVERSAL_PATTERNS: list[PatternEntry] = [
             r"\.\./\.\./",
         ),
         severity="high",
+        literals=("../../",),
     ),
     PatternEntry(
         name="etc_passwd",
@@ -231,6 +251,7 @@ _PATH_TRAVERSAL_PATTERNS: list[PatternEntry] = [
             r"/etc/(?:passwd|shadow|hosts)\b",
         ),
         severity="high",
+        literals=("/etc/",),
     ),
     PatternEntry(
         name="dot_env_file",
@@ -239,6 +260,7 @@ _PATH_TRAVERSAL_PATTERNS: list[PatternEntry] = [
             re.MULTILINE,
         ),
         severity="medium",
+        literals=(".env",),
     ),
     PatternEntry(
         name="ssh_directory",
@@ -246,6 +268,7 @@ _PATH_TRAVERSAL_PATTERNS: list[PatternEntry] = [
             r"\.ssh/",
         ),
         severity="high",
+        literals=(".ssh/",),
     ),
 ]
 
@@ -261,6 +284,7 @@ _ENCODING_ATTACK_PATTERNS: list[PatternEntry] = [
             re.IGNORECASE,
         ),
         severity="medium",
+        literals=("base64",),
     ),
     PatternEntry(
         name="hex_escape_sequence",
@@ -268,6 +292,7 @@ _ENCODING_ATTACK_PATTERNS: list[PatternEntry] = [
             r"(?:\\x[0-9a-fA-F]{2}){4,}",
         ),
         severity="medium",
+        literals=("\\x",),
     ),
     PatternEntry(
         name="unicode_escape_sequence",
@@ -275,6 +300,7 @@ _ENCODING_ATTACK_PATTERNS: list[PatternEntry] = [
             r"(?:\\u[0-9a-fA-F]{4}){4,}",
         ),
         severity="medium",
+        literals=("\\u",),
     ),
 ]
 
@@ -1,15 +1,20 @@
 """Semantic detector for embedding-based prompt injection detection.
 
 Embed text via InferencePipeline (MiniLM model) and compute cosine
-similarity against known injection pattern embeddings.
+similarity against known injection pattern embeddings. Reference
+embeddings are kept as a pre-normalized matrix, so scoring a text
+against all references is a single matrix-vector product.
 """
 
 from __future__ import annotations
 
+import heapq
 import math
 from dataclasses import dataclass
+from pathlib import Path
 from typing import TYPE_CHECKING
 
+from streetrace.guardrails.inference.postprocess import load_numpy
 from streetrace.log import get_logger
 
 if TYPE_CHECKING:
@@ -26,6 +31,12 @@ DEFAULT_WARN_THRESHOLD = 0.60
 DEFAULT_BLOCK_THRESHOLD = 0.85
 """Default cosine similarity score triggering a block."""
 
+DEFAULT_TOP_K = 3
+"""Default number of closest reference patterns reported per detection."""
+
+DEFAULT_REFERENCE_PATTERNS_PATH = Path(__file__).parent / "reference_patterns.txt"
+"""Bundled file with canonical injection phrases, one per line."""
+
 
 @dataclass(frozen=True)
 class SemanticResult:
@@ -34,11 +45,95 @@ class SemanticResult:
     Attributes:
         score: Maximum cosine similarity against reference embeddings.
         matched_pattern: Name of the closest reference pattern.
+        top_matches: Closest reference patterns with positive scores
+            as (name, score) pairs, best first.
 
     """
 
     score: float
     matched_pattern: str
+    top_matches: tuple[tuple[str, float], ...] = ()
+
+
+class ReferenceMatrix:
+    """Pre-normalized reference embeddings for similarity search.
+
+    Normalize every reference once, so the cosine similarity of a
+    query against all references is one matrix-vector product with
+    the normalized query. Use NumPy when available and fall back to
+    pure Python otherwise.
+    """
+
+    def __init__(self, embeddings: dict[str, list[float]]) -> None:
+        """Build the matrix from named reference embeddings.
+
+        Args:
+            embeddings: Map of pattern names to embedding vectors.
+
+        Raises:
+            ValueError: If the embeddings have different dimensions.
+
+        """
+        self._names = list(embeddings)
+        rows = [_normalize(list(vector)) for vector in embeddings.values()]
+        self._dim = len(rows[0]) if rows else 0
+        if any(len(row) != self._dim for row in rows):
+            msg = "Reference embeddings must have the same dimension"
+            raise ValueError(msg)
+
+        np = load_numpy()
+        self._matrix = None
+        self._rows = rows
+        if np is not None:
+            self._matrix = np.asarray(rows, dtype=np.float32).reshape(
+                len(rows), self._dim,
+            )
+            self._rows = []
+
+    def __len__(self) -> int:
+        """Return the number of reference patterns."""
+        return len(self._names)
+
+    def top_k(self, vector: list[float], k: int) -> list[tuple[str, float]]:
+        """Find the references most similar to a vector.
+
+        Args:
+            vector: Query embedding.
+            k: Maximum number of matches to return.
+
+        Returns:
+            Up to k (name, cosine similarity) pairs, best first.
+
+        Raises:
+            ValueError: If the vector dimension doesn't match.
+
+        """
+        if not self._names or k <= 0:
+            return []
+        if len(vector) != self._dim:
+            msg = (
+                f"Embedding dimension {len(vector)} doesn't match "
+                f"reference dimension {self._dim}"
+            )
+            raise ValueError(msg)
+
+        query = _normalize(list(vector))
+        np = load_numpy()
+        if self._matrix is None or np is None:
+            scores = [
+                math.fsum(a * b for a, b in zip(row, query, strict=True))
+                for row in self._rows
+            ]
+            best = heapq.nlargest(k, range(len(scores)), key=scores.__getitem__)
+            return [(self._names[i], scores[i]) for i in best]
+
+        similarity = self._matrix @ np.asarray(query, dtype=np.float32)
+        k = min(k, len(self._names))
+        best_idx = np.argpartition(-similarity, k - 1)[:k]
+        best_idx = best_idx[np.argsort(-similarity[best_idx])]
+        return [
+            (self._names[i], float(similarity[i])) for i in best_idx.tolist()
+        ]
 
 
 class SemanticDetector:
@@ -56,6 +151,7 @@ class SemanticDetector:
         reference_embeddings: dict[str, list[float]],
         warn_threshold: float = DEFAULT_WARN_THRESHOLD,
         block_threshold: float = DEFAULT_BLOCK_THRESHOLD,
+        top_k: int = DEFAULT_TOP_K,
     ) -> None:
         """Initialize the semantic detector.
 
@@ -64,12 +160,14 @@ class SemanticDetector:
             reference_embeddings: Map of pattern names to embedding vectors.
             warn_threshold: Similarity score triggering a warning.
             block_threshold: Similarity score triggering a block.
+            top_k: Number of closest reference patterns to report.
 
         """
         self._pipeline = inference_pipeline
-        self._reference_embeddings = reference_embeddings
+        self._references = ReferenceMatrix(reference_embeddings)
         self._warn_threshold = warn_threshold
         self._block_threshold = block_threshold
+        self._top_k = top_k
 
     async def detect(self, text: str) -> SemanticResult:
         """Detect prompt injection in the given text.
@@ -85,14 +183,14 @@ class SemanticDetector:
             EMBEDDING_MODEL_ID, text,
         )
 
-        max_score = 0.0
-        max_pattern = ""
-
-        for pattern_name, ref_embedding in self._reference_embeddings.items():
-            score = _cosine_similarity(text_embedding, ref_embedding)
-            if score > max_score:
-                max_score = score
-                max_pattern = pattern_name
+        top_matches = tuple(
+            (name, score)
+            for name, score in self._references.top_k(
+                text_embedding, max(self._top_k, 1),
+            )
+            if score > 0.0
+        )
+        max_pattern, max_score = top_matches[0] if top_matches else ("", 0.0)
 
         if max_score >= self._block_threshold:
             logger.warning(
@@ -107,25 +205,68 @@ class SemanticDetector:
                 max_pattern,
             )
 
-        return SemanticResult(score=max_score, matched_pattern=max_pattern)
+        return SemanticResult(
+            score=max_score,
+            matched_pattern=max_pattern,
+            top_matches=top_matches[: self._top_k],
+        )
 
 
-def _cosine_similarity(vec_a: list[float], vec_b: list[float]) -> float:
-    """Compute cosine similarity between two vectors.
+def read_reference_patterns(path: Path) -> list[str]:
+    """Read reference injection phrases from a text file.
 
     Args:
-        vec_a: First vector.
-        vec_b: Second vector.
+        path: File with one phrase per line. Blank lines and lines
+            starting with '#' are ignored.
 
     Returns:
-        Cosine similarity in range [-1.0, 1.0].
+        Phrases in file order, without duplicates.
 
     """
-    dot_product = sum(a * b for a, b in zip(vec_a, vec_b, strict=False))
-    norm_a = math.sqrt(sum(a * a for a in vec_a))
-    norm_b = math.sqrt(sum(b * b for b in vec_b))
+    phrases: dict[str, None] = {}
+    for line in path.read_text(encoding="utf-8").splitlines():
+        phrase = line.strip()
+        if phrase and not phrase.startswith("#"):
+            phrases[phrase] = None
+    return list(phrases)
 
-    if norm_a == 0.0 or norm_b == 0.0:
-        return 0.0
 
-    return dot_product / (norm_a * norm_b)
+async def load_reference_embeddings(
+    inference_pipeline: InferencePipeline,
+    path: Path = DEFAULT_REFERENCE_PATTERNS_PATH,
+) -> dict[str, list[float]]:
+    """Embed the reference phrases from a file.
+
+    Phrases are embedded in one batch, and the pipeline's embedding
+    cache keeps them warm across runs.
+
+    Args:
+        inference_pipeline: Pipeline for embedding generation.
+        path: File with one phrase per line.
+
+    Returns:
+        Map of phrases to their embedding vectors.
+
+    """
+    phrases = read_reference_patterns(path)
+    embeddings = await inference_pipeline.batch_embed(
+        EMBEDDING_MODEL_ID, phrases,
+    )
+    logger.info("Loaded %d reference patterns from %s", len(phrases), path)
+    return dict(zip(phrases, embeddings, strict=True))
+
+
+def _normalize(vector: list[float]) -> list[float]:
+    """Scale a vector to unit length.
+
+    Args:
+        vector: Input vector.
+
+    Returns:
+        Unit vector, or the zero vector unchanged.
+
+    """
+    norm = math.sqrt(math.fsum(v * v for v in vector))
+    if norm == 0.0:
+        return [0.0] * len(vector)
+    return [v / norm for v in vector]
@@ -8,8 +8,10 @@ from __future__ import annotations
 
 import re
 
+from streetrace.guardrails.pattern_scanner import PatternScanner
 from streetrace.guardrails.prompt_proxy.patterns import (
     PATTERN_REGISTRY,
+    PatternEntry,
     PatternMatch,
 )
 from streetrace.log import get_logger
@@ -57,21 +59,36 @@ class SyntacticFilter:
 
     Filter results by configurable severity threshold to control
     sensitivity. Default threshold is 'low' (return all matches).
+    Patterns below the threshold are left out of the scanner, so they
+    cost nothing at check time.
     """
 
     def __init__(
         self,
         *,
         severity_threshold: str = "low",
+        max_scan_chars: int | None = None,
     ) -> None:
         """Initialize the syntactic filter.
 
         Args:
             severity_threshold: Minimum severity to report.
                 One of 'low', 'medium', 'high'.
+            max_scan_chars: Maximum characters scanned per check, or
+                None to scan the whole text.
 
         """
+        self._max_scan_chars = max_scan_chars
         self._threshold_level = SEVERITY_LEVELS.get(severity_threshold, 0)
+        self._entries: list[tuple[str, PatternEntry]] = [
+            (category, entry)
+            for category, patterns in PATTERN_REGISTRY.items()
+            for entry in patterns
+            if SEVERITY_LEVELS.get(entry.severity, 0) >= self._threshold_level
+        ]
+        self._scanner = PatternScanner(
+            [(entry.pattern, entry.literals) for _, entry in self._entries],
+        )
 
     def check(self, text: str) -> list[PatternMatch]:
         """Check text against all registered patterns.
@@ -87,24 +104,12 @@ class SyntacticFilter:
 
         """
         scannable = _strip_markdown_code(text)
-        matches: list[PatternMatch] = []
-
-        for category, patterns in PATTERN_REGISTRY.items():
-            for entry in patterns:
-                entry_level = SEVERITY_LEVELS.get(entry.severity, 0)
-                if entry_level < self._threshold_level:
-                    continue
-
-                m = entry.pattern.search(scannable)
-                if m:
-                    matches.append(
-                        PatternMatch(
-                            category=category,
-                            pattern_name=entry.name,
-                            severity=entry.severity,
-                            matched_text=m.group(),
-                        ),
-                    )
+        matches = [
+            self._pattern_match(index, m)
+            for index, m in self._scanner.scan(
+                scannable, max_scan_chars=self._max_scan_chars,
+            )
+        ]
 
         if matches:
             logger.warning(
@@ -114,3 +119,47 @@ class SyntacticFilter:
             )
 
         return matches
+
+    def first(self, text: str) -> PatternMatch | None:
+        """Find the first pattern match, stopping the scan there.
+
+        Strip markdown code blocks before scanning, like ``check``.
+
+        Args:
+            text: Input text to scan.
+
+        Returns:
+            The first match above the severity threshold, or None.
+
+        """
+        found = self._scanner.first(
+            _strip_markdown_code(text), max_scan_chars=self._max_scan_chars,
+        )
+        if found is None:
+            return None
+        match = self._pattern_match(*found)
+        logger.warning(
+            "Syntactic filter matched pattern: %s/%s",
+            match.category,
+            match.pattern_name,
+        )
+        return match
+
+    def _pattern_match(self, index: int, m: re.Match[str]) -> PatternMatch:
+        """Build the result for a scanner match.
+
+        Args:
+            index: Index of the matched pattern.
+            m: The regex match.
+
+        Returns:
+            Pattern match with the entry's category and severity.
+
+        """
+        category, entry = self._entries[index]
+        return PatternMatch(
+            category=category,
+            pattern_name=entry.name,
+            severity=entry.severity,
+            matched_text=m.group(),
+        )
@@ -6,9 +6,11 @@ import os
 os.environ.setdefault("PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION", "python")
 
 import asyncio
+import signal
 import sys
 from importlib.metadata import version
 from pathlib import Path
+from types import FrameType
 
 from dotenv import load_dotenv
 
@@ -30,6 +32,11 @@ def show_version() -> None:
     sys.exit(0)
 
 
+def _exit_on_signal(signum: int, _frame: FrameType | None) -> None:
+    """Turn a termination signal into SystemExit so the app shuts down cleanly."""
+    raise SystemExit(128 + signum)
+
+
 def run(args: Args) -> None:
     """Configure and run the Application."""
     if args.version:
@@ -50,6 +57,8 @@ def run(args: Args) -> None:
     logger = get_logger(__name__)
 
     app = create_app(args)
+    # let the app write pending session changes when terminated
+    signal.signal(signal.SIGTERM, _exit_on_signal)
     while True:
         try:
             asyncio.run(app.run())
@@ -72,7 +81,7 @@ MIN_SUBCOMMAND_ARGS = 2
 
 
 def _handle_dsl_subcommands() -> bool:
-    """Check for and handle DSL-related subcommands.
+    """Check for and handle DSL-related and maintenance subcommands.
 
     Returns:
         True if a subcommand was handled (exit after), False otherwise.
@@ -95,6 +104,12 @@ def _handle_dsl_subcommands() -> bool:
         exit_code = run_dump_python(sys.argv[2:])
         sys.exit(exit_code)
 
+    if subcommand == "migrate-sessions":
+        from streetrace.session.cli import run_migrate_sessions
+
+        exit_code = run_migrate_sessions(sys.argv[2:])
+        sys.exit(exit_code)
+
     return False
 
 
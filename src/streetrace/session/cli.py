@@ -0,0 +1,197 @@
+"""CLI command that imports JSON session files into the SQLite session store."""
+
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from google.adk.events import Event
+    from google.adk.sessions import Session
+
+    from streetrace.session.sqlite_session_service import SqliteSessionService
+
+from streetrace.log import get_logger
+
+logger = get_logger(__name__)
+
+EXIT_SUCCESS = 0
+"""All sessions were imported or skipped."""
+
+EXIT_MIGRATION_ERRORS = 1
+"""Some sessions could not be read or imported."""
+
+EXIT_PATH_ERROR = 2
+"""The sessions directory does not exist."""
+
+_SESSION_FILE_SUFFIXES = (".json", ".json.gz", ".jsonl")
+
+
+def _session_id(path: Path) -> str | None:
+    """Get the session ID from a session file path, None if it's not a session."""
+    if not path.is_file():
+        return None
+    for suffix in _SESSION_FILE_SUFFIXES:
+        if path.name.endswith(suffix):
+            return path.name.removesuffix(suffix)
+    return None
+
+
+def _session_files(storage_path: Path) -> "Iterator[tuple[str, str, str]]":
+    """Find (app_name, user_id, session_id) of all sessions in a directory."""
+    for app_dir in sorted(p for p in storage_path.iterdir() if p.is_dir()):
+        for user_dir in sorted(p for p in app_dir.iterdir() if p.is_dir()):
+            session_ids = {
+                session_id
+                for path in user_dir.iterdir()
+                if (session_id := _session_id(path))
+            }
+            for session_id in sorted(session_ids):
+                yield app_dir.name, user_dir.name, session_id
+
+
+def _has_compacted_events(
+    session: "Session",
+    history: "list[Event] | None",
+) -> bool:
+    """Check if a session's history holds events no longer in the session."""
+    current = {event.id for event in session.events}
+    return any(event.id not in current for event in history or [])
+
+
+def migrate_sessions(
+    storage_path: Path,
+    service: "SqliteSessionService",
+    *,
+    overwrite: bool = False,
+    discard_history: bool = False,
+) -> tuple[int, int, int]:
+    """Import JSON session files into a SQLite session store.
+
+    JSON documents, compressed or not, and JSON Lines event logs are imported. The
+    session files are only read, damaged logs are imported without their unreadable
+    lines but are not repaired on disk.
+
+    The SQLite store keeps only the current events of a session. A log with events
+    replaced by a compaction fails to import unless `discard_history` is set.
+
+    Args:
+        storage_path: Directory holding `<app_name>/<user_id>/<session_id>` files.
+        service: Target session service.
+        overwrite: Replace sessions that already exist in the database.
+        discard_history: Import only the current events of compacted sessions.
+
+    Returns:
+        Number of imported, skipped and failed sessions.
+
+    """
+    from streetrace.session.jsonl_serializer import JSONLSessionSerializer
+
+    serializer = JSONLSessionSerializer(storage_path, repair=False)
+    imported = skipped = failed = 0
+    for app_name, user_id, session_id in _session_files(storage_path):
+        try:
+            session = serializer.read(
+                app_name=app_name,
+                user_id=user_id,
+                session_id=session_id,
+            )
+            history = serializer.read_history(
+                app_name=app_name,
+                user_id=user_id,
+                session_id=session_id,
+            )
+        except ValueError:
+            logger.exception("Cannot parse session %s", session_id)
+            session = None
+            history = None
+        if session is None:
+            print(  # noqa: T201
+                f"error: cannot read session {app_name}/{user_id}/{session_id}",
+                file=sys.stderr,
+            )
+            failed += 1
+        elif not discard_history and _has_compacted_events(session, history):
+            print(  # noqa: T201
+                f"error: session {app_name}/{user_id}/{session_id} has compacted "
+                "history that the database cannot keep, rerun with "
+                "--discard-history to import its current events only",
+                file=sys.stderr,
+            )
+            failed += 1
+        elif service.import_session(session, overwrite=overwrite):
+            imported += 1
+        else:
+            skipped += 1
+    return imported, skipped, failed
+
+
+def run_migrate_sessions(args: list[str]) -> int:
+    """Run the migrate-sessions command with given arguments.
+
+    Args:
+        args: Command line arguments after 'migrate-sessions'.
+
+    Returns:
+        Exit code.
+
+    """
+    import argparse
+
+    from streetrace.app import CONTEXT_DIR
+    from streetrace.session.sqlite_session_service import (
+        SQLITE_DB_FILE_NAME,
+        SqliteSessionService,
+    )
+
+    parser = argparse.ArgumentParser(
+        prog="streetrace migrate-sessions",
+        description=(
+            "Import JSON session files into the SQLite session store used with "
+            "--session-format=sqlite"
+        ),
+    )
+    parser.add_argument(
+        "--path",
+        type=Path,
+        default=Path.cwd(),
+        help="Working directory whose sessions to migrate (default: current)",
+    )
+    parser.add_argument(
+        "--overwrite",
+        action="store_true",
+        help="Replace sessions that already exist in the database",
+    )
+    parser.add_argument(
+        "--discard-history",
+        action="store_true",
+        help="Import compacted sessions without the events the compaction replaced",
+    )
+
+    parsed = parser.parse_args(args)
+
+    storage_path = parsed.path / CONTEXT_DIR / "sessions"
+    if not storage_path.is_dir():
+        print(  # noqa: T201
+            f"error: sessions directory not found: {storage_path}",
+            file=sys.stderr,
+        )
+        return EXIT_PATH_ERROR
+
+    service = SqliteSessionService(storage_path / SQLITE_DB_FILE_NAME)
+    try:
+        imported, skipped, failed = migrate_sessions(
+            storage_path,
+            service,
+            overwrite=parsed.overwrite,
+            discard_history=parsed.discard_history,
+        )
+    finally:
+        service.close()
+
+    print(  # noqa: T201
+        f"Imported {imported} sessions into {service.db_path} "
+        f"({skipped} already present, {failed} failed)",
+    )
+    return EXIT_MIGRATION_ERRORS if failed else EXIT_SUCCESS
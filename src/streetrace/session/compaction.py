@@ -0,0 +1,36 @@
+"""Mark session events that summarize compacted conversation history."""
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from google.adk.events import Event
+
+COMPACTION_SUMMARY_KEY = "streetrace_compaction_summary"
+"""Event custom metadata key set on events that stand in for compacted history."""
+
+
+def mark_compaction_summary(event: "Event") -> "Event":
+    """Mark an event as the summary of the conversation history it replaces.
+
+    Session storage uses the mark to keep the replaced events readable as history
+    while loading only the events after the compaction.
+
+    Args:
+        event: The summary event, modified in place.
+
+    Returns:
+        The same event.
+
+    """
+    event.custom_metadata = {
+        **(event.custom_metadata or {}),
+        COMPACTION_SUMMARY_KEY: True,
+    }
+    return event
+
+
+def is_compaction_summary(event: "Event") -> bool:
+    """Check if an event was marked with mark_compaction_summary."""
+    return bool(
+        event.custom_metadata and event.custom_metadata.get(COMPACTION_SUMMARY_KEY),
+    )
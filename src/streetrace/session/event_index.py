@@ -0,0 +1,69 @@
+"""Incrementally maintained function call bookkeeping for a session's events."""
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from google.adk.events import Event
+
+
+class SessionEventIndex:
+    """Track function calls and responses as events are appended to a session.
+
+    Session services update the index on every appended event, so the session
+    manager can check the session's consistency and count function responses in
+    constant time instead of scanning all events every turn.
+
+    A function call event is expected to be immediately followed by its function
+    response event, the same rule SessionManager.validate_session enforces. Events
+    without content don't break a pair.
+    """
+
+    def __init__(self, events: "Iterable[Event]" = ()) -> None:
+        """Initialize a new instance of SessionEventIndex.
+
+        Args:
+            events: Events already in the session.
+
+        """
+        self.event_count = 0
+        """Number of events seen, the index of the next appended event."""
+
+        self.function_response_indices: list[int] = []
+        """Indices of events holding a function response, in order."""
+
+        self.pending_call_index: int | None = None
+        """Index of the last function call event if no response followed it yet."""
+
+        self.orphan_count = 0
+        """Number of function calls and responses that did not form a pair."""
+
+        for event in events:
+            self.add(event)
+
+    @property
+    def is_consistent(self) -> bool:
+        """Check if all function calls are paired with their responses."""
+        return self.orphan_count == 0 and self.pending_call_index is None
+
+    def add(self, event: "Event") -> None:
+        """Update the index with an event appended to the session."""
+        index = self.event_count
+        self.event_count += 1
+        if not event.content or not event.content.parts:
+            return
+
+        parts = event.content.parts
+        if any(part.function_response for part in parts):
+            self.function_response_indices.append(index)
+            if self.pending_call_index is None:
+                self.orphan_count += 1
+            self.pending_call_index = None
+        elif any(part.function_call for part in parts):
+            if self.pending_call_index is not None:
+                self.orphan_count += 1
+            self.pending_call_index = index
+        elif self.pending_call_index is not None:
+            self.orphan_count += 1
+            self.pending_call_index = None
@@ -1,17 +1,38 @@
 """Serialize and deserialize ADK Session to/from JSON."""
 
+import gzip
+import os
+import zlib
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import IO, TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
 
+    from google.adk.events import Event
     from google.adk.sessions import Session
 
 from streetrace.log import get_logger
+from streetrace.session.session_index import SessionIndex
 
 logger = get_logger(__name__)
 
+GZIP_FILE_SUFFIX = ".json.gz"
+"""Extension of gzip-compressed, minified JSON session documents."""
+
+DOCUMENT_SUFFIXES = (".json", GZIP_FILE_SUFFIX)
+"""Extensions of JSON session documents, all of them are read by any serializer."""
+
+_GZIP_COMPRESS_LEVEL = 6
+"""Balances write time and size, higher levels barely shrink session documents."""
+
+
+def _read_document(path: Path) -> str:
+    """Read a JSON session document, decompressing it if needed."""
+    if path.name.endswith(GZIP_FILE_SUFFIX):
+        return gzip.decompress(path.read_bytes()).decode("utf-8")
+    return path.read_text()
+
 
 class JSONSessionSerializer:
     """Serialize and deserialize ADK Session to/from JSON.
@@ -20,9 +41,33 @@ class JSONSessionSerializer:
     only a necessary subset of fields.
     """
 
-    def __init__(self, storage_path: Path) -> None:
-        """Initialize a new instance of JSONSessionSerializer."""
+    FILE_SUFFIX = ".json"
+    """Extension of the session files managed by this serializer."""
+
+    def __init__(self, storage_path: Path, *, fsync: bool = False) -> None:
+        """Initialize a new instance of JSONSessionSerializer.
+
+        Args:
+            storage_path: Root directory of the session files.
+            fsync: Flush session files to disk after every write, so a crash of the
+                machine does not lose sessions at the cost of slower writes.
+
+        """
         self.storage_path = storage_path
+        self.fsync = fsync
+        self._indexes: dict[Path, SessionIndex] = {}
+
+    def _sync(self, file: IO[Any]) -> None:
+        """Flush a written file to disk if fsync is enabled."""
+        if self.fsync:
+            file.flush()
+            os.fsync(file.fileno())
+
+    def _index(self, root_path: Path) -> SessionIndex:
+        """Get the metadata index of an app/user sessions directory."""
+        if root_path not in self._indexes:
+            self._indexes[root_path] = SessionIndex(root_path)
+        return self._indexes[root_path]
 
     def _file_path(
         self,
@@ -43,7 +88,29 @@ class JSONSessionSerializer:
                 "or a Session object providing those values."
             )
             raise ValueError(msg)
-        return self.storage_path / app_name / user_id / f"{session_id}.json"
+        file_name = f"{session_id}{self.FILE_SUFFIX}"
+        return self.storage_path / app_name / user_id / file_name
+
+    def _other_format_paths(self, path: Path) -> list[Path]:
+        """Get paths of a session's documents stored in other formats."""
+        session_id = path.name.removesuffix(self.FILE_SUFFIX)
+        return [
+            path.with_name(f"{session_id}{suffix}")
+            for suffix in DOCUMENT_SUFFIXES
+            if suffix != self.FILE_SUFFIX
+        ]
+
+    def _remove_other_formats(self, path: Path) -> None:
+        """Delete documents of a session that has been written to `path`."""
+        for other_path in self._other_format_paths(path):
+            if not other_path.is_file():
+                continue
+            try:
+                other_path.unlink()
+            except OSError:
+                logger.exception("Cannot delete converted session %s", other_path)
+            else:
+                self._index(other_path.parent).remove(other_path)
 
     def read(
         self,
@@ -53,6 +120,7 @@ class JSONSessionSerializer:
     ) -> "Session | None":
         """Read a session from a JSON file.
 
+        Sessions stored in another JSON document format are read transparently.
         The config parameter is currently not used for filtering during read.
         """
         path = self._file_path(
@@ -60,13 +128,18 @@ class JSONSessionSerializer:
             user_id=user_id,
             session_id=session_id,
         )
-        if not path.is_file():
-            return None
+        for candidate in (path, *self._other_format_paths(path)):
+            if candidate.is_file():
+                return self._read_file(candidate)
+        return None
+
+    def _read_file(self, path: Path) -> "Session | None":
+        """Parse a session file."""
         try:
             from google.adk.sessions import Session
 
-            return Session.model_validate_json(path.read_text())
-        except (OSError, UnicodeDecodeError):
+            return Session.model_validate_json(_read_document(path))
+        except (OSError, UnicodeDecodeError, EOFError, zlib.error):
             logger.exception("Cannot read session at %s", path)
             return None
 
@@ -77,41 +150,97 @@ class JSONSessionSerializer:
         """Write a session to a JSON file."""
         path = self._file_path(session=session)
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(
-            session.model_dump_json(
-                indent=2,
-                exclude_none=True,
-            ),
-        )
+        with path.open("w") as document:
+            document.write(
+                session.model_dump_json(
+                    indent=2,
+                    exclude_none=True,
+                ),
+            )
+            self._sync(document)
+        self._remove_other_formats(path)
+        self._index(path.parent).update(path, session)
         return path
 
+    def append_event(
+        self,
+        session: "Session",
+        event: "Event",
+    ) -> Path:
+        """Persist a session after an event has been appended to it."""
+        return self.append_events(session, [event])
+
+    def append_events(
+        self,
+        session: "Session",
+        events: "list[Event]",  # noqa: ARG002
+    ) -> Path:
+        """Persist a session after events have been appended to it.
+
+        The JSON document has no incremental representation, so the whole session
+        is rewritten. Subclasses with append-friendly formats override this.
+        """
+        return self.write(session)
+
+    def write_compacted(
+        self,
+        session: "Session",
+    ) -> Path:
+        """Persist a session whose older events were replaced with a summary.
+
+        The JSON document holds only the current events, so the replaced events
+        are dropped. Subclasses that can keep them as history override this.
+        """
+        return self.write(session)
+
+    def read_history(
+        self,
+        app_name: str,
+        user_id: str,
+        session_id: str,
+    ) -> "list[Event] | None":
+        """Read all events ever recorded in a session, including compacted ones."""
+        session = self.read(
+            app_name=app_name,
+            user_id=user_id,
+            session_id=session_id,
+        )
+        return None if session is None else session.events
+
     def delete(
         self,
         app_name: str,
         user_id: str,
         session_id: str,
     ) -> None:
-        """Delete a session's JSON file."""
+        """Delete a session's JSON file and its documents in other formats."""
         path = self._file_path(
             app_name=app_name,
             user_id=user_id,
             session_id=session_id,
         )
-        if path.is_file():
+        if path.is_dir():
+            msg = f"Incorrect data storage structure, '{path}' is a directory."
+            logger.error(msg)
+            return
+
+        deleted = False
+        for candidate in (path, *self._other_format_paths(path)):
+            if not candidate.is_file():
+                continue
             try:
-                path.unlink()
+                candidate.unlink()
             except OSError:
-                logger.exception("Error deleting session file %s", path)
+                logger.exception("Error deleting session file %s", candidate)
             else:
-                try:
-                    path.parent.rmdir()
-                    path.parent.parent.rmdir()
-                except OSError:
-                    pass
-
-        elif path.is_dir():
-            msg = f"Incorrect data storage structure, '{path}' is a directory."
-            logger.error(msg)
+                self._index(candidate.parent).remove(candidate)
+                deleted = True
+        if deleted:
+            try:
+                path.parent.rmdir()
+                path.parent.parent.rmdir()
+            except OSError:
+                pass
 
     def list_saved(
         self,
@@ -119,35 +248,94 @@ class JSONSessionSerializer:
         app_name: str,
         user_id: str,
     ) -> "Iterator[Session]":
-        """List saved sessions."""
+        """List saved sessions.
+
+        Session metadata is served from the directory's index, only new or changed
+        session files are parsed.
+        """
         root_path = self.storage_path / app_name / user_id
         if not root_path.is_dir():
             return
-        from google.adk.sessions import Session
+        yield from self._index(root_path).list_sessions(
+            self._session_files(root_path),
+            self._read_listing,
+        )
 
-        for path in root_path.rglob("*.json"):
-            if not path.is_file():
-                continue
-            try:
-                session = Session.model_validate_json(path.read_text())
-            except (OSError, UnicodeDecodeError):
-                logger.exception(
-                    "Could not read session file %s for listing, skipping...",
-                    path,
-                )
+    def _session_files(self, root_path: Path) -> "Iterator[Path]":
+        """Find session files in an app/user sessions directory.
+
+        Documents in other formats are included unless the session has been
+        written in this serializer's format.
+        """
+        for path in root_path.rglob(f"*{self.FILE_SUFFIX}"):
+            if path.is_file():
+                yield path
+        for suffix in DOCUMENT_SUFFIXES:
+            if suffix == self.FILE_SUFFIX:
                 continue
-            else:
-                if not session:
-                    logger.warning(
-                        "Failed to read/parse session file %s for listing, skipping.",
-                        path,
-                    )
-                    continue
-                yield Session(
-                    id=session.id,
-                    app_name=session.app_name,
-                    user_id=session.user_id,
-                    last_update_time=session.last_update_time,
-                    events=[],
-                    state={},
-                )
+            for path in root_path.rglob(f"*{suffix}"):
+                session_id = path.name.removesuffix(suffix)
+                if (
+                    path.is_file()
+                    and not path.with_name(f"{session_id}{self.FILE_SUFFIX}").is_file()
+                ):
+                    yield path
+
+    def _read_listing(self, path: Path) -> "Session | None":
+        """Read session metadata (no events and state) from a session file."""
+        from google.adk.sessions import Session
+
+        try:
+            session = Session.model_validate_json(_read_document(path))
+        except (OSError, UnicodeDecodeError, EOFError, zlib.error):
+            logger.exception(
+                "Could not read session file %s for listing, skipping...",
+                path,
+            )
+            return None
+        if not session:
+            logger.warning(
+                "Failed to read/parse session file %s for listing, skipping.",
+                path,
+            )
+            return None
+        return Session(
+            id=session.id,
+            app_name=session.app_name,
+            user_id=session.user_id,
+            last_update_time=session.last_update_time,
+            events=[],
+            state={},
+        )
+
+
+class CompressedJSONSessionSerializer(JSONSessionSerializer):
+    """Store sessions as gzip-compressed, minified JSON documents.
+
+    Function responses with file contents and command output make up most of a
+    session and compress well, so the documents are several times smaller than
+    the indented JSON written by JSONSessionSerializer. Both serializers read
+    each other's files.
+    """
+
+    FILE_SUFFIX = GZIP_FILE_SUFFIX
+
+    def write(
+        self,
+        session: "Session",
+    ) -> Path:
+        """Write a session to a gzip-compressed JSON file."""
+        path = self._file_path(session=session)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("wb") as document:
+            document.write(
+                gzip.compress(
+                    session.model_dump_json(exclude_none=True).encode("utf-8"),
+                    compresslevel=_GZIP_COMPRESS_LEVEL,
+                    mtime=0,
+                ),
+            )
+            self._sync(document)
+        self._remove_other_formats(path)
+        self._index(path.parent).update(path, session)
+        return path
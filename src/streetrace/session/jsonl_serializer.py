@@ -0,0 +1,344 @@
+"""Serialize ADK Sessions as append-only JSON Lines event logs."""
+
+import json
+import mmap
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from google.adk.events import Event
+    from google.adk.sessions import Session
+
+from streetrace.log import get_logger
+from streetrace.session.json_serializer import JSONSessionSerializer
+
+logger = get_logger(__name__)
+
+_HEADER_RECORD = "session"
+"""Record type of a segment's first line, holds the session without events."""
+
+_EVENT_RECORD = "event"
+"""Record type of a single appended event."""
+
+_HEADER_PREFIX = f'{{"type":"{_HEADER_RECORD}",'
+"""Start of a header record line, each header starts a new segment of the log."""
+
+_SEGMENT_START = f"\n{_HEADER_PREFIX}".encode()
+"""Bytes preceding every header record except the one on the first line."""
+
+_COPY_CHUNK_SIZE = 1024 * 1024
+"""Size of the chunks used to copy the archived part of a log."""
+
+
+def _record(record_type: str, data_json: str) -> str:
+    """Wrap a serialized model into a single log line."""
+    return f'{{"type":"{record_type}","data":{data_json}}}\n'
+
+
+def _segment(session: "Session") -> "Iterator[bytes]":
+    """Serialize a session as a header record followed by its event records."""
+    yield _record(
+        _HEADER_RECORD,
+        session.model_dump_json(exclude={"events"}, exclude_none=True),
+    ).encode("utf-8")
+    for event in session.events:
+        yield _record(
+            _EVENT_RECORD,
+            event.model_dump_json(exclude_none=True),
+        ).encode("utf-8")
+
+
+def _is_header(line: bytes) -> bool:
+    """Check if a log line is a complete, parseable header record."""
+    try:
+        record = json.loads(line)
+    except ValueError:
+        return False
+    return (
+        isinstance(record, dict)
+        and record.get("type") == _HEADER_RECORD
+        and isinstance(record.get("data"), dict)
+    )
+
+
+def _live_segment_offset(path: Path) -> int:
+    """Find the byte offset of the last readable header record in a session log.
+
+    The log is memory mapped and searched from the end, so the archived part of the
+    log is not read. A header torn by a crash while a compaction appended it is
+    skipped, so the previous segment stays live and the torn tail is dropped by the
+    next rewrite.
+    """
+    with path.open("rb") as log:
+        if log.seek(0, 2) == 0:
+            return 0
+        with mmap.mmap(log.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            end = len(data)
+            while True:
+                offset = data.rfind(_SEGMENT_START, 0, end) + 1
+                line_end = data.find(b"\n", offset)
+                line = data[offset : line_end if line_end >= 0 else len(data)]
+                if offset == 0 or _is_header(line):
+                    return offset
+                logger.warning(
+                    "Skipping unreadable segment header in session log %s", path,
+                )
+                end = offset - 1
+
+
+def _replay_event(session: "Session", event: "Event") -> None:
+    """Apply an event to a session the same way the session service does."""
+    from google.adk.sessions.state import State
+
+    if event.actions and event.actions.state_delta:
+        for key, value in event.actions.state_delta.items():
+            if key.startswith(State.TEMP_PREFIX):
+                continue
+            session.state[key] = value
+    session.events.append(event)
+    session.last_update_time = event.timestamp
+
+
+class JSONLSessionSerializer(JSONSessionSerializer):
+    """Store each session as an append-only JSON Lines event log.
+
+    The first line of the log is a header with the session's identity, state and
+    last update time as of the moment the log was (re)written. Every following line
+    holds one event. Appending an event writes a single line instead of the whole
+    session, and reading replays the events on top of the header.
+
+    Replacing events rewrites the log as a fresh snapshot. When the replacement is
+    a compaction (see streetrace.session.compaction), a new header and the compacted
+    events are appended instead, starting a new segment of the log. Reading
+    materializes only the last segment, earlier segments stay on disk as history
+    that read_history returns on demand. A segment with unreadable lines (e.g. a
+    write torn by a crash) is rewritten on read, so further appends never land
+    after a damaged line. A torn segment header leaves the previous segment live.
+
+    Sessions stored as JSON documents are read transparently and converted to a log
+    on the next write.
+    """
+
+    FILE_SUFFIX = ".jsonl"
+
+    def __init__(
+        self,
+        storage_path: Path,
+        *,
+        fsync: bool = False,
+        repair: bool = True,
+    ) -> None:
+        """Initialize a new instance of JSONLSessionSerializer.
+
+        Args:
+            storage_path: Root directory of the session files.
+            fsync: Flush session files to disk after every write, so a crash of the
+                machine does not lose sessions at the cost of slower writes.
+            repair: Rewrite a segment with unreadable lines when it is read. Without
+                it, reading never modifies the log.
+
+        """
+        super().__init__(storage_path, fsync=fsync)
+        self.repair = repair
+
+    def _read_file(self, path: Path) -> "Session | None":
+        """Replay the last segment of a session event log."""
+        from google.adk.sessions import Session
+
+        if not path.name.endswith(self.FILE_SUFFIX):
+            return super()._read_file(path)
+        try:
+            with path.open("rb") as log:
+                log.seek(_live_segment_offset(path))
+                lines = log.read().decode("utf-8").splitlines()
+        except (OSError, UnicodeDecodeError):
+            logger.exception("Cannot read session at %s", path)
+            return None
+        if not lines:
+            logger.error("Session log %s is empty", path)
+            return None
+
+        try:
+            session = Session.model_validate(json.loads(lines[0])["data"])
+        except (ValueError, KeyError, TypeError):
+            logger.exception("Cannot read header of session log %s", path)
+            return None
+        damaged = False
+        for event in self._parse_events(path, lines[1:]):
+            if event is None:
+                damaged = True
+                continue
+            _replay_event(session, event)
+
+        if damaged and self.repair:
+            self.write(session)
+        return session
+
+    def _parse_events(
+        self,
+        path: Path,
+        lines: list[str],
+    ) -> "Iterator[Event | None]":
+        """Parse the event records of a segment, yielding None for unreadable lines."""
+        from google.adk.events import Event
+
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                if record.get("type") != _EVENT_RECORD:
+                    msg = f"unexpected record type {record.get('type')!r}"
+                    raise ValueError(msg)  # noqa: TRY301
+                yield Event.model_validate(record["data"])
+            except (ValueError, KeyError, AttributeError):
+                logger.warning(
+                    "Skipping unreadable record in session log %s: %.80s",
+                    path,
+                    line,
+                )
+                yield None
+
+    def read_history(
+        self,
+        app_name: str,
+        user_id: str,
+        session_id: str,
+    ) -> "list[Event] | None":
+        """Read events of all segments of a session log.
+
+        Events kept by a compaction appear in several segments, they are returned
+        once, in the order they were first recorded.
+        """
+        path = self._file_path(
+            app_name=app_name,
+            user_id=user_id,
+            session_id=session_id,
+        )
+        if not path.is_file():
+            return super().read_history(
+                app_name=app_name,
+                user_id=user_id,
+                session_id=session_id,
+            )
+        try:
+            lines = path.read_text(encoding="utf-8").splitlines()
+        except (OSError, UnicodeDecodeError):
+            logger.exception("Cannot read session at %s", path)
+            return None
+
+        starts = [i for i, line in enumerate(lines) if line.startswith(_HEADER_PREFIX)]
+        events: dict[str, Event] = {}
+        for start, end in zip(starts, [*starts[1:], len(lines)], strict=True):
+            for event in self._parse_events(path, lines[start + 1 : end]):
+                if event is not None:
+                    events.setdefault(event.id, event)
+        return list(events.values())
+
+    def write(
+        self,
+        session: "Session",
+    ) -> Path:
+        """Write a session as a fresh snapshot of the last log segment.
+
+        Earlier segments are copied over as they are.
+        """
+        path = self._file_path(session=session)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.tmp")
+        with tmp_path.open("wb") as log:
+            if path.is_file():
+                archived = _live_segment_offset(path)
+                with path.open("rb") as previous:
+                    while archived > 0:
+                        chunk = previous.read(min(archived, _COPY_CHUNK_SIZE))
+                        if not chunk:
+                            break
+                        log.write(chunk)
+                        archived -= len(chunk)
+            log.writelines(_segment(session))
+            self._sync(log)
+        tmp_path.replace(path)
+        self._remove_other_formats(path)
+        self._index(path.parent).update(path, session)
+        return path
+
+    def write_compacted(
+        self,
+        session: "Session",
+    ) -> Path:
+        """Start a new log segment, keeping the replaced events as history."""
+        path = self._file_path(session=session)
+        if not path.is_file():
+            return self.write(session)
+        with path.open("ab") as log:
+            log.writelines(_segment(session))
+            self._sync(log)
+        self._index(path.parent).update(path, session)
+        return path
+
+    def append_events(
+        self,
+        session: "Session",
+        events: "list[Event]",
+    ) -> Path:
+        """Append event records to the session log.
+
+        Falls back to a full write when there is no log yet, or when the events are
+        not the last events of the session. The metadata index is not touched, the
+        next listing picks up the change from the log file's size and modification
+        time.
+        """
+        path = self._file_path(session=session)
+        tail = session.events[-len(events) :] if events else []
+        if (
+            not path.is_file()
+            or len(tail) != len(events)
+            or any(kept is not event for kept, event in zip(tail, events, strict=True))
+        ):
+            return self.write(session)
+        with path.open("a", encoding="utf-8") as log:
+            log.writelines(
+                _record(_EVENT_RECORD, event.model_dump_json(exclude_none=True))
+                for event in events
+            )
+            self._sync(log)
+        return path
+
+    def _read_listing(self, path: Path) -> "Session | None":
+        """Read session metadata from the log header and its last record."""
+        from google.adk.sessions import Session
+
+        if not path.name.endswith(self.FILE_SUFFIX):
+            return super()._read_listing(path)
+
+        try:
+            lines = path.read_bytes().rstrip().rsplit(b"\n", 1)
+            header = json.loads(lines[0].split(b"\n", 1)[0])["data"]
+        except (OSError, ValueError, KeyError):
+            logger.exception(
+                "Could not read session file %s for listing, skipping...",
+                path,
+            )
+            return None
+
+        last_update_time = header.get("last_update_time", 0.0)
+        if len(lines) > 1:
+            try:
+                last_record = json.loads(lines[-1])
+                if last_record.get("type") == _EVENT_RECORD:
+                    last_update_time = last_record["data"]["timestamp"]
+                elif last_record.get("type") == _HEADER_RECORD:
+                    last_update_time = last_record["data"]["last_update_time"]
+            except (ValueError, KeyError, AttributeError):
+                logger.warning("Last record of session log %s is unreadable", path)
+        return Session(
+            id=header["id"],
+            app_name=header["app_name"],
+            user_id=header["user_id"],
+            last_update_time=last_update_time,
+            events=[],
+            state={},
+        )
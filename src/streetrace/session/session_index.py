@@ -0,0 +1,190 @@
+"""Sidecar index of saved session metadata."""
+
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import os
+    from collections.abc import Callable, Iterable, Iterator
+
+    from google.adk.sessions import Session
+
+from streetrace.log import get_logger
+
+logger = get_logger(__name__)
+
+INDEX_FILE_NAME = ".index"
+"""Name of the index file kept next to the session files."""
+
+_INDEX_VERSION = 1
+
+_Entries = dict[str, dict[str, Any]]
+
+
+def _stat(path: Path) -> "os.stat_result | None":
+    try:
+        return path.stat()
+    except OSError:
+        return None
+
+
+def _entry(session: "Session", stat: "os.stat_result") -> dict[str, Any]:
+    return {
+        "id": session.id,
+        "app_name": session.app_name,
+        "user_id": session.user_id,
+        "last_update_time": session.last_update_time,
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+    }
+
+
+def _is_fresh(entry: dict[str, Any], stat: "os.stat_result | None") -> bool:
+    return (
+        stat is not None
+        and entry.get("mtime_ns") == stat.st_mtime_ns
+        and entry.get("size") == stat.st_size
+    )
+
+
+class SessionIndex:
+    """Metadata index of the sessions saved in one app/user directory.
+
+    Listing sessions only needs their ids and last update times, but parsing a
+    session file costs time proportional to the whole conversation. The index
+    caches the metadata along with the size and modification time of the file it
+    was taken from, so a listing only parses files that are new or have changed.
+    Writes only touch the index when they create or delete a session.
+
+    The index is advisory: a missing, corrupt or outdated index is rebuilt from the
+    session files by the next listing.
+    """
+
+    def __init__(self, root_path: Path) -> None:
+        """Initialize a new instance of SessionIndex for the given directory."""
+        self.path = root_path / INDEX_FILE_NAME
+        self._entries: _Entries | None = None
+        self._stamp: tuple[int, int] | None = None
+
+    def _load(self) -> _Entries | None:
+        """Load the index, or return None if there is no usable index."""
+        stat = _stat(self.path)
+        if stat is None:
+            self._entries = None
+            return None
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        if self._entries is not None and self._stamp == stamp:
+            return self._entries
+
+        try:
+            with self.path.open("rb") as index_file:
+                data = json.load(index_file)
+        except (OSError, ValueError):
+            logger.warning("Session index %s is unreadable, rebuilding.", self.path)
+            return None
+        entries = data.get("sessions") if isinstance(data, dict) else None
+        if not isinstance(entries, dict) or data.get("version") != _INDEX_VERSION:
+            logger.warning("Session index %s is outdated, rebuilding.", self.path)
+            return None
+
+        self._entries = entries
+        self._stamp = stamp
+        return entries
+
+    def _save(self, entries: _Entries) -> None:
+        tmp_path = self.path.with_name(f"{self.path.name}.tmp")
+        try:
+            with tmp_path.open("w", encoding="utf-8") as index_file:
+                json.dump(
+                    {"version": _INDEX_VERSION, "sessions": entries},
+                    index_file,
+                    separators=(",", ":"),
+                )
+            tmp_path.replace(self.path)
+        except OSError:
+            logger.exception("Cannot write session index %s", self.path)
+            return
+        stat = _stat(self.path)
+        self._entries = entries
+        self._stamp = (stat.st_mtime_ns, stat.st_size) if stat else None
+
+    def update(self, path: Path, session: "Session") -> None:
+        """Record a newly written session file.
+
+        Only files missing from the index are recorded, so saving a session on every
+        event doesn't rewrite the index each time. The entry of a file that has
+        changed goes stale and the next listing refreshes it from the file. Nothing
+        is recorded if the index has not been built yet, the first listing will
+        build it.
+        """
+        entries = self._load()
+        if entries is None or path.name in entries:
+            return
+        stat = _stat(path)
+        if stat is None:
+            return
+        entries[path.name] = _entry(session, stat)
+        self._save(entries)
+
+    def remove(self, path: Path) -> None:
+        """Forget a deleted session file, dropping the index once it's empty."""
+        entries = self._load()
+        if entries is None or entries.pop(path.name, None) is None:
+            return
+        if entries:
+            self._save(entries)
+            return
+        try:
+            self.path.unlink()
+        except OSError:
+            logger.exception("Cannot delete session index %s", self.path)
+        self._entries = None
+
+    def list_sessions(
+        self,
+        paths: "Iterable[Path]",
+        read_listing: "Callable[[Path], Session | None]",
+    ) -> "Iterator[Session]":
+        """List session metadata, reading only the files the index doesn't cover.
+
+        Args:
+            paths: Session files to list.
+            read_listing: Reads session metadata from a file that's missing from the
+                index or has changed since it was indexed.
+
+        Yields:
+            Sessions without events and state.
+
+        """
+        from google.adk.sessions import Session
+
+        cached = self._load()
+        entries: _Entries = {}
+        dirty = cached is None
+        cached = cached or {}
+        for path in paths:
+            stat = _stat(path)
+            entry = cached.get(path.name)
+            if entry is not None and _is_fresh(entry, stat):
+                entries[path.name] = entry
+                yield Session(
+                    id=entry["id"],
+                    app_name=entry["app_name"],
+                    user_id=entry["user_id"],
+                    last_update_time=entry["last_update_time"],
+                    events=[],
+                    state={},
+                )
+                continue
+
+            dirty = True
+            session = read_listing(path)
+            if session is None:
+                continue
+            if stat is not None:
+                entries[path.name] = _entry(session, stat)
+            yield session
+
+        if dirty or entries.keys() != cached.keys():
+            self._save(entries)
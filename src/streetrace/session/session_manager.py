@@ -14,6 +14,7 @@ if TYPE_CHECKING:
 
     from streetrace.args import Args
     from streetrace.session.session_service import JSONSessionService
+    from streetrace.session.sqlite_session_service import SqliteSessionService
     from streetrace.system_context import SystemContext
     from streetrace.ui.ui_bus import UiBus
 
@@ -68,7 +69,7 @@ class SessionManager:
 
     current_session: "Session | None" = None
 
-    _session_service: "JSONSessionService | None" = None
+    _session_service: "JSONSessionService | SqliteSessionService | None" = None
 
     def __init__(
         self,
@@ -83,18 +84,50 @@ class SessionManager:
         self.current_session_id = _session_id(self.args.session_id)
 
     @property
-    def session_service(self) -> "JSONSessionService":
+    def session_service(self) -> "JSONSessionService | SqliteSessionService":
         """Get the session service."""
         if self._session_service is None:
-            from streetrace.session.json_serializer import JSONSessionSerializer
-            from streetrace.session.session_service import JSONSessionService
+            self._session_service = self._create_session_service()
+        return self._session_service
 
-            self._session_service = JSONSessionService(
-                serializer=JSONSessionSerializer(
-                    self.system_context.config_dir / "sessions",
-                ),
+    def _create_session_service(
+        self,
+    ) -> "JSONSessionService | SqliteSessionService":
+        """Create the session service for the configured storage format."""
+        storage_path = self.system_context.config_dir / "sessions"
+        if self.args.session_format == "sqlite":
+            from streetrace.session.sqlite_session_service import (
+                SQLITE_DB_FILE_NAME,
+                SqliteSessionService,
             )
-        return self._session_service
+
+            return SqliteSessionService(
+                storage_path / SQLITE_DB_FILE_NAME,
+                fsync=self.args.session_fsync,
+            )
+
+        from streetrace.session.json_serializer import (
+            CompressedJSONSessionSerializer,
+            JSONSessionSerializer,
+        )
+        from streetrace.session.jsonl_serializer import JSONLSessionSerializer
+        from streetrace.session.session_service import JSONSessionService
+
+        serializer_cls: type[JSONSessionSerializer] = JSONSessionSerializer
+        if self.args.session_format == "jsonl":
+            serializer_cls = JSONLSessionSerializer
+        elif self.args.session_format == "json.gz":
+            serializer_cls = CompressedJSONSessionSerializer
+        return JSONSessionService(
+            serializer=serializer_cls(storage_path, fsync=self.args.session_fsync),
+            flush_interval=self.args.session_flush_interval,
+        )
+
+    def close(self) -> None:
+        """Write pending session changes and close the session service."""
+        if self._session_service is not None:
+            self._session_service.close()
+            self._session_service = None
 
     @property
     def app_name(self) -> str:
@@ -132,6 +165,14 @@ class SessionManager:
             session_id=self.current_session_id,
         )
 
+    async def get_current_session_history(self) -> "list[Event]":
+        """Get all events of the current session, including compacted ones."""
+        return await self.session_service.get_session_history(
+            app_name=self.app_name,
+            user_id=self.user_id,
+            session_id=self.current_session_id,
+        )
+
     async def get_or_create_session(self) -> "Session":
         """Create the ADK agent session with empty state or get existing session."""
         session_id = self.current_session_id
@@ -159,13 +200,32 @@ class SessionManager:
         self.current_session = session
         return session
 
-    async def validate_session(self, session: "Session") -> "Session":
+    def _is_known_consistent(self, session: "Session") -> bool:
+        """Check the event index for unpaired function calls and responses."""
+        event_index = self.session_service.get_event_index(
+            app_name=session.app_name,
+            user_id=session.user_id,
+            session_id=session.id,
+        )
+        return (
+            event_index is not None
+            and event_index.event_count == len(session.events)
+            and event_index.is_consistent
+        )
+
+    async def validate_session(self, session: "Session") -> "Session":  # noqa: C901
         """Validate session fixing issues that are known to cause LLM call failure.
 
         Currently:
         - Remove function calls that don't have matching function responses.
         - Remove function responses that don't have matching function calls.
+
+        The session service's event index tells if the session is consistent without
+        scanning the events, they are only scanned when there is something to fix.
         """
+        if self._is_known_consistent(session):
+            return session
+
         new_events: list[Event] = []
         tool_call_event: Event | None = None
         errors_found = 0
@@ -256,21 +316,33 @@ class SessionManager:
         self.ui_bus.dispatch_ui_update(display_list)
 
     async def manage_current_session(self) -> None:  # noqa: C901, PLR0912
-        """Trim function call/response pairs to keep only last 20 pairs."""
+        """Trim function call/response pairs to keep only last 20 pairs.
+
+        The function responses are counted by the session service's event index, the
+        session is only loaded when it needs trimming.
+        """
+        event_index = self.session_service.get_event_index(
+            app_name=self.app_name,
+            user_id=self.user_id,
+            session_id=self.current_session_id,
+        )
+        if (
+            event_index is not None
+            and len(event_index.function_response_indices)
+            <= self.MAX_TOOL_CALLS_IN_SESSION
+        ):
+            return
+
         session = await self.get_current_session()
         if not session:
             msg = "Session not found."
             raise ValueError(msg)
 
-        # Find all function response events
-        function_response_indices = []
-        for i, event in enumerate(session.events):
-            if (
-                event.content
-                and event.content.parts
-                and any(part.function_response for part in event.content.parts)
-            ):
-                function_response_indices.append(i)
+        if event_index is None or event_index.event_count != len(session.events):
+            from streetrace.session.event_index import SessionEventIndex
+
+            event_index = SessionEventIndex(session.events)
+        function_response_indices = event_index.function_response_indices
 
         # If 20 or fewer function responses, no trimming needed
         if len(function_response_indices) <= self.MAX_TOOL_CALLS_IN_SESSION:
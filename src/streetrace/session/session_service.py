@@ -1,6 +1,8 @@
 """ADK Session Service that maintains a directory of sessions in JSON files."""
 
+import asyncio
 import copy
+import threading
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -16,20 +18,158 @@ if TYPE_CHECKING:
 from google.adk.sessions.in_memory_session_service import InMemorySessionService
 
 from streetrace.log import get_logger
+from streetrace.session.event_index import SessionEventIndex
 
 logger = get_logger(__name__)
 
 
+def _adds_compaction_summary(session: "Session", new_events: "list[Event]") -> bool:
+    """Check if new events bring a compaction summary the session did not have."""
+    from streetrace.session.compaction import is_compaction_summary
+
+    existing_ids = {event.id for event in session.events}
+    return any(
+        is_compaction_summary(event) and event.id not in existing_ids
+        for event in new_events
+    )
+
+
 class JSONSessionService(InMemorySessionService):
-    """ADK Session Service that combines in-memory and json storage."""
+    """ADK Session Service that combines in-memory and json storage.
+
+    By default every appended event is written to storage right away. In
+    write-behind mode (`flush_interval` is set) appended events only mark the
+    session dirty, and dirty sessions are written on a worker thread every
+    `flush_interval` seconds and when a turn ends with a final response, and
+    by `flush` on shutdown. Events that can't be written are kept and written
+    first on the next flush. Replacing events, creating and deleting sessions
+    are always written immediately.
+    """
 
     def __init__(
         self,
         serializer: "JSONSessionSerializer",
+        *,
+        flush_interval: float | None = None,
     ) -> None:
-        """Initialize a new instance of JSONSessionService."""
+        """Initialize a new instance of JSONSessionService.
+
+        Args:
+            serializer: Serializer that stores the sessions.
+            flush_interval: Seconds between background writes of appended events,
+                None to write each event as it is appended.
+
+        """
         super().__init__()  # type: ignore[no-untyped-call]
         self.serializer = serializer
+        self.flush_interval = flush_interval
+        self._event_indexes: dict[tuple[str, str, str], SessionEventIndex] = {}
+        self._dirty: dict[tuple[str, str, str], tuple[Session, list[Event]]] = {}
+        # events of failed writes, only accessed while holding _write_lock
+        self._retry: dict[tuple[str, str, str], tuple[Session, list[Event]]] = {}
+        # held while writing appended events, released by the writing thread
+        self._write_lock = threading.Lock()
+        self._background_write: asyncio.Future[None] | None = None
+        self._flush_task: asyncio.Task[None] | None = None
+
+    def flush(self) -> None:
+        """Write all appended events that have not been written yet.
+
+        Waits for a background write in progress, so events are stored in the
+        order they were appended. Events that can't be written are logged and
+        kept for the next flush.
+        """
+        with self._write_lock:
+            pending, self._dirty = self._dirty, {}
+            self._write_events(pending)
+
+    def close(self) -> None:
+        """Stop background writes and write all appended events."""
+        if self._flush_task is not None and not self._flush_task.done():
+            self._flush_task.cancel()
+        self.flush()
+
+    async def _flush_in_background(self) -> None:
+        """Write dirty sessions on a worker thread, keeping the event loop free."""
+        await self._wait_for_background_write()
+        if not self._dirty and not self._retry:
+            return
+        self._write_lock.acquire()
+        pending, self._dirty = self._dirty, {}
+        # a plain future rather than a task, so shutdown doesn't cancel it before
+        # the thread runs and releases the lock
+        self._background_write = asyncio.get_running_loop().run_in_executor(
+            None,
+            self._write_events_and_release,
+            pending,
+        )
+        await asyncio.shield(self._background_write)
+
+    async def _wait_for_background_write(self) -> None:
+        """Wait until no background write is in progress."""
+        while self._background_write is not None and not self._background_write.done():
+            await asyncio.wait({self._background_write})
+
+    def _write_events_and_release(
+        self,
+        pending: "dict[tuple[str, str, str], tuple[Session, list[Event]]]",
+    ) -> None:
+        """Write events on a worker thread and release the write lock."""
+        try:
+            self._write_events(pending)
+        finally:
+            self._write_lock.release()
+
+    def _write_events(
+        self,
+        pending: "dict[tuple[str, str, str], tuple[Session, list[Event]]]",
+    ) -> None:
+        """Append events left by failed writes, then the pending ones.
+
+        Must be called while holding the write lock.
+        """
+        batch, self._retry = self._retry, {}
+        for key, (session, events) in pending.items():
+            if key in batch:
+                batch[key] = (session, [*batch[key][1], *events])
+            else:
+                batch[key] = (session, events)
+        for key, (session, events) in batch.items():
+            try:
+                self.serializer.append_events(session, events)
+            except OSError:
+                logger.exception("Cannot write session %s, will retry.", key[2])
+                self._retry[key] = (session, events)
+                continue
+            logger.debug("Flushed %d events of session %s.", len(events), key[2])
+
+    async def _drop_pending(self, key: tuple[str, str, str]) -> None:
+        """Forget unwritten events of a session that is rewritten or deleted."""
+        await self._wait_for_background_write()
+        self._dirty.pop(key, None)
+        with self._write_lock:
+            self._retry.pop(key, None)
+
+    def _schedule_flush(self) -> None:
+        """Start the background flush task unless it's running in this loop."""
+        loop = asyncio.get_running_loop()
+        if (
+            self._flush_task is not None
+            and not self._flush_task.done()
+            and self._flush_task.get_loop() is loop
+        ):
+            return
+        self._flush_task = loop.create_task(self._flush_periodically())
+
+    async def _flush_periodically(self) -> None:
+        """Flush dirty sessions every flush_interval seconds while there are any."""
+        try:
+            while (self._dirty or self._retry) and self.flush_interval is not None:
+                await asyncio.sleep(self.flush_interval)
+                await self._flush_in_background()
+        finally:
+            # the loop is shutting down or the task was cancelled
+            self.flush()
 
     async def get_session(
         self,
@@ -94,6 +234,9 @@ class JSONSessionService(InMemorySessionService):
 
         in_memory_session = copy.deepcopy(session)
         self.sessions[app_name][user_id][session_id] = in_memory_session
+        self._event_indexes[app_name, user_id, session_id] = SessionEventIndex(
+            in_memory_session.events,
+        )
         return self._merge_state(
             app_name,
             user_id,
@@ -122,6 +265,9 @@ class JSONSessionService(InMemorySessionService):
             user_id,
         )
         self.serializer.write(session=session)
+        self._event_indexes[app_name, user_id, session.id] = SessionEventIndex(
+            session.events,
+        )
         return session
 
     async def replace_events(
@@ -173,9 +319,55 @@ class JSONSessionService(InMemorySessionService):
         # TODO(krmrn42): Restore session in try..except
         #   (easier to do if we compose instead of inherit).
         if new_session is not None:
-            self.serializer.write(new_session)
+            # the whole session is written below, including any pending events
+            await self._drop_pending((session.app_name, session.user_id, session.id))
+            if _adds_compaction_summary(session, new_events):
+                self.serializer.write_compacted(new_session)
+            else:
+                self.serializer.write(new_session)
+            self._event_indexes[session.app_name, session.user_id, session.id] = (
+                SessionEventIndex(new_session.events)
+            )
         return new_session
 
+    def get_event_index(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        session_id: str,
+    ) -> SessionEventIndex | None:
+        """Get the function call bookkeeping of a session held in memory.
+
+        The index is built when the session is created or loaded from storage, and
+        kept up to date by append_event and replace_events.
+
+        Returns:
+            The index, or None if the session is not in memory.
+
+        """
+        return self._event_indexes.get((app_name, user_id, session_id))
+
+    async def get_session_history(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        session_id: str,
+    ) -> "list[Event]":
+        """Get all events recorded in a session, including compacted ones.
+
+        Sessions are loaded with only the events after their last compaction, use
+        this to display or export the complete conversation.
+        """
+        self.flush()
+        history = self.serializer.read_history(
+            app_name=app_name,
+            user_id=user_id,
+            session_id=session_id,
+        )
+        return history or []
+
     async def list_sessions(
         self,
         *,
@@ -190,6 +382,7 @@ class JSONSessionService(InMemorySessionService):
             return await super().list_sessions(app_name=app_name, user_id=user_id)
 
         logger.debug("Listing sessions from storage for %s/%s.", app_name, user_id)
+        self.flush()
         sessions_iter = self.serializer.list_saved(app_name=app_name, user_id=user_id)
         return ListSessionsResponse(sessions=list(sessions_iter))
 
@@ -206,6 +399,8 @@ class JSONSessionService(InMemorySessionService):
             user_id=user_id,
             session_id=session_id,
         )
+        self._event_indexes.pop((app_name, user_id, session_id), None)
+        await self._drop_pending((app_name, user_id, session_id))
         self.serializer.delete(
             app_name=app_name,
             user_id=user_id,
@@ -228,10 +423,26 @@ class JSONSessionService(InMemorySessionService):
             session=session,
             event=event,
         )
+        if evt.partial:
+            # partial (streaming) events are never added to the session
+            return evt
+
+        key = (session.app_name, session.user_id, session.id)
+        event_index = self._event_indexes.get(key)
+        if event_index is not None:
+            event_index.add(evt)
 
         # it's unclear how to handle if the session is missing in memory or in
         # storage, so we defer the in-memory handling to super(), and always save
-        self.serializer.write(session)
+        if self.flush_interval is None:
+            self.serializer.append_event(session, evt)
+        else:
+            _, pending_events = self._dirty.setdefault(key, (session, []))
+            pending_events.append(evt)
+            if evt.is_final_response():
+                await self._flush_in_background()
+            if self._dirty or self._retry:
+                self._schedule_flush()
 
         logger.debug(
             "Event appended to session %s. Updating storage.",
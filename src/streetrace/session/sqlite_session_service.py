@@ -0,0 +1,676 @@
+"""ADK Session Service that keeps all sessions in a single SQLite database."""
+
+import json
+import sqlite3
+import time
+import uuid
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from google.adk.events import Event
+    from google.adk.sessions import Session
+    from google.adk.sessions.base_session_service import (
+        GetSessionConfig,
+        ListSessionsResponse,
+    )
+
+from google.adk.sessions.base_session_service import BaseSessionService
+
+from streetrace.log import get_logger
+from streetrace.session.event_index import SessionEventIndex
+
+logger = get_logger(__name__)
+
+SQLITE_DB_FILE_NAME = "sessions.db"
+"""Name of the database file in the sessions storage directory."""
+
+DEFAULT_BATCH_SIZE = 64
+"""Max number of buffered events before they are written mid-turn."""
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    app_name TEXT NOT NULL,
+    user_id TEXT NOT NULL,
+    id TEXT NOT NULL,
+    last_update_time REAL NOT NULL,
+    PRIMARY KEY (app_name, user_id, id)
+);
+CREATE INDEX IF NOT EXISTS sessions_by_update_time
+    ON sessions (app_name, user_id, last_update_time);
+CREATE TABLE IF NOT EXISTS events (
+    app_name TEXT NOT NULL,
+    user_id TEXT NOT NULL,
+    session_id TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    timestamp REAL NOT NULL,
+    event_data TEXT NOT NULL,
+    PRIMARY KEY (app_name, user_id, session_id, seq),
+    FOREIGN KEY (app_name, user_id, session_id)
+        REFERENCES sessions (app_name, user_id, id) ON DELETE CASCADE
+);
+CREATE TABLE IF NOT EXISTS replaced_events (
+    app_name TEXT NOT NULL,
+    user_id TEXT NOT NULL,
+    session_id TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    timestamp REAL NOT NULL,
+    event_data TEXT NOT NULL,
+    FOREIGN KEY (app_name, user_id, session_id)
+        REFERENCES sessions (app_name, user_id, id) ON DELETE CASCADE
+);
+CREATE INDEX IF NOT EXISTS replaced_events_by_session
+    ON replaced_events (app_name, user_id, session_id);
+CREATE TABLE IF NOT EXISTS state (
+    app_name TEXT NOT NULL,
+    user_id TEXT NOT NULL,
+    session_id TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    PRIMARY KEY (app_name, user_id, session_id, key)
+);
+"""
+"""Database schema.
+
+App-scoped state rows have empty user_id and session_id, user-scoped state rows
+have an empty session_id. State keys keep their scope prefix. replaced_events
+keeps the events removed by replace_events as the session's history.
+"""
+
+_SessionKey = tuple[str, str, str]
+"""(app_name, user_id, session_id)."""
+
+
+def _state_row_key(session_key: _SessionKey, key: str) -> tuple[str, str, str, str]:
+    """Get the state table primary key of a state entry given its scope prefix."""
+    from google.adk.sessions.state import State
+
+    app_name, user_id, session_id = session_key
+    if key.startswith(State.APP_PREFIX):
+        return app_name, "", "", key
+    if key.startswith(State.USER_PREFIX):
+        return app_name, user_id, "", key
+    return app_name, user_id, session_id, key
+
+
+class SqliteSessionService(BaseSessionService):
+    """ADK Session Service that stores sessions, events and state in SQLite.
+
+    All sessions live in one database file opened in WAL mode, so several agents
+    can share it. Events appended during a turn are buffered and written in a
+    single transaction when the turn produces its final response, when the buffer
+    reaches `batch_size`, or before any read, so reads always see all events.
+    Sessions are not cached in memory; get_session honors GetSessionConfig to load
+    only the most recent events.
+    """
+
+    def __init__(
+        self,
+        db_path: "Path",
+        *,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        fsync: bool = False,
+    ) -> None:
+        """Initialize a new instance of SqliteSessionService.
+
+        Args:
+            db_path: Path to the database file, created if missing.
+            batch_size: Max number of buffered events before they are written.
+            fsync: Sync the database to disk on every commit, so a crash of the
+                machine does not lose the last transactions.
+
+        """
+        super().__init__()
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.db_path = db_path
+        self.batch_size = batch_size
+        self._connection = sqlite3.connect(db_path, timeout=30)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "PRAGMA synchronous=FULL" if fsync else "PRAGMA synchronous=NORMAL",
+        )
+        self._connection.execute("PRAGMA foreign_keys=ON")
+        self._connection.executescript(_SCHEMA)
+        self._next_seq: dict[_SessionKey, int] = {}
+        self._pending_events: list[tuple[str, str, str, int, float, str]] = []
+        self._pending_state: dict[tuple[str, str, str, str], str] = {}
+        self._pending_updates: dict[_SessionKey, float] = {}
+        self._event_indexes: dict[_SessionKey, SessionEventIndex] = {}
+
+    def flush(self) -> None:
+        """Write all buffered events and state changes in one transaction.
+
+        If the transaction fails, the error is logged and the changes stay buffered
+        for the next flush. Buffered events are renumbered after the last stored
+        event of their session first, in case another process appended to it.
+        """
+        if not self._pending_events and not self._pending_state:
+            return
+        try:
+            self._write_pending()
+        except sqlite3.Error:
+            logger.exception(
+                "Cannot write %d buffered events to %s, will retry.",
+                len(self._pending_events),
+                self.db_path,
+            )
+            self._renumber_pending()
+            return
+        logger.debug(
+            "Flushed %d events to %s.",
+            len(self._pending_events),
+            self.db_path,
+        )
+        self._pending_events.clear()
+        self._pending_state.clear()
+        self._pending_updates.clear()
+
+    def _renumber_pending(self) -> None:
+        """Give buffered events sequence numbers after the stored events."""
+        for key in {row[:3] for row in self._pending_events}:
+            self._next_seq.pop(key, None)
+        renumbered = []
+        try:
+            for app_name, user_id, session_id, _, *values in self._pending_events:
+                key = (app_name, user_id, session_id)
+                seq = self._get_next_seq(key)
+                self._next_seq[key] = seq + 1
+                renumbered.append((*key, seq, *values))
+        except sqlite3.Error:
+            logger.exception("Cannot read sequence numbers from %s.", self.db_path)
+            return
+        self._pending_events[:] = renumbered
+
+    def _drop_pending(self, key: _SessionKey) -> None:
+        """Forget buffered changes of a session that is rewritten or deleted."""
+        self._pending_events[:] = [
+            row for row in self._pending_events if row[:3] != key
+        ]
+        self._pending_state = {
+            state_key: value
+            for state_key, value in self._pending_state.items()
+            if state_key[:3] != key
+        }
+        self._pending_updates.pop(key, None)
+
+    def _write_pending(self) -> None:
+        """Write the buffered changes in one transaction."""
+        with self._connection:
+            self._connection.executemany(
+                "INSERT INTO events "
+                "(app_name, user_id, session_id, seq, timestamp, event_data) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                self._pending_events,
+            )
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO state "
+                "(app_name, user_id, session_id, key, value) VALUES (?, ?, ?, ?, ?)",
+                [(*key, value) for key, value in self._pending_state.items()],
+            )
+            self._connection.executemany(
+                "UPDATE sessions SET last_update_time = ? "
+                "WHERE app_name = ? AND user_id = ? AND id = ?",
+                [
+                    (update_time, *key)
+                    for key, update_time in self._pending_updates.items()
+                ],
+            )
+
+    def close(self) -> None:
+        """Flush buffered changes and close the database."""
+        self.flush()
+        if self._pending_events or self._pending_state:
+            logger.error(
+                "Closing %s with %d events that could not be written.",
+                self.db_path,
+                len(self._pending_events),
+            )
+        self._connection.close()
+
+    def _session_exists(self, key: _SessionKey) -> bool:
+        row = self._connection.execute(
+            "SELECT 1 FROM sessions WHERE app_name = ? AND user_id = ? AND id = ?",
+            key,
+        ).fetchone()
+        return row is not None
+
+    def _load_state(self, key: _SessionKey) -> dict[str, Any]:
+        app_name, user_id, session_id = key
+        rows = self._connection.execute(
+            "SELECT key, value FROM state WHERE app_name = ? AND ("
+            "(user_id = '' AND session_id = '') "
+            "OR (user_id = ? AND session_id IN ('', ?)))",
+            (app_name, user_id, session_id),
+        )
+        return {state_key: json.loads(value) for state_key, value in rows}
+
+    def _insert_session(
+        self,
+        session: "Session",
+        *,
+        first_seq: int = 0,
+    ) -> None:
+        """Write a session, its state and events from `first_seq` on.
+
+        The caller controls the transaction.
+        """
+        from google.adk.sessions.state import State
+
+        key = (session.app_name, session.user_id, session.id)
+        self._connection.execute(
+            "INSERT INTO sessions (app_name, user_id, id, last_update_time) "
+            "VALUES (?, ?, ?, ?) ON CONFLICT DO UPDATE "
+            "SET last_update_time = excluded.last_update_time",
+            (*key, session.last_update_time),
+        )
+        self._connection.executemany(
+            "INSERT OR REPLACE INTO state "
+            "(app_name, user_id, session_id, key, value) VALUES (?, ?, ?, ?, ?)",
+            [
+                (*_state_row_key(key, state_key), json.dumps(value))
+                for state_key, value in session.state.items()
+                if not state_key.startswith(State.TEMP_PREFIX)
+            ],
+        )
+        events = session.events[first_seq:]
+        self._connection.executemany(
+            "INSERT INTO events "
+            "(app_name, user_id, session_id, seq, timestamp, event_data) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    *key,
+                    seq,
+                    event.timestamp,
+                    event.model_dump_json(exclude_none=True),
+                )
+                for seq, event in enumerate(events, start=first_seq)
+            ],
+        )
+        self._next_seq[key] = first_seq + len(events)
+
+    async def create_session(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        state: dict[str, Any] | None = None,
+        session_id: str | None = None,
+    ) -> "Session":
+        """Create a new session in the database."""
+        from google.adk.errors.already_exists_error import AlreadyExistsError
+        from google.adk.sessions import Session
+
+        session_id = (session_id or "").strip() or str(uuid.uuid4())
+        key = (app_name, user_id, session_id)
+        if self._session_exists(key):
+            msg = f"Session with id {session_id} already exists."
+            raise AlreadyExistsError(msg)  # type: ignore[no-untyped-call]
+
+        session = Session(
+            id=session_id,
+            app_name=app_name,
+            user_id=user_id,
+            state=state or {},
+            last_update_time=time.time(),
+        )
+        with self._connection:
+            self._insert_session(session)
+        self._event_indexes[key] = SessionEventIndex()
+        logger.info(
+            "Session %s created for %s/%s in %s.",
+            session_id,
+            app_name,
+            user_id,
+            self.db_path,
+        )
+        session.state = self._load_state(key)
+        return session
+
+    async def get_session(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        session_id: str,
+        config: "GetSessionConfig | None" = None,
+    ) -> "Session | None":
+        """Load a session, optionally limited to its most recent events."""
+        from google.adk.sessions import Session
+
+        self.flush()
+        key = (app_name, user_id, session_id)
+        row = self._connection.execute(
+            "SELECT last_update_time FROM sessions "
+            "WHERE app_name = ? AND user_id = ? AND id = ?",
+            key,
+        ).fetchone()
+        if row is None:
+            return None
+
+        num_recent_events = (config.num_recent_events or None) if config else None
+        after_timestamp = config.after_timestamp if config else None
+        events = await self.list_events(
+            app_name=app_name,
+            user_id=user_id,
+            session_id=session_id,
+            after_timestamp=after_timestamp,
+            limit=num_recent_events,
+            from_end=num_recent_events is not None,
+        )
+        if key not in self._event_indexes and not (
+            num_recent_events or after_timestamp
+        ):
+            self._event_indexes[key] = SessionEventIndex(events)
+        return Session(
+            id=session_id,
+            app_name=app_name,
+            user_id=user_id,
+            state=self._load_state(key),
+            events=events,
+            last_update_time=row[0],
+        )
+
+    async def list_events(  # noqa: PLR0913
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        session_id: str,
+        offset: int = 0,
+        limit: int | None = None,
+        after_timestamp: float | None = None,
+        from_end: bool = False,
+    ) -> "list[Event]":
+        """Load a page of session events in chronological order.
+
+        Args:
+            app_name: The session's app name.
+            user_id: The session's user ID.
+            session_id: The session ID.
+            offset: Number of events to skip.
+            limit: Max number of events to load, all if None.
+            after_timestamp: Load only events at or after this timestamp.
+            from_end: Count offset and limit from the most recent event.
+
+        Returns:
+            The loaded events, oldest first.
+
+        """
+        from google.adk.events import Event
+
+        self.flush()
+        sql = (
+            "SELECT event_data FROM events "
+            "WHERE app_name = ? AND user_id = ? AND session_id = ?"
+        )
+        params: list[Any] = [app_name, user_id, session_id]
+        if after_timestamp is not None:
+            sql += " AND timestamp >= ?"
+            params.append(after_timestamp)
+        sql += " ORDER BY seq DESC" if from_end else " ORDER BY seq"
+        sql += " LIMIT ? OFFSET ?"
+        params.extend([-1 if limit is None else limit, offset])
+
+        events = [
+            Event.model_validate_json(event_data)
+            for (event_data,) in self._connection.execute(sql, params)
+        ]
+        if from_end:
+            events.reverse()
+        return events
+
+    async def get_session_history(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        session_id: str,
+    ) -> "list[Event]":
+        """Get all stored events of a session, including replaced ones.
+
+        Events are returned once, ordered by timestamp. Events kept by a
+        compaction are also stored as replaced events.
+        """
+        from google.adk.events import Event
+
+        self.flush()
+        key = (app_name, user_id, session_id)
+        rows = self._connection.execute(
+            "SELECT event_data FROM ("
+            "SELECT timestamp, 0 AS current, rowid AS position, event_data "
+            "FROM replaced_events "
+            "WHERE app_name = ? AND user_id = ? AND session_id = ? "
+            "UNION ALL "
+            "SELECT timestamp, 1, seq, event_data FROM events "
+            "WHERE app_name = ? AND user_id = ? AND session_id = ?"
+            ") ORDER BY timestamp, current, position",
+            (*key, *key),
+        )
+        events: dict[str, Event] = {}
+        for (event_data,) in rows:
+            event = Event.model_validate_json(event_data)
+            events.setdefault(event.id, event)
+        return list(events.values())
+
+    async def list_sessions(
+        self,
+        *,
+        app_name: str,
+        user_id: str | None = None,
+    ) -> "ListSessionsResponse":
+        """List sessions without events and state, least recently updated first."""
+        from google.adk.sessions import Session
+        from google.adk.sessions.base_session_service import ListSessionsResponse
+
+        self.flush()
+        sql = "SELECT id, user_id, last_update_time FROM sessions WHERE app_name = ?"
+        params = [app_name]
+        if user_id is not None:
+            sql += " AND user_id = ?"
+            params.append(user_id)
+        sql += " ORDER BY last_update_time"
+        sessions = [
+            Session(
+                id=session_id,
+                app_name=app_name,
+                user_id=session_user_id,
+                last_update_time=last_update_time,
+                events=[],
+                state={},
+            )
+            for session_id, session_user_id, last_update_time in (
+                self._connection.execute(sql, params)
+            )
+        ]
+        return ListSessionsResponse(sessions=sessions)
+
+    async def delete_session(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        session_id: str,
+    ) -> None:
+        """Delete a session with its events and session-scoped state."""
+        self.flush()
+        key = (app_name, user_id, session_id)
+        self._drop_pending(key)
+        with self._connection:
+            self._connection.execute(
+                "DELETE FROM sessions WHERE app_name = ? AND user_id = ? AND id = ?",
+                key,
+            )
+            self._connection.execute(
+                "DELETE FROM state "
+                "WHERE app_name = ? AND user_id = ? AND session_id = ?",
+                key,
+            )
+        self._next_seq.pop(key, None)
+        self._event_indexes.pop(key, None)
+        logger.info("Session %s deleted for %s/%s.", session_id, app_name, user_id)
+
+    def get_event_index(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        session_id: str,
+    ) -> SessionEventIndex | None:
+        """Get the function call bookkeeping of a session.
+
+        The index is built when the session is created or first loaded in full, and
+        kept up to date by append_event and replace_events. Changes made to the
+        database by other processes are not reflected.
+
+        Returns:
+            The index, or None if the session has not been loaded by this service.
+
+        """
+        return self._event_indexes.get((app_name, user_id, session_id))
+
+    def _get_next_seq(self, key: _SessionKey) -> int:
+        if key not in self._next_seq:
+            row = self._connection.execute(
+                "SELECT MAX(seq) FROM events "
+                "WHERE app_name = ? AND user_id = ? AND session_id = ?",
+                key,
+            ).fetchone()
+            self._next_seq[key] = 0 if row[0] is None else row[0] + 1
+        return self._next_seq[key]
+
+    async def append_event(
+        self,
+        session: "Session",
+        event: "Event",
+    ) -> "Event":
+        """Append an event to a session, buffering the write until the turn ends."""
+        if event.partial:
+            return event
+        event = await super().append_event(session=session, event=event)
+        session.last_update_time = event.timestamp
+
+        key = (session.app_name, session.user_id, session.id)
+        try:
+            seq = self._get_next_seq(key)
+        except sqlite3.Error:
+            # a wrong guess makes the flush fail and renumber the buffered events
+            logger.exception("Cannot read sequence numbers from %s.", self.db_path)
+            seq = len(session.events) - 1
+        self._next_seq[key] = seq + 1
+        self._pending_events.append(
+            (*key, seq, event.timestamp, event.model_dump_json(exclude_none=True)),
+        )
+        if event.actions and event.actions.state_delta:
+            for state_key, value in event.actions.state_delta.items():
+                self._pending_state[_state_row_key(key, state_key)] = json.dumps(
+                    value,
+                )
+        self._pending_updates[key] = event.timestamp
+        if key in self._event_indexes:
+            self._event_indexes[key].add(event)
+
+        if event.is_final_response() or len(self._pending_events) >= self.batch_size:
+            self.flush()
+        return event
+
+    async def replace_events(
+        self,
+        *,
+        session: "Session",
+        new_events: "list[Event]",
+        start_at: int = 0,
+    ) -> "Session | None":
+        """Replace events in this session starting at `start_at`.
+
+        The session keeps events 0..start_at followed by the new events, and its
+        state is reset to the state of the provided session.
+
+        Args:
+            session: The session to replace events in.
+            new_events: The new events to put to the session.
+            start_at: Index in the session starting from which to write the new events.
+
+        Returns:
+            The updated session.
+
+        """
+        from google.adk.sessions import Session
+
+        self.flush()
+        key = (session.app_name, session.user_id, session.id)
+        # the session passed in holds any events a failed flush left buffered
+        self._drop_pending(key)
+        kept_events = session.events[:start_at]
+        all_events = [*kept_events, *new_events]
+        new_session = Session(
+            id=session.id,
+            app_name=session.app_name,
+            user_id=session.user_id,
+            state=session.state,
+            events=all_events,
+            last_update_time=(
+                all_events[-1].timestamp if all_events else session.last_update_time
+            ),
+        )
+        with self._connection:
+            self._connection.execute(
+                "INSERT INTO replaced_events "
+                "(app_name, user_id, session_id, seq, timestamp, event_data) "
+                "SELECT app_name, user_id, session_id, seq, timestamp, event_data "
+                "FROM events "
+                "WHERE app_name = ? AND user_id = ? AND session_id = ? AND seq >= ? "
+                "ORDER BY seq",
+                (*key, start_at),
+            )
+            self._connection.execute(
+                "DELETE FROM events "
+                "WHERE app_name = ? AND user_id = ? AND session_id = ? AND seq >= ?",
+                (*key, start_at),
+            )
+            self._connection.execute(
+                "DELETE FROM state "
+                "WHERE app_name = ? AND user_id = ? AND session_id = ?",
+                key,
+            )
+            self._insert_session(new_session, first_seq=start_at)
+        self._event_indexes.pop(key, None)
+        return await self.get_session(
+            app_name=session.app_name,
+            user_id=session.user_id,
+            session_id=session.id,
+        )
+
+    def import_session(self, session: "Session", *, overwrite: bool = False) -> bool:
+        """Store a complete session loaded from another storage.
+
+        Args:
+            session: The session to import.
+            overwrite: Replace the session if it already exists.
+
+        Returns:
+            True if the session was imported, False if it already exists.
+
+        """
+        self.flush()
+        key = (session.app_name, session.user_id, session.id)
+        if self._session_exists(key):
+            if not overwrite:
+                return False
+            self._drop_pending(key)
+            with self._connection:
+                self._connection.execute(
+                    "DELETE FROM sessions "
+                    "WHERE app_name = ? AND user_id = ? AND id = ?",
+                    key,
+                )
+                self._connection.execute(
+                    "DELETE FROM state "
+                    "WHERE app_name = ? AND user_id = ? AND session_id = ?",
+                    key,
+                )
+        with self._connection:
+            self._insert_session(session)
+        self._event_indexes.pop(key, None)
+        return True
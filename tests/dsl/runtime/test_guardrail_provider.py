@@ -1,10 +1,11 @@
 """Tests for GuardrailProvider with registry-based dispatch."""
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from streetrace.dsl.runtime.guardrail_provider import GuardrailProvider
+from streetrace.dsl.runtime.guardrail_types import ToolResultContent
 
 
 class TestPresidioAvailable:
@@ -108,7 +109,7 @@ class TestPresidioUnavailable:
         provider = GuardrailProvider()
         pii_guard = provider._registry["pii"]  # noqa: SLF001
         mock_backend = MagicMock()
-        mock_backend.mask_pii.return_value = "Hello [PII]"
+        mock_backend.mask_batch.return_value = ["Hello [PII]"]
 
         load_calls = iter([False, True])
 
@@ -160,6 +161,33 @@ class TestPresidioUnavailable:
         assert await provider.check("unknown", "test") is False
 
 
+class TestBuiltinWiring:
+    """Test construction of the built-in guardrails."""
+
+    def test_passes_inference_pipeline_and_mcp_guard_config(self):
+        """The inference pipeline and MCP-Guard config reach the guardrails."""
+        pipeline = MagicMock()
+        config = MagicMock()
+        with (
+            patch(
+                "streetrace.dsl.runtime.guardrail_provider.PromptProxyPipeline",
+            ) as proxy_cls,
+            patch(
+                "streetrace.dsl.runtime.guardrail_provider.McpGuardOrchestrator",
+            ) as mcp_guard_cls,
+        ):
+            GuardrailProvider(
+                inference_pipeline=pipeline,
+                mcp_guard_config=config,
+            )
+
+        proxy_cls.assert_called_once_with(inference_pipeline=pipeline)
+        mcp_guard_cls.assert_called_once_with(
+            inference_pipeline=pipeline,
+            config=config,
+        )
+
+
 class TestCustomGuardrails:
     """Test custom guardrail registration and dispatch."""
 
@@ -211,3 +239,86 @@ class TestCustomGuardrails:
         provider.register_custom("pii", custom_pii)
         result = await provider.mask("pii", "test@example.com")
         assert result == "[CUSTOM_PII]"
+
+
+class TestAsyncCheckGuardrails:
+    """Test dispatch to guardrails implementing check_async."""
+
+    @pytest.fixture
+    def provider(self) -> GuardrailProvider:
+        """Create a provider with an async jailbreak guardrail."""
+        provider = GuardrailProvider()
+        guardrail = MagicMock()
+        guardrail.check_async = AsyncMock(return_value=(True, "async"))
+        guardrail.check_str.return_value = (False, "")
+        provider._registry["jailbreak"] = guardrail  # noqa: SLF001
+        return provider
+
+    @pytest.mark.asyncio
+    async def test_check_awaits_check_async(self, provider):
+        """String checks use check_async instead of check_str."""
+        assert await provider.check("jailbreak", "some text") is True
+
+        guardrail = provider._registry["jailbreak"]  # noqa: SLF001
+        guardrail.check_async.assert_awaited_once_with("some text")
+        guardrail.check_str.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_tool_result_fields_use_check_async(self, provider):
+        """Inspectable tool result fields are checked with check_async."""
+        content = ToolResultContent(data={"output": "tool output"})
+
+        assert await provider.check("jailbreak", content) is True
+
+        guardrail = provider._registry["jailbreak"]  # noqa: SLF001
+        guardrail.check_async.assert_awaited_once_with("tool output")
+
+
+class TestAsyncMaskGuardrails:
+    """Test dispatch to guardrails implementing mask_batch_async."""
+
+    @pytest.fixture
+    def provider(self) -> GuardrailProvider:
+        """Create a provider with a mocked PII backend."""
+        provider = GuardrailProvider()
+        backend = MagicMock()
+        backend.mask_batch.side_effect = lambda texts: [
+            text.replace("John", "[P]") for text in texts
+        ]
+        provider._registry["pii"]._presidio = backend  # noqa: SLF001
+        return provider
+
+    @pytest.mark.asyncio
+    async def test_tool_result_fields_masked_in_one_batch(self, provider):
+        """All inspectable tool result fields go to mask_batch_async at once."""
+        pii_guard = provider._registry["pii"]  # noqa: SLF001
+        content = ToolResultContent(
+            data={"output": "John", "stderr": "John failed", "exit_code": 1},
+        )
+
+        with patch.object(
+            pii_guard, "mask_batch_async", wraps=pii_guard.mask_batch_async,
+        ) as mask_batch:
+            result = await provider.mask("pii", content)
+
+        assert result == ToolResultContent(
+            data={"output": "[P]", "stderr": "[P] failed", "exit_code": 1},
+        )
+        mask_batch.assert_awaited_once_with(["John", "John failed"])
+
+    @pytest.mark.asyncio
+    async def test_memoized_texts_are_not_rebatched(self, provider):
+        """Texts with memoized results are left out of the batch."""
+        pii_guard = provider._registry["pii"]  # noqa: SLF001
+        await provider.mask("pii", "John")
+        content = ToolResultContent(data={"output": "John", "stdout": "Hi John"})
+
+        with patch.object(
+            pii_guard, "mask_batch_async", wraps=pii_guard.mask_batch_async,
+        ) as mask_batch:
+            result = await provider.mask("pii", content)
+
+        assert result == ToolResultContent(
+            data={"output": "[P]", "stdout": "Hi [P]"},
+        )
+        mask_batch.assert_awaited_once_with(["Hi John"])
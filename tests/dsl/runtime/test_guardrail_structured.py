@@ -1,5 +1,6 @@
 """Tests for structure-aware guardrail dispatch."""
 
+import json
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -38,9 +39,9 @@ class TestMaskOnToolResult:
         provider = GuardrailProvider()
 
         mock_backend = MagicMock()
-        mock_backend.mask_pii.side_effect = (
-            lambda text: text.replace("123-45-6789", "[PII]")
-        )
+        mock_backend.mask_batch.side_effect = lambda texts: [
+            text.replace("123-45-6789", "[PII]") for text in texts
+        ]
         provider._registry["pii"]._presidio = mock_backend  # noqa: SLF001
 
         content = ToolResultContent(data={
@@ -60,9 +61,9 @@ class TestMaskOnToolResult:
         provider = GuardrailProvider()
 
         mock_backend = MagicMock()
-        mock_backend.mask_pii.side_effect = (
-            lambda text: text.replace("John", "[PII]")
-        )
+        mock_backend.mask_batch.side_effect = lambda texts: [
+            text.replace("John", "[PII]") for text in texts
+        ]
         provider._registry["pii"]._presidio = mock_backend  # noqa: SLF001
 
         content = ToolResultContent(data={
@@ -82,7 +83,7 @@ class TestMaskOnToolResult:
         provider = GuardrailProvider()
 
         mock_backend = MagicMock()
-        mock_backend.mask_pii.side_effect = lambda text: text
+        mock_backend.mask_batch.side_effect = list
         provider._registry["pii"]._presidio = mock_backend  # noqa: SLF001
 
         content = ToolResultContent(data={
@@ -103,7 +104,7 @@ class TestMaskOnToolResult:
         provider = GuardrailProvider()
 
         mock_backend = MagicMock()
-        mock_backend.mask_pii.side_effect = lambda text: text
+        mock_backend.mask_batch.side_effect = list
         provider._registry["pii"]._presidio = mock_backend  # noqa: SLF001
 
         content = ToolResultContent(data={"output": "hello"})
@@ -216,3 +217,74 @@ class TestToolCallContentPassthrough:
 
         assert isinstance(result, ToolCallContent)
         assert result is content
+
+    def test_text_is_canonical_json(self):
+        """text serializes the data once, with sorted keys."""
+        content = ToolCallContent(data={"b": 1, "a": {"d": 2, "c": 3}})
+
+        with patch(
+            "streetrace.dsl.runtime.guardrail_types.json.dumps",
+            wraps=json.dumps,
+        ) as dumps:
+            first = content.text
+            second = content.text
+
+        assert first == '{"a": {"c": 3, "d": 2}, "b": 1}'
+        assert second is first
+        dumps.assert_called_once()
+
+
+class _RecordingToolCallGuardrail:
+    """Guardrail that records the content passed to each entry point."""
+
+    def __init__(self) -> None:
+        self.tool_calls: list[ToolCallContent] = []
+        self.texts: list[str] = []
+
+    @property
+    def name(self) -> str:
+        return "recording"
+
+    def mask_str(self, text: str) -> str:
+        return text
+
+    def check_str(self, text: str) -> tuple[bool, str]:
+        self.texts.append(text)
+        return False, ""
+
+    async def check_tool_call(
+        self, content: ToolCallContent,
+    ) -> tuple[bool, str]:
+        self.tool_calls.append(content)
+        return True, "blocked"
+
+
+@pytest.mark.usefixtures("_mock_tracer")
+class TestCheckOnToolCall:
+    """Test checking ToolCallContent."""
+
+    async def test_tool_call_guardrail_receives_content(self):
+        """ToolCallGuardrail implementations get the content itself."""
+        provider = GuardrailProvider()
+        guardrail = _RecordingToolCallGuardrail()
+        provider._registry[guardrail.name] = guardrail  # noqa: SLF001
+        content = ToolCallContent(data={"tool_name": "exec", "args": {}})
+
+        triggered = await provider.check(guardrail.name, content)
+
+        assert triggered is True
+        assert guardrail.tool_calls == [content]
+        assert guardrail.texts == []
+
+    async def test_text_guardrail_receives_canonical_text(self):
+        """Text-only guardrails check the content's canonical JSON."""
+        provider = GuardrailProvider()
+        guardrail = MagicMock(spec=["name", "mask_str", "check_str"])
+        guardrail.name = "text_only"
+        guardrail.check_str.return_value = (False, "")
+        provider._registry["text_only"] = guardrail  # noqa: SLF001
+        content = ToolCallContent(data={"tool_name": "exec", "args": {}})
+
+        await provider.check("text_only", content)
+
+        guardrail.check_str.assert_called_once_with(content.text)
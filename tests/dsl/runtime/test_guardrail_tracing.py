@@ -305,9 +305,9 @@ class TestStructuredContentSpans:
         provider = GuardrailProvider()
 
         mock_backend = MagicMock()
-        mock_backend.mask_pii.side_effect = (
-            lambda text: text.replace("secret", "[PII]")
-        )
+        mock_backend.mask_batch.side_effect = lambda texts: [
+            text.replace("secret", "[PII]") for text in texts
+        ]
         provider._registry["pii"]._presidio = mock_backend  # noqa: SLF001
 
         content = ToolResultContent(data={
@@ -1,11 +1,13 @@
 """Tests for PiiGuardrail."""
 
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from streetrace.dsl.runtime.errors import MissingDependencyError
 from streetrace.dsl.runtime.pii_guardrail import PiiGuardrail
+from streetrace.guardrails.config import PiiConfig, PiiMode
 
 
 class TestPiiGuardrailProperties:
@@ -39,6 +41,183 @@ class TestPiiMasking:
         assert result == "Hello [PII]"
         mock_backend.mask_pii.assert_called_once_with("Hello John")
 
+    @pytest.mark.asyncio
+    async def test_mask_batch_async_masks_each_text(self):
+        """mask_batch_async masks every text in order off the event loop."""
+        guard = PiiGuardrail(config=PiiConfig(mode=PiiMode.NER))
+        mock_backend = MagicMock()
+        mock_backend.mask_batch.side_effect = (
+            lambda texts: [f"[{text}]" for text in texts]
+        )
+        guard._presidio = mock_backend  # noqa: SLF001
+
+        result = await guard.mask_batch_async(["a", "b"])
+
+        assert result == ["[a]", "[b]"]
+        mock_backend.mask_batch.assert_called_once_with(["a", "b"])
+        mock_backend.mask_pii.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_mask_batch_async_loads_presidio_off_loop(self):
+        """The lazy Presidio load runs on the worker thread."""
+        import threading
+
+        guard = PiiGuardrail(config=PiiConfig(mode=PiiMode.NER))
+        mock_backend = MagicMock()
+        mock_backend.mask_batch.side_effect = lambda texts: list(texts)
+        loaded_on: list[threading.Thread] = []
+
+        def load() -> bool:
+            loaded_on.append(threading.current_thread())
+            guard._presidio = mock_backend  # noqa: SLF001
+            return True
+
+        with patch.object(guard, "_try_load_presidio", side_effect=load):
+            await guard.mask_batch_async(["a"])
+
+        assert loaded_on
+        assert loaded_on[0] is not threading.main_thread()
+
+    @pytest.mark.asyncio
+    async def test_mask_batch_async_uses_worker_pool(self):
+        """With workers configured, batches go to the worker's backend."""
+        from streetrace.dsl.runtime import pii_guardrail
+
+        guard = PiiGuardrail(
+            max_workers=1, config=PiiConfig(mode=PiiMode.NER),
+        )
+        worker_backend = MagicMock()
+        worker_backend.mask_batch.return_value = ["[a]", "[b]"]
+
+        with (
+            ThreadPoolExecutor(max_workers=1) as executor,
+            patch.object(
+                PiiGuardrail, "_require_executor", return_value=executor,
+            ),
+            patch.dict(
+                pii_guardrail._worker_backend,  # noqa: SLF001
+                {"backend": worker_backend},
+            ),
+        ):
+            result = await guard.mask_batch_async(["a", "b"])
+
+        assert result == ["[a]", "[b]"]
+        worker_backend.mask_batch.assert_called_once_with(["a", "b"])
+        assert guard._presidio is None  # noqa: SLF001
+
+    @pytest.mark.asyncio
+    async def test_broken_worker_pool_is_restarted(self):
+        """A broken pool is replaced and the batch retried."""
+        from concurrent.futures.process import BrokenProcessPool
+
+        from streetrace.dsl.runtime import pii_guardrail
+
+        guard = PiiGuardrail(
+            max_workers=1, config=PiiConfig(mode=PiiMode.NER),
+        )
+        broken = MagicMock()
+        broken.submit.side_effect = BrokenProcessPool("worker died")
+        worker_backend = MagicMock()
+        worker_backend.mask_batch.return_value = ["[a]"]
+
+        with (
+            ThreadPoolExecutor(max_workers=1) as healthy,
+            patch.object(
+                PiiGuardrail,
+                "_require_executor",
+                side_effect=[broken, healthy],
+            ),
+            patch.dict(
+                pii_guardrail._worker_backend,  # noqa: SLF001
+                {"backend": worker_backend},
+            ),
+        ):
+            guard._executor = broken  # noqa: SLF001
+            result = await guard.mask_batch_async(["a"])
+
+        assert result == ["[a]"]
+        broken.shutdown.assert_called_once_with(wait=False)
+
+    def test_worker_pool_missing_presidio_raises(self):
+        """The worker pool is not started when Presidio is unavailable."""
+        guard = PiiGuardrail(max_workers=2)
+
+        with (
+            patch.object(
+                PiiGuardrail, "_presidio_installed", return_value=False,
+            ),
+            patch.object(
+                PiiGuardrail, "_attempt_runtime_install", return_value=False,
+            ),
+            pytest.raises(MissingDependencyError),
+        ):
+            guard._require_executor()  # noqa: SLF001
+
+        assert guard._executor is None  # noqa: SLF001
+
+
+class TestPiiModes:
+    """Test how the PII mode decides which texts reach Presidio."""
+
+    @staticmethod
+    def _guard(mode: PiiMode) -> tuple[PiiGuardrail, MagicMock]:
+        guard = PiiGuardrail(config=PiiConfig(mode=mode))
+        mock_backend = MagicMock()
+        mock_backend.mask_pii.side_effect = lambda text: f"<{text}>"
+        mock_backend.mask_batch.side_effect = (
+            lambda texts: [f"<{text}>" for text in texts]
+        )
+        guard._presidio = mock_backend  # noqa: SLF001
+        return guard, mock_backend
+
+    def test_prefilter_skips_text_without_candidates(self):
+        """Code without PII candidates never reaches Presidio."""
+        guard, mock_backend = self._guard(PiiMode.PREFILTER_NER)
+
+        text = "def load(path: str) -> dict:"
+        assert guard.mask_str(text) == text
+        mock_backend.mask_pii.assert_not_called()
+
+    def test_prefilter_runs_ner_on_candidates(self):
+        """Text with a name candidate is analyzed by Presidio."""
+        guard, mock_backend = self._guard(PiiMode.PREFILTER_NER)
+
+        assert guard.mask_str("Hello John") == "<Hello John>"
+        mock_backend.mask_pii.assert_called_once_with("Hello John")
+
+    def test_ner_mode_analyzes_everything(self):
+        """ner mode sends every text to Presidio."""
+        guard, mock_backend = self._guard(PiiMode.NER)
+
+        assert guard.mask_str("plain text") == "<plain text>"
+
+    def test_regex_only_never_loads_presidio(self):
+        """regex-only mode masks with the recognizers alone."""
+        guard = PiiGuardrail(config=PiiConfig(mode=PiiMode.REGEX_ONLY))
+
+        with patch.object(PiiGuardrail, "_require_presidio") as require:
+            result = guard.mask_str("Mail a@example.com")
+
+        assert result == "Mail [MASKED_EMAIL_ADDRESS]"
+        require.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_batch_only_sends_candidates(self):
+        """mask_batch_async only sends texts with candidates to Presidio."""
+        guard, mock_backend = self._guard(PiiMode.PREFILTER_NER)
+
+        result = await guard.mask_batch_async(["x = 1", "Hello John"])
+
+        assert result == ["x = 1", "<Hello John>"]
+        mock_backend.mask_batch.assert_called_once_with(["Hello John"])
+
+    def test_memo_key_depends_on_mode(self):
+        """Results of different modes are memoized separately."""
+        assert (
+            PiiGuardrail(config=PiiConfig(mode=PiiMode.NER)).memo_key
+            != PiiGuardrail(config=PiiConfig(mode=PiiMode.REGEX_ONLY)).memo_key
+        )
+
 
 class TestPresidioBackendMasking:
     """Test _PresidioBackend builds per-entity-type operators."""
@@ -101,6 +280,31 @@ class TestPresidioBackendMasking:
         call_kwargs = mock_anonymizer.anonymize.call_args[1]
         assert call_kwargs["operators"] == {}
 
+    def test_mask_batch_analyzes_texts_together(self):
+        """mask_batch runs one batched analysis over all texts."""
+        from streetrace.dsl.runtime.pii_guardrail import _PresidioBackend
+
+        backend = object.__new__(_PresidioBackend)
+        backend._analyzer = MagicMock()  # noqa: SLF001
+
+        mock_anonymizer = MagicMock()
+        mock_anonymizer.anonymize.side_effect = lambda text, **_: MagicMock(
+            text=f"masked {text}",
+        )
+        backend._anonymizer = mock_anonymizer  # noqa: SLF001
+        backend._operator_config = MagicMock()  # noqa: SLF001
+
+        mock_presidio = MagicMock()
+        batch_engine = mock_presidio.BatchAnalyzerEngine.return_value
+        batch_engine.analyze_iterator.return_value = [[], []]
+
+        with patch.dict("sys.modules", {"presidio_analyzer": mock_presidio}):
+            result = backend.mask_batch(["one", "two"])
+
+        assert result == ["masked one", "masked two"]
+        batch_engine.analyze_iterator.assert_called_once()
+        backend._analyzer.analyze.assert_not_called()  # noqa: SLF001
+
 
 class TestPresidioLazyInit:
     """Test lazy initialization of Presidio backend."""
@@ -0,0 +1,115 @@
+"""Tests for the PII regex pre-pass."""
+
+import pytest
+
+from streetrace.dsl.runtime.pii_prefilter import (
+    find_pii_candidates,
+    has_pii_candidates,
+    may_contain_name,
+    mask_pii_regex,
+)
+
+
+class TestRecognizers:
+    """Test the structured PII recognizers."""
+
+    @pytest.mark.parametrize(
+        ("text", "entity_type"),
+        [
+            ("Contact john.doe@example.com today", "EMAIL_ADDRESS"),
+            ("Call 555-123-4567", "PHONE_NUMBER"),
+            ("Call (555) 123-4567", "PHONE_NUMBER"),
+            ("Call +1 555 123 4567", "PHONE_NUMBER"),
+            ("Card 4111-1111-1111-1111", "CREDIT_CARD"),
+            ("Card 5500 0000 0000 0004", "CREDIT_CARD"),
+            ("SSN 123-45-6789", "US_SSN"),
+            ("IBAN DE89 3704 0044 0532 0130 00", "IBAN_CODE"),
+            ("IBAN GB82WEST12345698765432", "IBAN_CODE"),
+            ("Server at 192.168.1.20", "IP_ADDRESS"),
+        ],
+    )
+    def test_finds_entity(self, text, entity_type):
+        entity_types = {c.entity_type for c in find_pii_candidates(text)}
+        assert entity_type in entity_types
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "Card 4111-1111-1111-1112",
+            "IBAN DE00 3704 0044 0532 0130 00",
+            "SSN 000-45-6789",
+            "INFO 2025-01-01 12:00:00 request completed in 35ms status=200",
+            "id=1234567890123",
+        ],
+    )
+    def test_rejects_invalid_candidates(self, text):
+        assert find_pii_candidates(text) == []
+
+
+class TestNameHeuristic:
+    """Test the capitalized-name heuristic."""
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "Hello John",
+            "Failed for user John",
+            "John Smith called",
+            "Dr. Watson",
+        ],
+    )
+    def test_flags_names(self, text):
+        assert may_contain_name(text) is True
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "John",
+            "The quick brown fox jumps over the lazy dog.",
+            '    """Read the configuration file."""',
+            "    if value is None: return True",
+            "except Exception as exc:",
+            "class PatternScanner(BaseModel):",
+            "class Cache:",
+        ],
+    )
+    def test_ignores_code_and_sentence_starts(self, text):
+        assert may_contain_name(text) is False
+
+
+class TestHasPiiCandidates:
+    """Test the NER gating decision."""
+
+    def test_code_has_no_candidates(self):
+        text = "def load(path: str) -> dict:\n    return json.load(open(path))"
+        assert has_pii_candidates(text) is False
+
+    def test_email_is_candidate(self):
+        assert has_pii_candidates("mail me: a@b.io") is True
+
+    def test_name_is_candidate(self):
+        assert has_pii_candidates("assigned to Alice") is True
+
+
+class TestMaskPiiRegex:
+    """Test regex-only masking."""
+
+    def test_masks_each_entity(self):
+        text = "Email: test@example.org, Phone: 555-999-8888, SSN: 111-22-3333"
+
+        assert mask_pii_regex(text) == (
+            "Email: [MASKED_EMAIL_ADDRESS], Phone: [MASKED_PHONE_NUMBER], "
+            "SSN: [MASKED_US_SSN]"
+        )
+
+    def test_does_not_mask_names(self):
+        assert mask_pii_regex("Hello John") == "Hello John"
+
+    def test_masks_email_after_stray_at_sign(self):
+        assert mask_pii_regex("@here mail a@b.io") == (
+            "@here mail [MASKED_EMAIL_ADDRESS]"
+        )
+
+    def test_returns_text_without_candidates(self):
+        text = "nothing to see here"
+        assert mask_pii_regex(text) is text
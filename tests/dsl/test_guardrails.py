@@ -39,6 +39,7 @@ def _make_mock_presidio_backend() -> MagicMock:
         return result
 
     backend.mask_pii = _mock_mask_pii
+    backend.mask_batch = lambda texts: [_mock_mask_pii(text) for text in texts]
     return backend
 
 
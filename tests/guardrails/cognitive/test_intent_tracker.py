@@ -2,12 +2,19 @@
 
 from __future__ import annotations
 
+import base64
 import math
+from array import array
+from pathlib import Path
 from unittest.mock import MagicMock
 
 import pytest
 
-from streetrace.guardrails.cognitive.intent_tracker import IntentTracker
+from streetrace.guardrails.cognitive import intent_tracker
+from streetrace.guardrails.cognitive.intent_tracker import (
+    IntentTracker,
+    load_gru_weights,
+)
 
 SESSION_ID = "test-session-001"
 
@@ -26,6 +33,19 @@ def _make_provider(
     return provider
 
 
+@pytest.fixture(params=["numpy", "python"])
+def math_backend(
+    request: pytest.FixtureRequest,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Run tracker tests with and without NumPy."""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(intent_tracker, "load_numpy", lambda: None)
+
+
+@pytest.mark.usefixtures("math_backend")
 class TestBaselineCosineeDelta:
     """Verify baseline cosine similarity delta scoring."""
 
@@ -78,6 +98,7 @@ class TestBaselineCosineeDelta:
         assert score1 < score2 < score3
 
 
+@pytest.mark.usefixtures("math_backend")
 class TestSessionStatePersistence:
     """Verify state persistence across calls via session state."""
 
@@ -90,8 +111,7 @@ class TestSessionStatePersistence:
         embedding = [0.1, 0.2, 0.3]
         tracker.compute_risk(embedding)
 
-        assert PREV_EMBEDDING_KEY in state
-        assert state[PREV_EMBEDDING_KEY] == embedding
+        assert _unpack(state[PREV_EMBEDDING_KEY]) == pytest.approx(embedding)
 
     def test_reads_prev_embedding_from_session(self) -> None:
         """Read previous embedding from session state on compute."""
@@ -139,6 +159,7 @@ class TestTurnCounting:
         assert tracker.turn_count == 2
 
 
+@pytest.mark.usefixtures("math_backend")
 class TestGruForwardPass:
     """Verify optional GRU forward pass when weights are available."""
 
@@ -189,7 +210,107 @@ class TestGruForwardPass:
         )
 
         tracker.compute_risk([0.5, 0.3, 0.2])
-        assert HIDDEN_STATE_KEY in state
+        assert _unpack(state[HIDDEN_STATE_KEY]) == [0.0] * hidden_size
+
+
+class TestMathBackendParity:
+    """Verify the NumPy and pure Python paths agree."""
+
+    def test_scores_and_state_match(
+        self, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Both paths produce the same risk scores and hidden state."""
+        pytest.importorskip("numpy")
+        input_size = 4
+        hidden_size = 3
+        gru_weights = _make_gru_weights(input_size, hidden_size)
+        vectorized_state: dict[str, object] = {}
+        vectorized = IntentTracker(
+            provider=_make_provider(session_state=vectorized_state),
+            gru_weights=gru_weights,
+        )
+        monkeypatch.setattr(intent_tracker, "load_numpy", lambda: None)
+        fallback_state: dict[str, object] = {}
+        fallback = IntentTracker(
+            provider=_make_provider(session_state=fallback_state),
+            gru_weights=gru_weights,
+        )
+
+        turns = [
+            [0.5, 0.3, 0.2, 0.0],
+            [0.1, 0.8, 0.1, -0.2],
+            [-0.4, 0.2, 0.9, 0.3],
+            [0.0, 0.0, 0.0, 0.0],
+            [0.7, -0.7, 0.1, 0.1],
+        ]
+        for turn in turns:
+            assert vectorized.compute_risk(turn) == pytest.approx(
+                fallback.compute_risk(turn), abs=1e-5,
+            )
+        assert _unpack(vectorized_state[HIDDEN_STATE_KEY]) == pytest.approx(
+            _unpack(fallback_state[HIDDEN_STATE_KEY]), abs=1e-5,
+        )
+
+    @pytest.mark.usefixtures("math_backend")
+    def test_reads_list_state(self) -> None:
+        """State stored as float lists by earlier versions is read."""
+        hidden_size = 3
+        state: dict[str, object] = {
+            PREV_EMBEDDING_KEY: [1.0, 0.0, 0.0],
+            HIDDEN_STATE_KEY: [0.0] * hidden_size,
+        }
+        tracker = IntentTracker(
+            provider=_make_provider(session_state=state),
+            gru_weights=_make_gru_weights(3, hidden_size),
+        )
+
+        score = tracker.compute_risk([0.0, 1.0, 0.0])
+        assert score >= 0.5
+        assert isinstance(state[HIDDEN_STATE_KEY], str)
+
+
+class TestLoadGruWeights:
+    """Verify loading GRU weights from .npz archives."""
+
+    def test_loads_float32_arrays(self, tmp_path: Path) -> None:
+        """Archived weights score like the same weights given as lists."""
+        np = pytest.importorskip("numpy")
+        gru_weights = _make_gru_weights(3, 3)
+        path = tmp_path / "gru.npz"
+        np.savez(path, **gru_weights)
+
+        loaded = load_gru_weights(path)
+
+        assert all(value.dtype == np.float32 for value in loaded.values())
+        from_lists = IntentTracker(
+            provider=_make_provider(), gru_weights=gru_weights,
+        )
+        from_archive = IntentTracker(
+            provider=_make_provider(), gru_weights=loaded,
+        )
+        for turn in ([0.5, 0.3, 0.2], [0.1, 0.8, 0.1]):
+            assert from_archive.compute_risk(turn) == pytest.approx(
+                from_lists.compute_risk(turn), abs=1e-6,
+            )
+
+    def test_missing_array_raises(self, tmp_path: Path) -> None:
+        """Archives without every GRU array are rejected."""
+        np = pytest.importorskip("numpy")
+        gru_weights = _make_gru_weights(3, 3)
+        del gru_weights["U_h"]
+        path = tmp_path / "gru.npz"
+        np.savez(path, **gru_weights)
+
+        with pytest.raises(ValueError, match="U_h"):
+            load_gru_weights(path)
+
+
+def _unpack(raw: object) -> list[float]:
+    """Decode a vector stored in session state."""
+    assert isinstance(raw, str)
+    values = array("f")
+    values.frombytes(base64.b64decode(raw))
+    return values.tolist()
 
 
 def _make_gru_weights(
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import pytest
+
 from streetrace.guardrails.cognitive.sequence_anomaly import (
     SequenceAnomalyDetector,
     SequencePattern,
@@ -80,6 +82,103 @@ class TestSuspiciousSequenceDetection:
         assert result.detected is True
 
 
+class TestGappedPatterns:
+    """Verify patterns whose steps may be separated by other calls."""
+
+    def _detector(self) -> SequenceAnomalyDetector:
+        return SequenceAnomalyDetector(patterns=[
+            SequencePattern(
+                name="read_then_send",
+                sequence=["read_file", "send_*"],
+                within=5,
+            ),
+        ])
+
+    def test_match_within_window(self) -> None:
+        """Steps separated by other calls match inside the window."""
+        detector = self._detector()
+
+        for tool in ["read_file", "list_files", "grep", "write_file"]:
+            assert detector.record_tool_call(tool).detected is False
+        result = detector.record_tool_call("send_email")
+
+        assert result.detected is True
+        assert result.sequence == ["read_file", "send_email"]
+
+    def test_no_match_beyond_window(self) -> None:
+        """Steps spanning more calls than the window don't match."""
+        detector = self._detector()
+
+        for tool in ["read_file", "a", "b", "c", "d"]:
+            detector.record_tool_call(tool)
+        result = detector.record_tool_call("send_email")
+
+        assert result.detected is False
+
+    def test_later_start_keeps_match_alive(self) -> None:
+        """A repeated first step restarts the window."""
+        detector = self._detector()
+
+        for tool in ["read_file", "a", "b", "read_file", "c", "d"]:
+            detector.record_tool_call(tool)
+        result = detector.record_tool_call("send_email")
+
+        assert result.detected is True
+
+    def test_window_shorter_than_sequence_rejected(self) -> None:
+        """A window can't be shorter than the pattern."""
+        with pytest.raises(ValueError, match="at least 3 calls"):
+            SequencePattern(
+                name="too_short",
+                sequence=["a", "b", "c"],
+                within=2,
+            )
+
+
+class TestMultipleMatches:
+    """Verify every pattern completed by a call is reported."""
+
+    def test_reports_all_matches_in_pattern_order(self) -> None:
+        """Overlapping patterns are all reported."""
+        patterns = [
+            SequencePattern(
+                name="exfiltration",
+                sequence=["read_file", "encode_*", "send_*"],
+            ),
+            SequencePattern(name="any_send", sequence=["*", "send_email"]),
+            SequencePattern(name="unrelated", sequence=["delete_file"]),
+        ]
+        detector = SequenceAnomalyDetector(patterns=patterns)
+
+        detector.record_tool_call("read_file")
+        detector.record_tool_call("encode_base64")
+        result = detector.record_tool_call("send_email")
+
+        assert [m.pattern_name for m in result.matches] == [
+            "exfiltration", "any_send",
+        ]
+        assert result.matches[1].sequence == ["encode_base64", "send_email"]
+        assert result.pattern_name == "exfiltration"
+
+    def test_many_patterns(self) -> None:
+        """Hundreds of patterns only match the calls they name."""
+        patterns = [
+            SequencePattern(
+                name=f"pattern_{i}",
+                sequence=[f"tool_{i}", f"tool_{i + 1}"],
+                within=3,
+            )
+            for i in range(500)
+        ]
+        detector = SequenceAnomalyDetector(patterns=patterns)
+
+        detector.record_tool_call("tool_41")
+        detector.record_tool_call("other")
+        result = detector.record_tool_call("tool_42")
+
+        assert [m.pattern_name for m in result.matches] == ["pattern_41"]
+
+
 class TestBenignSequences:
     """Verify benign sequences do not trigger detection."""
 
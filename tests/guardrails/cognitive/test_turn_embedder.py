@@ -17,6 +17,7 @@ def mock_pipeline() -> MagicMock:
     """Create a mock InferencePipeline."""
     pipeline = MagicMock()
     pipeline.get_embedding = AsyncMock(return_value=SAMPLE_EMBEDDING)
+    pipeline.get_cached_embedding = MagicMock(return_value=None)
     return pipeline
 
 
@@ -47,30 +48,39 @@ class TestEmbeddingGeneration:
 
 
 class TestEmbeddingCaching:
-    """Verify that embeddings are cached per text hash."""
+    """Verify that caching is delegated to the pipeline's cache."""
 
     @pytest.mark.asyncio
-    async def test_caches_on_second_call(
+    async def test_does_not_keep_own_cache(
         self, mock_pipeline: MagicMock,
     ) -> None:
-        """Second call with same text returns cached result."""
+        """Every call goes to the pipeline, which owns the cache."""
         embedder = TurnEmbedder(inference_pipeline=mock_pipeline)
-        result1 = await embedder.embed("same text")
-        result2 = await embedder.embed("same text")
+        await embedder.embed("same text")
+        await embedder.embed("same text")
 
-        assert result1 == result2
-        assert mock_pipeline.get_embedding.await_count == 1
+        assert mock_pipeline.get_embedding.await_count == 2
+        assert not hasattr(embedder, "_cache")
 
-    @pytest.mark.asyncio
-    async def test_different_text_not_cached(
+    def test_embed_sync_reads_pipeline_cache(
         self, mock_pipeline: MagicMock,
     ) -> None:
-        """Different text produces separate inference calls."""
+        """Synchronous lookups are served by the pipeline's cache."""
+        mock_pipeline.get_cached_embedding.return_value = SAMPLE_EMBEDDING
         embedder = TurnEmbedder(inference_pipeline=mock_pipeline)
-        await embedder.embed("text one")
-        await embedder.embed("text two")
 
-        assert mock_pipeline.get_embedding.await_count == 2
+        assert embedder.embed_sync("cached text") == SAMPLE_EMBEDDING
+        mock_pipeline.get_cached_embedding.assert_called_once_with(
+            "minilm-l6-v2", "cached text",
+        )
+
+    def test_embed_sync_miss_returns_none(
+        self, mock_pipeline: MagicMock,
+    ) -> None:
+        """Return None when the pipeline has not cached the text."""
+        embedder = TurnEmbedder(inference_pipeline=mock_pipeline)
+
+        assert embedder.embed_sync("unseen text") is None
 
 
 class TestWithoutInferencePipeline:
@@ -8,6 +8,7 @@ from unittest.mock import AsyncMock
 import pytest
 
 from streetrace.guardrails.inference.batch import BatchInferenceQueue
+from streetrace.guardrails.inference.tokenizer_manager import TokenizerOutput
 
 DEFAULT_DEADLINE_MS = 2
 """Default batch deadline in milliseconds."""
@@ -16,6 +17,14 @@ MAX_BATCH_SIZE = 8
 """Default maximum batch size."""
 
 
+def _tokens(*input_ids: int) -> TokenizerOutput:
+    """Create tokenizer output attending to every token."""
+    return TokenizerOutput(
+        input_ids=list(input_ids),
+        attention_mask=[1] * len(input_ids),
+    )
+
+
 @pytest.fixture
 def mock_inference_fn() -> AsyncMock:
     """Create a mock inference function that returns embeddings."""
@@ -44,7 +53,7 @@ class TestBatchGrouping:
         mock_inference_fn: AsyncMock,
     ) -> None:
         mock_inference_fn.return_value = [[0.1, 0.2, 0.3]]
-        result = await queue.submit("model-a", [101, 102, 103])
+        result = await queue.submit("model-a", _tokens(101, 102, 103))
         assert result == [0.1, 0.2, 0.3]
 
     @pytest.mark.asyncio
@@ -63,8 +72,8 @@ class TestBatchGrouping:
         )
 
         r1, r2 = await asyncio.gather(
-            q.submit("model-a", [101]),
-            q.submit("model-a", [201]),
+            q.submit("model-a", _tokens(101)),
+            q.submit("model-a", _tokens(201)),
         )
         assert r1 == [0.1, 0.2]
         assert r2 == [0.3, 0.4]
@@ -81,7 +90,7 @@ class TestDeadlineFlushing:
     ) -> None:
         mock_inference_fn.return_value = [[1.0, 2.0]]
         result = await asyncio.wait_for(
-            queue.submit("model-a", [101]),
+            queue.submit("model-a", _tokens(101)),
             timeout=1.0,
         )
         assert result == [1.0, 2.0]
@@ -105,8 +114,8 @@ class TestMaxBatchSize:
         )
 
         r1, r2 = await asyncio.gather(
-            q.submit("model-a", [101]),
-            q.submit("model-a", [201]),
+            q.submit("model-a", _tokens(101)),
+            q.submit("model-a", _tokens(201)),
         )
         assert r1 == [1.0]
         assert r2 == [2.0]
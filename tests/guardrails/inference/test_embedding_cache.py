@@ -7,10 +7,17 @@ from unittest.mock import MagicMock
 
 import pytest
 
-from streetrace.guardrails.inference.embedding_cache import EmbeddingCache
+from streetrace.guardrails.config import InferenceConfig
+from streetrace.guardrails.inference import embedding_cache
+from streetrace.guardrails.inference.embedding_cache import (
+    EmbeddingCache,
+    OtelCacheMetrics,
+    create_embedding_cache,
+)
 
-SAMPLE_EMBEDDING = [0.1, 0.2, 0.3, 0.4, 0.5]
-DIFFERENT_EMBEDDING = [0.9, 0.8, 0.7, 0.6, 0.5]
+SAMPLE_EMBEDDING = [0.125, 0.25, 0.375, 0.5, 0.625]
+DIFFERENT_EMBEDDING = [0.875, 0.75, 0.625, 0.5, 0.375]
+"""Embeddings exactly representable as float32, the cache's storage type."""
 
 
 @pytest.fixture
@@ -149,6 +156,60 @@ class TestCacheMetrics:
 
         mock_metrics.record_miss.assert_called_once()
 
+    def test_size_recorded_on_insert_and_eviction(
+        self,
+        mock_metrics: MagicMock,
+    ) -> None:
+        cache = EmbeddingCache(
+            max_entries=2,
+            ttl_seconds=3600,
+            metrics=mock_metrics,
+        )
+        for i in range(3):
+            cache.put("m", f"text{i}", [float(i)])
+
+        sizes = [call.args[0] for call in mock_metrics.record_size.call_args_list]
+        assert sizes == [1, 2, 2]
+
+    def test_recorder_without_record_size(self) -> None:
+        metrics = MagicMock(spec=["record_hit", "record_miss"])
+        cache = EmbeddingCache(metrics=metrics)
+
+        cache.put("m", "text", SAMPLE_EMBEDDING)
+
+        assert cache.get("m", "text") == SAMPLE_EMBEDDING
+        metrics.record_hit.assert_called_once()
+
+    def test_configured_cache_reports_otel_metrics(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        hits = MagicMock()
+        monkeypatch.setattr(embedding_cache, "_CACHE_HITS", hits)
+        cache = create_embedding_cache(InferenceConfig())
+
+        cache.put("m", "text", SAMPLE_EMBEDDING)
+        cache.get("m", "text")
+
+        hits.add.assert_called_once_with(1, {"cache": "embedding"})
+
+    def test_otel_metrics_tracks_size_deltas(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        entries = MagicMock()
+        monkeypatch.setattr(embedding_cache, "_CACHE_ENTRIES", entries)
+        metrics = OtelCacheMetrics(cache_name="turns")
+
+        metrics.record_size(3)
+        metrics.record_size(3)
+        metrics.record_size(1)
+
+        assert [call.args for call in entries.add.call_args_list] == [
+            (3, {"cache": "turns"}),
+            (-2, {"cache": "turns"}),
+        ]
+
 
 class TestCacheSize:
     """Verify cache size tracking."""
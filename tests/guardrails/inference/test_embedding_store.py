@@ -0,0 +1,179 @@
+"""Tests for the disk-backed embedding store and its use by the cache."""
+
+from __future__ import annotations
+
+import sqlite3
+from array import array
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock
+
+import pytest
+
+from streetrace.guardrails.config import InferenceConfig
+from streetrace.guardrails.inference.embedding_cache import (
+    EmbeddingCache,
+    create_embedding_cache,
+)
+from streetrace.guardrails.inference.embedding_store import (
+    EmbeddingStore,
+    pack_embedding,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+SAMPLE_EMBEDDING = [0.125, 0.25, 0.375, 0.5]
+"""Embedding exactly representable as float32."""
+
+
+@pytest.fixture
+def db_path(tmp_path: Path) -> Path:
+    """Return the store database path."""
+    return tmp_path / "cache" / "embeddings.db"
+
+
+@pytest.fixture
+def store(db_path: Path) -> Iterator[EmbeddingStore]:
+    """Create a store in a temporary directory."""
+    store = EmbeddingStore(db_path)
+    yield store
+    store.close()
+
+
+class TestEmbeddingStore:
+    """Verify persistence and eviction in the embedding store."""
+
+    def test_put_then_get(self, store: EmbeddingStore) -> None:
+        store.put("key", pack_embedding(SAMPLE_EMBEDDING))
+        result = store.get("key")
+        assert result is not None
+        assert result.typecode == "f"
+        assert result.tolist() == SAMPLE_EMBEDDING
+
+    def test_missing_key(self, store: EmbeddingStore) -> None:
+        assert store.get("missing") is None
+
+    def test_shared_between_connections(
+        self,
+        store: EmbeddingStore,
+        db_path: Path,
+    ) -> None:
+        store.put("key", pack_embedding(SAMPLE_EMBEDDING))
+        other = EmbeddingStore(db_path)
+        try:
+            result = other.get("key")
+        finally:
+            other.close()
+        assert result is not None
+        assert result.tolist() == SAMPLE_EMBEDDING
+
+    def test_evicts_least_recently_used_over_max_bytes(
+        self,
+        db_path: Path,
+    ) -> None:
+        vector = array("f", [0.0] * 4)
+        store = EmbeddingStore(db_path, max_bytes=10_000)
+        for i in range(200):
+            store.put(f"key-{i}", vector)
+        store.close()
+
+        store = EmbeddingStore(db_path, max_bytes=len(vector.tobytes()) * 100)
+        try:
+            assert store.size <= 100
+            assert store.get("key-199") is not None
+            assert store.get("key-0") is None
+        finally:
+            store.close()
+
+    def test_hits_buffer_access_times(self, db_path: Path) -> None:
+        def accessed_at() -> float:
+            with sqlite3.connect(db_path) as connection:
+                return connection.execute(
+                    "SELECT accessed_at FROM embeddings WHERE key = 'key'",
+                ).fetchone()[0]
+
+        store = EmbeddingStore(db_path)
+        store.put("key", pack_embedding(SAMPLE_EMBEDDING))
+        with sqlite3.connect(db_path) as connection:
+            connection.execute("UPDATE embeddings SET accessed_at = 0")
+
+        assert store.get("key") is not None
+        assert accessed_at() == 0
+
+        store.close()
+        assert accessed_at() > 0
+
+
+class TestEmbeddingCacheWithStore:
+    """Verify the cache uses the store as a second tier."""
+
+    def test_put_writes_through(self, store: EmbeddingStore) -> None:
+        cache = EmbeddingCache(store=store)
+        cache.put("model-a", "text", SAMPLE_EMBEDDING)
+        assert store.size == 1
+
+    def test_restart_reads_from_store(self, store: EmbeddingStore) -> None:
+        EmbeddingCache(store=store).put("model-a", "text", SAMPLE_EMBEDDING)
+        metrics = MagicMock()
+        cache = EmbeddingCache(store=store, metrics=metrics)
+
+        assert cache.get("model-a", "text") == SAMPLE_EMBEDDING
+        assert cache.size == 1
+        metrics.record_hit.assert_called_once()
+
+    def test_expired_entry_falls_back_to_store(
+        self,
+        store: EmbeddingStore,
+    ) -> None:
+        cache = EmbeddingCache(store=store, ttl_seconds=0)
+        cache.put("model-a", "text", SAMPLE_EMBEDDING)
+        assert cache.get("model-a", "text") == SAMPLE_EMBEDDING
+
+    def test_miss_in_both_tiers(self, store: EmbeddingStore) -> None:
+        metrics = MagicMock()
+        cache = EmbeddingCache(store=store, metrics=metrics)
+        assert cache.get("model-a", "text") is None
+        metrics.record_miss.assert_called_once()
+
+    async def test_async_lookup_reads_store(self, store: EmbeddingStore) -> None:
+        await EmbeddingCache(store=store).put_async(
+            "model-a", "text", SAMPLE_EMBEDDING,
+        )
+        cache = EmbeddingCache(store=store)
+
+        assert await cache.get_async("model-a", "text") == SAMPLE_EMBEDDING
+        assert store.size == 1
+
+    def test_lookup_can_skip_store(self, store: EmbeddingStore) -> None:
+        EmbeddingCache(store=store).put("model-a", "text", SAMPLE_EMBEDDING)
+        cache = EmbeddingCache(store=store)
+
+        assert cache.get("model-a", "text", include_store=False) is None
+        assert cache.get("model-a", "text") == SAMPLE_EMBEDDING
+
+
+class TestCreateEmbeddingCache:
+    """Verify the cache is built from the inference config."""
+
+    def test_store_from_config(self, db_path: Path) -> None:
+        cache = create_embedding_cache(
+            InferenceConfig(embedding_store_path=str(db_path)),
+        )
+        cache.put("model-a", "text", SAMPLE_EMBEDDING)
+
+        store = EmbeddingStore(db_path)
+        try:
+            assert store.size == 1
+        finally:
+            store.close()
+
+    def test_cache_limits_from_config(self) -> None:
+        cache = create_embedding_cache(
+            InferenceConfig(embedding_cache_entries=1),
+        )
+        cache.put("model-a", "one", SAMPLE_EMBEDDING)
+        cache.put("model-a", "two", SAMPLE_EMBEDDING)
+
+        assert cache.size == 1
+        assert cache.get("model-a", "one") is None
@@ -67,6 +67,21 @@ class TestModelRegistration:
             checksum=model_checksum,
         )
         assert registry.get_state("test-model") == ModelState.UNLOADED
+        assert registry.outputs_logits("test-model") is False
+
+    def test_register_logits_model(
+        self,
+        registry: ModelRegistry,
+        tmp_model_file: Path,
+        model_checksum: str,
+    ) -> None:
+        registry.register_model(
+            "classifier",
+            path=tmp_model_file,
+            checksum=model_checksum,
+            outputs_logits=True,
+        )
+        assert registry.outputs_logits("classifier") is True
 
     def test_register_duplicate_model_raises(
         self,
@@ -2,28 +2,53 @@
 
 from __future__ import annotations
 
+import math
+import threading
+from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from streetrace.dsl.runtime.errors import MissingDependencyError
+from streetrace.guardrails.config import GuardrailsConfig, InferenceConfig
 from streetrace.guardrails.inference.embedding_cache import EmbeddingCache
 from streetrace.guardrails.inference.model_registry import (
     ModelRegistry,
     ModelState,
 )
-from streetrace.guardrails.inference.pipeline import InferencePipeline
+from streetrace.guardrails.inference.pipeline import (
+    InferencePipeline,
+    create_inference_pipeline,
+)
 from streetrace.guardrails.inference.session_pool import SessionPool
 from streetrace.guardrails.inference.tokenizer_manager import (
     TokenizerManager,
+    TokenizerOutput,
 )
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _token_outputs(
+    _output_names: object,
+    feeds: dict[str, list[list[int]]],
+) -> list[object]:
+    """Return per-token hidden states of [token_id, 1.0] for a batch."""
+    return [
+        [
+            [[float(token_id), 1.0] for token_id in input_ids]
+            for input_ids in feeds["input_ids"]
+        ],
+    ]
+
 
 @pytest.fixture
 def mock_registry() -> MagicMock:
     """Create a mock model registry."""
     registry = MagicMock(spec=ModelRegistry)
     registry.get_state = MagicMock(return_value=ModelState.READY)
+    registry.outputs_logits = MagicMock(return_value=False)
     mock_session = MagicMock()
     mock_session.run = MagicMock(
         return_value=[[[0.1, 0.2, 0.3, 0.4, 0.5]]],
@@ -36,10 +61,9 @@ def mock_registry() -> MagicMock:
 def mock_pool() -> MagicMock:
     """Create a mock session pool."""
     pool = MagicMock(spec=SessionPool)
+    pool.pool_size = 2
     mock_session = MagicMock()
-    mock_session.run = MagicMock(
-        return_value=[[[0.1, 0.2, 0.3, 0.4, 0.5]]],
-    )
+    mock_session.run = MagicMock(side_effect=_token_outputs)
     pool.acquire = AsyncMock(return_value=mock_session)
     pool.release = MagicMock()
     pool.has_model = MagicMock(return_value=True)
@@ -52,6 +76,8 @@ def mock_cache() -> MagicMock:
     cache = MagicMock(spec=EmbeddingCache)
     cache.get = MagicMock(return_value=None)
     cache.put = MagicMock()
+    cache.get_async = AsyncMock(return_value=None)
+    cache.put_async = AsyncMock()
     return cache
 
 
@@ -64,6 +90,7 @@ def mock_tokenizer_mgr() -> MagicMock:
     encoding.attention_mask = [1, 1, 1]
     mgr.tokenize = MagicMock(return_value=encoding)
     mgr.has_tokenizer = MagicMock(return_value=True)
+    mgr.pad_token_id = MagicMock(return_value=0)
     return mgr
 
 
@@ -95,7 +122,7 @@ class TestGetEmbedding:
         result = await pipeline.get_embedding("model-a", "hello world")
         assert isinstance(result, list)
         assert len(result) > 0
-        mock_cache.put.assert_called_once()
+        mock_cache.put_async.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_cache_hit_skips_inference(
@@ -104,11 +131,148 @@ class TestGetEmbedding:
         mock_cache: MagicMock,
         mock_pool: MagicMock,
     ) -> None:
-        mock_cache.get.return_value = [0.5, 0.6, 0.7]
+        mock_cache.get_async.return_value = [0.5, 0.6, 0.7]
         result = await pipeline.get_embedding("model-a", "hello world")
         assert result == [0.5, 0.6, 0.7]
         mock_pool.acquire.assert_not_awaited()
 
+    def test_get_cached_embedding_reads_cache_only(
+        self,
+        pipeline: InferencePipeline,
+        mock_cache: MagicMock,
+        mock_pool: MagicMock,
+    ) -> None:
+        assert pipeline.get_cached_embedding("model-a", "hello") is None
+        mock_cache.get.return_value = [0.5, 0.6, 0.7]
+        assert pipeline.get_cached_embedding("model-a", "hello") == [
+            0.5, 0.6, 0.7,
+        ]
+        mock_cache.get.assert_called_with(
+            "model-a", "hello", include_store=False,
+        )
+        mock_pool.acquire.assert_not_awaited()
+
+
+class TestInferenceThreads:
+    """Verify inference runs off the event loop thread."""
+
+    @pytest.mark.asyncio
+    async def test_session_runs_on_worker_thread(
+        self,
+        pipeline: InferencePipeline,
+        mock_pool: MagicMock,
+    ) -> None:
+        threads: list[str] = []
+
+        def run(*_args: object) -> list[object]:
+            threads.append(threading.current_thread().name)
+            return [[[0.1, 0.2]]]
+
+        mock_session = MagicMock()
+        mock_session.run = MagicMock(side_effect=run)
+        mock_pool.acquire = AsyncMock(return_value=mock_session)
+
+        await pipeline.get_embedding("model-a", "hello world")
+
+        assert threads != [threading.current_thread().name]
+        assert threads[0].startswith("guardrails-inference")
+        mock_pool.release.assert_called_once_with("model-a", mock_session)
+        pipeline.close()
+
+    @pytest.mark.asyncio
+    async def test_session_released_on_failure(
+        self,
+        pipeline: InferencePipeline,
+        mock_pool: MagicMock,
+    ) -> None:
+        mock_session = MagicMock()
+        mock_session.run = MagicMock(side_effect=RuntimeError("boom"))
+        mock_pool.acquire = AsyncMock(return_value=mock_session)
+
+        with pytest.raises(RuntimeError):
+            await pipeline.classify("model-a", "hello world")
+
+        mock_pool.release.assert_called_once_with("model-a", mock_session)
+        pipeline.close()
+
+
+class TestBatching:
+    """Verify concurrent requests run as one padded inference."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_embeddings_share_one_run(
+        self,
+        pipeline: InferencePipeline,
+        mock_pool: MagicMock,
+        mock_tokenizer_mgr: MagicMock,
+    ) -> None:
+        encodings = {
+            "short": TokenizerOutput(input_ids=[2], attention_mask=[1]),
+            "long": TokenizerOutput(
+                input_ids=[4, 6, 8],
+                attention_mask=[1, 1, 1],
+            ),
+        }
+        mock_tokenizer_mgr.tokenize.side_effect = (
+            lambda _model_id, text: encodings[text]
+        )
+        mock_session = await mock_pool.acquire("model-a")
+
+        short, long = await pipeline.batch_embed("model-a", ["short", "long"])
+
+        mock_session.run.assert_called_once()
+        feeds = mock_session.run.call_args.args[1]
+        assert feeds["input_ids"] == [[2, 0, 0], [4, 6, 8]]
+        assert feeds["attention_mask"] == [[1, 0, 0], [1, 1, 1]]
+        assert short == [2.0, 1.0]
+        assert long == [6.0, 1.0]
+        assert mock_pool.acquire.await_count == 2
+        mock_pool.release.assert_called_once()
+        pipeline.close()
+
+    @pytest.mark.asyncio
+    async def test_batch_uses_tokenizer_padding(
+        self,
+        pipeline: InferencePipeline,
+        mock_pool: MagicMock,
+        mock_tokenizer_mgr: MagicMock,
+    ) -> None:
+        encodings = {
+            "short": TokenizerOutput(input_ids=[2, 1], attention_mask=[1, 0]),
+            "long": TokenizerOutput(
+                input_ids=[4, 6, 8],
+                attention_mask=[1, 1, 1],
+            ),
+        }
+        mock_tokenizer_mgr.tokenize.side_effect = (
+            lambda _model_id, text: encodings[text]
+        )
+        mock_tokenizer_mgr.pad_token_id.return_value = 1
+        mock_session = await mock_pool.acquire("model-a")
+
+        short, _ = await pipeline.batch_embed("model-a", ["short", "long"])
+
+        feeds = mock_session.run.call_args.args[1]
+        assert feeds["input_ids"] == [[2, 1, 1], [4, 6, 8]]
+        assert feeds["attention_mask"] == [[1, 0, 0], [1, 1, 1]]
+        # the tokenizer's own padding is left out of the mean
+        assert short == [2.0, 1.0]
+        pipeline.close()
+
+    @pytest.mark.asyncio
+    async def test_output_batch_mismatch_fails_all_requests(
+        self,
+        pipeline: InferencePipeline,
+        mock_pool: MagicMock,
+    ) -> None:
+        mock_session = MagicMock()
+        mock_session.run = MagicMock(return_value=[[[0.1, 0.2]]])
+        mock_pool.acquire = AsyncMock(return_value=mock_session)
+
+        with pytest.raises(ValueError, match="2 inputs"):
+            await pipeline.batch_embed("model-a", ["text1", "text2"])
+        pipeline.close()
+
 
 class TestClassify:
     """Verify classification via pipeline."""
@@ -133,7 +297,28 @@ class TestClassify:
             "test text",
             labels=["safe", "unsafe"],
         )
-        assert isinstance(result, dict)
+        assert result == pytest.approx({"safe": 0.1, "unsafe": 0.9})
+        pipeline.close()
+
+    @pytest.mark.asyncio
+    async def test_classify_applies_softmax_to_logits(
+        self,
+        pipeline: InferencePipeline,
+        mock_pool: MagicMock,
+        mock_registry: MagicMock,
+    ) -> None:
+        mock_session = MagicMock()
+        mock_session.run = MagicMock(return_value=[[[0.0, math.log(3.0)]]])
+        mock_pool.acquire = AsyncMock(return_value=mock_session)
+        mock_registry.outputs_logits.return_value = True
+
+        result = await pipeline.classify(
+            "model-a",
+            "test text",
+            labels=["safe", "unsafe"],
+        )
+        assert result == pytest.approx({"safe": 0.25, "unsafe": 0.75})
+        pipeline.close()
 
 
 class TestFailFast:
@@ -198,10 +383,49 @@ class TestBatchEmbed:
         pipeline: InferencePipeline,
         mock_cache: MagicMock,
     ) -> None:
-        mock_cache.get.return_value = None
+        mock_cache.get_async.return_value = None
         results = await pipeline.batch_embed(
             "model-a",
             ["text1", "text2"],
         )
         assert isinstance(results, list)
         assert len(results) == 2
+
+
+class TestCreateInferencePipeline:
+    """Verify the pipeline built from the guardrails config."""
+
+    @pytest.mark.asyncio
+    async def test_embedding_store_path_persists_embeddings(
+        self,
+        tmp_path: Path,
+        mock_registry: MagicMock,
+        mock_pool: MagicMock,
+        mock_tokenizer_mgr: MagicMock,
+    ) -> None:
+        config = GuardrailsConfig(
+            inference=InferenceConfig(
+                embedding_store_path=str(tmp_path / "embeddings.db"),
+            ),
+        )
+        first = create_inference_pipeline(
+            config,
+            registry=mock_registry,
+            pool=mock_pool,
+            tokenizer_manager=mock_tokenizer_mgr,
+            metrics=MagicMock(),
+        )
+        embedding = await first.get_embedding("model-a", "hello")
+        first.close()
+
+        restarted = create_inference_pipeline(
+            config,
+            registry=mock_registry,
+            pool=mock_pool,
+            tokenizer_manager=mock_tokenizer_mgr,
+            metrics=MagicMock(),
+        )
+        mock_pool.acquire.reset_mock()
+
+        assert await restarted.get_embedding("model-a", "hello") == embedding
+        mock_pool.acquire.assert_not_awaited()
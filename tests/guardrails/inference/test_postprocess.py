@@ -0,0 +1,87 @@
+"""Tests for ONNX output post-processing."""
+
+from __future__ import annotations
+
+import math
+
+import pytest
+
+from streetrace.guardrails.inference import postprocess
+from streetrace.guardrails.inference.postprocess import (
+    split_embeddings,
+    split_probabilities,
+)
+
+TOKEN_OUTPUT = [
+    [[1.0, 2.0], [3.0, 4.0], [100.0, 100.0]],
+    [[2.0, 0.0], [4.0, 0.0], [6.0, 0.0]],
+]
+"""Per-token output for a batch of two, the first request is padded."""
+
+
+@pytest.fixture(params=["numpy", "python"])
+def backend(
+    request: pytest.FixtureRequest,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Run each test with and without NumPy."""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(postprocess, "load_numpy", lambda: None)
+
+
+@pytest.mark.usefixtures("backend")
+class TestSplitEmbeddings:
+    """Verify pooling of embedding outputs."""
+
+    def test_mean_pool_ignores_padding(self) -> None:
+        embeddings = split_embeddings([TOKEN_OUTPUT], [2, 3])
+        assert embeddings == [[2.0, 3.0], [4.0, 0.0]]
+
+    def test_pooled_output_passes_through(self) -> None:
+        embeddings = split_embeddings([[[1.0, 2.0], [3.0, 4.0]]], [5, 1])
+        assert embeddings == [[1.0, 2.0], [3.0, 4.0]]
+
+    def test_normalize(self) -> None:
+        embeddings = split_embeddings(
+            [[[3.0, 4.0], [0.0, 0.0]]],
+            [1, 1],
+            normalize=True,
+        )
+        assert embeddings[0] == pytest.approx([0.6, 0.8])
+        assert embeddings[1] == [0.0, 0.0]
+
+    def test_batch_mismatch_raises(self) -> None:
+        with pytest.raises(ValueError, match="2 inputs"):
+            split_embeddings([[[1.0, 2.0]]], [1, 1])
+
+
+@pytest.mark.usefixtures("backend")
+class TestSplitProbabilities:
+    """Verify classifier output handling."""
+
+    def test_scores_pass_through_by_default(self) -> None:
+        probabilities = split_probabilities([[[0.25, 0.75]]], 1)
+        assert probabilities[0] == pytest.approx([0.25, 0.75])
+
+    def test_logits_get_softmax(self) -> None:
+        probabilities = split_probabilities(
+            [[[0.0, math.log(3.0)]]], 1, outputs_logits=True,
+        )
+        assert probabilities[0] == pytest.approx([0.25, 0.75])
+
+    def test_logits_that_look_like_probabilities_get_softmax(self) -> None:
+        probabilities = split_probabilities(
+            [[[0.0, 1.0]]], 1, outputs_logits=True,
+        )
+        expected = 1 / (1 + math.e)
+        assert probabilities[0] == pytest.approx([expected, 1 - expected])
+
+    def test_per_token_output_uses_first_token(self) -> None:
+        probabilities = split_probabilities(
+            [[[[0.1, 0.9], [0.5, 0.5]], [[0.7, 0.3], [0.5, 0.5]]]],
+            2,
+        )
+        assert probabilities[0] == pytest.approx([0.1, 0.9])
+        assert probabilities[1] == pytest.approx([0.7, 0.3])
@@ -7,7 +7,10 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from streetrace.dsl.runtime.errors import MissingDependencyError
-from streetrace.guardrails.inference.tokenizer_manager import TokenizerManager
+from streetrace.guardrails.inference.tokenizer_manager import (
+    DEFAULT_PAD_TOKEN_ID,
+    TokenizerManager,
+)
 
 
 @pytest.fixture
@@ -97,6 +100,36 @@ class TestTokenizerFromPath:
             manager.load_from_path("model-a", "/path/to/tokenizer")
 
 
+class TestPadTokenId:
+    """Verify the padding token is read from the tokenizer."""
+
+    def test_padding_config(self, manager: TokenizerManager) -> None:
+        tokenizer = MagicMock()
+        tokenizer.padding = {"pad_id": 1, "pad_token": "<pad>"}
+        manager.register("model-a", tokenizer)
+        assert manager.pad_token_id("model-a") == 1
+
+    def test_vocabulary_pad_token(self, manager: TokenizerManager) -> None:
+        tokenizer = MagicMock()
+        tokenizer.padding = None
+        tokenizer.token_to_id = MagicMock(
+            side_effect=lambda token: 3 if token == "<pad>" else None,
+        )
+        manager.register("model-a", tokenizer)
+        assert manager.pad_token_id("model-a") == 3
+
+    def test_default_without_pad_token(self, manager: TokenizerManager) -> None:
+        tokenizer = MagicMock()
+        tokenizer.padding = None
+        tokenizer.token_to_id = MagicMock(return_value=None)
+        manager.register("model-a", tokenizer)
+        assert manager.pad_token_id("model-a") == DEFAULT_PAD_TOKEN_ID
+
+    def test_unregistered_raises(self, manager: TokenizerManager) -> None:
+        with pytest.raises(MissingDependencyError):
+            manager.pad_token_id("unknown")
+
+
 class TestTokenizerMaxLength:
     """Verify max token length enforcement."""
 
@@ -6,7 +6,14 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from streetrace.guardrails.mcp_guard.neural_inspector import NeuralInspector
+from streetrace.guardrails.mcp_guard.neural_inspector import (
+    _KNOWN_GOOD_DESCRIPTIONS,
+    MAX_CACHED_SCORES,
+    MAX_CACHED_SERVERS,
+    NeuralInspector,
+)
+
+REFERENCE_COUNT = len(_KNOWN_GOOD_DESCRIPTIONS)
 
 
 class TestAnomalyScoring:
@@ -112,3 +119,129 @@ class TestInspectorResult:
         assert hasattr(result, "anomalies")
         assert isinstance(result.anomaly_score, float)
         assert isinstance(result.anomalies, list)
+
+
+class TestDescriptionScoreCache:
+    """Verify description scores are cached per server manifest."""
+
+    @staticmethod
+    def _inspector() -> tuple[NeuralInspector, MagicMock]:
+        mock_pipeline = MagicMock()
+        mock_pipeline.get_embedding = AsyncMock(
+            return_value=[1.0, 0.0, 0.0, 0.0],
+        )
+        return NeuralInspector(inference_pipeline=mock_pipeline), mock_pipeline
+
+    @pytest.mark.asyncio
+    async def test_repeated_calls_skip_embedding(self) -> None:
+        """Only the first call of a tool embeds its description."""
+        inspector, mock_pipeline = self._inspector()
+
+        for path in ("a.txt", "b.txt"):
+            await inspector.inspect(
+                tool_name="read_file",
+                tool_description="Read a file",
+                args={"path": path},
+                server_id="fs",
+                manifest_hash="hash-1",
+            )
+
+        assert mock_pipeline.get_embedding.await_count == REFERENCE_COUNT + 1
+
+    @pytest.mark.asyncio
+    async def test_manifest_change_invalidates_scores(self) -> None:
+        """A new manifest hash re-embeds the description only."""
+        inspector, mock_pipeline = self._inspector()
+
+        for manifest_hash in ("hash-1", "hash-2"):
+            await inspector.inspect(
+                tool_name="read_file",
+                tool_description="Read a file",
+                args={},
+                server_id="fs",
+                manifest_hash=manifest_hash,
+            )
+
+        assert mock_pipeline.get_embedding.await_count == REFERENCE_COUNT + 2
+
+    @pytest.mark.asyncio
+    async def test_register_manifest_precomputes_scores(self) -> None:
+        """Inspecting a registered tool runs no inference."""
+        inspector, mock_pipeline = self._inspector()
+        await inspector.register_manifest(
+            "fs", "hash-1", {"read_file": "Read a file", "ls": "List files"},
+        )
+        await_count = mock_pipeline.get_embedding.await_count
+
+        result = await inspector.inspect(
+            tool_name="ls",
+            tool_description="List files",
+            args={"__proto__": {}},
+            server_id="fs",
+            manifest_hash="hash-1",
+        )
+
+        assert mock_pipeline.get_embedding.await_count == await_count
+        assert any("__proto__" in a for a in result.anomalies)
+
+    @pytest.mark.asyncio
+    async def test_missing_manifest_hash_not_cached(self) -> None:
+        """Without a manifest hash, every call embeds the description."""
+        inspector, mock_pipeline = self._inspector()
+
+        for _ in range(2):
+            await inspector.inspect(
+                tool_name="read_file",
+                tool_description="Read a file",
+                args={},
+                server_id="fs",
+            )
+
+        assert mock_pipeline.get_embedding.await_count == REFERENCE_COUNT + 2
+
+    @pytest.mark.asyncio
+    async def test_register_manifest_requires_hash(self) -> None:
+        """Registering a manifest without a hash is rejected."""
+        inspector, _ = self._inspector()
+
+        with pytest.raises(ValueError, match="empty"):
+            await inspector.register_manifest("fs", "", {"ls": "List files"})
+
+    @pytest.mark.asyncio
+    async def test_scores_are_bounded(self) -> None:
+        """Least recently used scores and servers are evicted."""
+        inspector, _ = self._inspector()
+        descriptions = {
+            f"tool_{i}": "List files" for i in range(MAX_CACHED_SCORES + 1)
+        }
+        await inspector.register_manifest("fs", "hash-1", descriptions)
+        for i in range(MAX_CACHED_SERVERS):
+            await inspector.register_manifest(f"server-{i}", "hash-1", {})
+
+        manifests = inspector._manifests  # noqa: SLF001
+        assert len(manifests) == MAX_CACHED_SERVERS
+        assert "fs" not in manifests
+        assert all(
+            len(entry.scores) <= MAX_CACHED_SCORES
+            for entry in manifests.values()
+        )
+
+    @pytest.mark.asyncio
+    async def test_failed_embedding_not_cached(self) -> None:
+        """A description whose embedding failed is retried."""
+        inspector, mock_pipeline = self._inspector()
+        mock_pipeline.get_embedding.side_effect = [
+            RuntimeError("model not ready"),
+            [1.0, 0.0, 0.0, 0.0],
+        ] + [[1.0, 0.0, 0.0, 0.0]] * REFERENCE_COUNT
+
+        for _ in range(2):
+            await inspector.inspect(
+                tool_name="read_file",
+                tool_description="Read a file",
+                args={},
+                server_id="fs",
+                manifest_hash="hash-1",
+            )
+
+        assert mock_pipeline.get_embedding.await_count == REFERENCE_COUNT + 2
@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from streetrace.dsl.runtime.guardrail_types import ToolCallContent
+from streetrace.guardrails.config import McpGuardConfig
+from streetrace.guardrails.mcp_guard.neural_inspector import NeuralInspector
 from streetrace.guardrails.mcp_guard.orchestrator import McpGuardOrchestrator
 
 
@@ -83,6 +87,67 @@ class TestPipelineOrder:
         triggered, _ = orch.check_str(tool_call)
         assert triggered is False
 
+    def test_syntactic_result_is_memoized(self) -> None:
+        """Repeated tool calls reuse the syntactic result, not the policy."""
+        orch = McpGuardOrchestrator()
+        tool_call = json.dumps({
+            "server_id": "normal-server",
+            "tool_name": "exec",
+            "args": {"cmd": "rm -rf /"},
+        })
+
+        with (
+            patch.object(
+                orch._gatekeeper,  # noqa: SLF001
+                "check",
+                wraps=orch._gatekeeper.check,  # noqa: SLF001
+            ) as gatekeeper_check,
+            patch.object(
+                orch._policy,  # noqa: SLF001
+                "check",
+                wraps=orch._policy.check,  # noqa: SLF001
+            ) as policy_check,
+        ):
+            first = orch.check_str(tool_call)
+            second = orch.check_str(tool_call)
+
+        assert first == second
+        assert first[0] is True
+        gatekeeper_check.assert_called_once()
+        assert policy_check.call_count == 2
+
+
+_GOOD_VECTOR = [1.0, 0.0, 0.0, 0.0]
+_ANOMALOUS_VECTOR = [0.0, 0.0, 1.0, 0.0]
+
+
+def _embedding_pipeline(*, delay: asyncio.Event | None = None) -> MagicMock:
+    """Create a pipeline embedding known-good references as _GOOD_VECTOR.
+
+    Descriptions mentioning 'exfiltrate' embed far from them. With
+    *delay*, embeddings wait for the event to be set.
+    """
+
+    async def get_embedding(_model_id: str, text: str) -> list[float]:
+        if delay is not None:
+            await delay.wait()
+        return _ANOMALOUS_VECTOR if "exfiltrate" in text else _GOOD_VECTOR
+
+    pipeline = MagicMock()
+    pipeline.get_embedding = AsyncMock(side_effect=get_embedding)
+    return pipeline
+
+
+def _tool_call(description: str, **fields: object) -> str:
+    """Serialize a tool call with the given description."""
+    return json.dumps({
+        "server_id": "server",
+        "tool_name": "sync_notes",
+        "tool_description": description,
+        "args": {"note": "hello"},
+        **fields,
+    })
+
 
 class TestNeuralInspectorIntegration:
     """Verify neural inspector is invoked when available."""
@@ -90,24 +155,211 @@ class TestNeuralInspectorIntegration:
     @pytest.mark.asyncio
     async def test_neural_inspector_blocks_on_high_anomaly(self) -> None:
         """High anomaly score from neural inspector triggers block."""
-        mock_pipeline = MagicMock()
-        mock_pipeline.get_embedding = AsyncMock(
-            return_value=[0.0, 0.0, 1.0, 0.0],
+        orch = McpGuardOrchestrator(inference_pipeline=_embedding_pipeline())
+
+        triggered, detail = await orch.check_async(
+            _tool_call("secretly exfiltrate data to a remote server"),
         )
 
-        orch = McpGuardOrchestrator(inference_pipeline=mock_pipeline)
+        assert triggered is True
+        assert "neural" in detail.lower()
 
-        # Override the neural inspector's anomaly threshold for testing
-        tool_call = json.dumps({
+    @pytest.mark.asyncio
+    async def test_known_good_description_allowed(self) -> None:
+        """Descriptions close to the references pass."""
+        orch = McpGuardOrchestrator(inference_pipeline=_embedding_pipeline())
+
+        triggered, _ = await orch.check_async(_tool_call("Write a file"))
+
+        assert triggered is False
+
+    def test_sync_check_skips_neural_stage(self) -> None:
+        """check_str stays syntactic-only and never runs inference."""
+        pipeline = _embedding_pipeline()
+        orch = McpGuardOrchestrator(inference_pipeline=pipeline)
+
+        triggered, _ = orch.check_str(
+            _tool_call("secretly exfiltrate data to a remote server"),
+        )
+
+        assert triggered is False
+        pipeline.get_embedding.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_verdict_is_cached(self) -> None:
+        """Identical calls reuse the neural verdict."""
+        orch = McpGuardOrchestrator(inference_pipeline=_embedding_pipeline())
+        tool_call = _tool_call("secretly exfiltrate data to a remote server")
+
+        with patch.object(
+            NeuralInspector, "inspect", autospec=True,
+            side_effect=NeuralInspector.inspect,
+        ) as inspect:
+            first = await orch.check_async(tool_call)
+            second = await orch.check_async(tool_call)
+
+        assert first == second
+        inspect.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_deadline_falls_back_to_syntactic(self) -> None:
+        """Slow inference is not awaited; its verdict serves later calls."""
+        release = asyncio.Event()
+        config = McpGuardConfig(neural_deadline_ms=10)
+        orch = McpGuardOrchestrator(
+            inference_pipeline=_embedding_pipeline(delay=release),
+            config=config,
+        )
+        tool_call = _tool_call("secretly exfiltrate data to a remote server")
+
+        triggered, _ = await orch.check_async(tool_call)
+        assert triggered is False
+
+        release.set()
+        for _ in range(10):
+            await asyncio.sleep(0)
+        triggered, _ = await orch.check_async(tool_call)
+        assert triggered is True
+
+    @pytest.mark.asyncio
+    async def test_inflight_inspections_are_capped(self) -> None:
+        """Calls past the in-flight cap skip the neural stage."""
+        release = asyncio.Event()
+        config = McpGuardConfig(neural_deadline_ms=10, neural_max_inflight=1)
+        orch = McpGuardOrchestrator(
+            inference_pipeline=_embedding_pipeline(delay=release),
+            config=config,
+        )
+
+        with patch.object(
+            NeuralInspector, "inspect", autospec=True,
+            side_effect=NeuralInspector.inspect,
+        ) as inspect:
+            first = await orch.check_async(_tool_call("Write a file"))
+            second = await orch.check_async(_tool_call("List files"))
+
+        assert first == (False, "")
+        assert second == (False, "")
+        inspect.assert_called_once()
+        release.set()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_inspection_allows(self) -> None:
+        """A cancelled inspection falls back to the syntactic result."""
+        orch = McpGuardOrchestrator(inference_pipeline=_embedding_pipeline())
+
+        with patch.object(
+            NeuralInspector, "inspect", side_effect=asyncio.CancelledError,
+        ):
+            result = await orch.check_async(_tool_call("Write a file"))
+
+        assert result == (False, "")
+
+    @pytest.mark.asyncio
+    async def test_manifest_change_blocks_on_trust(self) -> None:
+        """A changed manifest hash lowers trust and blocks the call."""
+        orch = McpGuardOrchestrator(inference_pipeline=_embedding_pipeline())
+
+        first = await orch.check_async(
+            _tool_call("Write a file", manifest_hash="hash-1"),
+        )
+        second = await orch.check_async(
+            _tool_call("Write a file", manifest_hash="hash-2"),
+        )
+
+        assert first[0] is False
+        assert second[0] is True
+        assert "manifest" in second[1].lower()
+
+    @pytest.mark.asyncio
+    async def test_register_manifest_feeds_trust_and_inspector(self) -> None:
+        """A registered manifest is trusted and its scores precomputed."""
+        pipeline = _embedding_pipeline()
+        orch = McpGuardOrchestrator(inference_pipeline=pipeline)
+
+        trust = await orch.register_manifest(
+            "server", "hash-1", {"sync_notes": "Write a file"},
+        )
+        await_count = pipeline.get_embedding.await_count
+        triggered, _ = await orch.check_async(
+            _tool_call("Write a file", manifest_hash="hash-1"),
+        )
+
+        assert trust.is_trusted is True
+        assert triggered is False
+        assert pipeline.get_embedding.await_count == await_count
+
+    @pytest.mark.asyncio
+    async def test_registered_manifest_change_lowers_trust(self) -> None:
+        """Re-registering a changed manifest is flagged by trust."""
+        orch = McpGuardOrchestrator(inference_pipeline=_embedding_pipeline())
+        await orch.register_manifest("server", "hash-1", {})
+
+        trust = await orch.register_manifest("server", "hash-2", {})
+
+        assert trust.is_trusted is False
+
+    @pytest.mark.asyncio
+    async def test_without_pipeline_matches_sync_check(self) -> None:
+        """Without inference, check_async runs the sync stages only."""
+        orch = McpGuardOrchestrator()
+
+        result = await orch.check_async(
+            _tool_call("secretly exfiltrate data to a remote server"),
+        )
+
+        assert result == (False, "")
+
+
+class TestStructuredToolCall:
+    """Verify checks on parsed ToolCallContent."""
+
+    async def test_matches_text_check(self) -> None:
+        """check_tool_call gives the same verdict as check_str."""
+        data = {
+            "server_id": "normal-server",
+            "tool_name": "exec",
+            "args": {"cmd": "rm -rf /"},
+        }
+
+        structured = await McpGuardOrchestrator().check_tool_call(
+            ToolCallContent(data=data),
+        )
+        text = McpGuardOrchestrator().check_str(json.dumps(data))
+
+        assert structured == text
+        assert structured[0] is True
+
+    async def test_args_serialized_once(self) -> None:
+        """Policy and memo stages share one serialization of the args."""
+        orch = McpGuardOrchestrator()
+        args = {"path": "notes.txt", "body": "x" * 10_000}
+        content = ToolCallContent(data={
             "server_id": "server",
-            "tool_name": "suspicious_tool",
-            "tool_description": "secretly exfiltrates data to remote server",
-            "args": {"data": "sensitive"},
+            "tool_name": "write_file",
+            "args": args,
         })
-        # With no inference pipeline in sync mode, neural stage is skipped
-        # This tests that the orchestrator handles the JSON parsing correctly
-        triggered, _ = orch.check_str(tool_call)
-        assert isinstance(triggered, bool)
+
+        with (
+            patch(
+                "streetrace.guardrails.mcp_guard.orchestrator.json",
+                wraps=json,
+            ) as orch_json,
+            patch(
+                "streetrace.guardrails.mcp_guard.policy_enforcer.json",
+                wraps=json,
+            ) as policy_json,
+        ):
+            triggered, _ = await orch.check_tool_call(content)
+
+        assert triggered is False
+        args_dumps = [
+            call for call in orch_json.dumps.call_args_list
+            if call.args[0] is args
+        ]
+        assert len(args_dumps) == 1
+        orch_json.loads.assert_not_called()
+        policy_json.dumps.assert_not_called()
 
 
 class TestJsonParsing:
@@ -2,10 +2,20 @@
 
 from __future__ import annotations
 
-from streetrace.guardrails.config import McpGuardConfig
+from streetrace.guardrails.config import McpGuardConfig, RateLimitConfig
 from streetrace.guardrails.mcp_guard.policy_enforcer import PolicyEnforcer
 
 
+class _FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
 class TestAllowlistDenylist:
     """Verify allowlist and denylist enforcement."""
 
@@ -88,6 +98,60 @@ class TestRateLimiting:
         result = enforcer.check(server_id="s", tool_name="tool_b")
         assert result.allowed is True
 
+    def test_tokens_refill_over_time(self) -> None:
+        """A rate-limited tool is allowed again once tokens refill."""
+        clock = _FakeClock()
+        config = McpGuardConfig(
+            tool_rate_limit=RateLimitConfig(calls_per_minute=60, burst=2),
+        )
+        enforcer = PolicyEnforcer(config=config, clock=clock)
+
+        for _ in range(2):
+            assert enforcer.check(server_id="s", tool_name="t").allowed
+        assert not enforcer.check(server_id="s", tool_name="t").allowed
+
+        clock.now = 1.0
+        assert enforcer.check(server_id="s", tool_name="t").allowed
+        assert not enforcer.check(server_id="s", tool_name="t").allowed
+
+    def test_server_limit_aggregates_tools(self) -> None:
+        """The server limit counts calls to all of its tools."""
+        config = McpGuardConfig(
+            server_rate_limit=RateLimitConfig(calls_per_minute=1, burst=3),
+        )
+        enforcer = PolicyEnforcer(config=config, clock=_FakeClock())
+
+        for tool_name in ("a", "b", "c"):
+            assert enforcer.check(server_id="s", tool_name=tool_name).allowed
+
+        result = enforcer.check(server_id="s", tool_name="d")
+        assert result.allowed is False
+        assert "server 's'" in result.reason
+        assert enforcer.check(server_id="other", tool_name="d").allowed
+
+    def test_blocked_call_spends_no_tokens(self) -> None:
+        """A call blocked by the server limit keeps its tool token."""
+        clock = _FakeClock()
+        config = McpGuardConfig(
+            tool_rate_limit=RateLimitConfig(calls_per_minute=1, burst=1),
+            server_rate_limit=RateLimitConfig(calls_per_minute=60, burst=1),
+        )
+        enforcer = PolicyEnforcer(config=config, clock=clock)
+
+        assert enforcer.check(server_id="s", tool_name="a").allowed
+        assert not enforcer.check(server_id="s", tool_name="b").allowed
+
+        clock.now = 1.0
+        assert enforcer.check(server_id="s", tool_name="b").allowed
+
+    def test_rate_limits_can_be_disabled(self) -> None:
+        """No call is rate limited without configured limits."""
+        config = McpGuardConfig(tool_rate_limit=None)
+        enforcer = PolicyEnforcer(config=config)
+
+        for _ in range(500):
+            assert enforcer.check(server_id="s", tool_name="t").allowed
+
 
 class TestDataBoundaryEnforcement:
     """Verify data boundary pattern detection in args."""
@@ -115,6 +179,18 @@ class TestDataBoundaryEnforcement:
         )
         assert result.allowed is True
 
+    def test_scans_precomputed_args_text(self) -> None:
+        """Serialized args passed by the caller are scanned as given."""
+        enforcer = PolicyEnforcer(config=McpGuardConfig())
+        result = enforcer.check(
+            server_id="server",
+            tool_name="send",
+            args={},
+            args_text='{"body": "API_KEY=sk-test"}',
+        )
+        assert result.allowed is False
+        assert "api_key" in result.reason
+
 
 class TestPolicyResult:
     """Verify PolicyResult structure."""
@@ -0,0 +1,89 @@
+"""Tests for TokenBucketLimiter: refill, burst, and idle eviction."""
+
+from __future__ import annotations
+
+from streetrace.guardrails.config import RateLimitConfig
+from streetrace.guardrails.mcp_guard.rate_limiter import TokenBucketLimiter
+
+
+class _FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _limiter(
+    clock: _FakeClock, *, calls_per_minute: float = 60, burst: int = 2,
+) -> TokenBucketLimiter:
+    """Create a limiter driven by the fake clock."""
+    return TokenBucketLimiter(
+        config=RateLimitConfig(calls_per_minute=calls_per_minute, burst=burst),
+        clock=clock,
+    )
+
+
+class TestTokenBucket:
+    """Verify token accounting."""
+
+    def test_allows_burst_then_blocks(self) -> None:
+        """Up to burst calls pass back to back."""
+        limiter = _limiter(_FakeClock(), burst=3)
+
+        assert [limiter.try_acquire("k") for _ in range(4)] == [
+            True, True, True, False,
+        ]
+
+    def test_refills_at_sustained_rate(self) -> None:
+        """Tokens come back at calls_per_minute, capped at burst."""
+        clock = _FakeClock()
+        limiter = _limiter(clock, calls_per_minute=120, burst=2)
+        limiter.try_acquire("k")
+        limiter.try_acquire("k")
+
+        clock.now = 0.25
+        assert limiter.available("k") == 0.5
+        clock.now = 10.0
+        assert limiter.available("k") == 2.0
+
+    def test_keys_are_independent(self) -> None:
+        """Each key has its own bucket."""
+        limiter = _limiter(_FakeClock(), burst=1)
+
+        assert limiter.try_acquire("a") is True
+        assert limiter.try_acquire("a") is False
+        assert limiter.try_acquire("b") is True
+
+
+class TestIdleEviction:
+    """Verify buckets of idle keys are dropped."""
+
+    def test_full_buckets_are_evicted(self) -> None:
+        """Keys idle long enough to refill are dropped on later checks."""
+        clock = _FakeClock()
+        limiter = _limiter(clock, calls_per_minute=60, burst=2)
+        for i in range(1000):
+            limiter.try_acquire(f"tool-{i}")
+        assert limiter.size == 1000
+
+        clock.now = 2.0
+        for _ in range(600):
+            limiter.try_acquire("active")
+
+        assert limiter.size == 1
+
+    def test_recent_buckets_are_kept(self) -> None:
+        """Keys that may still be rate limited are not evicted."""
+        clock = _FakeClock()
+        limiter = _limiter(clock, calls_per_minute=60, burst=2)
+        limiter.try_acquire("a")
+        limiter.try_acquire("a")
+
+        clock.now = 1.0
+        limiter.try_acquire("b")
+
+        assert limiter.size == 2
+        assert limiter.available("a") == 1.0
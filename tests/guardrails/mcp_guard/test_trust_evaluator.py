@@ -70,6 +70,15 @@ class TestRugPullDetection:
         result = evaluator.evaluate("server-a")
         assert result.trust_score < 0.9
 
+    def test_manifest_hash_tracks_latest_manifest(self) -> None:
+        """The registered hash follows manifest changes."""
+        evaluator = TrustEvaluator(trust_threshold=0.5)
+        assert evaluator.manifest_hash("server-a") is None
+
+        evaluator.register_manifest("server-a", "hash-original")
+        evaluator.check_manifest("server-a", "hash-changed")
+        assert evaluator.manifest_hash("server-a") == "hash-changed"
+
 
 class TestTrustResult:
     """Verify TrustResult structure."""
@@ -2,15 +2,25 @@
 
 from __future__ import annotations
 
+import math
+from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from streetrace.guardrails.prompt_proxy import semantic_detector
 from streetrace.guardrails.prompt_proxy.semantic_detector import (
+    DEFAULT_REFERENCE_PATTERNS_PATH,
+    ReferenceMatrix,
     SemanticDetector,
     SemanticResult,
+    load_reference_embeddings,
+    read_reference_patterns,
 )
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
 
 def _make_pipeline(embedding_map: dict[str, list[float]]) -> MagicMock:
     """Create a mock InferencePipeline returning predetermined embeddings."""
@@ -113,3 +123,94 @@ class TestSemanticDetectorThresholds:
         )
         result = await detector.detect("ambiguous text")
         assert 0.60 <= result.score <= 0.85
+
+
+@pytest.fixture(params=["numpy", "python"])
+def similarity_backend(
+    request: pytest.FixtureRequest,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Run reference matrix tests with and without NumPy."""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(semantic_detector, "load_numpy", lambda: None)
+
+
+@pytest.mark.usefixtures("similarity_backend")
+class TestReferenceMatrix:
+    """Verify similarity search against pre-normalized references."""
+
+    def test_top_k_orders_by_similarity(self) -> None:
+        """Matches are sorted best first and limited to k."""
+        matrix = ReferenceMatrix({
+            "x": [2.0, 0.0, 0.0],
+            "xy": [1.0, 1.0, 0.0],
+            "y": [0.0, 3.0, 0.0],
+        })
+        matches = matrix.top_k([1.0, 0.2, 0.0], 2)
+        assert [name for name, _ in matches] == ["x", "xy"]
+        assert matches[0][1] == pytest.approx(1 / math.sqrt(1.04), abs=1e-6)
+
+    def test_k_larger_than_references(self) -> None:
+        """All references are returned when k exceeds their count."""
+        matrix = ReferenceMatrix({"x": [1.0, 0.0]})
+        assert [name for name, _ in matrix.top_k([1.0, 0.0], 5)] == ["x"]
+
+    def test_zero_vector_scores_zero(self) -> None:
+        """A zero query has zero similarity with every reference."""
+        matrix = ReferenceMatrix({"x": [1.0, 0.0]})
+        assert matrix.top_k([0.0, 0.0], 1) == [("x", 0.0)]
+
+    def test_dimension_mismatch_raises(self) -> None:
+        """Queries must match the reference dimension."""
+        matrix = ReferenceMatrix({"x": [1.0, 0.0]})
+        with pytest.raises(ValueError, match="dimension"):
+            matrix.top_k([1.0, 0.0, 0.0], 1)
+
+
+class TestSemanticDetectorTopMatches:
+    """Verify detection reports the closest reference patterns."""
+
+    @pytest.mark.asyncio
+    async def test_top_matches(self) -> None:
+        """Only positively similar references are reported."""
+        pipeline = _make_pipeline({"text": [1.0, 0.5, 0.0]})
+        detector = SemanticDetector(
+            inference_pipeline=pipeline,
+            reference_embeddings={
+                "x": [1.0, 0.0, 0.0],
+                "y": [0.0, 1.0, 0.0],
+                "not_x": [-1.0, 0.0, 0.0],
+            },
+            top_k=3,
+        )
+        result = await detector.detect("text")
+        assert result.matched_pattern == "x"
+        assert [name for name, _ in result.top_matches] == ["x", "y"]
+
+
+class TestLoadReferenceEmbeddings:
+    """Verify reference phrases are read from a file and embedded."""
+
+    def test_bundled_patterns(self) -> None:
+        """The bundled file has phrases and no comments."""
+        phrases = read_reference_patterns(DEFAULT_REFERENCE_PATTERNS_PATH)
+        assert "ignore all previous instructions" in phrases
+        assert not any(phrase.startswith("#") for phrase in phrases)
+
+    @pytest.mark.asyncio
+    async def test_embeds_phrases_in_one_batch(self, tmp_path: Path) -> None:
+        """Phrases are deduplicated and embedded with one batch call."""
+        path = tmp_path / "patterns.txt"
+        path.write_text("# comment\nfirst phrase\n\nsecond phrase\nfirst phrase\n")
+        pipeline = MagicMock()
+        pipeline.batch_embed = AsyncMock(return_value=[[1.0], [2.0]])
+
+        embeddings = await load_reference_embeddings(pipeline, path)
+
+        assert embeddings == {"first phrase": [1.0], "second phrase": [2.0]}
+        pipeline.batch_embed.assert_awaited_once_with(
+            "minilm-l6-v2",
+            ["first phrase", "second phrase"],
+        )
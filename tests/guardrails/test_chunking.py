@@ -0,0 +1,38 @@
+"""Tests for overlapping text chunking."""
+
+from __future__ import annotations
+
+import pytest
+
+from streetrace.guardrails.chunking import iter_chunks
+
+
+class TestIterChunks:
+
+    def test_short_text_is_one_chunk(self) -> None:
+        text = "short text"
+        assert list(iter_chunks(text, chunk_size=100, overlap=10)) == [text]
+
+    def test_empty_text(self) -> None:
+        assert list(iter_chunks("", chunk_size=10)) == [""]
+
+    def test_chunks_overlap(self) -> None:
+        chunks = list(iter_chunks("abcdefghij", chunk_size=4, overlap=1))
+        assert chunks == ["abcd", "defg", "ghij"]
+
+    def test_chunks_cover_text(self) -> None:
+        text = "".join(chr(ord("a") + i % 26) for i in range(1000))
+        chunks = list(iter_chunks(text, chunk_size=64, overlap=16))
+
+        assert all(len(chunk) <= 64 for chunk in chunks)
+        assert chunks[0] + "".join(c[16:] for c in chunks[1:]) == text
+
+    def test_span_within_overlap_is_never_split(self) -> None:
+        text = "x" * 95 + "NEEDLE" + "x" * 100
+        chunks = list(iter_chunks(text, chunk_size=50, overlap=5))
+        assert any("NEEDLE" in chunk for chunk in chunks)
+
+    @pytest.mark.parametrize("overlap", [-1, 10, 11])
+    def test_invalid_overlap(self, overlap: int) -> None:
+        with pytest.raises(ValueError, match="overlap"):
+            list(iter_chunks("text", chunk_size=10, overlap=overlap))
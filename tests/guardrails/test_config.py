@@ -8,8 +8,12 @@ from pydantic import ValidationError
 from streetrace.guardrails.config import (
     CognitiveMonitorConfig,
     GuardrailsConfig,
+    InferenceConfig,
     McpGuardConfig,
+    PiiConfig,
+    PiiMode,
     PromptProxyConfig,
+    RateLimitConfig,
 )
 
 
@@ -40,6 +44,18 @@ class TestPromptProxyConfig:
         with pytest.raises(ValidationError):
             PromptProxyConfig(block_threshold=1.1)
 
+    def test_chunk_overlap_must_be_less_than_chunk_size(self) -> None:
+        with pytest.raises(ValidationError):
+            PromptProxyConfig(chunk_size=100, chunk_overlap=100)
+
+    def test_max_scan_chars_must_be_positive(self) -> None:
+        with pytest.raises(ValidationError):
+            PromptProxyConfig(max_scan_chars=0)
+
+    def test_syntactic_max_scan_chars_must_be_positive(self) -> None:
+        with pytest.raises(ValidationError):
+            PromptProxyConfig(syntactic_max_scan_chars=0)
+
 
 class TestMcpGuardConfig:
     """Verify MCP-Guard configuration validation."""
@@ -61,6 +77,39 @@ class TestMcpGuardConfig:
         assert cfg.server_allowlist == ["safe-server"]
         assert cfg.server_denylist == ["bad-server"]
 
+    def test_rate_limit_defaults(self) -> None:
+        cfg = McpGuardConfig()
+        assert cfg.tool_rate_limit == RateLimitConfig()
+        assert cfg.server_rate_limit is None
+
+    def test_rate_limit_from_dict(self) -> None:
+        cfg = McpGuardConfig.model_validate({
+            "server_rate_limit": {"calls_per_minute": 30, "burst": 10},
+        })
+        assert cfg.server_rate_limit == RateLimitConfig(
+            calls_per_minute=30, burst=10,
+        )
+
+    def test_rate_must_be_positive(self) -> None:
+        with pytest.raises(ValidationError):
+            RateLimitConfig(calls_per_minute=0)
+
+    def test_burst_must_be_positive(self) -> None:
+        with pytest.raises(ValidationError):
+            RateLimitConfig(burst=0)
+
+    def test_neural_deadline_must_be_positive(self) -> None:
+        with pytest.raises(ValidationError):
+            McpGuardConfig(neural_deadline_ms=0)
+
+    def test_neural_max_inflight_must_be_positive(self) -> None:
+        with pytest.raises(ValidationError):
+            McpGuardConfig(neural_max_inflight=0)
+
+    def test_neural_threshold_above_one_invalid(self) -> None:
+        with pytest.raises(ValidationError):
+            McpGuardConfig(neural_block_threshold=1.5)
+
 
 class TestCognitiveMonitorConfig:
     """Verify Cognitive Monitor configuration validation."""
@@ -82,6 +131,32 @@ class TestCognitiveMonitorConfig:
             CognitiveMonitorConfig(min_turns_before_alert=0)
 
 
+class TestPiiConfig:
+    """Verify PII masking configuration."""
+
+    def test_defaults_to_ner(self) -> None:
+        assert PiiConfig().mode is PiiMode.NER
+
+    def test_mode_from_string(self) -> None:
+        cfg = PiiConfig.model_validate({"mode": "regex-only"})
+        assert cfg.mode is PiiMode.REGEX_ONLY
+
+    def test_rejects_unknown_mode(self) -> None:
+        with pytest.raises(ValidationError):
+            PiiConfig.model_validate({"mode": "fast"})
+
+
+class TestInferenceConfig:
+    """Verify inference pipeline configuration."""
+
+    def test_store_disabled_by_default(self) -> None:
+        assert InferenceConfig().embedding_store_path is None
+
+    def test_rejects_non_positive_store_size(self) -> None:
+        with pytest.raises(ValidationError):
+            InferenceConfig(embedding_store_max_bytes=0)
+
+
 class TestGuardrailsConfig:
     """Verify top-level guardrails configuration."""
 
@@ -90,6 +165,8 @@ class TestGuardrailsConfig:
         assert isinstance(cfg.prompt_proxy, PromptProxyConfig)
         assert isinstance(cfg.mcp_guard, McpGuardConfig)
         assert isinstance(cfg.cognitive_monitor, CognitiveMonitorConfig)
+        assert isinstance(cfg.pii, PiiConfig)
+        assert isinstance(cfg.inference, InferenceConfig)
 
     def test_nested_override(self) -> None:
         cfg = GuardrailsConfig(
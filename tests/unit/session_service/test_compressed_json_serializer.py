@@ -0,0 +1,175 @@
+"""Tests for the CompressedJSONSessionSerializer class in json_serializer.py."""
+
+import gzip
+import json
+from unittest.mock import Mock
+
+import pytest
+from google.adk.events import Event
+from google.genai import types as genai_types
+
+from streetrace.args import Args
+from streetrace.session.json_serializer import (
+    CompressedJSONSessionSerializer,
+    JSONSessionSerializer,
+)
+from streetrace.session.jsonl_serializer import JSONLSessionSerializer
+from streetrace.session.session_manager import SessionManager
+
+
+def _tool_output_event(output: str) -> Event:
+    return Event(
+        author="assistant",
+        content=genai_types.Content(
+            role="user",
+            parts=[
+                genai_types.Part(
+                    function_response=genai_types.FunctionResponse(
+                        name="read_file",
+                        response={"output": output},
+                    ),
+                ),
+            ],
+        ),
+    )
+
+
+def _read(serializer, session):
+    return serializer.read(
+        app_name=session.app_name,
+        user_id=session.user_id,
+        session_id=session.id,
+    )
+
+
+@pytest.fixture
+def compressed_serializer(session_storage_dir) -> CompressedJSONSessionSerializer:
+    return CompressedJSONSessionSerializer(storage_path=session_storage_dir)
+
+
+class TestCompressedJSONSessionSerializer:
+    """Tests for the CompressedJSONSessionSerializer class."""
+
+    def test_write_and_read_roundtrip(self, compressed_serializer, sample_session):
+        session = sample_session.model_copy(deep=True)
+        session.events = [_tool_output_event("line\n" * 1000)]
+
+        path = compressed_serializer.write(session)
+
+        assert path.name == f"{session.id}.json.gz"
+        document = json.loads(gzip.decompress(path.read_bytes()))
+        assert document["id"] == session.id
+        read_session = _read(compressed_serializer, session)
+        assert read_session is not None
+        assert read_session.model_dump() == session.model_dump()
+
+    def test_smaller_than_json_document(
+        self,
+        compressed_serializer,
+        session_storage_dir,
+        sample_session,
+    ):
+        session = sample_session.model_copy(deep=True)
+        session.events = [_tool_output_event("line\n" * 1000)]
+
+        compressed_size = compressed_serializer.write(session).stat().st_size
+        plain_path = JSONSessionSerializer(session_storage_dir).write(session)
+
+        assert compressed_size * 10 < plain_path.stat().st_size
+
+    @pytest.mark.parametrize(
+        "reader_cls",
+        [JSONSessionSerializer, JSONLSessionSerializer],
+    )
+    def test_other_serializers_read_compressed(
+        self,
+        compressed_serializer,
+        session_storage_dir,
+        sample_session,
+        reader_cls,
+    ):
+        compressed_serializer.write(sample_session)
+
+        read_session = _read(reader_cls(session_storage_dir), sample_session)
+
+        assert read_session is not None
+        assert read_session.id == sample_session.id
+
+    def test_converts_json_document_on_write(
+        self,
+        compressed_serializer,
+        session_storage_dir,
+        sample_session,
+    ):
+        plain_path = JSONSessionSerializer(session_storage_dir).write(sample_session)
+
+        read_session = _read(compressed_serializer, sample_session)
+        assert read_session is not None
+        compressed_serializer.write(read_session)
+
+        assert not plain_path.exists()
+        sessions = list(
+            compressed_serializer.list_saved(
+                app_name=sample_session.app_name,
+                user_id=sample_session.user_id,
+            ),
+        )
+        assert [s.id for s in sessions] == [sample_session.id]
+
+    def test_list_saved_includes_json_documents(
+        self,
+        compressed_serializer,
+        session_storage_dir,
+        sample_session,
+    ):
+        JSONSessionSerializer(session_storage_dir).write(sample_session)
+        other = sample_session.model_copy(deep=True)
+        other.id = "other-session"
+        compressed_serializer.write(other)
+
+        sessions = compressed_serializer.list_saved(
+            app_name=sample_session.app_name,
+            user_id=sample_session.user_id,
+        )
+
+        assert {s.id for s in sessions} == {sample_session.id, "other-session"}
+
+    def test_unreadable_file(self, compressed_serializer, sample_session):
+        path = compressed_serializer.write(sample_session)
+        path.write_bytes(b"not gzip")
+
+        assert _read(compressed_serializer, sample_session) is None
+
+    def test_delete_removes_all_formats(
+        self,
+        compressed_serializer,
+        session_storage_dir,
+        sample_session,
+    ):
+        path = compressed_serializer.write(sample_session)
+        plain_path = path.with_name(f"{sample_session.id}.json")
+        plain_path.write_text(sample_session.model_dump_json())
+
+        JSONSessionSerializer(session_storage_dir).delete(
+            app_name=sample_session.app_name,
+            user_id=sample_session.user_id,
+            session_id=sample_session.id,
+        )
+
+        assert not path.exists()
+        assert not plain_path.exists()
+
+
+def test_session_manager_selects_compressed_format(system_context, ui_bus):
+    args = Mock(spec=Args)
+    args.session_id = None
+    args.session_format = "json.gz"
+    args.session_flush_interval = None
+    args.session_fsync = False
+
+    manager = SessionManager(args=args, system_context=system_context, ui_bus=ui_bus)
+
+    assert isinstance(
+        manager.session_service.serializer,
+        CompressedJSONSessionSerializer,
+    )
@@ -361,8 +361,38 @@ class TestJSONSessionService:
                 event=event,
             )
 
-            # Verify serializer.write was called with the session
-            service.serializer.write.assert_called_once()
+            # Verify the serializer persisted the appended event
+            service.serializer.append_event.assert_called_once_with(
+                sample_session,
+                event,
+            )
 
             # Verify the result is the event returned by the superclass method
             assert result == event
+
+    async def test_append_partial_event_is_not_persisted(
+        self,
+        json_serializer,
+        sample_session,
+    ):
+        """Test append_event skips storage for partial (streaming) events."""
+        service = JSONSessionService(json_serializer)
+        event = Event(
+            author="assistant",
+            partial=True,
+            content=genai_types.Content(
+                role="model",
+                parts=[genai_types.Part.from_text(text="Partial")],
+            ),
+        )
+        with patch(
+            "streetrace.session.session_service.InMemorySessionService.append_event",
+            new=AsyncMock(return_value=event),
+        ):
+            service.serializer = Mock(spec=JSONSessionSerializer)
+
+            result = await service.append_event(session=sample_session, event=event)
+
+            service.serializer.append_event.assert_not_called()
+            service.serializer.write.assert_not_called()
+            assert result == event
@@ -0,0 +1,356 @@
+"""Tests for the JSONLSessionSerializer class in jsonl_serializer.py."""
+
+import json
+
+import pytest
+from google.adk.events import Event, EventActions
+from google.adk.sessions import Session
+from google.genai import types as genai_types
+
+from streetrace.session.compaction import mark_compaction_summary
+from streetrace.session.json_serializer import JSONSessionSerializer
+from streetrace.session.jsonl_serializer import JSONLSessionSerializer
+from streetrace.session.session_service import JSONSessionService
+
+
+def _texts(events: list[Event]) -> list[str]:
+    return [e.content.parts[0].text for e in events]
+
+
+def _text_event(text: str, timestamp: float, **kwargs) -> Event:
+    return Event(
+        author="user",
+        timestamp=timestamp,
+        content=genai_types.Content(
+            role="user",
+            parts=[genai_types.Part.from_text(text=text)],
+        ),
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def jsonl_serializer(session_storage_dir) -> JSONLSessionSerializer:
+    return JSONLSessionSerializer(storage_path=session_storage_dir)
+
+
+class TestJSONLSessionSerializer:
+    """Tests for the JSONLSessionSerializer class."""
+
+    def test_file_path_uses_jsonl_suffix(self, jsonl_serializer, sample_session):
+        path = jsonl_serializer._file_path(session=sample_session)  # noqa: SLF001
+
+        assert path.name == f"{sample_session.id}.jsonl"
+
+    def test_write_and_read_roundtrip(self, jsonl_serializer, sample_session):
+        session = sample_session.model_copy(deep=True)
+        session.state = {"key": "value"}
+        session.events = [_text_event("one", 1.0), _text_event("two", 2.0)]
+        session.last_update_time = 2.0
+
+        path = jsonl_serializer.write(session)
+
+        lines = path.read_text().splitlines()
+        assert len(lines) == 3
+        assert json.loads(lines[0])["type"] == "session"
+        assert "events" not in json.loads(lines[0])["data"]
+
+        read_session = jsonl_serializer.read(
+            app_name=session.app_name,
+            user_id=session.user_id,
+            session_id=session.id,
+        )
+        assert read_session is not None
+        assert [e.content.parts[0].text for e in read_session.events] == [
+            "one",
+            "two",
+        ]
+        assert read_session.state == {"key": "value"}
+        assert read_session.last_update_time == 2.0
+
+    def test_append_event_appends_single_line(self, jsonl_serializer, sample_session):
+        session = sample_session.model_copy(deep=True)
+        path = jsonl_serializer.write(session)
+        header = path.read_text()
+
+        event = _text_event("appended", 5.0)
+        session.events.append(event)
+        jsonl_serializer.append_event(session, event)
+
+        content = path.read_text()
+        assert content.startswith(header)
+        assert len(content.splitlines()) == 2
+
+    def test_append_event_without_log_writes_snapshot(
+        self,
+        jsonl_serializer,
+        sample_session,
+    ):
+        session = sample_session.model_copy(deep=True)
+        event = _text_event("first", 1.0)
+        session.events.append(event)
+
+        path = jsonl_serializer.append_event(session, event)
+
+        assert path.is_file()
+        assert len(path.read_text().splitlines()) == 2
+
+    def test_replay_applies_state_delta(self, jsonl_serializer, sample_session):
+        session = sample_session.model_copy(deep=True)
+        jsonl_serializer.write(session)
+
+        event = _text_event(
+            "with state",
+            3.0,
+            actions=EventActions(state_delta={"counter": 1, "temp:scratch": "x"}),
+        )
+        session.events.append(event)
+        jsonl_serializer.append_event(session, event)
+
+        read_session = jsonl_serializer.read(
+            app_name=session.app_name,
+            user_id=session.user_id,
+            session_id=session.id,
+        )
+        assert read_session is not None
+        assert read_session.state == {"counter": 1}
+        assert read_session.last_update_time == 3.0
+
+    def test_read_compacts_torn_log(self, jsonl_serializer, sample_session):
+        session = sample_session.model_copy(deep=True)
+        session.events = [_text_event("kept", 1.0)]
+        path = jsonl_serializer.write(session)
+        with path.open("a", encoding="utf-8") as log:
+            log.write('{"type":"event","data":{"author":')
+
+        read_session = jsonl_serializer.read(
+            app_name=session.app_name,
+            user_id=session.user_id,
+            session_id=session.id,
+        )
+
+        assert read_session is not None
+        assert len(read_session.events) == 1
+        # the damaged tail has been dropped from disk
+        assert len(path.read_text().splitlines()) == 2
+
+    def test_write_compacted_appends_segment(self, jsonl_serializer, sample_session):
+        session = sample_session.model_copy(deep=True)
+        first = _text_event("first", 1.0)
+        session.events = [first, _text_event("second", 2.0)]
+        path = jsonl_serializer.write(session)
+        session.events = [first, _text_event("summary", 3.0)]
+
+        jsonl_serializer.write_compacted(session)
+
+        lines = path.read_text().splitlines()
+        assert [json.loads(line)["type"] for line in lines].count("session") == 2
+        read_session = jsonl_serializer.read(
+            app_name=session.app_name,
+            user_id=session.user_id,
+            session_id=session.id,
+        )
+        assert read_session is not None
+        assert _texts(read_session.events) == ["first", "summary"]
+        history = jsonl_serializer.read_history(
+            app_name=session.app_name,
+            user_id=session.user_id,
+            session_id=session.id,
+        )
+        assert history is not None
+        assert _texts(history) == ["first", "second", "summary"]
+
+    def test_read_skips_torn_compaction_header(self, jsonl_serializer, sample_session):
+        session = sample_session.model_copy(deep=True)
+        session.events = [_text_event("old", 1.0), _text_event("older", 2.0)]
+        path = jsonl_serializer.write(session)
+        intact = len(path.read_bytes())
+        session.events = [_text_event("summary", 3.0)]
+        jsonl_serializer.write_compacted(session)
+        compacted = path.read_bytes()
+        header_end = compacted.index(b"\n", intact)
+        path.write_bytes(compacted[: (intact + header_end) // 2])
+
+        read_session = jsonl_serializer.read(
+            app_name=session.app_name,
+            user_id=session.user_id,
+            session_id=session.id,
+        )
+
+        assert read_session is not None
+        assert _texts(read_session.events) == ["old", "older"]
+        # the torn header has been dropped from disk
+        records = [json.loads(line) for line in path.read_text().splitlines()]
+        assert [record["type"] for record in records] == ["session", "event", "event"]
+
+    def test_write_keeps_compacted_segments(self, jsonl_serializer, sample_session):
+        session = sample_session.model_copy(deep=True)
+        session.events = [_text_event("old", 1.0)]
+        jsonl_serializer.write(session)
+        session.events = [_text_event("summary", 2.0)]
+        jsonl_serializer.write_compacted(session)
+
+        session.events = [*session.events, _text_event("new", 3.0)]
+        jsonl_serializer.write(session)
+
+        read_session = jsonl_serializer.read(
+            app_name=session.app_name,
+            user_id=session.user_id,
+            session_id=session.id,
+        )
+        assert read_session is not None
+        assert _texts(read_session.events) == ["summary", "new"]
+        history = jsonl_serializer.read_history(
+            app_name=session.app_name,
+            user_id=session.user_id,
+            session_id=session.id,
+        )
+        assert history is not None
+        assert _texts(history) == ["old", "summary", "new"]
+
+    def test_reads_and_converts_legacy_json(self, session_storage_dir, sample_session):
+        legacy_path = JSONSessionSerializer(session_storage_dir).write(sample_session)
+        serializer = JSONLSessionSerializer(session_storage_dir)
+
+        read_session = serializer.read(
+            app_name=sample_session.app_name,
+            user_id=sample_session.user_id,
+            session_id=sample_session.id,
+        )
+        assert read_session is not None
+        assert read_session.id == sample_session.id
+
+        path = serializer.write(read_session)
+        assert path.suffix == ".jsonl"
+        assert not legacy_path.exists()
+
+    def test_list_saved_includes_legacy_sessions(
+        self,
+        session_storage_dir,
+        sample_session,
+    ):
+        JSONSessionSerializer(session_storage_dir).write(sample_session)
+        serializer = JSONLSessionSerializer(session_storage_dir)
+        other = sample_session.model_copy(deep=True)
+        other.id = "other-session"
+        other.events = [_text_event("latest", 42.0)]
+        serializer.write(other)
+
+        sessions = {
+            s.id: s
+            for s in serializer.list_saved(
+                app_name=sample_session.app_name,
+                user_id=sample_session.user_id,
+            )
+        }
+
+        assert set(sessions) == {sample_session.id, "other-session"}
+        assert sessions["other-session"].last_update_time == 42.0
+        assert not sessions["other-session"].events
+
+    def test_delete_removes_log_and_legacy(self, session_storage_dir, sample_session):
+        legacy_path = JSONSessionSerializer(session_storage_dir).write(sample_session)
+        serializer = JSONLSessionSerializer(session_storage_dir)
+        legacy_path.with_suffix(".jsonl").write_text(
+            legacy_path.read_text().replace("\n", ""),
+        )
+
+        serializer.delete(
+            app_name=sample_session.app_name,
+            user_id=sample_session.user_id,
+            session_id=sample_session.id,
+        )
+
+        assert not legacy_path.exists()
+        assert not legacy_path.with_suffix(".jsonl").exists()
+
+
+class TestJSONSessionServiceWithJSONL:
+    """Tests for JSONSessionService persisting to an event log."""
+
+    async def test_events_survive_restart(self, jsonl_serializer):
+        service = JSONSessionService(jsonl_serializer)
+        session = await service.create_session(
+            app_name="test-app",
+            user_id="test-user",
+            session_id="log-session",
+        )
+        for i in range(3):
+            await service.append_event(session, _text_event(f"event {i}", i + 1.0))
+
+        restarted = JSONSessionService(jsonl_serializer)
+        restored = await restarted.get_session(
+            app_name="test-app",
+            user_id="test-user",
+            session_id="log-session",
+        )
+
+        assert isinstance(restored, Session)
+        assert [e.content.parts[0].text for e in restored.events] == [
+            "event 0",
+            "event 1",
+            "event 2",
+        ]
+
+    async def test_replace_events_rewrites_log(self, jsonl_serializer):
+        service = JSONSessionService(jsonl_serializer)
+        session = await service.create_session(
+            app_name="test-app",
+            user_id="test-user",
+            session_id="log-session",
+        )
+        for i in range(3):
+            await service.append_event(session, _text_event(f"event {i}", i + 1.0))
+
+        await service.replace_events(
+            session=session,
+            new_events=[_text_event("summary", 10.0)],
+        )
+
+        path = jsonl_serializer._file_path(session=session)  # noqa: SLF001
+        assert len(path.read_text().splitlines()) == 2
+        restored = jsonl_serializer.read(
+            app_name="test-app",
+            user_id="test-user",
+            session_id="log-session",
+        )
+        assert restored is not None
+        assert [e.content.parts[0].text for e in restored.events] == ["summary"]
+
+    async def test_compaction_keeps_history_on_disk(self, jsonl_serializer):
+        service = JSONSessionService(jsonl_serializer)
+        session = await service.create_session(
+            app_name="test-app",
+            user_id="test-user",
+            session_id="log-session",
+        )
+        for i in range(3):
+            await service.append_event(session, _text_event(f"event {i}", i + 1.0))
+
+        compacted = await service.replace_events(
+            session=session,
+            new_events=[mark_compaction_summary(_text_event("summary", 10.0))],
+        )
+        assert compacted is not None
+        await service.append_event(compacted, _text_event("after", 11.0))
+
+        restarted = JSONSessionService(jsonl_serializer)
+        restored = await restarted.get_session(
+            app_name="test-app",
+            user_id="test-user",
+            session_id="log-session",
+        )
+        assert restored is not None
+        assert _texts(restored.events) == ["summary", "after"]
+        history = await restarted.get_session_history(
+            app_name="test-app",
+            user_id="test-user",
+            session_id="log-session",
+        )
+        assert _texts(history) == [
+            "event 0",
+            "event 1",
+            "event 2",
+            "summary",
+            "after",
+        ]
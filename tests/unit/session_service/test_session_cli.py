@@ -0,0 +1,134 @@
+"""Tests for the migrate-sessions command in session/cli.py."""
+
+from google.adk.events import Event
+from google.genai import types as genai_types
+
+from streetrace.session.cli import (
+    EXIT_MIGRATION_ERRORS,
+    EXIT_PATH_ERROR,
+    EXIT_SUCCESS,
+    run_migrate_sessions,
+)
+from streetrace.session.json_serializer import (
+    CompressedJSONSessionSerializer,
+    JSONSessionSerializer,
+)
+from streetrace.session.jsonl_serializer import JSONLSessionSerializer
+from streetrace.session.sqlite_session_service import (
+    SQLITE_DB_FILE_NAME,
+    SqliteSessionService,
+)
+
+
+def _event(text: str) -> Event:
+    return Event(
+        author="user",
+        content=genai_types.Content(
+            role="user",
+            parts=[genai_types.Part.from_text(text=text)],
+        ),
+    )
+
+
+class TestMigrateSessions:
+    """Tests for importing JSON sessions into SQLite."""
+
+    async def test_imports_json_and_jsonl_sessions(self, temp_dir, sample_session):
+        storage_path = temp_dir / ".streetrace" / "sessions"
+        json_session = sample_session.model_copy(deep=True)
+        json_session.events = [_event("from json")]
+        JSONSessionSerializer(storage_path).write(json_session)
+        jsonl_session = sample_session.model_copy(deep=True)
+        jsonl_session.id = "log-session"
+        jsonl_session.events = [_event("from jsonl")]
+        JSONLSessionSerializer(storage_path).write(jsonl_session)
+
+        assert run_migrate_sessions(["--path", str(temp_dir)]) == EXIT_SUCCESS
+
+        service = SqliteSessionService(storage_path / SQLITE_DB_FILE_NAME)
+        for session_id, text in (
+            (json_session.id, "from json"),
+            ("log-session", "from jsonl"),
+        ):
+            session = await service.get_session(
+                app_name=sample_session.app_name,
+                user_id=sample_session.user_id,
+                session_id=session_id,
+            )
+            assert session is not None
+            assert session.events[0].content.parts[0].text == text
+        service.close()
+
+    async def test_imports_compressed_sessions(self, temp_dir, sample_session):
+        storage_path = temp_dir / ".streetrace" / "sessions"
+        CompressedJSONSessionSerializer(storage_path).write(sample_session)
+
+        assert run_migrate_sessions(["--path", str(temp_dir)]) == EXIT_SUCCESS
+
+        service = SqliteSessionService(storage_path / SQLITE_DB_FILE_NAME)
+        session = await service.get_session(
+            app_name=sample_session.app_name,
+            user_id=sample_session.user_id,
+            session_id=sample_session.id,
+        )
+        assert session is not None
+        service.close()
+
+    def test_rerun_skips_existing_sessions(self, temp_dir, sample_session, capsys):
+        storage_path = temp_dir / ".streetrace" / "sessions"
+        JSONSessionSerializer(storage_path).write(sample_session)
+
+        assert run_migrate_sessions(["--path", str(temp_dir)]) == EXIT_SUCCESS
+        assert run_migrate_sessions(["--path", str(temp_dir)]) == EXIT_SUCCESS
+
+        assert "Imported 0 sessions" in capsys.readouterr().out
+
+    def test_unreadable_session_fails(self, temp_dir, sample_session, capsys):
+        storage_path = temp_dir / ".streetrace" / "sessions"
+        path = JSONSessionSerializer(storage_path).write(sample_session)
+        path.with_name("broken.json").write_text("{broken")
+
+        assert run_migrate_sessions(["--path", str(temp_dir)]) == (
+            EXIT_MIGRATION_ERRORS
+        )
+        assert "cannot read session" in capsys.readouterr().err
+
+    def test_damaged_log_is_not_modified(self, temp_dir, sample_session):
+        storage_path = temp_dir / ".streetrace" / "sessions"
+        session = sample_session.model_copy(deep=True)
+        session.events = [_event("kept")]
+        path = JSONLSessionSerializer(storage_path).write(session)
+        with path.open("a", encoding="utf-8") as log:
+            log.write('{"type":"event","data":{"author":')
+        source = path.read_bytes()
+
+        assert run_migrate_sessions(["--path", str(temp_dir)]) == EXIT_SUCCESS
+
+        assert path.read_bytes() == source
+
+    def test_compacted_session_fails_without_discard_history(
+        self,
+        temp_dir,
+        sample_session,
+        capsys,
+    ):
+        storage_path = temp_dir / ".streetrace" / "sessions"
+        serializer = JSONLSessionSerializer(storage_path)
+        session = sample_session.model_copy(deep=True)
+        session.events = [_event("old")]
+        serializer.write(session)
+        session.events = [_event("summary")]
+        serializer.write_compacted(session)
+
+        assert run_migrate_sessions(["--path", str(temp_dir)]) == (
+            EXIT_MIGRATION_ERRORS
+        )
+        assert "--discard-history" in capsys.readouterr().err
+
+        assert (
+            run_migrate_sessions(["--path", str(temp_dir), "--discard-history"])
+            == EXIT_SUCCESS
+        )
+
+    def test_missing_sessions_dir(self, temp_dir):
+        assert run_migrate_sessions(["--path", str(temp_dir)]) == EXIT_PATH_ERROR
@@ -0,0 +1,287 @@
+"""Tests for SessionEventIndex and its use by session services and SessionManager."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+from google.adk.events import Event
+
+from streetrace.session.event_index import SessionEventIndex
+from streetrace.session.sqlite_session_service import (
+    SQLITE_DB_FILE_NAME,
+    SqliteSessionService,
+)
+
+
+def _pair(call: Event, response: Event, name: str) -> list[Event]:
+    call = call.model_copy(deep=True)
+    call.content.parts[0].function_call.name = name
+    response = response.model_copy(deep=True)
+    response.content.parts[0].function_response.name = name
+    return [call, response]
+
+
+class TestSessionEventIndex:
+    """Tests for the SessionEventIndex class."""
+
+    def test_empty(self):
+        index = SessionEventIndex()
+
+        assert index.event_count == 0
+        assert index.function_response_indices == []
+        assert index.is_consistent
+
+    def test_pairs_are_consistent(
+        self,
+        user_event,
+        function_call_event,
+        function_response_event,
+        assistant_event,
+    ):
+        index = SessionEventIndex(
+            [user_event, function_call_event, function_response_event, assistant_event],
+        )
+
+        assert index.event_count == 4
+        assert index.function_response_indices == [2]
+        assert index.is_consistent
+
+    def test_pending_call_is_not_consistent(self, user_event, function_call_event):
+        index = SessionEventIndex([user_event, function_call_event])
+
+        assert index.pending_call_index == 1
+        assert not index.is_consistent
+
+    @pytest.mark.parametrize(
+        "sequence",
+        [
+            ["response"],
+            ["call", "text"],
+            ["call", "call", "response"],
+        ],
+    )
+    def test_orphans(
+        self,
+        sequence,
+        user_event,
+        function_call_event,
+        function_response_event,
+    ):
+        events = {
+            "call": function_call_event,
+            "response": function_response_event,
+            "text": user_event,
+        }
+
+        index = SessionEventIndex([events[kind] for kind in sequence])
+
+        assert index.orphan_count == 1
+        assert not index.is_consistent
+
+
+class TestServiceEventIndex:
+    """Tests for event index bookkeeping in session services."""
+
+    async def test_json_service_tracks_appended_events(
+        self,
+        json_session_service,
+        function_call_event,
+        function_response_event,
+    ):
+        session = await json_session_service.create_session(
+            app_name="test-app",
+            user_id="test-user",
+            session_id="s1",
+        )
+        await json_session_service.append_event(session, function_call_event)
+
+        index = json_session_service.get_event_index(
+            app_name="test-app",
+            user_id="test-user",
+            session_id="s1",
+        )
+        assert index is not None
+        assert index.pending_call_index == 0
+
+        await json_session_service.append_event(session, function_response_event)
+
+        assert index.is_consistent
+        assert index.function_response_indices == [1]
+
+    async def test_json_service_rebuilds_on_replace(
+        self,
+        json_session_service,
+        user_event,
+        function_call_event,
+    ):
+        session = await json_session_service.create_session(
+            app_name="test-app",
+            user_id="test-user",
+            session_id="s1",
+        )
+        await json_session_service.append_event(session, function_call_event)
+
+        await json_session_service.replace_events(
+            session=session,
+            new_events=[user_event],
+        )
+
+        index = json_session_service.get_event_index(
+            app_name="test-app",
+            user_id="test-user",
+            session_id="s1",
+        )
+        assert index is not None
+        assert index.event_count == 1
+        assert index.is_consistent
+
+    async def test_json_service_indexes_sessions_loaded_from_storage(
+        self,
+        json_serializer,
+        json_session_service,
+        sample_session,
+        function_call_event,
+        function_response_event,
+    ):
+        session = sample_session.model_copy(deep=True)
+        session.events = [function_call_event, function_response_event]
+        json_serializer.write(session)
+        assert (
+            json_session_service.get_event_index(
+                app_name=session.app_name,
+                user_id=session.user_id,
+                session_id=session.id,
+            )
+            is None
+        )
+
+        await json_session_service.get_session(
+            app_name=session.app_name,
+            user_id=session.user_id,
+            session_id=session.id,
+        )
+
+        index = json_session_service.get_event_index(
+            app_name=session.app_name,
+            user_id=session.user_id,
+            session_id=session.id,
+        )
+        assert index is not None
+        assert index.function_response_indices == [1]
+
+    async def test_sqlite_service_tracks_appended_events(
+        self,
+        session_storage_dir,
+        function_call_event,
+        function_response_event,
+    ):
+        service = SqliteSessionService(session_storage_dir / SQLITE_DB_FILE_NAME)
+        session = await service.create_session(
+            app_name="test-app",
+            user_id="test-user",
+            session_id="s1",
+        )
+        await service.append_event(session, function_call_event)
+        await service.append_event(session, function_response_event)
+
+        index = service.get_event_index(
+            app_name="test-app",
+            user_id="test-user",
+            session_id="s1",
+        )
+        assert index is not None
+        assert index.function_response_indices == [1]
+        assert index.is_consistent
+        service.close()
+
+
+class TestSessionManagerUsesEventIndex:
+    """Tests for SessionManager checks served from the event index."""
+
+    async def test_validate_skips_scan_for_consistent_session(
+        self,
+        session_manager,
+        json_session_service,
+        function_call_event,
+        function_response_event,
+    ):
+        session = await json_session_service.create_session(
+            app_name="test-app",
+            user_id="test-user",
+            session_id="s1",
+        )
+        await json_session_service.append_event(session, function_call_event)
+        await json_session_service.append_event(session, function_response_event)
+        json_session_service.replace_events = AsyncMock()
+
+        assert await session_manager.validate_session(session) is session
+        json_session_service.replace_events.assert_not_called()
+
+    async def test_validate_repairs_pending_call(
+        self,
+        session_manager,
+        json_session_service,
+        user_event,
+        function_call_event,
+    ):
+        session = await json_session_service.create_session(
+            app_name="test-app",
+            user_id="test-user",
+            session_id="s1",
+        )
+        await json_session_service.append_event(session, user_event)
+        await json_session_service.append_event(session, function_call_event)
+
+        validated = await session_manager.validate_session(session)
+
+        assert [e.id for e in validated.events] == [user_event.id]
+
+    async def test_manage_does_not_load_session_under_limit(
+        self,
+        session_manager,
+        json_session_service,
+        function_call_event,
+        function_response_event,
+    ):
+        session = await json_session_service.create_session(
+            app_name=session_manager.app_name,
+            user_id=session_manager.user_id,
+            session_id=session_manager.current_session_id,
+        )
+        for event in _pair(function_call_event, function_response_event, "tool"):
+            await json_session_service.append_event(session, event)
+        json_session_service.get_session = AsyncMock()
+
+        await session_manager.manage_current_session()
+
+        json_session_service.get_session.assert_not_called()
+
+    async def test_manage_trims_using_index(
+        self,
+        session_manager,
+        json_session_service,
+        function_call_event,
+        function_response_event,
+    ):
+        session = await json_session_service.create_session(
+            app_name=session_manager.app_name,
+            user_id=session_manager.user_id,
+            session_id=session_manager.current_session_id,
+        )
+        pair_count = session_manager.MAX_TOOL_CALLS_IN_SESSION + 2
+        for i in range(pair_count):
+            for event in _pair(function_call_event, function_response_event, f"f{i}"):
+                await json_session_service.append_event(session, event)
+
+        await session_manager.manage_current_session()
+
+        index = json_session_service.get_event_index(
+            app_name=session_manager.app_name,
+            user_id=session_manager.user_id,
+            session_id=session_manager.current_session_id,
+        )
+        assert index is not None
+        assert len(index.function_response_indices) == (
+            session_manager.MAX_TOOL_CALLS_IN_SESSION
+        )
+        trimmed = await session_manager.get_current_session()
+        assert trimmed.events[0].content.parts[0].function_call.name == "f2"
@@ -0,0 +1,153 @@
+"""Tests for the SessionIndex sidecar used when listing saved sessions."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+from google.adk.events import Event
+from google.genai import types as genai_types
+
+from streetrace.session.json_serializer import JSONSessionSerializer
+from streetrace.session.jsonl_serializer import JSONLSessionSerializer
+from streetrace.session.session_index import INDEX_FILE_NAME
+
+
+def _list_ids(serializer, session) -> set[str]:
+    return {
+        s.id
+        for s in serializer.list_saved(
+            app_name=session.app_name,
+            user_id=session.user_id,
+        )
+    }
+
+
+@pytest.fixture(params=[JSONSessionSerializer, JSONLSessionSerializer])
+def serializer(request, session_storage_dir):
+    return request.param(storage_path=session_storage_dir)
+
+
+class TestSessionIndex:
+    """Tests for the session metadata index."""
+
+    def test_listing_builds_index(self, serializer, sample_session):
+        path = serializer.write(sample_session)
+        index_path = path.parent / INDEX_FILE_NAME
+        assert not index_path.exists()
+
+        assert _list_ids(serializer, sample_session) == {sample_session.id}
+
+        index = json.loads(index_path.read_text())
+        assert set(index["sessions"]) == {path.name}
+
+    def test_listing_uses_index_without_parsing(self, serializer, sample_session):
+        serializer.write(sample_session)
+        _list_ids(serializer, sample_session)
+
+        with patch.object(
+            serializer,
+            "_read_listing",
+            side_effect=AssertionError("should not parse"),
+        ):
+            assert _list_ids(serializer, sample_session) == {sample_session.id}
+
+    def test_write_updates_existing_index(self, serializer, sample_session):
+        serializer.write(sample_session)
+        _list_ids(serializer, sample_session)
+
+        other = sample_session.model_copy(deep=True)
+        other.id = "other-session"
+        other.last_update_time = 123.0
+        serializer.write(other)
+
+        with patch.object(
+            serializer,
+            "_read_listing",
+            side_effect=AssertionError("should not parse"),
+        ):
+            sessions = {
+                s.id: s
+                for s in serializer.list_saved(
+                    app_name=sample_session.app_name,
+                    user_id=sample_session.user_id,
+                )
+            }
+        assert set(sessions) == {sample_session.id, "other-session"}
+        assert sessions["other-session"].last_update_time == 123.0
+
+    def test_rewrite_leaves_index_alone(self, serializer, sample_session):
+        session = sample_session.model_copy(deep=True)
+        path = serializer.write(session)
+        _list_ids(serializer, session)
+        index_path = path.parent / INDEX_FILE_NAME
+        indexed = index_path.read_bytes()
+
+        session.last_update_time = 456.0
+        serializer.write(session)
+
+        assert index_path.read_bytes() == indexed
+        sessions = list(
+            serializer.list_saved(app_name=session.app_name, user_id=session.user_id),
+        )
+        assert [s.last_update_time for s in sessions] == [456.0]
+
+    def test_stale_entry_is_refreshed(self, sample_session, session_storage_dir):
+        serializer = JSONLSessionSerializer(storage_path=session_storage_dir)
+        session = sample_session.model_copy(deep=True)
+        serializer.write(session)
+        _list_ids(serializer, session)
+
+        # appending to the log does not touch the index
+        event = Event(
+            author="user",
+            timestamp=77.0,
+            content=genai_types.Content(
+                role="user",
+                parts=[genai_types.Part.from_text(text="late event")],
+            ),
+        )
+        session.events.append(event)
+        serializer.append_event(session, event)
+
+        sessions = list(
+            serializer.list_saved(app_name=session.app_name, user_id=session.user_id),
+        )
+        assert [s.last_update_time for s in sessions] == [77.0]
+
+    def test_externally_removed_file_is_dropped(self, serializer, sample_session):
+        path = serializer.write(sample_session)
+        other = sample_session.model_copy(deep=True)
+        other.id = "other-session"
+        serializer.write(other)
+        _list_ids(serializer, sample_session)
+
+        path.unlink()
+
+        assert _list_ids(serializer, sample_session) == {"other-session"}
+        index = json.loads((path.parent / INDEX_FILE_NAME).read_text())
+        assert path.name not in index["sessions"]
+
+    def test_corrupt_index_is_rebuilt(self, serializer, sample_session):
+        path = serializer.write(sample_session)
+        (path.parent / INDEX_FILE_NAME).write_text("{not json")
+
+        assert _list_ids(serializer, sample_session) == {sample_session.id}
+        index = json.loads((path.parent / INDEX_FILE_NAME).read_text())
+        assert path.name in index["sessions"]
+
+    def test_delete_last_session_removes_index_and_dirs(
+        self,
+        serializer,
+        sample_session,
+    ):
+        path = serializer.write(sample_session)
+        _list_ids(serializer, sample_session)
+
+        serializer.delete(
+            app_name=sample_session.app_name,
+            user_id=sample_session.user_id,
+            session_id=sample_session.id,
+        )
+
+        assert not (path.parent / INDEX_FILE_NAME).exists()
+        assert not path.parent.exists()
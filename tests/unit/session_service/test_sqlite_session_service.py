@@ -0,0 +1,421 @@
+"""Tests for the SqliteSessionService class in sqlite_session_service.py."""
+
+import sqlite3
+from collections.abc import Iterator
+from unittest.mock import Mock
+
+import pytest
+from google.adk.errors.already_exists_error import AlreadyExistsError
+from google.adk.events import Event, EventActions
+from google.adk.sessions.base_session_service import GetSessionConfig
+from google.genai import types as genai_types
+
+from streetrace.args import Args
+from streetrace.session.session_manager import SessionManager
+from streetrace.session.sqlite_session_service import (
+    SQLITE_DB_FILE_NAME,
+    SqliteSessionService,
+)
+
+
+def _event(text: str, timestamp: float, *, author: str = "user", **kwargs) -> Event:
+    return Event(
+        author=author,
+        timestamp=timestamp,
+        content=genai_types.Content(
+            role="user" if author == "user" else "model",
+            parts=[genai_types.Part.from_text(text=text)],
+        ),
+        **kwargs,
+    )
+
+
+def _tool_call_event(timestamp: float) -> Event:
+    return Event(
+        author="assistant",
+        timestamp=timestamp,
+        content=genai_types.Content(
+            role="model",
+            parts=[
+                genai_types.Part(
+                    function_call=genai_types.FunctionCall(name="tool", args={}),
+                ),
+            ],
+        ),
+    )
+
+
+def _texts(session) -> list[str]:
+    return [e.content.parts[0].text for e in session.events]
+
+
+def _count_events(db_path) -> int:
+    with sqlite3.connect(db_path) as connection:
+        return connection.execute("SELECT COUNT(*) FROM events").fetchone()[0]
+
+
+@pytest.fixture
+def sqlite_service(session_storage_dir) -> Iterator[SqliteSessionService]:
+    service = SqliteSessionService(session_storage_dir / SQLITE_DB_FILE_NAME)
+    yield service
+    service.close()
+
+
+class TestSqliteSessionService:
+    """Tests for the SqliteSessionService class."""
+
+    def test_database_uses_wal(self, sqlite_service):
+        with sqlite3.connect(sqlite_service.db_path) as connection:
+            mode = connection.execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode == "wal"
+
+    async def test_create_and_get_session(self, sqlite_service):
+        created = await sqlite_service.create_session(
+            app_name="test-app",
+            user_id="test-user",
+            session_id="s1",
+            state={"key": "value"},
+        )
+        assert created.id == "s1"
+
+        session = await sqlite_service.get_session(
+            app_name="test-app",
+            user_id="test-user",
+            session_id="s1",
+        )
+        assert session is not None
+        assert session.state == {"key": "value"}
+        assert session.events == []
+
+    async def test_create_existing_session_raises(self, sqlite_service):
+        await sqlite_service.create_session(
+            app_name="test-app",
+            user_id="test-user",
+            session_id="s1",
+        )
+        with pytest.raises(AlreadyExistsError):
+            await sqlite_service.create_session(
+                app_name="test-app",
+                user_id="test-user",
+                session_id="s1",
+            )
+
+    async def test_get_missing_session(self, sqlite_service):
+        assert (
+            await sqlite_service.get_session(
+                app_name="test-app",
+                user_id="test-user",
+                session_id="missing",
+            )
+            is None
+        )
+
+    async def test_events_are_batched_until_final_response(self, sqlite_service):
+        session = await sqlite_service.create_session(
+            app_name="test-app",
+            user_id="test-user",
+            session_id="s1",
+        )
+
+        await sqlite_service.append_event(session, _tool_call_event(1.0))
+        assert _count_events(sqlite_service.db_path) == 0
+
+        await sqlite_service.append_event(session, _event("done", 2.0, author="a"))
+        assert _count_events(sqlite_service.db_path) == 2
+
+    async def test_batch_size_forces_flush(self, session_storage_dir):
+        service = SqliteSessionService(
+            session_storage_dir / SQLITE_DB_FILE_NAME,
+            batch_size=2,
+        )
+        session = await service.create_session(
+            app_name="test-app",
+            user_id="test-user",
+            session_id="s1",
+        )
+        await service.append_event(session, _tool_call_event(1.0))
+        await service.append_event(session, _tool_call_event(2.0))
+
+        assert _count_events(service.db_path) == 2
+        service.close()
+
+    async def test_failed_flush_keeps_buffer(self, sqlite_service):
+        session = await sqlite_service.create_session(
+            app_name="test-app",
+            user_id="test-user",
+            session_id="s1",
+        )
+        await sqlite_service.append_event(session, _tool_call_event(1.0))
+        with sqlite3.connect(sqlite_service.db_path) as connection:
+            connection.execute(
+                "INSERT INTO events "
+                "(app_name, user_id, session_id, seq, timestamp, event_data) "
+                "VALUES ('test-app', 'test-user', 's1', 0, 0.5, '{}')",
+            )
+
+        await sqlite_service.append_event(session, _event("done", 2.0, author="a"))
+        assert _count_events(sqlite_service.db_path) == 1
+
+        sqlite_service.flush()
+        assert _count_events(sqlite_service.db_path) == 3
+
+    async def test_reads_see_buffered_events(self, sqlite_service):
+        session = await sqlite_service.create_session(
+            app_name="test-app",
+            user_id="test-user",
+            session_id="s1",
+        )
+        await sqlite_service.append_event(session, _tool_call_event(1.0))
+
+        loaded = await sqlite_service.get_session(
+            app_name="test-app",
+            user_id="test-user",
+            session_id="s1",
+        )
+        assert loaded is not None
+        assert len(loaded.events) == 1
+        assert loaded.last_update_time == 1.0
+
+    async def test_partial_events_are_not_stored(self, sqlite_service):
+        session = await sqlite_service.create_session(
+            app_name="test-app",
+            user_id="test-user",
+            session_id="s1",
+        )
+        await sqlite_service.append_event(
+            session,
+            _event("partial", 1.0, partial=True),
+        )
+        sqlite_service.flush()
+
+        assert _count_events(sqlite_service.db_path) == 0
+        assert session.events == []
+
+    async def test_state_scopes(self, sqlite_service):
+        session = await sqlite_service.create_session(
+            app_name="test-app",
+            user_id="test-user",
+            session_id="s1",
+        )
+        await sqlite_service.append_event(
+            session,
+            _event(
+                "state",
+                1.0,
+                actions=EventActions(
+                    state_delta={
+                        "app:shared": 1,
+                        "user:pref": "x",
+                        "local": True,
+                        "temp:scratch": "dropped",
+                    },
+                ),
+            ),
+        )
+        other = await sqlite_service.create_session(
+            app_name="test-app",
+            user_id="test-user",
+            session_id="s2",
+        )
+
+        assert other.state == {"app:shared": 1, "user:pref": "x"}
+        loaded = await sqlite_service.get_session(
+            app_name="test-app",
+            user_id="test-user",
+            session_id="s1",
+        )
+        assert loaded is not None
+        assert loaded.state == {"app:shared": 1, "user:pref": "x", "local": True}
+
+    async def test_paginated_event_loading(self, sqlite_service):
+        session = await sqlite_service.create_session(
+            app_name="test-app",
+            user_id="test-user",
+            session_id="s1",
+        )
+        for i in range(5):
+            await sqlite_service.append_event(session, _event(f"e{i}", i + 1.0))
+
+        recent = await sqlite_service.get_session(
+            app_name="test-app",
+            user_id="test-user",
+            session_id="s1",
+            config=GetSessionConfig(num_recent_events=2),
+        )
+        assert recent is not None
+        assert _texts(recent) == ["e3", "e4"]
+
+        page = await sqlite_service.list_events(
+            app_name="test-app",
+            user_id="test-user",
+            session_id="s1",
+            offset=1,
+            limit=2,
+        )
+        assert [e.content.parts[0].text for e in page] == ["e1", "e2"]
+
+        after = await sqlite_service.get_session(
+            app_name="test-app",
+            user_id="test-user",
+            session_id="s1",
+            config=GetSessionConfig(after_timestamp=4.0),
+        )
+        assert after is not None
+        assert _texts(after) == ["e3", "e4"]
+
+    async def test_list_sessions(self, sqlite_service):
+        for session_id in ("s1", "s2"):
+            await sqlite_service.create_session(
+                app_name="test-app",
+                user_id="test-user",
+                session_id=session_id,
+            )
+        await sqlite_service.create_session(
+            app_name="test-app",
+            user_id="other-user",
+            session_id="s3",
+        )
+
+        response = await sqlite_service.list_sessions(
+            app_name="test-app",
+            user_id="test-user",
+        )
+        assert {s.id for s in response.sessions} == {"s1", "s2"}
+
+        response = await sqlite_service.list_sessions(app_name="test-app")
+        assert {s.id for s in response.sessions} == {"s1", "s2", "s3"}
+
+    async def test_replace_events(self, sqlite_service):
+        session = await sqlite_service.create_session(
+            app_name="test-app",
+            user_id="test-user",
+            session_id="s1",
+        )
+        for i in range(3):
+            await sqlite_service.append_event(session, _event(f"e{i}", i + 1.0))
+
+        replaced = await sqlite_service.replace_events(
+            session=session,
+            new_events=[_event("new", 10.0)],
+            start_at=1,
+        )
+
+        assert replaced is not None
+        assert _texts(replaced) == ["e0", "new"]
+        assert replaced.last_update_time == 10.0
+
+        # appending continues after the replaced events
+        await sqlite_service.append_event(replaced, _event("next", 11.0))
+        loaded = await sqlite_service.get_session(
+            app_name="test-app",
+            user_id="test-user",
+            session_id="s1",
+        )
+        assert loaded is not None
+        assert _texts(loaded) == ["e0", "new", "next"]
+
+    async def test_history_keeps_replaced_events(self, sqlite_service):
+        session = await sqlite_service.create_session(
+            app_name="test-app",
+            user_id="test-user",
+            session_id="s1",
+        )
+        events = [_event(f"e{i}", i + 1.0) for i in range(3)]
+        for event in events:
+            await sqlite_service.append_event(session, event)
+
+        replaced = await sqlite_service.replace_events(
+            session=session,
+            new_events=[_event("summary", 10.0), events[2]],
+            start_at=1,
+        )
+        assert replaced is not None
+        await sqlite_service.append_event(replaced, _event("next", 11.0))
+
+        history = await sqlite_service.get_session_history(
+            app_name="test-app",
+            user_id="test-user",
+            session_id="s1",
+        )
+        assert _texts(history) == ["e0", "e1", "e2", "summary", "next"]
+
+    async def test_delete_session(self, sqlite_service):
+        session = await sqlite_service.create_session(
+            app_name="test-app",
+            user_id="test-user",
+            session_id="s1",
+        )
+        await sqlite_service.append_event(session, _event("e", 1.0))
+
+        await sqlite_service.delete_session(
+            app_name="test-app",
+            user_id="test-user",
+            session_id="s1",
+        )
+
+        assert (
+            await sqlite_service.get_session(
+                app_name="test-app",
+                user_id="test-user",
+                session_id="s1",
+            )
+            is None
+        )
+        assert _count_events(sqlite_service.db_path) == 0
+
+    async def test_import_session(self, sqlite_service, sample_session):
+        session = sample_session.model_copy(deep=True)
+        session.events = [_event("imported", 5.0)]
+        session.last_update_time = 5.0
+
+        assert sqlite_service.import_session(session)
+        assert not sqlite_service.import_session(session)
+        assert sqlite_service.import_session(session, overwrite=True)
+
+        loaded = await sqlite_service.get_session(
+            app_name=session.app_name,
+            user_id=session.user_id,
+            session_id=session.id,
+        )
+        assert loaded is not None
+        assert _texts(loaded) == ["imported"]
+
+
+def test_session_manager_selects_sqlite(system_context, ui_bus):
+    args = Mock(spec=Args)
+    args.session_id = None
+    args.session_format = "sqlite"
+    args.session_flush_interval = None
+    args.session_fsync = False
+
+    manager = SessionManager(args=args, system_context=system_context, ui_bus=ui_bus)
+
+    service = manager.session_service
+    assert isinstance(service, SqliteSessionService)
+    assert service.db_path == (
+        system_context.config_dir / "sessions" / SQLITE_DB_FILE_NAME
+    )
+    manager.close()
+
+
+async def test_session_manager_close_writes_buffered_events(
+    system_context,
+    ui_bus,
+):
+    args = Mock(spec=Args)
+    args.session_id = None
+    args.session_format = "sqlite"
+    args.session_flush_interval = None
+    args.session_fsync = False
+    manager = SessionManager(args=args, system_context=system_context, ui_bus=ui_bus)
+    service = manager.session_service
+    session = await service.create_session(
+        app_name="test-app",
+        user_id="test-user",
+        session_id="s1",
+    )
+    await service.append_event(session, _tool_call_event(1.0))
+
+    manager.close()
+
+    assert _count_events(service.db_path) == 1
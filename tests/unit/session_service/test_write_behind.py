@@ -0,0 +1,213 @@
+"""Tests for write-behind persistence in JSONSessionService."""
+
+import asyncio
+import json
+import threading
+from unittest.mock import patch
+
+import pytest
+from google.adk.events import Event
+from google.genai import types as genai_types
+
+from streetrace.session.jsonl_serializer import JSONLSessionSerializer
+from streetrace.session.session_service import JSONSessionService
+
+
+def _tool_call_event(name: str) -> Event:
+    return Event(
+        author="assistant",
+        content=genai_types.Content(
+            role="model",
+            parts=[
+                genai_types.Part(
+                    function_call=genai_types.FunctionCall(name=name, args={}),
+                ),
+            ],
+        ),
+    )
+
+
+def _final_event(text: str) -> Event:
+    return Event(
+        author="assistant",
+        content=genai_types.Content(
+            role="model",
+            parts=[genai_types.Part.from_text(text=text)],
+        ),
+    )
+
+
+def _stored_events(serializer, session) -> list[Event]:
+    stored = serializer.read(
+        app_name=session.app_name,
+        user_id=session.user_id,
+        session_id=session.id,
+    )
+    assert stored is not None
+    return stored.events
+
+
+@pytest.fixture
+def jsonl_serializer(session_storage_dir) -> JSONLSessionSerializer:
+    return JSONLSessionSerializer(storage_path=session_storage_dir)
+
+
+@pytest.fixture
+async def write_behind_service(jsonl_serializer) -> JSONSessionService:
+    return JSONSessionService(jsonl_serializer, flush_interval=60)
+
+
+async def _create(service: JSONSessionService):
+    return await service.create_session(
+        app_name="test-app",
+        user_id="test-user",
+        session_id="s1",
+    )
+
+
+class TestWriteBehind:
+    """Tests for batching appended events in memory."""
+
+    async def test_events_are_written_on_flush(
+        self,
+        write_behind_service,
+        jsonl_serializer,
+    ):
+        session = await _create(write_behind_service)
+        await write_behind_service.append_event(session, _tool_call_event("a"))
+        await write_behind_service.append_event(session, _tool_call_event("b"))
+
+        assert _stored_events(jsonl_serializer, session) == []
+
+        write_behind_service.flush()
+
+        assert len(_stored_events(jsonl_serializer, session)) == 2
+        path = jsonl_serializer._file_path(session=session)  # noqa: SLF001
+        records = [json.loads(line) for line in path.read_text().splitlines()]
+        assert [r["type"] for r in records] == ["session", "event", "event"]
+
+    async def test_final_response_flushes(self, write_behind_service, jsonl_serializer):
+        session = await _create(write_behind_service)
+        await write_behind_service.append_event(session, _tool_call_event("a"))
+        await write_behind_service.append_event(session, _final_event("done"))
+
+        assert len(_stored_events(jsonl_serializer, session)) == 2
+
+    async def test_close_writes_events(self, write_behind_service, jsonl_serializer):
+        session = await _create(write_behind_service)
+        await write_behind_service.append_event(session, _tool_call_event("a"))
+
+        write_behind_service.close()
+
+        assert len(_stored_events(jsonl_serializer, session)) == 1
+
+    async def test_background_flush(self, jsonl_serializer):
+        service = JSONSessionService(jsonl_serializer, flush_interval=0.01)
+        session = await _create(service)
+        await service.append_event(session, _tool_call_event("a"))
+
+        for _ in range(100):
+            await asyncio.sleep(0.01)
+            if _stored_events(jsonl_serializer, session):
+                break
+
+        assert len(_stored_events(jsonl_serializer, session)) == 1
+
+    async def test_final_response_writes_off_the_event_loop(
+        self,
+        write_behind_service,
+        jsonl_serializer,
+    ):
+        session = await _create(write_behind_service)
+        append_events = jsonl_serializer.append_events
+        threads = []
+
+        def record_thread(*args, **kwargs):
+            threads.append(threading.current_thread())
+            return append_events(*args, **kwargs)
+
+        with patch.object(jsonl_serializer, "append_events", record_thread):
+            await write_behind_service.append_event(session, _final_event("done"))
+
+        assert threads
+        assert threading.main_thread() not in threads
+        assert len(_stored_events(jsonl_serializer, session)) == 1
+
+    async def test_failed_write_is_retried(self, write_behind_service, jsonl_serializer):
+        session = await _create(write_behind_service)
+        append_events = jsonl_serializer.append_events
+        calls = []
+
+        def fail_once(*args, **kwargs):
+            calls.append(args)
+            if len(calls) == 1:
+                raise OSError("disk full")
+            return append_events(*args, **kwargs)
+
+        with patch.object(jsonl_serializer, "append_events", fail_once):
+            await write_behind_service.append_event(session, _final_event("first"))
+            assert _stored_events(jsonl_serializer, session) == []
+            await write_behind_service.append_event(session, _final_event("second"))
+
+        stored = _stored_events(jsonl_serializer, session)
+        assert [e.content.parts[0].text for e in stored] == ["first", "second"]
+
+    async def test_replace_events_drops_pending_events(
+        self,
+        write_behind_service,
+        jsonl_serializer,
+    ):
+        session = await _create(write_behind_service)
+        await write_behind_service.append_event(session, _tool_call_event("a"))
+
+        await write_behind_service.replace_events(
+            session=session,
+            new_events=[_final_event("replaced")],
+        )
+        write_behind_service.flush()
+
+        stored = _stored_events(jsonl_serializer, session)
+        assert [e.content.parts[0].text for e in stored] == ["replaced"]
+
+    async def test_listing_sees_pending_events(self, write_behind_service):
+        session = await _create(write_behind_service)
+        event = _tool_call_event("a")
+        await write_behind_service.append_event(session, event)
+
+        response = await write_behind_service.list_sessions(
+            app_name="test-app",
+            user_id="test-user",
+        )
+
+        assert response.sessions[0].last_update_time == event.timestamp
+
+    async def test_delete_drops_pending_events(self, write_behind_service):
+        session = await _create(write_behind_service)
+        await write_behind_service.append_event(session, _tool_call_event("a"))
+
+        await write_behind_service.delete_session(
+            app_name="test-app",
+            user_id="test-user",
+            session_id="s1",
+        )
+        write_behind_service.flush()
+
+        assert (
+            await write_behind_service.get_session(
+                app_name="test-app",
+                user_id="test-user",
+                session_id="s1",
+            )
+            is None
+        )
+
+
+async def test_fsync(session_storage_dir):
+    serializer = JSONLSessionSerializer(storage_path=session_storage_dir, fsync=True)
+    service = JSONSessionService(serializer)
+
+    with patch("streetrace.session.json_serializer.os.fsync") as fsync:
+        session = await _create(service)
+        await service.append_event(session, _final_event("done"))
+
+    assert fsync.call_count == 2